@@ -1,9 +1,12 @@
 import os
 
 from ordinarium import create_app
+from ordinarium.liturgical_calendar import warm_calendar
 
 
 app = create_app()
+if os.path.exists(app.config["DATABASE"]):
+    warm_calendar(app)
 
 def _debug_enabled():
     return (
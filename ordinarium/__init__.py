@@ -3,12 +3,27 @@ import os
 import re
 from html.parser import HTMLParser
 
-import markdown2
 from jinja2 import pass_context
 from markupsafe import Markup
 from flask import Flask
 
-from .db import close_db, init_db_command
+from .cache import LRUCache
+from .db import build_content_command, close_db, init_db_command
+from .exports import export_worker_command
+from .liturgical_calendar import (
+    CalendarStore,
+    precompute_calendar_command,
+    reload_calendar_command,
+    snapshot_calendar_command,
+)
+from .propers import TextPools
+from .rendering import (
+    cached_fragment,
+    markdown_html,
+    prerender_texts_command,
+    render_markdown_template,
+    wrap_trailing_indent,
+)
 from .routes import bp as main_bp
 
 
@@ -17,65 +32,79 @@ def create_app():
     app.config.from_mapping(
         DATABASE=os.path.join(app.instance_path, "ordinarium.db"),
         SECRET_KEY=os.environ.get("SECRET_KEY", "dev"),
+        # Applied to each connection as it is opened, in this order.
+        DATABASE_PRAGMAS={
+            "busy_timeout": 5000,
+            "journal_mode": "wal",
+            "synchronous": "normal",
+            "cache_size": -16000,
+            "mmap_size": 134217728,
+            "temp_store": "memory",
+        },
+        DATABASE_CACHED_STATEMENTS=256,
+        # Set to keep the reference data (texts, calendar rules, pages) in a
+        # separate read-only file, built with `flask build-content`.
+        CONTENT_DATABASE=os.environ.get("CONTENT_DATABASE"),
+        CONTENT_PRAGMAS={"mmap_size": 268435456},
+        CALENDAR_CHECK_INTERVAL=5,
+        CALENDAR_RELOAD_FILE=os.path.join(app.instance_path, "calendar.reload"),
+        CALENDAR_SNAPSHOT_FILE=os.path.join(app.instance_path, "calendar.snapshot"),
+        TEMPLATE_CACHE_SIZE=512,
+        TEXT_RENDER_CACHE_SIZE=4096,
+        FRAGMENT_CACHE_SIZE=4096,
+        SHARE_CACHE_SIZE=256,
+        # Set to a directory shared by the workers to enable the disk tier.
+        SHARE_CACHE_DIR=os.environ.get("SHARE_CACHE_DIR"),
+        SHARE_CACHE_DISK_ENTRIES=1024,
+        SHARE_CACHE_MAX_AGE=60,
+        # Exports are run by `flask export-worker`, which renders in a pool of
+        # this many processes; the web workers only queue them.
+        EXPORT_WORKERS=min(4, os.cpu_count() or 1),
+        EXPORT_POLL_INTERVAL=1.0,
+        EXPORT_DIR=os.path.join(app.instance_path, "exports"),
+        EXPORT_MAX_SERVICES=400,
+        EXPORT_MAX_ACTIVE_JOBS=2,
+        # Queued or running exports not updated for this long are failed.
+        EXPORT_STALE_AFTER=900,
     )
 
     os.makedirs(app.instance_path, exist_ok=True)
 
     app.jinja_env.add_extension("jinja_markdown2.MarkdownExtension")
-    extras = [
-        "fenced-code-blocks",
-        "code-friendly",
-        # 'target-blank-links',
-        "markdown-in-html",
-        "footnotes",
-    ]
 
     @pass_context
     def markdown_template(context, value):
-        template = context.environment.from_string(value or "")
-        rendered = template.render(context.get_all())
-        html_text = markdown2.markdown(rendered, extras=extras)
-        return Markup(html_text)
-
-    def wrap_trailing_indent(value):
-        if not value:
-            return Markup("")
-
-        trailing_span_re = re.compile(
-            r'class=["\'][^"\']*\btrailing-indent\b[^"\']*["\']',
-            re.IGNORECASE,
+        return Markup(
+            render_markdown_template(
+                context.environment, value or "", context.get_all()
+            )
         )
-        br_split_re = re.compile(r"(<br\s*/?>)", re.IGNORECASE)
-        paragraph_re = re.compile(r"(<p\b[^>]*>)(.*?)(</p>)", re.DOTALL)
 
-        def wrap_segment(segment):
-            match = re.match(r"(\s*)(<em>.*?</em>)(.*)", segment, re.DOTALL)
-            if not match:
-                return segment
-            leading, em_html, remainder = match.groups()
-            if not remainder.strip():
-                return segment
-            if trailing_span_re.search(remainder):
-                return segment
-            return f"{leading}{em_html}<span class=\"trailing-indent\">{remainder}</span>"
+    def trailing_indent(value):
+        return Markup(wrap_trailing_indent(str(value or "")))
 
-        def wrap_paragraph(match):
-            open_tag, inner, close_tag = match.groups()
-            parts = br_split_re.split(inner)
-            for index in range(0, len(parts), 2):
-                parts[index] = wrap_segment(parts[index])
-            return f"{open_tag}{''.join(parts)}{close_tag}"
+    @pass_context
+    def rendered_ordinary(context, ordinary, part):
+        source = ordinary[part] or ""
 
-        return Markup(paragraph_re.sub(wrap_paragraph, str(value)))
+        def render():
+            html_text = render_markdown_template(
+                context.environment, source, context.get_all()
+            )
+            if part == "text":
+                html_text = wrap_trailing_indent(html_text)
+            return html_text
 
-    app.jinja_env.filters["markdown"] = lambda value: Markup(
-        markdown2.markdown(
-            value or "",
-            extras=extras,
+        return Markup(
+            cached_fragment(
+                context.environment, (*ordinary["key"], part), source, context, render
+            )
         )
-    )
+
+    app.jinja_env.filters["markdown"] = lambda value: Markup(markdown_html(value or ""))
     app.jinja_env.filters["markdown_template"] = markdown_template
-    app.jinja_env.filters["trailing_indent"] = wrap_trailing_indent
+    app.jinja_env.filters["trailing_indent"] = trailing_indent
+    app.jinja_env.filters["rendered_ordinary"] = rendered_ordinary
     app.jinja_env.filters["clean"] = lambda value: re.sub(
         r"\s+", " ", value or ""
     ).strip()
@@ -83,5 +112,18 @@ def create_app():
     app.register_blueprint(main_bp)
     app.teardown_appcontext(close_db)
     app.cli.add_command(init_db_command)
+    app.cli.add_command(build_content_command)
+    app.cli.add_command(precompute_calendar_command)
+    app.cli.add_command(reload_calendar_command)
+    app.cli.add_command(snapshot_calendar_command)
+    app.cli.add_command(prerender_texts_command)
+    app.cli.add_command(export_worker_command)
+    app.extensions["ordinarium_calendar"] = CalendarStore()
+    app.extensions["ordinarium_text_pools"] = TextPools()
+    app.extensions["ordinarium_templates"] = LRUCache(app.config["TEMPLATE_CACHE_SIZE"])
+    app.extensions["ordinarium_text_renders"] = LRUCache(
+        app.config["TEXT_RENDER_CACHE_SIZE"]
+    )
+    app.extensions["ordinarium_fragments"] = LRUCache(app.config["FRAGMENT_CACHE_SIZE"])
 
     return app
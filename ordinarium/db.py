@@ -1,32 +1,294 @@
+import hashlib
+import os
 import sqlite3
+import tempfile
+import threading
+from contextlib import contextmanager
+from urllib.parse import quote
 
 import click
 from flask import current_app, g
+from flask.cli import with_appcontext
 
+# Reference data, kept in the content database when one is configured.
+CONTENT_TABLES = ("holidays", "fragments", "subcycles", "pages", "texts")
 
-def get_db():
-    if "db" not in g:
-        g.db = sqlite3.connect(
-            current_app.config["DATABASE"],
+
+class ConnectionPool:
+    """Long-lived SQLite connections, one per thread of the process.
+
+    Keeping a thread's connection across requests keeps SQLite's page cache
+    and prepared statements warm. Connections left by threads that have
+    exited are closed when the next one is opened, and a forked process
+    starts over rather than share its parent's connections.
+
+    With a ``content_database``, each connection attaches it read-only as
+    ``content``. Connections that attached a file since replaced by a new
+    version are reopened.
+    """
+
+    def __init__(
+        self,
+        database,
+        pragmas=None,
+        cached_statements=128,
+        content_database=None,
+        content_pragmas=None,
+    ):
+        self.database = database
+        self.pragmas = dict(pragmas or {})
+        self.cached_statements = cached_statements
+        self.content_database = content_database
+        self.content_pragmas = dict(content_pragmas or {})
+        self._connections = {}
+        self._attached = {}
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.reused = 0
+        self.rolled_back = 0
+
+    def acquire(self):
+        ident = threading.get_ident()
+        content = None
+        if self.content_database:
+            content = file_identity(self.content_database)
+        with self._lock:
+            if self._pid != os.getpid():
+                self._connections = {}
+                self._attached = {}
+                self._pid = os.getpid()
+                self.opened = self.reused = self.rolled_back = 0
+            connection = self._connections.get(ident)
+            if connection is not None and self._attached.get(ident) != content:
+                # The content database was replaced. Reconnecting is simpler
+                # than detaching it from under any statements still open.
+                self._connections.pop(ident).close()
+                connection = None
+            if connection is not None:
+                self.reused += 1
+                return connection
+            self._close_exited_threads()
+        connection = self._connect(content)
+        with self._lock:
+            self._connections[ident] = connection
+            self._attached[ident] = content
+            self.opened += 1
+        return connection
+
+    def release(self, connection):
+        # Whatever a request left uncommitted is discarded, as closing the
+        # connection used to, so the next request starts clean.
+        if connection.in_transaction:
+            connection.rollback()
+            with self._lock:
+                self.rolled_back += 1
+
+    def close_all(self):
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections = {}
+            self._attached = {}
+        for connection in connections:
+            connection.close()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "connections": len(self._connections),
+                "opened": self.opened,
+                "reused": self.reused,
+                "rolled_back": self.rolled_back,
+            }
+
+    def _connect(self, content=None):
+        # Only ever used by the thread that opened it, but closed from
+        # another once that thread has exited.
+        connection = sqlite3.connect(
+            self.database,
             detect_types=sqlite3.PARSE_DECLTYPES,
+            cached_statements=self.cached_statements,
+            check_same_thread=False,
+            uri=True,
+        )
+        connection.row_factory = sqlite3.Row
+        for name, value in self.pragmas.items():
+            connection.execute(f"pragma {name}={value}")
+        if content is not None:
+            connection.execute(
+                "attach database ? as content", (content_uri(self.content_database),)
+            )
+            for name, value in self.content_pragmas.items():
+                connection.execute(f"pragma content.{name}={value}")
+        return connection
+
+    def _close_exited_threads(self):
+        running = {thread.ident for thread in threading.enumerate()}
+        for ident in list(self._connections):
+            if ident not in running:
+                self._connections.pop(ident).close()
+                self._attached.pop(ident, None)
+
+
+def file_identity(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def content_uri(path):
+    # immutable=1 lets SQLite skip locking and change detection entirely;
+    # safe because a new version of the file always replaces the old one.
+    return f"file:{quote(os.path.abspath(path))}?mode=ro&immutable=1"
+
+
+def connection_pool(app=None):
+    app = app or current_app
+    pool = app.extensions.get("ordinarium_db")
+    if pool is None:
+        pool = app.extensions.setdefault(
+            "ordinarium_db",
+            ConnectionPool(
+                app.config["DATABASE"],
+                app.config["DATABASE_PRAGMAS"],
+                app.config["DATABASE_CACHED_STATEMENTS"],
+                app.config["CONTENT_DATABASE"],
+                app.config["CONTENT_PRAGMAS"],
+            ),
         )
-        g.db.row_factory = sqlite3.Row
+    return pool
+
+
+def get_db():
+    if "db" not in g:
+        g.db = connection_pool().acquire()
     return g.db
 
 
 def close_db(_exception=None):
     db = g.pop("db", None)
     if db is not None:
-        db.close()
+        connection_pool().release(db)
+
+
+@contextmanager
+def write_transaction(db):
+    """Run a block in a transaction that holds the write lock from the start.
+
+    Reads inside the block see the state its writes apply to, even with
+    other workers writing: they wait on the lock (up to ``busy_timeout``)
+    rather than interleave. Commits if the block succeeds.
+    """
+    db.execute("begin immediate")
+    try:
+        yield db
+    except BaseException:
+        db.rollback()
+        raise
+    db.commit()
+
+
+def data_version(db, reload_file):
+    """Identify the state of the reference data (calendar, texts).
+
+    Changes whenever a migration is applied, the reload file is touched or
+    a new content database is swapped in.
+    """
+    migrations = db.execute(
+        "select count(*) as count, max(id) as last_id from schema_migrations"
+    ).fetchone()
+    try:
+        reloaded_at = os.stat(reload_file).st_mtime_ns
+    except OSError:
+        reloaded_at = None
+    content = None
+    for row in db.execute("pragma database_list"):
+        if row["name"] == "content":
+            content = file_identity(row["file"])
+    return (migrations["count"], migrations["last_id"], reloaded_at, content)
 
 
 def init_db():
     db = get_db()
     with current_app.open_resource("schema.sql") as f:
         db.executescript(f.read().decode("utf-8"))
+    if current_app.config["CONTENT_DATABASE"]:
+        build_content(current_app.config["CONTENT_DATABASE"])
+    else:
+        db.executescript(content_script())
+
+
+def content_script():
+    with current_app.open_resource("content.sql") as f:
+        return f.read().decode("utf-8")
+
+
+def script_content_version(script=None):
+    """Return the version a content database built now would have."""
+    script = script if script is not None else content_script()
+    return hashlib.sha1(script.encode("utf-8")).hexdigest()
+
+
+def content_version(path):
+    """Return the version of the content database at ``path``, if any."""
+    if file_identity(path) is None:
+        return None
+    connection = sqlite3.connect(content_uri(path), uri=True)
+    try:
+        row = connection.execute("select version from content_version").fetchone()
+    except sqlite3.OperationalError:
+        return None
+    finally:
+        connection.close()
+    return row[0] if row else None
+
+
+def build_content(path):
+    """Build the content database from ``content.sql`` and swap it in.
+
+    The new file is written next to ``path`` and renamed over it, so readers
+    only ever see a complete database. Returns the content version.
+    """
+    script = content_script()
+    version = script_content_version(script)
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    os.close(fd)
+    try:
+        connection = sqlite3.connect(tmp_path)
+        try:
+            connection.executescript(script)
+            connection.execute(
+                "create table content_version (version TEXT NOT NULL, built_at TEXT DEFAULT CURRENT_TIMESTAMP)"
+            )
+            connection.execute(
+                "insert into content_version (version) values (?)", (version,)
+            )
+            connection.commit()
+            connection.execute("vacuum")
+        finally:
+            connection.close()
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return version
 
 
 @click.command("init-db")
 def init_db_command():
     init_db()
     click.echo("Initialized the database.")
+
+
+@click.command("build-content")
+@with_appcontext
+def build_content_command():
+    path = current_app.config["CONTENT_DATABASE"]
+    if not path:
+        raise click.ClickException("CONTENT_DATABASE is not configured.")
+    version = build_content(path)
+    click.echo(f"Built content database {path} ({version[:12]}).")
@@ -0,0 +1,301 @@
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+import uuid
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import click
+from flask import current_app, g, render_template
+from flask.cli import with_appcontext
+from markupsafe import Markup
+
+from .db import get_db, write_transaction
+
+EXPORT_FORMATS = {"html": "text/html", "zip": "application/zip"}
+EXPORT_BATCH_SIZE = 8
+# Config the worker processes need to render texts like the web app does.
+_WORKER_CONFIG_KEYS = (
+    "DATABASE",
+    "CONTENT_DATABASE",
+    "CALENDAR_CHECK_INTERVAL",
+    "CALENDAR_RELOAD_FILE",
+    "CALENDAR_SNAPSHOT_FILE",
+    "TEMPLATE_CACHE_SIZE",
+    "TEXT_RENDER_CACHE_SIZE",
+    "FRAGMENT_CACHE_SIZE",
+)
+
+_worker_app = None
+
+
+class ExportLimitReached(Exception):
+    """Raised when a user already has as many exports running as allowed."""
+
+
+def export_executor(app=None):
+    app = app or current_app
+    executor = app.extensions.get("ordinarium_export_executor")
+    if executor is None:
+        # Worker processes are only started once jobs are submitted. They are
+        # spawned rather than forked, so they start from a clean interpreter
+        # whatever the parent has open.
+        executor = app.extensions.setdefault(
+            "ordinarium_export_executor",
+            ProcessPoolExecutor(
+                max_workers=app.config["EXPORT_WORKERS"],
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=({key: app.config[key] for key in _WORKER_CONFIG_KEYS},),
+            ),
+        )
+    return executor
+
+
+def start_export(user_id, services, export_format):
+    """Queue an export of ``services`` and return the job's uuid.
+
+    ``services`` are rows with ``id``, ``rite`` and ``service_date``, in the
+    order they appear in the bundle. The job is run by ``flask export-worker``,
+    so the request returns as soon as it is queued.
+
+    Raises ``ExportLimitReached`` if the user already has
+    ``EXPORT_MAX_ACTIVE_JOBS`` exports queued or running.
+    """
+    job_uuid = str(uuid.uuid4())
+    db = get_db()
+    with write_transaction(db):
+        fail_stale_exports(db, user_id)
+        active = db.execute(
+            "select count(*) as count from export_jobs where user_id=? and status in ('queued', 'running')",
+            (user_id,),
+        ).fetchone()["count"]
+        if active >= current_app.config["EXPORT_MAX_ACTIVE_JOBS"]:
+            raise ExportLimitReached()
+        db.execute(
+            "insert into export_jobs (job_uuid, user_id, format, total, service_ids) values (?, ?, ?, ?, ?)",
+            (
+                job_uuid,
+                user_id,
+                export_format,
+                len(services),
+                json.dumps([service["id"] for service in services]),
+            ),
+        )
+    return job_uuid
+
+
+def claim_export_job(db):
+    """Mark the oldest queued export as running and return it, or ``None``."""
+    with write_transaction(db):
+        job = db.execute(
+            "select job_uuid, user_id, format, service_ids from export_jobs where status='queued' order by id limit 1"
+        ).fetchone()
+        if job is not None:
+            _update_job(db, job["job_uuid"], status="running", commit=False)
+    return job
+
+
+def process_export_jobs(app):
+    """Run queued exports until none are left; return how many were run."""
+    count = 0
+    while True:
+        with app.app_context():
+            db = get_db()
+            job = claim_export_job(db)
+            if job is None:
+                return count
+            # Services deleted since the job was queued are left out.
+            services = [
+                dict(row)
+                for row in db.execute(
+                    "select id, rite, service_date from services where user_id=? and id in (select value from json_each(?)) order by service_date, id",
+                    (job["user_id"], job["service_ids"]),
+                )
+            ]
+        _run_export(app, job["job_uuid"], job["user_id"], services, job["format"])
+        count += 1
+
+
+@click.command("export-worker")
+@click.option("--once", is_flag=True, help="Exit once the queue is empty.")
+@with_appcontext
+def export_worker_command(once):
+    """Run queued exports, rendering in a pool of EXPORT_WORKERS processes."""
+    app = current_app._get_current_object()
+    try:
+        while True:
+            count = process_export_jobs(app)
+            if once:
+                click.echo(f"Ran {count} exports.")
+                return
+            if not count:
+                time.sleep(app.config["EXPORT_POLL_INTERVAL"])
+    finally:
+        executor = app.extensions.pop("ordinarium_export_executor", None)
+        if executor is not None:
+            executor.shutdown()
+
+
+def fail_stale_exports(db, user_id):
+    """Mark the user's exports that stopped making progress as failed.
+
+    A job whose export worker was stopped is left running, and one queued
+    while no worker is up stays queued; one that has not been updated for
+    ``EXPORT_STALE_AFTER`` seconds is taken to be lost.
+    """
+    db.execute(
+        "update export_jobs set status='failed', error=?, updated_at=CURRENT_TIMESTAMP where user_id=? and status in ('queued', 'running') and updated_at < datetime('now', ?)",
+        (
+            "Export was interrupted.",
+            user_id,
+            f"-{current_app.config['EXPORT_STALE_AFTER']} seconds",
+        ),
+    )
+
+
+def load_export_job(job_uuid, user_id):
+    db = get_db()
+    fail_stale_exports(db, user_id)
+    db.commit()
+    return db.execute(
+        "select job_uuid, format, status, total, completed, skipped, path, error, created_at, updated_at from export_jobs where job_uuid=? and user_id=? limit 1",
+        (job_uuid, user_id),
+    ).fetchone()
+
+
+def render_export_batch(rite_texts, service_ids, user_id):
+    """Render the text of each service in a batch of services of one rite.
+
+    Runs in an export worker process. ``rite_texts`` are the rite's texts,
+    loaded once per rite by the job. Returns the HTML by service id, with
+    ``None`` for services whose text cannot be generated.
+    """
+    # Imported here, as the routes module imports this one.
+    from .routes import (
+        TextUnavailable,
+        get_user_by_id,
+        load_service_for_text,
+        text_page_context,
+    )
+
+    sections = {}
+    with _worker_app.test_request_context():
+        g.user = get_user_by_id(user_id)
+        for service_id in service_ids:
+            saved_service, saved_data = load_service_for_text(service_id, user_id)
+            try:
+                context = text_page_context(
+                    service_id,
+                    saved_service,
+                    saved_data,
+                    user_id=user_id,
+                    text_rows=rite_texts,
+                )
+            except TextUnavailable:
+                sections[service_id] = None
+                continue
+            sections[service_id] = render_template("_text.html", **context)
+    return sections
+
+
+def _init_worker(config):
+    global _worker_app
+    from . import create_app
+
+    _worker_app = create_app()
+    _worker_app.config.update(config)
+
+
+def _run_export(app, job_uuid, user_id, services, export_format):
+    from .routes import load_rite_texts
+
+    with app.app_context():
+        db = get_db()
+        try:
+            executor = export_executor(app)
+            by_rite = {}
+            for service in services:
+                by_rite.setdefault(service["rite"], []).append(service["id"])
+            futures = []
+            for rite, service_ids in by_rite.items():
+                # Resolved once per rite, and shared by every batch of it.
+                rite_texts = [dict(row) for row in load_rite_texts(rite)]
+                for start in range(0, len(service_ids), EXPORT_BATCH_SIZE):
+                    futures.append(
+                        executor.submit(
+                            render_export_batch,
+                            rite_texts,
+                            service_ids[start : start + EXPORT_BATCH_SIZE],
+                            user_id,
+                        )
+                    )
+            sections = {}
+            for future in as_completed(futures):
+                sections.update(future.result())
+                _update_job(
+                    db,
+                    job_uuid,
+                    completed=len(sections),
+                    skipped=sum(section is None for section in sections.values()),
+                )
+            path = _write_bundle(app, job_uuid, services, sections, export_format)
+        except Exception as error:
+            app.logger.exception("Export %s failed", job_uuid)
+            _update_job(db, job_uuid, status="failed", error=str(error))
+        else:
+            _update_job(db, job_uuid, status="done", path=path)
+
+
+def _update_job(db, job_uuid, commit=True, **fields):
+    assignments = ", ".join(f"{name}=?" for name in fields)
+    db.execute(
+        f"update export_jobs set {assignments}, updated_at=CURRENT_TIMESTAMP where job_uuid=?",
+        (*fields.values(), job_uuid),
+    )
+    if commit:
+        db.commit()
+
+
+def _write_bundle(app, job_uuid, services, sections, export_format):
+    template = app.jinja_env.get_template("export.html")
+    with app.open_resource("static/styles/style.css") as f:
+        stylesheet = Markup(f.read().decode("utf-8"))
+    rendered = [
+        (service, Markup(sections[service["id"]]))
+        for service in services
+        if sections.get(service["id"])
+    ]
+    directory = app.config["EXPORT_DIR"]
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{job_uuid}.{export_format}")
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            if export_format == "zip":
+                with zipfile.ZipFile(f, "w", zipfile.ZIP_DEFLATED) as bundle:
+                    for service, section in rendered:
+                        name = f"{service['service_date'] or 'undated'}-{service['id']}"
+                        document = template.render(
+                            title=name, stylesheet=stylesheet, sections=[section]
+                        )
+                        bundle.writestr(f"{name}.html", document)
+            else:
+                dates = [service["service_date"] for service, _ in rendered]
+                dates = [value for value in dates if value]
+                title = "Ordinarium"
+                if dates:
+                    title = f"Ordinarium — {dates[0]} to {dates[-1]}"
+                document = template.render(
+                    title=title,
+                    stylesheet=stylesheet,
+                    sections=[section for _, section in rendered],
+                )
+                f.write(document.encode("utf-8"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return path
@@ -0,0 +1,109 @@
+from datetime import date, timedelta
+
+from .liturgical_calendar import resolve_observance_range
+
+PRODUCT_ID = "-//Ordinarium//Liturgical Calendar//EN"
+
+
+def calendar_lines(name, events):
+    """Yield a VCALENDAR, one CRLF-terminated line at a time."""
+    yield "BEGIN:VCALENDAR\r\n"
+    yield "VERSION:2.0\r\n"
+    yield f"PRODID:{PRODUCT_ID}\r\n"
+    yield "CALSCALE:GREGORIAN\r\n"
+    yield _fold(f"X-WR-CALNAME:{_escape(name)}")
+    for event in events:
+        yield from event
+    yield "END:VCALENDAR\r\n"
+
+
+def observance_events(start, end, stamp, chunk_days=366):
+    # Resolve a year at a time so multi-year feeds never sit in memory.
+    chunk_start = start
+    while chunk_start <= end:
+        # Feeds may end on date.max, so never step past the end date.
+        chunk_end = end
+        if (end - chunk_start).days >= chunk_days:
+            chunk_end = chunk_start + timedelta(days=chunk_days - 1)
+        for day in resolve_observance_range(chunk_start, chunk_end):
+            if not day.observances:
+                continue
+            observance = day.observances[0]
+            yield _all_day_event(
+                uid=f"{day.date:%Y%m%d}-{observance.handle}@ordinarium",
+                event_date=day.date,
+                stamp=stamp,
+                summary=observance.name or observance.alternative_name,
+                categories=day.season,
+            )
+        if chunk_end == end:
+            break
+        chunk_start = chunk_end + timedelta(days=1)
+
+
+def service_events(services, url_for_service, stamp):
+    for service in services:
+        try:
+            event_date = date.fromisoformat(service["service_date"])
+        except (TypeError, ValueError):
+            continue
+        yield _all_day_event(
+            uid=f"service-{service['id']}@ordinarium",
+            event_date=event_date,
+            stamp=stamp,
+            summary=service["title"],
+            url=url_for_service(service["id"]),
+        )
+
+
+def _all_day_event(uid, event_date, stamp, summary, categories=None, url=None):
+    """Return the lines of a one-day VEVENT.
+
+    ``stamp`` is when the feed was generated, in UTC, shared by its events.
+    """
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{uid}",
+        f"DTSTAMP:{stamp:%Y%m%dT%H%M%SZ}",
+        f"DTSTART;VALUE=DATE:{event_date:%Y%m%d}",
+    ]
+    # Without DTEND an all-day event lasts the one day, which is the only
+    # option for date.max.
+    if event_date < date.max:
+        lines.append(f"DTEND;VALUE=DATE:{event_date + timedelta(days=1):%Y%m%d}")
+    lines.append(f"SUMMARY:{_escape(summary or '')}")
+    if categories:
+        lines.append(f"CATEGORIES:{_escape(categories)}")
+    if url:
+        lines.append(f"URL:{url}")
+    lines.append("END:VEVENT")
+    return [_fold(line) for line in lines]
+
+
+def _escape(value):
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line, limit=75):
+    # RFC 5545 folds lines longer than 75 octets without splitting characters.
+    encoded = line.encode("utf-8")
+    if len(encoded) <= limit:
+        return f"{line}\r\n"
+    parts = []
+    current = ""
+    current_size = 0
+    for char in line:
+        size = len(char.encode("utf-8"))
+        if current_size + size > limit:
+            parts.append(current)
+            current = " "
+            current_size = 1
+        current += char
+        current_size += size
+    parts.append(current)
+    return "\r\n".join(parts) + "\r\n"
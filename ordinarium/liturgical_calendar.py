@@ -1,85 +1,152 @@
+import hashlib
+import json
+import os
+import pickle
 import re
+import time
+from bisect import bisect_right
 from dataclasses import dataclass
-from datetime import date, timedelta
+from datetime import MAXYEAR, MINYEAR, date
 from functools import lru_cache
+from pathlib import Path
+from threading import Lock
 from typing import Optional
 
-from .db import get_db
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+from .cache import LRUCache
+from .db import data_version, get_db
+
+OBSERVANCE_YEAR_CACHE_SIZE = 8
+CALENDAR_SNAPSHOT_MAGIC = b"ORDINARIUM-CALENDAR-1\n"
+# The pickled year tables hold instances of this module's classes, so a
+# snapshot is only read by the code that wrote it.
+CALENDAR_SNAPSHOT_HEADER = (
+    CALENDAR_SNAPSHOT_MAGIC
+    + hashlib.sha1(Path(__file__).read_bytes()).hexdigest().encode("ascii")
+    + b"\n"
+)
 
 
 def easter_date(year):
-    # Anonymous Gregorian algorithm.
-    a = year % 19
-    b = year // 100
-    c = year % 100
-    d = b // 4
-    e = b % 4
-    f = (b + 8) // 25
-    g = (b - f + 1) // 3
-    h = (19 * a + b - d - g + 15) % 30
-    i = c // 4
-    k = c % 4
-    l = (32 + 2 * e + 2 * i - h - k) % 7
-    m = (a + 11 * h + 22 * l) // 451
-    month = (h + l - 7 * m + 114) // 31
-    day = ((h + l - 7 * m + 114) % 31) + 1
+    month, day = _computus(year)
     return date(year, month, day)
 
 
 def advent_start(year):
-    nov_27 = date(year, 11, 27)
-    days_until_sunday = (6 - nov_27.weekday()) % 7
-    return nov_27 + timedelta(days=days_until_sunday)
+    return date.fromordinal(_ADVENT_SUNDAY.resolve(year))
+
+
+def movable_anchors(years):
+    """Return ``{year: YearAnchors}`` for many years at once.
+
+    Anchors are ordinals computed with integer arithmetic only, so the season
+    and date-rule evaluators can index into the table without building dates.
+    """
+    table = {}
+    for year in years:
+        table[year] = _year_anchors(year)
+    return table
 
 
 def resolve_season(service_date):
     if not service_date:
         return None
+    starts, labels = _season_boundaries(service_date.year)
+    return labels[bisect_right(starts, service_date.toordinal()) - 1]
 
-    easter = easter_date(service_date.year)
-    ash_wednesday = easter - timedelta(days=46)
-    palm_sunday = easter - timedelta(days=7)
-    maundy_thursday = easter - timedelta(days=3)
-    ascension = easter + timedelta(days=39)
-    pentecost = easter + timedelta(days=49)
-    trinity_sunday = easter + timedelta(days=56)
 
-    advent = advent_start(service_date.year)
-    christ_king = advent - timedelta(days=7)
+def resolve_seasons(service_dates):
+    seasons = []
+    year = None
+    for service_date in service_dates:
+        if not service_date:
+            seasons.append(None)
+            continue
+        if service_date.year != year:
+            year = service_date.year
+            starts, labels = _season_boundaries(year)
+        seasons.append(labels[bisect_right(starts, service_date.toordinal()) - 1])
+    return seasons
+
+
+@lru_cache(maxsize=64)
+def _season_boundaries(year):
+    """Return sorted season start ordinals and their labels for ``year``.
+
+    Every comparison in ``_season_label`` changes outcome only on an anchor
+    or on the day after one, so labelling those days is enough to describe
+    the whole year.
+    """
+    anchors = _year_anchors(year)
+    first = _month_day_ordinal(year, 1, 1)
+    last = _month_day_ordinal(year, 12, 31)
+    candidates = {
+        first,
+        anchors.epiphany,
+        anchors.ash_wednesday,
+        anchors.palm_sunday,
+        anchors.maundy_thursday,
+        anchors.maundy_thursday + 1,
+        anchors.easter,
+        anchors.ascension,
+        anchors.ascension + 1,
+        anchors.pentecost,
+        anchors.pentecost + 1,
+        anchors.trinity_sunday,
+        anchors.trinity_sunday + 1,
+        anchors.christ_the_king,
+        anchors.christ_the_king + 1,
+        anchors.advent,
+        anchors.christmas_eve + 1,
+    }
+    starts = []
+    labels = []
+    for ordinal in sorted(day for day in candidates if first <= day <= last):
+        label = _season_label(ordinal, anchors)
+        if labels and labels[-1] == label:
+            continue
+        starts.append(ordinal)
+        labels.append(label)
+    return tuple(starts), tuple(labels)
+
 
-    if service_date.month == 12 and service_date.day >= 25:
+def _season_label(day, anchors):
+    if day > anchors.christmas_eve:
         return "Christmastide"
-    if service_date.month == 1 and service_date.day <= 5:
+    if day < anchors.epiphany:
         return "Christmastide"
 
-    if service_date == christ_king:
+    if day == anchors.christ_the_king:
         return "Christ the King"
 
-    if advent <= service_date <= date(service_date.year, 12, 24):
+    if anchors.advent <= day <= anchors.christmas_eve:
         return "Advent"
 
-    if date(service_date.year, 1, 6) <= service_date < ash_wednesday:
+    if anchors.epiphany <= day < anchors.ash_wednesday:
         return "Epiphanytide"
 
-    if service_date == maundy_thursday:
+    if day == anchors.maundy_thursday:
         return "Maundy Thursday"
 
-    if palm_sunday <= service_date < easter:
+    if anchors.palm_sunday <= day < anchors.easter:
         return "Holy Week"
 
-    if service_date == ascension:
+    if day == anchors.ascension:
         return "Ascension"
 
-    if service_date == pentecost:
+    if day == anchors.pentecost:
         return "Pentecost"
 
-    if service_date == trinity_sunday:
+    if day == anchors.trinity_sunday:
         return "Trinity Sunday"
 
-    if easter <= service_date < pentecost:
+    if anchors.easter <= day < anchors.pentecost:
         return "Easter"
 
-    if ash_wednesday <= service_date < palm_sunday:
+    if anchors.ash_wednesday <= day < anchors.palm_sunday:
         return "Lent"
 
     return "Ordinary Time"
@@ -107,6 +174,79 @@ class Observance:
     subcycle: Optional[str]
 
 
+@dataclass(frozen=True)
+class YearAnchors:
+    """Movable and fixed season anchors for a civil year, as date ordinals."""
+
+    year: int
+    epiphany: int
+    ash_wednesday: int
+    palm_sunday: int
+    maundy_thursday: int
+    easter: int
+    ascension: int
+    pentecost: int
+    trinity_sunday: int
+    christ_the_king: int
+    advent: int
+    christmas_eve: int
+
+
+@dataclass(frozen=True)
+class CalendarDay:
+    date: date
+    observances: tuple[Observance, ...]
+    season: Optional[str]
+    subcycle: Optional[str]
+
+
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_DAYS_BEFORE_MONTH = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+
+@dataclass(frozen=True)
+class DateExpression:
+    """A parsed date expression: ``E+49``, ``12/25`` or ``11/27→Sun``."""
+
+    easter_offset: Optional[int] = None
+    month: int = 0
+    day: int = 0
+    weekday: Optional[int] = None
+
+    def resolve(self, year):
+        if self.easter_offset is not None:
+            return _easter_ordinal(year) + self.easter_offset
+        ordinal = _month_day_ordinal(year, self.month, self.day)
+        if ordinal is None or self.weekday is None:
+            return ordinal
+        # date.fromordinal(1) is a Monday, so (ordinal - 1) % 7 is the weekday.
+        return ordinal + (self.weekday - (ordinal - 1)) % 7
+
+
+@dataclass(frozen=True)
+class DateRule:
+    """One comma-separated entry of a ``date_rule`` with its condition."""
+
+    base: DateExpression
+    before: Optional[DateExpression] = None
+    not_on: Optional[DateExpression] = None
+
+    def resolve(self, year):
+        base = self.base.resolve(year)
+        if base is None:
+            return None
+        if self.before is not None:
+            bound = self.before.resolve(year)
+            if bound is None or base >= bound:
+                return None
+        if self.not_on is not None and self.not_on.resolve(year) == base:
+            return None
+        return base
+
+
+_ADVENT_SUNDAY = DateExpression(month=11, day=27, weekday=6)
+
+
 def resolve_sunday_title(service_date):
     observance = resolve_observance(service_date)
     if not observance:
@@ -117,18 +257,9 @@ def resolve_sunday_title(service_date):
 def resolve_subcycle(service_date):
     if not service_date:
         return None
-    subcycles = _load_subcycles()
-    if not subcycles:
-        return None
-    epoch_year = subcycles[0]["epoch"]
-    full_cycle = subcycles[0]["full_cycle"]
-    lit_year = _resolve_liturgical_year(service_date)
-    cycle_index = (lit_year - epoch_year) % full_cycle
-    match = next(
-        (cycle for cycle in subcycles if cycle["order"] == cycle_index),
-        None,
+    return _subcycle_for_liturgical_year(
+        _resolve_liturgical_year(service_date), _load_subcycles()
     )
-    return match["handle"] if match else None
 
 
 def resolve_observance(service_date, handle=None):
@@ -147,27 +278,352 @@ def resolve_observance(service_date, handle=None):
 def resolve_observance_options(service_date):
     if not service_date:
         return []
-    matches = _matching_holidays(service_date)
-    if not matches:
+    return list(_calendar_engine().observances(service_date))
+
+
+def resolve_observance_range(start, end):
+    """Resolve every date from ``start`` to ``end`` inclusive in one pass."""
+    if not start or not end or end < start:
         return []
-    options = []
-    for holiday in matches:
-        propers = list(holiday["propers"])
-        if holiday["style"].lower() == "sunday":
-            propers = _apply_fragments(propers, service_date)
-        options.append(
-            Observance(
-                handle=holiday["handle"],
-                name=holiday["name"],
-                alternative_name=holiday["alternative_name"],
-                propers=tuple(_dedupe_list(propers)),
-                style=holiday["style"],
-                priority=holiday["priority"],
-                subcycle=resolve_subcycle(service_date),
+    engine = _calendar_engine()
+    days = []
+    liturgical_year = None
+    for ordinal in range(start.toordinal(), end.toordinal() + 1):
+        current = date.fromordinal(ordinal)
+        if liturgical_year is None or ordinal >= next_advent:
+            liturgical_year = _resolve_liturgical_year(current)
+            next_advent = _ADVENT_SUNDAY.resolve(liturgical_year)
+            table = engine.year_table(liturgical_year)
+            subcycle = _subcycle_for_liturgical_year(
+                liturgical_year, engine.subcycles
+            )
+        days.append(
+            CalendarDay(
+                date=current,
+                observances=table.get(current, ()),
+                season=resolve_season(current),
+                subcycle=subcycle,
+            )
+        )
+    return days
+
+
+class CalendarEngine:
+    """Expands holidays and fragments into per-liturgical-year tables.
+
+    Each table maps a date to its observances, already sorted and with
+    fragments applied, so a lookup is a dictionary hit. Tables are kept in an
+    LRU of liturgical years.
+    """
+
+    def __init__(self, holidays, fragments, subcycles, max_years=None):
+        self.holidays = holidays
+        self.fragments = fragments
+        self.subcycles = subcycles
+        self._years = LRUCache(max_years or OBSERVANCE_YEAR_CACHE_SIZE)
+        self._holiday_index = {}
+        for holiday in holidays:
+            self._holiday_index.setdefault(holiday["handle"], holiday["index"])
+
+    def uses(self, holidays, fragments, subcycles):
+        return (
+            self.holidays is holidays
+            and self.fragments is fragments
+            and self.subcycles is subcycles
+        )
+
+    def observances(self, service_date):
+        table = self.year_table(_resolve_liturgical_year(service_date))
+        return table.get(service_date, ())
+
+    def year_table(self, liturgical_year):
+        return self._years.get_or_set(
+            liturgical_year, lambda: self._build_year_table(liturgical_year)
+        )
+
+    def seed(self, tables):
+        for liturgical_year, table in tables.items():
+            self._years.set(liturgical_year, table)
+
+    def _build_year_table(self, liturgical_year):
+        start = _ADVENT_SUNDAY.resolve(liturgical_year - 1)
+        end = _ADVENT_SUNDAY.resolve(liturgical_year)
+        matches = {}
+        appended = {}
+        for year in (liturgical_year - 1, liturgical_year):
+            if year < MINYEAR or year > MAXYEAR:
+                continue
+            first = max(start, _month_day_ordinal(year, 1, 1))
+            last = min(end, _month_day_ordinal(year, 12, 31) + 1)
+            for holiday in self.holidays:
+                for ordinal in _rule_ordinals(holiday["date"], year, first, last):
+                    matches.setdefault(ordinal, []).append(holiday)
+            for fragment in self.fragments:
+                if fragment["behaviour"] != "Append":
+                    continue
+                for ordinal in _rule_ordinals(fragment["date"], year, first, last):
+                    appended.setdefault(ordinal, []).extend(fragment["propers"])
+
+        subcycle = _subcycle_for_liturgical_year(liturgical_year, self.subcycles)
+        table = {}
+        for ordinal, holidays in matches.items():
+            holidays.sort(key=lambda item: (item["priority"], item["index"]))
+            options = []
+            for holiday in holidays:
+                propers = list(holiday["propers"])
+                if holiday["style"].lower() == "sunday":
+                    propers.extend(appended.get(ordinal, ()))
+                options.append(
+                    Observance(
+                        handle=holiday["handle"],
+                        name=holiday["name"],
+                        alternative_name=holiday["alternative_name"],
+                        propers=tuple(_dedupe_list(propers)),
+                        style=holiday["style"],
+                        priority=holiday["priority"],
+                        subcycle=subcycle,
+                    )
+                )
+            options.sort(
+                key=lambda item: (
+                    item.priority,
+                    self._holiday_index.get(item.handle, 0),
+                )
+            )
+            table[date.fromordinal(ordinal)] = tuple(options)
+        return table
+
+
+class CalendarStore:
+    """Calendar data for one Flask app, reloaded when its data version changes.
+
+    The version combines the ``schema_migrations`` rows with the modification
+    time of the app's reload file, and is checked at most once every
+    ``CALENDAR_CHECK_INTERVAL`` seconds.
+    """
+
+    def __init__(self):
+        self.version = None
+        self.holidays = []
+        self.fragments = []
+        self.subcycles = []
+        self.engine = None
+        self._checked_at = None
+        self._lock = Lock()
+
+    def refresh(self, force=False):
+        config = current_app.config
+        now = time.monotonic()
+        if (
+            not force
+            and self._checked_at is not None
+            and now - self._checked_at < config["CALENDAR_CHECK_INTERVAL"]
+        ):
+            return self
+        with self._lock:
+            db = get_db()
+            version = data_version(db, config["CALENDAR_RELOAD_FILE"])
+            if force or version != self.version:
+                snapshot = _read_calendar_snapshot(
+                    config["CALENDAR_SNAPSHOT_FILE"], version
+                )
+                if snapshot:
+                    self.holidays = snapshot["holidays"]
+                    self.fragments = snapshot["fragments"]
+                    self.subcycles = snapshot["subcycles"]
+                    self.engine = CalendarEngine(
+                        self.holidays, self.fragments, self.subcycles
+                    )
+                    self.engine.seed(snapshot["years"])
+                else:
+                    self.holidays = _read_holidays(db)
+                    self.fragments = _read_fragments(db)
+                    self.subcycles = _read_subcycles(db)
+                    self.engine = None
+                self.version = version
+            self._checked_at = now
+        return self
+
+    def invalidate(self):
+        with self._lock:
+            self.version = None
+            self._checked_at = None
+
+
+def calendar_store(app=None):
+    app = app or current_app
+    return app.extensions.setdefault("ordinarium_calendar", CalendarStore())
+
+
+def warm_calendar(app):
+    with app.app_context():
+        calendar_store(app).refresh(force=True)
+        _calendar_engine().year_table(_resolve_liturgical_year(date.today()))
+
+
+def signal_calendar_reload(app):
+    path = app.config["CALENDAR_RELOAD_FILE"]
+    with open(path, "a", encoding="utf-8"):
+        pass
+    os.utime(path)
+
+
+def write_calendar_snapshot(app):
+    """Write the expanded calendar for the current data version to disk.
+
+    Workers whose data version matches load holidays, fragments, subcycles
+    and the nearby liturgical-year tables from this file instead of SQLite.
+    The file is replaced atomically so running workers never see a partial
+    snapshot.
+    """
+    path = app.config["CALENDAR_SNAPSHOT_FILE"]
+    with app.app_context():
+        db = get_db()
+        version = data_version(db, app.config["CALENDAR_RELOAD_FILE"])
+        holidays = _read_holidays(db)
+        fragments = _read_fragments(db)
+        subcycles = _read_subcycles(db)
+    engine = CalendarEngine(holidays, fragments, subcycles)
+    current = _resolve_liturgical_year(date.today())
+    years = range(current - 2, current - 2 + OBSERVANCE_YEAR_CACHE_SIZE)
+    payload = pickle.dumps(
+        {
+            "version": version,
+            "holidays": holidays,
+            "fragments": fragments,
+            "subcycles": subcycles,
+            "years": {year: engine.year_table(year) for year in years},
+        },
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(CALENDAR_SNAPSHOT_HEADER)
+        f.write(payload)
+    os.replace(temp_path, path)
+    return path
+
+
+def precompute_calendar(start_year, end_year):
+    """Materialize observances for whole civil years into ``calendar_days``.
+
+    Every date in the span gets at least one row (rank 0), with a null handle
+    when nothing is observed, so readers can tell a precomputed date apart
+    from one outside the span.
+    """
+    start = date(start_year, 1, 1)
+    end = date(end_year, 12, 31)
+    rows = []
+    for day in resolve_observance_range(start, end):
+        observances = day.observances or (None,)
+        for rank, observance in enumerate(observances):
+            rows.append(
+                (
+                    day.date.isoformat(),
+                    rank,
+                    observance.handle if observance else None,
+                    (observance.name or observance.alternative_name)
+                    if observance
+                    else None,
+                    observance.priority if observance else None,
+                    day.season,
+                    day.subcycle,
+                    json.dumps(list(observance.propers)) if observance else "[]",
+                )
             )
+    db = get_db()
+    db.execute(
+        "delete from calendar_days where date between ? and ?",
+        (start.isoformat(), end.isoformat()),
+    )
+    db.executemany(
+        "insert into calendar_days (date, rank, handle, title, priority, season, subcycle, propers) values (?, ?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    db.commit()
+    return (end - start).days + 1
+
+
+def refresh_precomputed_calendar():
+    """Re-materialize the civil years already in ``calendar_days``.
+
+    Run whenever the reference data changes, so listing titles and feeds
+    never read observances from an older calendar. Returns the span as
+    ``(start_year, end_year)``, or ``None`` if nothing was precomputed.
+    """
+    span = (
+        get_db()
+        .execute("select min(date) as first, max(date) as last from calendar_days")
+        .fetchone()
+    )
+    if span["first"] is None:
+        return None
+    start_year, end_year = int(span["first"][:4]), int(span["last"][:4])
+    calendar_store().invalidate()
+    precompute_calendar(start_year, end_year)
+    return start_year, end_year
+
+
+@click.command("precompute-calendar")
+@click.option("--start-year", type=int, help="First civil year (default: 10 years ago).")
+@click.option("--end-year", type=int, help="Last civil year (default: 10 years ahead).")
+@with_appcontext
+def precompute_calendar_command(start_year, end_year):
+    today = date.today()
+    start_year = start_year or today.year - 10
+    end_year = end_year or today.year + 10
+    if end_year < start_year:
+        raise click.BadParameter("--end-year must not be before --start-year.")
+    count = precompute_calendar(start_year, end_year)
+    click.echo(f"Precomputed {count} calendar days for {start_year}-{end_year}.")
+
+
+@click.command("snapshot-calendar")
+@with_appcontext
+def snapshot_calendar_command():
+    path = write_calendar_snapshot(current_app)
+    click.echo(f"Wrote calendar snapshot to {path}.")
+
+
+@click.command("reload-calendar")
+@with_appcontext
+def reload_calendar_command():
+    signal_calendar_reload(current_app)
+    span = refresh_precomputed_calendar()
+    if span:
+        click.echo(f"Precomputed calendar days for {span[0]}-{span[1]}.")
+    click.echo("Signalled workers to reload calendar data.")
+
+
+def _calendar_engine():
+    store = calendar_store().refresh()
+    holidays = _load_holidays()
+    fragments = _load_fragments()
+    subcycles = _load_subcycles()
+    if store.engine is None or not store.engine.uses(holidays, fragments, subcycles):
+        store.engine = CalendarEngine(holidays, fragments, subcycles)
+    return store.engine
+
+
+def _read_calendar_snapshot(path, version):
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if not data.startswith(CALENDAR_SNAPSHOT_HEADER):
+        return None
+    try:
+        snapshot = pickle.loads(data[len(CALENDAR_SNAPSHOT_HEADER) :])
+    except Exception:
+        # Any damaged snapshot falls back to reading the database.
+        current_app.logger.warning(
+            "Ignoring unreadable calendar snapshot %s", path, exc_info=True
         )
-    options.sort(key=lambda item: (item.priority, _holiday_index(item.handle)))
-    return options
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("version") != version:
+        return None
+    return snapshot
 
 
 def _resolve_liturgical_year(service_date):
@@ -177,61 +633,38 @@ def _resolve_liturgical_year(service_date):
     return current_year
 
 
-def _matching_holidays(service_date):
-    holidays = _load_holidays()
-    if not holidays:
-        return []
-    matches = []
-    for holiday in holidays:
-        for match_date in _expand_date_rules(holiday["date"], service_date.year):
-            if match_date == service_date:
-                matches.append(holiday)
-                break
-    matches.sort(key=lambda item: (item["priority"], item["index"]))
-    return matches
+def _subcycle_for_liturgical_year(liturgical_year, subcycles):
+    if not subcycles:
+        return None
+    epoch_year = subcycles[0]["epoch"]
+    full_cycle = subcycles[0]["full_cycle"]
+    cycle_index = (liturgical_year - epoch_year) % full_cycle
+    match = next(
+        (cycle for cycle in subcycles if cycle["order"] == cycle_index),
+        None,
+    )
+    return match["handle"] if match else None
 
 
-def _holiday_index(handle):
-    for holiday in _load_holidays():
-        if holiday["handle"] == handle:
-            return holiday["index"]
-    return 0
+def _rule_ordinals(date_field, year, first, last):
+    # A rule only ever matches dates it resolves to within its own year.
+    seen = set()
+    for rule in _compile_date_rules(date_field):
+        ordinal = rule.resolve(year)
+        if ordinal is not None and first <= ordinal < last and ordinal not in seen:
+            seen.add(ordinal)
+            yield ordinal
 
 
 def _expand_date_rules(date_field, year):
-    if not date_field or date_field == "_":
-        return []
     dates = []
-    for rule in [part.strip() for part in date_field.split(",") if part.strip()]:
-        base_rule, condition = _split_rule_condition(rule)
-        base_date = _parse_date_expression(base_rule, year)
-        if not base_date:
-            continue
-        if condition:
-            condition_lower = condition.lower()
-            if condition_lower.startswith("before "):
-                bound_date = _parse_date_expression(condition[7:].strip(), year)
-                if not bound_date or base_date >= bound_date:
-                    continue
-            elif condition_lower.startswith("not on "):
-                excluded_date = _parse_date_expression(condition[7:].strip(), year)
-                if excluded_date and base_date == excluded_date:
-                    continue
-        dates.append(base_date)
+    for rule in _compile_date_rules(date_field):
+        ordinal = rule.resolve(year)
+        if ordinal is not None:
+            dates.append(date.fromordinal(ordinal))
     return dates
 
 
-def _apply_fragments(propers, service_date):
-    for fragment in _load_fragments():
-        if fragment["behaviour"] != "Append":
-            continue
-        for match_date in _expand_date_rules(fragment["date"], service_date.year):
-            if match_date == service_date:
-                propers.extend(fragment["propers"])
-                break
-    return propers
-
-
 def _split_rule_condition(rule):
     match = re.match(r"^(.*?)\s*\((.*?)\)\s*$", rule)
     if not match:
@@ -240,36 +673,129 @@ def _split_rule_condition(rule):
 
 
 def _parse_date_expression(expression, year):
+    compiled = _compile_date_expression(expression)
+    if compiled is None:
+        return None
+    ordinal = compiled.resolve(year)
+    if ordinal is None:
+        return None
+    return date.fromordinal(ordinal)
+
+
+@lru_cache(maxsize=None)
+def _compile_date_rules(date_field):
+    """Parse a comma-separated ``date_rule`` field into ``DateRule`` objects.
+
+    Rules are compiled once per distinct string; resolving them for a year
+    afterwards is integer arithmetic on proleptic Gregorian ordinals.
+    """
+    if not date_field or date_field == "_":
+        return ()
+    rules = []
+    for part in [part.strip() for part in date_field.split(",") if part.strip()]:
+        base_rule, condition = _split_rule_condition(part)
+        base = _compile_date_expression(base_rule)
+        if base is None:
+            continue
+        before = None
+        not_on = None
+        if condition:
+            condition_lower = condition.lower()
+            if condition_lower.startswith("before "):
+                before = _compile_date_expression(condition[7:].strip())
+                if before is None:
+                    continue
+            elif condition_lower.startswith("not on "):
+                not_on = _compile_date_expression(condition[7:].strip())
+        rules.append(DateRule(base=base, before=before, not_on=not_on))
+    return tuple(rules)
+
+
+def _compile_date_expression(expression):
     if not expression:
         return None
     expression = expression.strip().replace(" ", "")
     if not expression or expression == "_":
         return None
     if expression.startswith("E"):
-        easter = easter_date(year)
         if expression == "E":
-            return easter
+            return DateExpression(easter_offset=0)
         match = re.match(r"^E([+-]\d+)$", expression)
         if match:
-            return easter + timedelta(days=int(match.group(1)))
+            return DateExpression(easter_offset=int(match.group(1)))
         return None
+    weekday = None
     if "→" in expression:
-        base_expr, _, weekday = expression.partition("→")
-        base_date = _parse_date_expression(base_expr, year)
-        target_weekday = WEEKDAY_MAP.get(weekday.title())
-        if base_date and target_weekday is not None:
-            return _next_weekday(base_date, target_weekday)
-        return None
+        expression, _, weekday_name = expression.partition("→")
+        weekday = WEEKDAY_MAP.get(weekday_name.title())
+        if weekday is None:
+            return None
     try:
         month_str, day_str = expression.split("/")
-        return date(year, int(month_str), int(day_str))
+        month, day = int(month_str), int(day_str)
     except ValueError:
         return None
+    if not 1 <= month <= 12 or not 1 <= day <= 31:
+        return None
+    return DateExpression(month=month, day=day, weekday=weekday)
+
+
+def _easter_ordinal(year):
+    return _year_anchors(year).easter
+
+
+def _computus(year):
+    # Anonymous Gregorian algorithm.
+    a = year % 19
+    b = year // 100
+    c = year % 100
+    d = b // 4
+    e = b % 4
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i = c // 4
+    k = c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month = (h + l - 7 * m + 114) // 31
+    day = ((h + l - 7 * m + 114) % 31) + 1
+    return month, day
+
+
+@lru_cache(maxsize=None)
+def _year_anchors(year):
+    easter = _month_day_ordinal(year, *_computus(year))
+    advent = _ADVENT_SUNDAY.resolve(year)
+    return YearAnchors(
+        year=year,
+        epiphany=_month_day_ordinal(year, 1, 6),
+        ash_wednesday=easter - 46,
+        palm_sunday=easter - 7,
+        maundy_thursday=easter - 3,
+        easter=easter,
+        ascension=easter + 39,
+        pentecost=easter + 49,
+        trinity_sunday=easter + 56,
+        christ_the_king=advent - 7,
+        advent=advent,
+        christmas_eve=_month_day_ordinal(year, 12, 24),
+    )
+
 
+def _is_leap_year(year):
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
 
-def _next_weekday(start_date, target_weekday):
-    days_until = (target_weekday - start_date.weekday()) % 7
-    return start_date + timedelta(days=days_until)
+
+def _month_day_ordinal(year, month, day):
+    if day > _DAYS_IN_MONTH[month] + (month == 2 and _is_leap_year(year)):
+        return None
+    previous = year - 1
+    ordinal = previous * 365 + previous // 4 - previous // 100 + previous // 400
+    ordinal += _DAYS_BEFORE_MONTH[month] + day
+    if month > 2 and _is_leap_year(year):
+        ordinal += 1
+    return ordinal
 
 
 def _dedupe_list(items):
@@ -296,10 +822,20 @@ def _parse_propers(value):
     return [item.strip() for item in value.split(",") if item.strip() and item != "_"]
 
 
-@lru_cache(maxsize=1)
 def _load_holidays():
+    return calendar_store().refresh().holidays
+
+
+def _load_fragments():
+    return calendar_store().refresh().fragments
+
+
+def _load_subcycles():
+    return calendar_store().refresh().subcycles
+
+
+def _read_holidays(db):
     holidays = []
-    db = get_db()
     rows = db.execute(
         "select id, handle, date_rule, style, priority, propers, name, alternative_name from holidays order by id"
     ).fetchall()
@@ -319,10 +855,8 @@ def _load_holidays():
     return holidays
 
 
-@lru_cache(maxsize=1)
-def _load_fragments():
+def _read_fragments(db):
     fragments = []
-    db = get_db()
     rows = db.execute(
         "select date_rule, behaviour, propers from fragments order by id"
     ).fetchall()
@@ -337,10 +871,8 @@ def _load_fragments():
     return fragments
 
 
-@lru_cache(maxsize=1)
-def _load_subcycles():
+def _read_subcycles(db):
     subcycles = []
-    db = get_db()
     rows = db.execute(
         "select handle, epoch, order_value, full_cycle from subcycles order by id"
     ).fetchall()
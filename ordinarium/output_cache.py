@@ -0,0 +1,92 @@
+import os
+import tempfile
+
+from flask import current_app
+
+from .cache import LRUCache
+
+
+class OutputCache:
+    """Rendered pages in a bounded in-process LRU, optionally backed by disk.
+
+    Keys must change whenever the page would, so entries are never
+    invalidated: superseded ones age out of the LRU, and the disk tier keeps
+    at most ``disk_entries`` files, dropping the oldest first. The disk tier
+    lets every gunicorn worker reuse a page any one of them rendered.
+    """
+
+    def __init__(self, maxsize=256, directory=None, disk_entries=1024):
+        self.memory = LRUCache(maxsize)
+        self.directory = directory
+        self.disk_entries = disk_entries
+
+    def get(self, key):
+        body = self.memory.get(key)
+        if body is None and self.directory:
+            body = self._read(key)
+            if body is not None:
+                self.memory.set(key, body)
+        return body
+
+    def set(self, key, body):
+        self.memory.set(key, body)
+        if self.directory:
+            try:
+                self._write(key, body)
+            except OSError:
+                current_app.logger.warning(
+                    "Could not write output cache entry %s", key, exc_info=True
+                )
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.html")
+
+    def _read(self, key):
+        try:
+            with open(self._path(key), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write(self, key, body):
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(body)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+        self._prune()
+
+    def _prune(self):
+        entries = [
+            entry
+            for entry in os.scandir(self.directory)
+            if entry.name.endswith(".html")
+        ]
+        excess = len(entries) - self.disk_entries
+        if excess <= 0:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime_ns)
+        for entry in entries[:excess]:
+            try:
+                os.unlink(entry.path)
+            except OSError:
+                pass
+
+
+def share_cache(app=None):
+    app = app or current_app
+    cache = app.extensions.get("ordinarium_share_cache")
+    if cache is None:
+        cache = app.extensions.setdefault(
+            "ordinarium_share_cache",
+            OutputCache(
+                app.config["SHARE_CACHE_SIZE"],
+                app.config["SHARE_CACHE_DIR"],
+                app.config["SHARE_CACHE_DISK_ENTRIES"],
+            ),
+        )
+    return cache
@@ -0,0 +1,187 @@
+import json
+from bisect import bisect_left
+
+
+def normalize_plan_token(value):
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return f"text:{int(value)}"
+    if isinstance(value, str):
+        raw = value.strip()
+        if not raw:
+            return None
+        if ":" in raw:
+            return raw
+        if raw.isdigit():
+            return f"text:{raw}"
+    return None
+
+
+def parse_plan_tokens(raw):
+    if not raw:
+        return []
+    data = raw
+    if isinstance(raw, str):
+        try:
+            data = json.loads(raw)
+        except json.JSONDecodeError:
+            return []
+    if not isinstance(data, list):
+        return []
+    tokens = []
+    for value in data:
+        token = normalize_plan_token(value)
+        if token:
+            tokens.append(token)
+    return tokens
+
+
+def load_plan(db, service_id, saved_service=None):
+    """Return a service's plan as ``(order_tokens, disabled_tokens)``.
+
+    ``saved_service`` is the service's row, with ``text_order`` and
+    ``text_disabled`` columns; its legacy JSON plan is used when the service
+    has no plan rows yet.
+    """
+    rows = db.execute(
+        "select token, position, disabled from service_items where service_id=? order by position",
+        (service_id,),
+    ).fetchall()
+    if not rows:
+        if saved_service is None:
+            return [], []
+        return (
+            parse_plan_tokens(saved_service["text_order"]),
+            parse_plan_tokens(saved_service["text_disabled"]),
+        )
+    order_tokens = [row["token"] for row in rows if row["position"] is not None]
+    disabled_tokens = [row["token"] for row in rows if row["disabled"]]
+    return order_tokens, disabled_tokens
+
+
+def save_plan(db, service_id, order_tokens, disabled_tokens):
+    """Store a service's plan, writing only the rows that changed.
+
+    Items keep their position unless they moved relative to the others, so
+    dragging one element or toggling it writes a single row. Disabled tokens
+    that are not in the order are kept without a position.
+    """
+    order_tokens = list(dict.fromkeys(order_tokens))
+    disabled = set(disabled_tokens)
+    current = {
+        row["token"]: row
+        for row in db.execute(
+            "select id, token, position, disabled from service_items where service_id=?",
+            (service_id,),
+        )
+    }
+    if not current:
+        # The plan is moving out of the legacy JSON; drop it so it cannot
+        # resurface if every row is later removed.
+        db.execute(
+            "update services set data=json_remove(data, '$.text_order', '$.text_disabled') where id=? and (text_order is not null or text_disabled is not null)",
+            (service_id,),
+        )
+    positions = plan_positions(
+        order_tokens,
+        {
+            token: row["position"]
+            for token, row in current.items()
+            if row["position"] is not None
+        },
+    )
+    for token in dict.fromkeys(disabled_tokens):
+        positions.setdefault(token, None)
+
+    deleted = [(row["id"],) for token, row in current.items() if token not in positions]
+    updated = []
+    inserted = []
+    for token, position in positions.items():
+        flag = int(token in disabled)
+        row = current.get(token)
+        if row is None:
+            inserted.append((service_id, token, position, flag))
+        elif row["position"] != position or row["disabled"] != flag:
+            updated.append((position, flag, row["id"]))
+    if deleted:
+        db.executemany("delete from service_items where id=?", deleted)
+    if updated:
+        db.executemany(
+            "update service_items set position=?, disabled=? where id=?", updated
+        )
+    if inserted:
+        db.executemany(
+            "insert into service_items (service_id, token, position, disabled) values (?, ?, ?, ?)",
+            inserted,
+        )
+
+
+def plan_positions(tokens, positions):
+    """Return a position for each of ``tokens``, in order.
+
+    ``positions`` are the current positions of tokens already in the plan.
+    The longest run of them that is still in order is kept; the other tokens
+    are placed in the gaps between, and everything is renumbered only once
+    the gaps run out of floating point precision.
+    """
+    placed = [positions.get(token) for token in tokens]
+    kept = set(increasing_subsequence(placed))
+    result = {}
+    index = 0
+    while index < len(tokens):
+        if index in kept:
+            result[tokens[index]] = placed[index]
+            index += 1
+            continue
+        end = index
+        while end < len(tokens) and end not in kept:
+            end += 1
+        low = result[tokens[index - 1]] if index else None
+        high = placed[end] if end < len(tokens) else None
+        count = end - index
+        if low is None and high is None:
+            values = [float(offset + 1) for offset in range(count)]
+        elif high is None:
+            values = [low + offset + 1 for offset in range(count)]
+        elif low is None:
+            values = [high - count + offset for offset in range(count)]
+        else:
+            step = (high - low) / (count + 1)
+            values = [low + step * (offset + 1) for offset in range(count)]
+        bounds = [value for value in (low, *values, high) if value is not None]
+        if any(a >= b for a, b in zip(bounds, bounds[1:])):
+            return {token: float(offset + 1) for offset, token in enumerate(tokens)}
+        for token, value in zip(tokens[index:end], values):
+            result[token] = value
+        index = end
+    return result
+
+
+def increasing_subsequence(values):
+    """Indices of a longest strictly increasing run of ``values``.
+
+    ``None`` values are skipped.
+    """
+    tails = []
+    tail_values = []
+    previous = {}
+    for index, value in enumerate(values):
+        if value is None:
+            continue
+        slot = bisect_left(tail_values, value)
+        previous[index] = tails[slot - 1] if slot else None
+        if slot == len(tails):
+            tails.append(index)
+            tail_values.append(value)
+        else:
+            tails[slot] = index
+            tail_values[slot] = value
+    indices = []
+    index = tails[-1] if tails else None
+    while index is not None:
+        indices.append(index)
+        index = previous[index]
+    return indices[::-1]
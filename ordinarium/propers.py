@@ -0,0 +1,202 @@
+import json
+import random
+import time
+from threading import Lock
+
+from flask import current_app
+
+from .cache import LRUCache
+from .db import data_version, get_db
+
+POOLED_TEXT_TYPES = ("acclamation", "offertory_sentence", "proper_preface")
+ANY_TIME_FILTERS = (("other", "At Any Time"), ("day", "The Lord’s Day"))
+APPOINTED_TEXTS_CACHE_SIZE = 1024
+# The first collect, and the first lesson for each reading, across the propers
+# in order. Optional lessons and lessons for other subcycles are skipped.
+APPOINTED_TEXTS_SELECT = (
+    "select type, reading, text, book, book_name, reference_long, reference_short "
+    "from (select texts.type, texts.reading, texts.text, "
+    "json_extract(texts.data, '$.book') as book, "
+    "json_extract(texts.data, '$.book_name') as book_name, "
+    "json_extract(texts.data, '$.reference_long') as reference_long, "
+    "json_extract(texts.data, '$.reference_short') as reference_short, "
+    "row_number() over (partition by texts.type, texts.reading "
+    "order by propers.key, texts.default_order, texts.id) as pick "
+    "from json_each(:propers) propers "
+    "join texts on texts.type in ('collect', 'lesson') and texts.filter_type='proper' "
+    "and texts.filter_content=propers.value "
+    "where texts.type='collect' or (not coalesce(texts.optional, 0) "
+    "and (:subcycle is null or texts.subcycles is null "
+    "or json_array_length(texts.subcycles)=0 "
+    "or exists (select 1 from json_each(texts.subcycles) where value=:subcycle)))) "
+    "where pick=1"
+)
+
+
+class TextPools:
+    """Candidate texts for the propers chosen at random, grouped by filter.
+
+    Pools are keyed by ``(type, filter_type, filter_content)`` and hold
+    ``(id, text)`` pairs in id order. Like the calendar, they are reloaded
+    when the data version changes.
+    """
+
+    def __init__(self):
+        self.version = None
+        self.pools = {}
+        self.by_type = {}
+        self.appointed = LRUCache(APPOINTED_TEXTS_CACHE_SIZE)
+        self._checked_at = None
+        self._lock = Lock()
+
+    def refresh(self, force=False):
+        config = current_app.config
+        now = time.monotonic()
+        if (
+            not force
+            and self._checked_at is not None
+            and now - self._checked_at < config["CALENDAR_CHECK_INTERVAL"]
+        ):
+            return self
+        with self._lock:
+            db = get_db()
+            version = data_version(db, config["CALENDAR_RELOAD_FILE"])
+            if force or version != self.version:
+                self.pools, self.by_type = _read_text_pools(db)
+                self.appointed.clear()
+                self.version = version
+            self._checked_at = now
+        return self
+
+    def candidates(self, text_type, filters=None):
+        if filters is None:
+            return self.by_type.get(text_type, [])
+        candidates = []
+        for filter_type, filter_content in filters:
+            candidates.extend(
+                self.pools.get((text_type, filter_type, filter_content), [])
+            )
+        return sorted(candidates)
+
+    def appointed_texts(self, propers, subcycle=None):
+        """Return the collect and lessons appointed for ``propers``."""
+        key = (tuple(propers), subcycle)
+        return self.appointed.get_or_set(
+            key, lambda: _read_appointed_texts(get_db(), key[0], subcycle)
+        )
+
+    def invalidate(self):
+        with self._lock:
+            self.version = None
+            self._checked_at = None
+
+
+def text_pools(app=None):
+    app = app or current_app
+    return app.extensions.setdefault("ordinarium_text_pools", TextPools())
+
+
+def choose_text(text_type, filters=None, seed=None):
+    """Pick one text of ``text_type`` matching any of ``filters``.
+
+    ``filters`` is a sequence of ``(filter_type, filter_content)`` pairs;
+    without it every text of the type is a candidate. A given seed always
+    picks the same text from the same candidates.
+    """
+    candidates = text_pools().refresh().candidates(text_type, filters)
+    if not candidates:
+        return None
+    chooser = random.Random(f"{seed}:{text_type}") if seed is not None else random
+    return chooser.choice(candidates)[1]
+
+
+def resolve_propers(propers, subcycle=None, season=None, seed=None):
+    """Return the proper texts and references for a service's text.
+
+    ``propers`` are the observance's proper handles in order of preference.
+    Missing texts are replaced with an error message for the reader.
+    """
+    pools = text_pools().refresh()
+    appointed = pools.appointed_texts(propers, subcycle) if propers else {}
+
+    acclamation = None
+    if season:
+        acclamation = choose_text("acclamation", [("season", season)], seed=seed)
+    if not acclamation:
+        acclamation = choose_text("acclamation", ANY_TIME_FILTERS, seed=seed)
+    proper_preface = None
+    if season:
+        proper_preface = choose_text("proper_preface", [("season", season)], seed=seed)
+    if not proper_preface:
+        proper_preface = choose_text("proper_preface", ANY_TIME_FILTERS, seed=seed)
+    offertory_sentence = choose_text("offertory_sentence", seed=seed)
+
+    readings = appointed.get("readings", {})
+    return {
+        "acclamation": acclamation or "*Error: No acclamation found.*",
+        "collect_of_the_day": (
+            appointed.get("collect") or "*Error: No collect found for this date.*"
+        ),
+        "lesson_1_reference": _format_reference(readings.get(1))
+        or "*Error: No first lesson found.*",
+        "psalm_reference": _format_reference(readings.get(2))
+        or "*Error: No psalm found.*",
+        "lesson_2_reference": _format_reference(readings.get(3))
+        or "*Error: No second lesson found.*",
+        "gospel_reference": _format_reference(readings.get(5))
+        or "*Error: No gospel found.*",
+        "offertory_sentence": (
+            offertory_sentence or "*Error: No offertory sentence found.*"
+        ),
+        "proper_preface": proper_preface or "*Error: No proper preface found.*",
+    }
+
+
+def _format_reference(lesson):
+    if not lesson:
+        return None
+    reference_short = lesson["reference_short"]
+    if reference_short and reference_short.strip() == "_":
+        reference_short = None
+    reference = reference_short or lesson["reference_long"]
+    if not reference:
+        return None
+    book_name = lesson["book_name"] or lesson["book"]
+    if not book_name:
+        return reference
+    return f"{book_name} ({reference})"
+
+
+def _read_appointed_texts(db, propers, subcycle):
+    rows = db.execute(
+        APPOINTED_TEXTS_SELECT,
+        {"propers": json.dumps(list(propers)), "subcycle": subcycle},
+    ).fetchall()
+    appointed = {"collect": None, "readings": {}}
+    for row in rows:
+        if row["type"] == "collect":
+            appointed["collect"] = row["text"]
+        else:
+            appointed["readings"][row["reading"]] = {
+                "book": row["book"],
+                "book_name": row["book_name"],
+                "reference_long": row["reference_long"],
+                "reference_short": row["reference_short"],
+            }
+    return appointed
+
+
+def _read_text_pools(db):
+    placeholders = ", ".join("?" for _ in POOLED_TEXT_TYPES)
+    rows = db.execute(
+        f"select id, type, filter_type, filter_content, text from texts where type in ({placeholders}) order by id",
+        POOLED_TEXT_TYPES,
+    ).fetchall()
+    pools = {}
+    by_type = {}
+    for row in rows:
+        candidate = (row["id"], row["text"])
+        key = (row["type"], row["filter_type"], row["filter_content"])
+        pools.setdefault(key, []).append(candidate)
+        by_type.setdefault(row["type"], []).append(candidate)
+    return pools, by_type
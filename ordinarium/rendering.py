@@ -0,0 +1,386 @@
+import hashlib
+import json
+import re
+import sqlite3
+
+import click
+import markdown2
+from flask import current_app
+from flask.cli import with_appcontext
+from jinja2 import meta, nodes
+from jinja2.utils import missing
+from markupsafe import escape
+
+from .cache import LRUCache
+from .db import get_db
+
+MARKDOWN_EXTRAS = [
+    "fenced-code-blocks",
+    "code-friendly",
+    # 'target-blank-links',
+    "markdown-in-html",
+    "footnotes",
+]
+
+# Slot values are spliced into pre-rendered HTML only when markdown could not
+# have treated them differently in context: plain inline text for `{{ name }}`,
+# and a run of simple paragraphs and headings (passed through as raw HTML) for
+# `{{ name | markdown }}`. Anything else takes the full render path.
+_PLAIN_SLOT_VALUE_RE = re.compile(
+    r"(?!\d+\.)[^\W_](?:[^\W_]|[,.;:'’()\-–—]| (?! ))*(?<! )\Z"
+)
+_BLOCK_SLOT_HTML_RE = re.compile(
+    r"(?:<(p|h[1-6])>(?:(?!</?(?:p|h[1-6])\b).)*</\1>\n+)+\Z", re.DOTALL
+)
+_SLOT_SENTINEL = "ORDINARIUMSLOT{}X"
+# Cached for sources that have no pre-rendered row, so they are only looked
+# up once; prerender_texts clears the cache along with the rows.
+_NOT_PRERENDERED = object()
+_PARAGRAPH_OPEN_RE = re.compile(r"<p\b[^>]*>")
+_PARAGRAPH_BREAK_RE = re.compile(r"</p>|(?i:<br\s*/?>)")
+_TRAILING_INDENT_CLASS_RE = re.compile(
+    r'class=["\'][^"\']*\btrailing-indent\b[^"\']*["\']',
+    re.IGNORECASE,
+)
+_SLOT_PROBES = {
+    None: ("Probe", "Saint John's (3:16-21)"),
+    "markdown": (
+        "Probe.",
+        "First *paragraph*.\n\nSecond paragraph.",
+        "Line one  \nLine **two**.",
+        "A sentence of Scripture.\n###### Acts 20:35",
+    ),
+}
+
+
+def template_cache(app=None):
+    app = app or current_app
+    cache = app.extensions.get("ordinarium_templates")
+    if cache is None:
+        cache = app.extensions.setdefault(
+            "ordinarium_templates", LRUCache(app.config["TEMPLATE_CACHE_SIZE"])
+        )
+    return cache
+
+
+def text_render_cache(app=None):
+    app = app or current_app
+    cache = app.extensions.get("ordinarium_text_renders")
+    if cache is None:
+        cache = app.extensions.setdefault(
+            "ordinarium_text_renders", LRUCache(app.config["TEXT_RENDER_CACHE_SIZE"])
+        )
+    return cache
+
+
+def fragment_cache(app=None):
+    app = app or current_app
+    cache = app.extensions.get("ordinarium_fragments")
+    if cache is None:
+        cache = app.extensions.setdefault(
+            "ordinarium_fragments", LRUCache(app.config["FRAGMENT_CACHE_SIZE"])
+        )
+    return cache
+
+
+def compiled_template(environment, source, app=None):
+    # Keyed by content, so an edited text simply misses and its old
+    # compilation ages out of the LRU.
+    key = source_hash(source)
+    return template_cache(app).get_or_set(key, lambda: environment.from_string(source))
+
+
+def source_hash(source):
+    return hashlib.sha1(source.encode("utf-8")).hexdigest()
+
+
+def markdown_html(source):
+    """Convert markdown to HTML, using the pre-rendered copy when there is one."""
+    prerendered = _prerendered_text("markdown", source)
+    if prerendered is not None:
+        return prerendered["html"]
+    return markdown2.markdown(source, extras=MARKDOWN_EXTRAS)
+
+
+def render_markdown_template(environment, source, context):
+    """Render a text as a Jinja template, then convert it from markdown.
+
+    Texts pre-rendered by ``prerender-texts`` skip both steps: static texts
+    are served as stored, and texts with slots only have their propers
+    interpolated between stored HTML fragments.
+    """
+    prerendered = _prerendered_text("template", source)
+    if prerendered is not None:
+        if prerendered["fragments"] is None:
+            return prerendered["html"]
+        html_text = _interpolate_slots(
+            json.loads(prerendered["fragments"]), context, markdown_html
+        )
+        if html_text is not None:
+            return html_text
+    rendered = compiled_template(environment, source).render(context)
+    return markdown2.markdown(rendered, extras=MARKDOWN_EXTRAS)
+
+
+def template_variables(environment, source):
+    """Return the names a text reads from its template context."""
+    key = ("variables", source_hash(source))
+    return fragment_cache().get_or_set(
+        key,
+        lambda: frozenset(meta.find_undeclared_variables(environment.parse(source))),
+    )
+
+
+def cached_fragment(environment, element_key, source, context, render):
+    """Return ``render()`` for one element of a text, cached across pages.
+
+    The HTML is keyed by ``element_key``, the source and the values of the
+    variables the source references in the Jinja ``context``, so any page
+    binding the same values shares it. Elements reading anything other than
+    plain values, such as the current user, are rendered every time.
+    """
+    bindings = []
+    for name in sorted(template_variables(environment, source)):
+        value = context.resolve_or_missing(name)
+        if value is missing:
+            bindings.append((name,))
+        elif value is None or isinstance(value, (str, int, float)):
+            bindings.append((name, value))
+        else:
+            return render()
+    key = (
+        *element_key,
+        source_hash(source),
+        hashlib.sha1(repr(bindings).encode("utf-8")).hexdigest(),
+    )
+    return fragment_cache().get_or_set(key, render)
+
+
+def wrap_trailing_indent(html_text):
+    """Indent the text that follows a leading ``<em>`` rubric in a paragraph.
+
+    Each ``<br>``-separated line of a paragraph that starts with an ``<em>``
+    and continues after it has the rest wrapped in a ``trailing-indent``
+    span. The HTML is read in one pass from paragraph tag to line break.
+    """
+    output = []
+    position = 0
+    length = len(html_text)
+    while position < length:
+        opening = _PARAGRAPH_OPEN_RE.search(html_text, position)
+        if opening is None:
+            break
+        segments = []
+        line_start = opening.end()
+        while True:
+            tag = _PARAGRAPH_BREAK_RE.search(html_text, line_start)
+            if tag is None:
+                # An unclosed paragraph is left as it is, with everything after it.
+                segments = None
+                break
+            segments.append(_wrap_trailing_segment(html_text[line_start : tag.start()]))
+            segments.append(tag.group())
+            line_start = tag.end()
+            if tag.group() == "</p>":
+                break
+        if segments is None:
+            break
+        output.append(html_text[position : opening.end()])
+        output.extend(segments)
+        position = line_start
+    output.append(html_text[position:])
+    return "".join(output)
+
+
+def _wrap_trailing_segment(segment):
+    stripped = segment.lstrip()
+    if not stripped.startswith("<em>"):
+        return segment
+    em_end = stripped.find("</em>", 4)
+    if em_end < 0:
+        return segment
+    em_end += 5
+    remainder = stripped[em_end:]
+    if not remainder.strip() or _TRAILING_INDENT_CLASS_RE.search(remainder):
+        return segment
+    leading = segment[: len(segment) - len(stripped)]
+    return (
+        f'{leading}{stripped[:em_end]}<span class="trailing-indent">{remainder}</span>'
+    )
+
+
+def prerender_texts():
+    """Store rendered HTML for every title and text in ``text_renders``.
+
+    Returns ``(static, slotted)`` counts of template renders stored.
+    """
+    environment = current_app.jinja_env
+    db = get_db()
+    template_sources = set()
+    markdown_sources = set()
+    for row in db.execute("select title, text from texts"):
+        if row["title"]:
+            template_sources.add(row["title"])
+        if row["text"]:
+            template_sources.add(row["text"])
+            markdown_sources.add(row["text"])
+
+    rows = []
+    static = slotted = 0
+    for source in sorted(template_sources):
+        split = _split_template(environment, source)
+        if split is None:
+            continue
+        parts, slots = split
+        if not slots:
+            html_text = markdown2.markdown(
+                compiled_template(environment, source).render(),
+                extras=MARKDOWN_EXTRAS,
+            )
+            rows.append((source_hash(source), "template", html_text, None))
+            static += 1
+            continue
+        fragments = _slot_fragments(environment, source, parts, slots)
+        if fragments is None:
+            continue
+        rows.append((source_hash(source), "template", None, json.dumps(fragments)))
+        slotted += 1
+    for source in sorted(markdown_sources):
+        html_text = markdown2.markdown(source, extras=MARKDOWN_EXTRAS)
+        rows.append((source_hash(source), "markdown", html_text, None))
+
+    db.execute("delete from text_renders")
+    db.executemany(
+        "insert into text_renders (source_hash, kind, html, fragments) values (?, ?, ?, ?)",
+        rows,
+    )
+    db.commit()
+    text_render_cache().clear()
+    return static, slotted
+
+
+@click.command("prerender-texts")
+@with_appcontext
+def prerender_texts_command():
+    static, slotted = prerender_texts()
+    click.echo(f"Pre-rendered {static} static and {slotted} slotted texts.")
+
+
+def _prerendered_text(kind, source):
+    if not source:
+        return None
+    key = (kind, source_hash(source))
+    cache = text_render_cache()
+    row = cache.get(key)
+    if row is _NOT_PRERENDERED:
+        return None
+    if row is not None:
+        return row
+    try:
+        row = (
+            get_db()
+            .execute(
+                "select html, fragments from text_renders where source_hash=? and kind=?",
+                (key[1], kind),
+            )
+            .fetchone()
+        )
+    except sqlite3.OperationalError:
+        # Databases that have not been migrated yet render everything live.
+        return None
+    if row is None:
+        cache.set(key, _NOT_PRERENDERED)
+        return None
+    row = {"html": row["html"], "fragments": row["fragments"]}
+    cache.set(key, row)
+    return row
+
+
+def _split_template(environment, source):
+    """Split a template into literal parts and the slots between them.
+
+    Returns ``None`` for anything beyond bare ``{{ name }}`` and
+    ``{{ name | markdown }}`` expressions.
+    """
+    parts = [""]
+    slots = []
+    for node in environment.parse(source).body:
+        if not isinstance(node, nodes.Output):
+            return None
+        for child in node.nodes:
+            if isinstance(child, nodes.TemplateData):
+                parts[-1] += child.data
+            elif isinstance(child, nodes.Name):
+                slots.append({"name": child.name, "filter": None})
+                parts.append("")
+            elif (
+                isinstance(child, nodes.Filter)
+                and child.name == "markdown"
+                and isinstance(child.node, nodes.Name)
+                and not child.args
+                and not child.kwargs
+                and child.dyn_args is None
+                and child.dyn_kwargs is None
+            ):
+                slots.append({"name": child.node.name, "filter": "markdown"})
+                parts.append("")
+            else:
+                return None
+    return parts, slots
+
+
+def _slot_fragments(environment, source, parts, slots):
+    sentinels = []
+    marked = [parts[0]]
+    for index, (slot, part) in enumerate(zip(slots, parts[1:])):
+        sentinel = _SLOT_SENTINEL.format(index)
+        if slot["filter"] == "markdown":
+            sentinel = f"<p>{sentinel}</p>\n"
+        sentinels.append(sentinel)
+        marked.extend((sentinel, part))
+    remaining = markdown2.markdown("".join(marked), extras=MARKDOWN_EXTRAS)
+    html_parts = []
+    for sentinel in sentinels:
+        before, found, remaining = remaining.partition(sentinel)
+        if not found:
+            return None
+        html_parts.append(before)
+    html_parts.append(remaining)
+    fragments = {"parts": html_parts, "slots": slots}
+
+    # Only keep the split if it renders exactly like the template does.
+    template = compiled_template(environment, source)
+    probe_count = max(len(probes) for probes in _SLOT_PROBES.values())
+    for probe_index in range(probe_count):
+        context = {}
+        for slot in slots:
+            probes = _SLOT_PROBES[slot["filter"]]
+            context[slot["name"]] = probes[probe_index % len(probes)]
+        expected = markdown2.markdown(template.render(context), extras=MARKDOWN_EXTRAS)
+        actual = _interpolate_slots(
+            fragments,
+            context,
+            lambda value: markdown2.markdown(value, extras=MARKDOWN_EXTRAS),
+        )
+        if actual != expected:
+            return None
+    return fragments
+
+
+def _interpolate_slots(fragments, context, render_markdown):
+    parts = fragments["parts"]
+    output = [parts[0]]
+    for slot, part in zip(fragments["slots"], parts[1:]):
+        value = context.get(slot["name"])
+        if not isinstance(value, str):
+            return None
+        if slot["filter"] == "markdown":
+            slot_html = render_markdown(value)
+            if not _BLOCK_SLOT_HTML_RE.match(slot_html):
+                return None
+        else:
+            if not _PLAIN_SLOT_VALUE_RE.match(value):
+                return None
+            slot_html = str(escape(value))
+        output.extend((slot_html, part))
+    return "".join(output)
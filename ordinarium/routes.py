@@ -1,8 +1,11 @@
+import hashlib
+import itertools
 import json
+import secrets
 import uuid
 from urllib.parse import urlparse
 from functools import wraps
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 
 from flask import (
     Blueprint,
@@ -14,22 +17,51 @@ from flask import (
     render_template,
     request,
     session,
+    send_file,
     send_from_directory,
+    stream_template,
+    stream_with_context,
     url_for,
 )
 from werkzeug.security import check_password_hash, generate_password_hash
 
 import ordinarium
 
-from .db import get_db
+from .db import connection_pool, get_db, write_transaction
+from .exports import (
+    EXPORT_FORMATS,
+    ExportLimitReached,
+    load_export_job,
+    start_export,
+)
+from .ics import calendar_lines, observance_events, service_events
 from .liturgical_calendar import (
+    calendar_store,
     resolve_observance,
     resolve_observance_options,
+    resolve_observance_range,
     resolve_season,
 )
+from .output_cache import share_cache
+from .plans import load_plan, normalize_plan_token, save_plan
+from .propers import resolve_propers
 
 bp = Blueprint("main", __name__)
 DEFAULT_RITE = "Renewed Ancient Text"
+OBSERVANCE_RANGE_MAX_DAYS = 1096
+CALENDAR_FEED_DEFAULT_YEARS = 3
+CALENDAR_FEED_MAX_YEARS = 10
+# Listing queries pick up precomputed observance titles from calendar_days;
+# calendar_date is null for dates outside the precomputed span.
+SERVICE_LISTING_SELECT = (
+    "select services.id, services.title, services.service_date, services.data, "
+    "coalesce(chosen.title, fallback.title) as observance_title, "
+    "fallback.date as calendar_date "
+    "from services "
+    "left join calendar_days fallback on fallback.date=services.service_date and fallback.rank=0 "
+    "left join calendar_days chosen on chosen.date=services.service_date "
+    "and chosen.handle=json_extract(services.data, '$.observance_handle') "
+)
 
 
 # Utility functions
@@ -64,6 +96,11 @@ def health():
     return jsonify({"status": "ok"})
 
 
+@bp.route("/health/database")
+def health_database():
+    return jsonify(connection_pool().stats())
+
+
 @bp.route("/login", methods=["GET", "POST"])
 def login():
     if g.user:
@@ -182,43 +219,6 @@ def render_error(message, status_code=400):
     return render_template("page.html", title="Error", content=""), status_code
 
 
-def normalize_plan_token(value):
-    if value is None:
-        return None
-    if isinstance(value, bool):
-        return None
-    if isinstance(value, (int, float)):
-        return f"text:{int(value)}"
-    if isinstance(value, str):
-        raw = value.strip()
-        if not raw:
-            return None
-        if ":" in raw:
-            return raw
-        if raw.isdigit():
-            return f"text:{raw}"
-    return None
-
-
-def parse_plan_tokens(raw):
-    if not raw:
-        return []
-    data = raw
-    if isinstance(raw, str):
-        try:
-            data = json.loads(raw)
-        except json.JSONDecodeError:
-            return []
-    if not isinstance(data, list):
-        return []
-    tokens = []
-    for value in data:
-        token = normalize_plan_token(value)
-        if token:
-            tokens.append(token)
-    return tokens
-
-
 def load_custom_elements(service_id, user_id=None):
     if not service_id:
         return []
@@ -256,7 +256,9 @@ def format_services(services):
         title = None
         saved_data = json.loads(service["data"]) if service["data"] else {}
         observance_handle = saved_data.get("observance_handle")
-        if service["service_date"]:
+        if "calendar_date" in service.keys() and service["calendar_date"]:
+            title = service["observance_title"]
+        elif service["service_date"]:
             try:
                 observance = resolve_observance(
                     date.fromisoformat(service["service_date"]),
@@ -299,12 +301,22 @@ def load_custom_templates(user_id):
     ]
 
 
-def build_plan_items(service_id, rite, order_tokens, disabled_tokens, user_id=None):
-    db = get_db()
-    text_rows = db.execute(
-        "select id, default_order, title, detailed_title, text from texts where type=? and filter_type=? and filter_content=? order by default_order",
-        ("ordinarium", "rite", rite),
-    ).fetchall()
+def load_rite_texts(rite):
+    return (
+        get_db()
+        .execute(
+            "select id, default_order, title, detailed_title, text from texts where type=? and filter_type=? and filter_content=? order by default_order",
+            ("ordinarium", "rite", rite),
+        )
+        .fetchall()
+    )
+
+
+def build_plan_items(
+    service_id, rite, order_tokens, disabled_tokens, user_id=None, text_rows=None
+):
+    if text_rows is None:
+        text_rows = load_rite_texts(rite)
     text_items = []
     items_by_token = {}
     for row in text_rows:
@@ -415,12 +427,42 @@ def account():
             return redirect(url_for("main.account"))
     if error:
         flash(error, "error")
+    calendar_feed_url = None
+    if data.get("calendar_token"):
+        calendar_feed_url = url_for(
+            "main.user_calendar_feed",
+            feed_token=data["calendar_token"],
+            _external=True,
+        )
     return render_template(
         "account.html",
         first_name=user["first_name"] if user else "",
         last_name=user["last_name"] if user else "",
         email=user["email"] if user else "",
+        calendar_feed_url=calendar_feed_url,
+    )
+
+
+@bp.route("/account/calendar-feed", methods=["POST"])
+@login_required
+def account_calendar_feed():
+    db = get_db()
+    user = get_user_by_id(g.user["id"])
+    data = json.loads(user["data"]) if user["data"] else {}
+    created = False
+    if not data.get("calendar_token"):
+        data["calendar_token"] = secrets.token_urlsafe(24)
+        db.execute(
+            "update users set data=? where id=?", (json.dumps(data), g.user["id"])
+        )
+        db.commit()
+        created = True
+    feed_url = url_for(
+        "main.user_calendar_feed", feed_token=data["calendar_token"], _external=True
     )
+    if "application/json" in request.headers.get("Accept", ""):
+        return jsonify({"feed_url": feed_url, "created": created})
+    return redirect(url_for("main.account"))
 
 
 @bp.route("/templates", methods=["GET", "POST"])
@@ -494,7 +536,8 @@ def index():
         db = get_db()
         today = date.today().isoformat()
         rows = db.execute(
-            "select id, title, service_date, data from services where user_id=? and service_date is not null and service_date >= ? order by service_date asc limit 5",
+            SERVICE_LISTING_SELECT
+            + "where services.user_id=? and services.service_date is not null and services.service_date >= ? order by services.service_date asc limit 5",
             (g.user["id"], today),
         ).fetchall()
         upcoming_services = format_services(rows)
@@ -511,10 +554,7 @@ def build_plan_context(service_id, rite):
     saved_data = (
         json.loads(saved_plan["data"]) if saved_plan and saved_plan["data"] else {}
     )
-    order_tokens = parse_plan_tokens(saved_plan["text_order"]) if saved_plan else []
-    disabled_tokens = (
-        parse_plan_tokens(saved_plan["text_disabled"]) if saved_plan else []
-    )
+    order_tokens, disabled_tokens = load_plan(db, service_id, saved_plan)
     ordinaries = build_plan_items(
         service_id,
         rite,
@@ -582,11 +622,8 @@ def build_plan_context(service_id, rite):
 @bp.route("/service/<int:service_id>")
 @login_required
 def service(service_id, rite=DEFAULT_RITE):
-    db = get_db()
-    existing_owner = db.execute(
-        "select user_id from services where id=? limit 1", (service_id,)
-    ).fetchone()
-    if existing_owner and existing_owner["user_id"] != g.user["id"]:
+    owner = service_owner(get_db(), service_id)
+    if owner is not None and owner != g.user["id"]:
         return render_error("Service not found.", 404)
     context = build_plan_context(service_id, rite)
     return render_template("service.html", **context)
@@ -606,15 +643,18 @@ def services():
     db = get_db()
     today = date.today().isoformat()
     current_services = db.execute(
-        "select id, title, service_date, data from services where user_id=? and service_date is not null and service_date >= ? order by service_date asc",
+        SERVICE_LISTING_SELECT
+        + "where services.user_id=? and services.service_date is not null and services.service_date >= ? order by services.service_date asc",
         (g.user["id"], today),
     ).fetchall()
     past_services = db.execute(
-        "select id, title, service_date, data from services where user_id=? and service_date is not null and service_date < ? order by service_date desc",
+        SERVICE_LISTING_SELECT
+        + "where services.user_id=? and services.service_date is not null and services.service_date < ? order by services.service_date desc",
         (g.user["id"], today),
     ).fetchall()
     copy_services = db.execute(
-        "select id, title, service_date, data from services where user_id=? and rite=? order by service_date desc",
+        SERVICE_LISTING_SELECT
+        + "where services.user_id=? and services.rite=? order by services.service_date desc",
         (g.user["id"], DEFAULT_RITE),
     ).fetchall()
 
@@ -631,9 +671,6 @@ def services():
 @login_required
 def services_new():
     db = get_db()
-    next_id = db.execute(
-        "select coalesce(max(id), 0) + 1 as next_id from services"
-    ).fetchone()
     if request.method == "POST":
         mode = request.form.get("mode", "defaults")
         if mode == "copy":
@@ -655,17 +692,14 @@ def services_new():
             if source_data.get("rite") != rite:
                 return render_error("Service rite does not match.", 400)
 
-            custom_rows = db.execute(
-                "select id, title, text, created_at from service_custom_elements where service_id=? and user_id=? order by created_at, id",
-                (source_id, g.user["id"]),
-            ).fetchall()
-            custom_id_map = {}
-            for row in custom_rows:
-                cursor = db.execute(
-                    "insert into service_custom_elements (service_id, user_id, title, text) values (?, ?, ?, ?)",
-                    (next_id["next_id"], g.user["id"], row["title"], row["text"]),
-                )
-                custom_id_map[row["id"]] = cursor.lastrowid
+            payload = {
+                "user_id": g.user["id"],
+                "title": None,
+                "rite": source_data.get("rite", DEFAULT_RITE),
+                "season": None,
+                "service_date": None,
+                "observance_handle": None,
+            }
 
             def remap_tokens(tokens):
                 remapped = []
@@ -682,56 +716,159 @@ def services_new():
                     remapped.append(token)
                 return remapped
 
-            order_tokens = remap_tokens(
-                parse_plan_tokens(source_data.get("text_order"))
-            )
-            disabled_tokens = remap_tokens(
-                parse_plan_tokens(source_data.get("text_disabled"))
-            )
-            payload = {
-                "user_id": g.user["id"],
-                "title": None,
-                "rite": source_data.get("rite", DEFAULT_RITE),
-                "season": None,
-                "service_date": None,
-                "observance_handle": None,
-                "text_order": json.dumps(order_tokens),
-                "text_disabled": json.dumps(disabled_tokens),
-            }
-            db.execute(
-                "insert into services (id, data) values (?, ?)",
-                (next_id["next_id"], json.dumps(payload)),
-            )
-            db.commit()
-            return redirect(
-                url_for("main.service", service_id=next_id["next_id"])
-            )
-    return redirect(url_for("main.service", service_id=next_id["next_id"]))
+            with write_transaction(db):
+                source = db.execute(
+                    "select text_order, text_disabled from services where id=? limit 1",
+                    (source_id,),
+                ).fetchone()
+                order_tokens, disabled_tokens = load_plan(db, source_id, source)
+                custom_rows = db.execute(
+                    "select id, title, text, created_at from service_custom_elements where service_id=? and user_id=? order by created_at, id",
+                    (source_id, g.user["id"]),
+                ).fetchall()
+                service_id = next_service_id(db)
+                insert_service(db, service_id, payload)
+                # The copies' ids are claimed up front rather than read back
+                # one insert at a time.
+                first_custom_id = next_custom_element_id(db, len(custom_rows))
+                custom_id_map = {
+                    row["id"]: first_custom_id + offset
+                    for offset, row in enumerate(custom_rows)
+                }
+                db.executemany(
+                    "insert into service_custom_elements (id, service_id, user_id, title, text) values (?, ?, ?, ?, ?)",
+                    [
+                        (
+                            custom_id_map[row["id"]],
+                            service_id,
+                            g.user["id"],
+                            row["title"],
+                            row["text"],
+                        )
+                        for row in custom_rows
+                    ],
+                )
+                save_plan(
+                    db,
+                    service_id,
+                    remap_tokens(order_tokens),
+                    remap_tokens(disabled_tokens),
+                )
+                touch_service(db, service_id)
+            return redirect(url_for("main.service", service_id=service_id))
+        with write_transaction(db):
+            service_id = reserve_service_id(db, g.user["id"])
+        return redirect(url_for("main.service", service_id=service_id))
+    # Reserving an id is a write, so it is left to the form on the services
+    # page rather than done for every visit, prefetch or crawl.
+    return redirect(url_for("main.services"))
+
+
+def next_service_id(db):
+    """Claim an id for a new service. Must be called in a write transaction.
+
+    Ids come from ``service_id_sequence`` and are never handed out twice,
+    even once the service that had one is deleted.
+    """
+    service_id = db.execute(
+        "select max(coalesce((select last_id from service_id_sequence where id=1), 0), (select coalesce(max(id), 0) from services), (select coalesce(max(id), 0) from service_drafts)) + 1 as next_id"
+    ).fetchone()["next_id"]
+    db.execute(
+        "insert or replace into service_id_sequence (id, last_id) values (1, ?)",
+        (service_id,),
+    )
+    return service_id
+
+
+def reserve_service_id(db, user_id):
+    """Reserve an id for a service the user is about to create.
+
+    The service is only written when it is first saved; until then its
+    draft keeps the id from being handed out again or saved by another user.
+    Must be called in a write transaction.
+    """
+    service_id = next_service_id(db)
+    # The user's older drafts need no reservation any more, as no id is
+    # handed out twice.
+    db.execute("delete from service_drafts where user_id=?", (user_id,))
+    db.execute(
+        "insert into service_drafts (id, user_id) values (?, ?)", (service_id, user_id)
+    )
+    return service_id
+
+
+def next_custom_element_id(db, count=1):
+    """Claim ``count`` consecutive ids for new custom elements.
+
+    Returns the first. Like service ids, they are never handed out twice;
+    the update takes the write lock before the ids are read back.
+    """
+    db.execute(
+        "update custom_element_id_sequence set last_id=max(last_id, (select coalesce(max(id), 0) from service_custom_elements)) + ? where id=1",
+        (count,),
+    )
+    last_id = db.execute(
+        "select last_id from custom_element_id_sequence where id=1"
+    ).fetchone()["last_id"]
+    return last_id - count + 1
+
+
+def insert_service(db, service_id, data):
+    db.execute(
+        "insert into services (id, data) values (?, ?)",
+        (service_id, json.dumps(data)),
+    )
+    db.execute("delete from service_drafts where id=?", (service_id,))
+
+
+def service_owner(db, service_id):
+    # The id of a service not saved yet belongs to the user who reserved it.
+    row = db.execute(
+        "select user_id from services where id=? union all select user_id from service_drafts where id=? limit 1",
+        (service_id, service_id),
+    ).fetchone()
+    return row["user_id"] if row else None
 
 
 @bp.route("/service/<int:service_id>/delete", methods=["POST"])
 @login_required
 def service_delete(service_id):
     db = get_db()
-    db.execute(
+    cursor = db.execute(
         "delete from services where id=? and user_id=?", (service_id, g.user["id"])
     )
+    if cursor.rowcount:
+        # The id is never reused, but nothing of the service should linger.
+        db.execute("delete from service_shares where service_id=?", (service_id,))
+        db.execute("delete from service_items where service_id=?", (service_id,))
+        db.execute(
+            "delete from service_custom_elements where service_id=?", (service_id,)
+        )
     db.commit()
     return redirect(url_for("main.services"))
 
 
+def touch_service(db, service_id):
+    # Every write to a service or its custom elements bumps the revision,
+    # which keys cached renders of the service's text.
+    db.execute(
+        "update services set data=json_set(data, '$.revision', coalesce(revision, 0) + 1, '$.updated_at', datetime('now')) where id=?",
+        (service_id,),
+    )
+
+
 def load_service_for_text(service_id, user_id=None):
     if not service_id:
         return None, {}
     db = get_db()
     if user_id:
         saved_service = db.execute(
-            "select text_order, text_disabled, season, rite, service_date, data from services where id=? and user_id=? limit 1",
+            "select text_order, text_disabled, season, rite, service_date, revision, updated_at, data from services where id=? and user_id=? limit 1",
             (service_id, user_id),
         ).fetchone()
     else:
         saved_service = db.execute(
-            "select text_order, text_disabled, season, rite, service_date, data from services where id=? limit 1",
+            "select text_order, text_disabled, season, rite, service_date, revision, updated_at, data from services where id=? limit 1",
             (service_id,),
         ).fetchone()
     saved_data = (
@@ -742,76 +879,132 @@ def load_service_for_text(service_id, user_id=None):
     return saved_service, saved_data
 
 
+def parse_updated_at(value):
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+def requested_season(saved_service):
+    # Services without a saved season take it from the query string.
+    if saved_service and saved_service["season"]:
+        return ""
+    return request.args.get("season", "")
+
+
+def service_page_etag(*parts):
+    return hashlib.sha1(
+        repr(parts + (calendar_store().refresh().version,)).encode("utf-8")
+    ).hexdigest()
+
+
+def service_page_response(etag, updated_at, render, public=False):
+    """Answer a conditional GET for a service page, rendering only if needed.
+
+    ``render`` returns the page body, which may be streamed, or an error
+    response tuple to pass through.
+    Public pages may be stored by shared caches; others must be revalidated
+    by the browser on every use. Only ``If-None-Match`` is honoured, as the
+    page also changes with inputs that ``Last-Modified`` does not reflect.
+    """
+    last_modified = parse_updated_at(updated_at)
+    if request.if_none_match.contains(etag):
+        response = current_app.response_class(status=304)
+    else:
+        body = render()
+        if isinstance(body, tuple):
+            return body
+        response = current_app.response_class(body, mimetype="text/html")
+    response.set_etag(etag)
+    if last_modified:
+        response.last_modified = last_modified
+    if public:
+        response.cache_control.public = True
+        response.cache_control.max_age = current_app.config["SHARE_CACHE_MAX_AGE"]
+        response.vary.add("Cookie")
+    else:
+        response.cache_control.private = True
+        response.cache_control.no_cache = True
+    return response
+
+
+def propers_seed(service_id, saved_service):
+    # Changes whenever the service is saved, so a given version of a service
+    # always shows the same acclamation, offertory sentence and preface.
+    digest = hashlib.sha1((saved_service["data"] or "").encode("utf-8")).hexdigest()
+    return f"{service_id}:{digest}"
+
+
+class TextUnavailable(Exception):
+    """Raised when a service's text cannot be generated."""
+
+    def __init__(self, message, status_code):
+        super().__init__(message)
+        self.status_code = status_code
+
+
 def render_text_page(service_id, saved_service, saved_data, user_id=None):
+    try:
+        context = text_page_context(
+            service_id, saved_service, saved_data, user_id=user_id
+        )
+    except TextUnavailable as error:
+        return render_error(str(error), error.status_code)
+    if session.get("_flashes"):
+        # The session cookie is saved before a streamed body runs, so flashed
+        # messages popped while streaming would be shown again on the next
+        # page.
+        return render_template("text.html", **context)
+    # Streamed, so the first sections reach the browser while later ones are
+    # still rendering. Each section is rendered once per set of propers it
+    # uses and then served from the fragment cache.
+    return stream_template("text.html", **context)
+
+
+def text_page_context(
+    service_id, saved_service, saved_data, user_id=None, text_rows=None
+):
+    """Return the template context for a service's text.
+
+    ``text_rows`` are the rite's texts, for callers rendering many services
+    of the same rite; they are loaded here otherwise.
+    """
     if not saved_service:
-        return render_error("Service ID required to generate text.", 400)
-    db = get_db()
+        raise TextUnavailable("Service ID required to generate text.", 400)
 
     # Update not to be hard coded:
     # title = "<!--<small>The Order for the Administration of</small>  \nThe Lord’s Supper  \n<small>*or*</small>  \nHoly Communion,  \n<small>Commonly Called</small>  \n-->The Holy Eucharist"
     title = "The Holy Eucharist"
 
     if not saved_service["rite"]:
-        return render_error("Service rite is required to generate text.", 400)
+        raise TextUnavailable("Service rite is required to generate text.", 400)
     rite_name = saved_service["rite"]
-    rite = db.execute(
-        "select distinct filter_content from texts where type=? and filter_type=? and filter_content=? limit 1",
-        ("ordinarium", "rite", rite_name),
-    ).fetchone()
-    if not rite:
-        return render_error("Rite not found.", 404)
+    if text_rows is None:
+        text_rows = load_rite_texts(rite_name)
+    if not text_rows:
+        raise TextUnavailable("Rite not found.", 404)
 
-    order_tokens = parse_plan_tokens(saved_service["text_order"])
-    disabled_tokens = parse_plan_tokens(saved_service["text_disabled"])
+    order_tokens, disabled_tokens = load_plan(get_db(), service_id, saved_service)
     plan_items = build_plan_items(
         service_id,
         rite_name,
         order_tokens,
         disabled_tokens,
         user_id=user_id,
+        text_rows=text_rows,
     )
-    ordinaries = [
-        {"title": item["title"], "text": item["text"], "type": item.get("type")}
-        for item in plan_items
-        if not item.get("disabled")
-    ]
-    if not ordinaries:
-        return render_error("Content not found.", 404)
+    if all(item.get("disabled") for item in plan_items):
+        raise TextUnavailable("Content not found.", 404)
 
     season = request.args.get("season", "")
     if service_id:
         if saved_service and saved_service["season"]:
             season = saved_service["season"]
 
-    # Move propers selection to class
-    acclamation = None
-    if season:
-        acclamation = db.execute(
-            "select text from texts where type=? and filter_type=? and filter_content=? order by random() limit 1",
-            ("acclamation", "season", season),
-        ).fetchone()
-    if not acclamation:
-        acclamation = db.execute(
-            "select text from texts where type=? and ((filter_type=? and filter_content=?) or (filter_type=? and filter_content=?)) order by random() limit 1",
-            ("acclamation", "other", "At Any Time", "day", "The Lord’s Day"),
-        ).fetchone()
-    offertory_sentence = db.execute(
-        "select text from texts where type=? order by random() limit 1",
-        ("offertory_sentence",),
-    ).fetchone()
-    proper_preface = None
-    if season:
-        proper_preface = db.execute(
-            "select text from texts where type=? and filter_type=? and filter_content=? order by random() limit 1",
-            ("proper_preface", "season", season),
-        ).fetchone()
-    if not proper_preface:
-        proper_preface = db.execute(
-            "select text from texts where type=? and ((filter_type=? and filter_content=?) or (filter_type=? and filter_content=?)) order by random() limit 1",
-            ("proper_preface", "other", "At Any Time", "day", "The Lord’s Day"),
-        ).fetchone()
     observance = None
-    propers_list = []
     if saved_service and saved_service["service_date"]:
         try:
             observance = resolve_observance(
@@ -820,82 +1013,12 @@ def render_text_page(service_id, saved_service, saved_data, user_id=None):
             )
         except ValueError:
             observance = None
-    if observance:
-        propers_list = list(observance.propers)
-
-    collect_text = None
-    if propers_list:
-        propers_json = json.dumps(propers_list)
-        collect_text = db.execute(
-            "select texts.text from texts join json_each(?) propers on texts.filter_content=propers.value where texts.type=? and texts.filter_type=? order by propers.key, texts.default_order limit 1",
-            (propers_json, "collect", "proper"),
-        ).fetchone()
-
-    lessons = []
-    if propers_list:
-        propers_json = json.dumps(propers_list)
-        lessons = db.execute(
-            "select texts.data from texts join json_each(?) propers on texts.filter_content=propers.value where texts.type=? and texts.filter_type=? order by propers.key, texts.default_order",
-            (propers_json, "lesson", "proper"),
-        ).fetchall()
-
-    subcycle = observance.subcycle if observance else None
-    readings = {}
-    if lessons:
-        for row in lessons:
-            lesson = json.loads(row["data"])
-            if lesson.get("optional"):
-                continue
-            lesson_subcycles = lesson.get("subcycles") or []
-            if lesson_subcycles and subcycle and subcycle not in lesson_subcycles:
-                continue
-            reading_number = lesson.get("reading")
-            if reading_number in readings:
-                continue
-            readings[reading_number] = lesson
-
-    def format_reference(lesson):
-        if not lesson:
-            return None
-        reference_short = lesson.get("reference_short")
-        if reference_short and reference_short.strip() == "_":
-            reference_short = None
-        reference = reference_short or lesson.get("reference_long")
-        if not reference:
-            return None
-        book_name = lesson.get("book_name") or lesson.get("book")
-        if not book_name:
-            return reference
-        return f"{book_name} ({reference})"
-
-    propers = {
-        "acclamation": (
-            acclamation["text"] if acclamation else "*Error: No acclamation found.*"
-        ),
-        "collect_of_the_day": (
-            collect_text["text"]
-            if collect_text
-            else "*Error: No collect found for this date.*"
-        ),
-        "lesson_1_reference": format_reference(readings.get(1))
-        or "*Error: No first lesson found.*",
-        "psalm_reference": format_reference(readings.get(2))
-        or "*Error: No psalm found.*",
-        "lesson_2_reference": format_reference(readings.get(3))
-        or "*Error: No second lesson found.*",
-        "gospel_reference": format_reference(readings.get(5))
-        or "*Error: No gospel found.*",
-        "offertory_sentence": (
-            offertory_sentence["text"]
-            if offertory_sentence
-            else "*Error: No offertory sentence found.*"
-        ),
-        "proper_preface": (
-            proper_preface["text"]
-            if proper_preface
-            else "*Error: No proper preface found.*"
-        ),
-    }
+    propers = resolve_propers(
+        observance.propers if observance else (),
+        subcycle=observance.subcycle if observance else None,
+        season=season,
+        seed=propers_seed(service_id, saved_service),
+    )
     service_title = observance.name or observance.alternative_name if observance else ""
     service_date_display = ""
     if saved_service and saved_service["service_date"]:
@@ -906,43 +1029,114 @@ def render_text_page(service_id, saved_service, saved_data, user_id=None):
             )
         except ValueError:
             service_date_display = ""
-    generated_at = datetime.now()
+    # Derived from the last edit rather than the clock, so the page only
+    # changes when the service does and can be served conditionally.
+    generated_at = parse_updated_at(saved_service["updated_at"])
+    generated_at = generated_at.astimezone() if generated_at else datetime.now()
     generated_at_display = (
         f"{generated_at.strftime('%B')} {generated_at.day}, {generated_at.year} "
         f"at {generated_at.strftime('%I:%M %p').lstrip('0')}"
     )
-    return render_template(
-        "text.html",
-        title=title,
-        rite=rite_name,
-        service_title=service_title,
-        service_date_display=service_date_display,
-        generated_at_display=generated_at_display,
-        ordinaries=ordinaries,
+    return {
+        "title": title,
+        "rite": rite_name,
+        "service_title": service_title,
+        "service_date_display": service_date_display,
+        "generated_at_display": generated_at_display,
+        "ordinaries": iter_ordinaries(plan_items),
         **propers,
-    )
+    }
+
+
+def iter_ordinaries(plan_items):
+    for item in plan_items:
+        if not item.get("disabled"):
+            # Keys the element's cached fragments. Library texts are known by
+            # id; custom elements only by their content, which is in the key.
+            key = ("text", item["id"]) if item.get("type") == "text" else ("custom",)
+            yield {
+                "title": item["title"],
+                "text": item["text"],
+                "type": item.get("type"),
+                "key": key,
+            }
 
 
 @bp.route("/text/<int:service_id>")
 @login_required
 def text(service_id):
     saved_service, saved_data = load_service_for_text(service_id, g.user["id"])
-    return render_text_page(service_id, saved_service, saved_data, user_id=g.user["id"])
+    if not saved_service or not saved_service["updated_at"] or session.get("_flashes"):
+        return render_text_page(
+            service_id, saved_service, saved_data, user_id=g.user["id"]
+        )
+    etag = service_page_etag(
+        "text",
+        service_id,
+        g.user["id"],
+        g.user["first_name"],
+        saved_service["revision"],
+        saved_service["updated_at"],
+        requested_season(saved_service),
+    )
+    return service_page_response(
+        etag,
+        saved_service["updated_at"],
+        lambda: render_text_page(
+            service_id, saved_service, saved_data, user_id=g.user["id"]
+        ),
+    )
 
 
 @bp.route("/share/<share_uuid>")
 def shared_text(share_uuid):
     db = get_db()
     share = db.execute(
-        "select service_id from service_shares where share_uuid=? limit 1",
+        "select service_shares.service_id, services.id as found_id, services.revision, services.updated_at, services.season from service_shares left join services on services.id=service_shares.service_id where service_shares.share_uuid=? limit 1",
         (share_uuid,),
     ).fetchone()
     if not share:
         return render_error("Share link not found.", 404)
-    saved_service, saved_data = load_service_for_text(share["service_id"])
-    if not saved_service:
+    if not share["found_id"]:
         return render_error("Service not found.", 404)
-    return render_text_page(share["service_id"], saved_service, saved_data)
+    if g.user or session.get("_flashes"):
+        # The header names the logged-in user, and flashed messages belong to
+        # one visitor, so only plain anonymous renders go through the cache.
+        saved_service, saved_data = load_service_for_text(share["service_id"])
+        return render_text_page(share["service_id"], saved_service, saved_data)
+
+    etag = service_page_etag(
+        "share",
+        share_uuid,
+        share["service_id"],
+        share["revision"],
+        share["updated_at"],
+        requested_season(share),
+    )
+
+    def render():
+        cache = share_cache()
+        body = cache.get(etag)
+        if body is not None:
+            return body
+        saved_service, saved_data = load_service_for_text(share["service_id"])
+        rendered = render_text_page(share["service_id"], saved_service, saved_data)
+        if isinstance(rendered, tuple):
+            return rendered
+        return stream_with_context(tee_into_cache(rendered, cache, etag))
+
+    return service_page_response(etag, share["updated_at"], render, public=True)
+
+
+def tee_into_cache(chunks, cache, key):
+    # Pass a streamed page through while keeping a copy. The copy is only
+    # cached if the whole page was sent; a dropped connection closes the
+    # generator before it gets there.
+    body = []
+    for chunk in chunks:
+        body.append(chunk)
+        yield chunk
+    cache.set(key, "".join(body).encode("utf-8"))
 
 
 @bp.route("/service/<int:service_id>/share", methods=["POST"])
@@ -975,6 +1169,113 @@ def service_share(service_id):
     )
 
 
+@bp.route("/exports", methods=["POST"])
+@login_required
+def export_create():
+    payload = request.get_json(silent=True) or request.form
+    export_format = payload.get("format") or "html"
+    if not isinstance(export_format, str):
+        return jsonify({"error": "Unknown export format."}), 400
+    if export_format in ("pdf", "docx"):
+        return jsonify({"error": "PDF and DOCX exports are not available yet."}), 400
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({"error": "Unknown export format."}), 400
+    db = get_db()
+    service_ids = payload.get("service_ids")
+    if service_ids:
+        if isinstance(service_ids, str):
+            service_ids = service_ids.split(",")
+        try:
+            service_ids = [int(value) for value in service_ids]
+        except (TypeError, ValueError):
+            return jsonify({"error": "Service ids must be numbers."}), 400
+        services = db.execute(
+            "select id, rite, service_date from services where user_id=? and id in (select value from json_each(?)) order by service_date, id",
+            (g.user["id"], json.dumps(service_ids)),
+        ).fetchall()
+    else:
+        try:
+            start = date.fromisoformat(payload.get("start") or "")
+            end = date.fromisoformat(payload.get("end") or "")
+        except ValueError:
+            return (
+                jsonify(
+                    {"error": "Service ids or valid start and end dates are required."}
+                ),
+                400,
+            )
+        if end < start:
+            return jsonify({"error": "End date must not be before start date."}), 400
+        services = db.execute(
+            "select id, rite, service_date from services where user_id=? and service_date between ? and ? order by service_date, id",
+            (g.user["id"], start.isoformat(), end.isoformat()),
+        ).fetchall()
+    if not services:
+        return jsonify({"error": "No services found."}), 404
+    max_services = current_app.config["EXPORT_MAX_SERVICES"]
+    if len(services) > max_services:
+        return (
+            jsonify({"error": f"Exports are limited to {max_services} services."}),
+            400,
+        )
+    try:
+        job_uuid = start_export(g.user["id"], services, export_format)
+    except ExportLimitReached:
+        return (
+            jsonify({"error": "Wait for your running exports to finish."}),
+            429,
+        )
+    return (
+        jsonify(
+            {
+                "job_id": job_uuid,
+                "status_url": url_for("main.export_status", job_uuid=job_uuid),
+                "total": len(services),
+            }
+        ),
+        202,
+    )
+
+
+@bp.route("/exports/<job_uuid>")
+@login_required
+def export_status(job_uuid):
+    job = load_export_job(job_uuid, g.user["id"])
+    if not job:
+        return jsonify({"error": "Export not found."}), 404
+    download_url = None
+    if job["status"] == "done":
+        download_url = url_for("main.export_download", job_uuid=job_uuid)
+    return jsonify(
+        {
+            "job_id": job["job_uuid"],
+            "format": job["format"],
+            "status": job["status"],
+            "total": job["total"],
+            "completed": job["completed"],
+            "skipped": job["skipped"],
+            "error": job["error"],
+            "download_url": download_url,
+        }
+    )
+
+
+@bp.route("/exports/<job_uuid>/download")
+@login_required
+def export_download(job_uuid):
+    job = load_export_job(job_uuid, g.user["id"])
+    if not job:
+        return jsonify({"error": "Export not found."}), 404
+    if job["status"] != "done":
+        return jsonify({"error": "Export is not finished."}), 409
+    return send_file(
+        job["path"],
+        mimetype=EXPORT_FORMATS[job["format"]],
+        as_attachment=True,
+        download_name=f"ordinarium-export-{job_uuid[:8]}.{job['format']}",
+    )
+
+
 @bp.route("/service/<int:service_id>/custom-element", methods=["POST"])
 @login_required
 def service_add_custom_element(service_id):
@@ -1015,9 +1316,13 @@ def service_add_custom_element(service_id):
 
     db = get_db()
     existing = db.execute(
-        "select user_id, data from services where id=? limit 1", (service_id,)
+        "select user_id, text_order, text_disabled, data from services where id=? limit 1",
+        (service_id,),
     ).fetchone()
-    if existing and existing["user_id"] != g.user["id"]:
+    # Only the user's own services and the ids reserved for them can be
+    # written; any other id may have belonged to a deleted service.
+    owner = existing["user_id"] if existing else service_owner(db, service_id)
+    if owner != g.user["id"]:
         if is_autosave:
             return jsonify({"ok": False, "error": "Service not found."}), 404
         return render_error("Service not found.", 404)
@@ -1037,6 +1342,7 @@ def service_add_custom_element(service_id):
             "update service_custom_elements set title=?, text=? where id=?",
             (title, text_value, custom_id),
         )
+        touch_service(db, service_id)
         db.commit()
         if is_autosave:
             return jsonify(
@@ -1053,21 +1359,21 @@ def service_add_custom_element(service_id):
             "rite": rite,
             "season": None,
             "service_date": None,
-            "text_order": None,
-            "text_disabled": None,
             "observance_handle": None,
         }
 
-    if not service_data.get("rite"):
+    rite_missing = not service_data.get("rite")
+    if rite_missing:
         service_data["rite"] = rite
 
-    cursor = db.execute(
-        "insert into service_custom_elements (service_id, user_id, title, text) values (?, ?, ?, ?)",
-        (service_id, g.user["id"], title, text_value),
+    new_custom_id = next_custom_element_id(db)
+    db.execute(
+        "insert into service_custom_elements (id, service_id, user_id, title, text) values (?, ?, ?, ?, ?)",
+        (new_custom_id, service_id, g.user["id"], title, text_value),
     )
-    custom_token = f"custom:{cursor.lastrowid}"
+    custom_token = f"custom:{new_custom_id}"
 
-    order_tokens = parse_plan_tokens(service_data.get("text_order"))
+    order_tokens, disabled_tokens = load_plan(db, service_id, existing)
     if not order_tokens:
         text_rows = db.execute(
             "select id from texts where type=? and filter_type=? and filter_content=? order by default_order",
@@ -1090,18 +1396,16 @@ def service_add_custom_element(service_id):
             order_tokens.append(custom_token)
         else:
             order_tokens.insert(insert_index + 1, custom_token)
-    service_data["text_order"] = json.dumps(order_tokens)
 
-    if existing:
+    if not existing:
+        insert_service(db, service_id, service_data)
+    elif rite_missing:
         db.execute(
             "update services set data=? where id=?",
             (json.dumps(service_data), service_id),
         )
-    else:
-        db.execute(
-            "insert into services (id, data) values (?, ?)",
-            (service_id, json.dumps(service_data)),
-        )
+    save_plan(db, service_id, order_tokens, disabled_tokens)
+    touch_service(db, service_id)
     db.commit()
     return redirect(url_for("main.service", service_id=service_id))
 
@@ -1113,7 +1417,8 @@ def service_add_custom_element(service_id):
 def service_delete_custom_element(service_id, custom_id):
     db = get_db()
     existing = db.execute(
-        "select user_id, data from services where id=? limit 1", (service_id,)
+        "select user_id, text_order, text_disabled from services where id=? limit 1",
+        (service_id,),
     ).fetchone()
     if not existing or existing["user_id"] != g.user["id"]:
         return render_error("Service not found.", 404)
@@ -1128,20 +1433,15 @@ def service_delete_custom_element(service_id, custom_id):
         (custom_id, service_id, g.user["id"]),
     )
 
-    service_data = json.loads(existing["data"]) if existing["data"] else {}
     token = f"custom:{custom_id}"
-    order_tokens = parse_plan_tokens(service_data.get("text_order"))
-    disabled_tokens = parse_plan_tokens(service_data.get("text_disabled"))
-    if order_tokens:
-        order_tokens = [value for value in order_tokens if value != token]
-        service_data["text_order"] = json.dumps(order_tokens)
-    if disabled_tokens:
-        disabled_tokens = [value for value in disabled_tokens if value != token]
-        service_data["text_disabled"] = json.dumps(disabled_tokens)
-    db.execute(
-        "update services set data=? where id=?",
-        (json.dumps(service_data), service_id),
+    order_tokens, disabled_tokens = load_plan(db, service_id, existing)
+    save_plan(
+        db,
+        service_id,
+        [value for value in order_tokens if value != token],
+        [value for value in disabled_tokens if value != token],
     )
+    touch_service(db, service_id)
     db.commit()
     return redirect(url_for("main.service", service_id=service_id))
 
@@ -1173,7 +1473,6 @@ def persist_service():
             token = normalize_plan_token(value)
             if token:
                 order_tokens.append(token)
-    order_json = json.dumps(order_tokens)
 
     raw_disabled = request.form.get("disabled", "")
     disabled_tokens = []
@@ -1182,19 +1481,14 @@ def persist_service():
             token = normalize_plan_token(value)
             if token:
                 disabled_tokens.append(token)
-    disabled_json = json.dumps(disabled_tokens)
 
     db = get_db()
     existing = db.execute(
         "select data from services where id=? and user_id=? limit 1",
         (service_id, g.user["id"]),
     ).fetchone()
-    other_owner = None
-    if not existing:
-        other_owner = db.execute(
-            "select id from services where id=? limit 1", (service_id,)
-        ).fetchone()
-    if other_owner:
+    owner = g.user["id"] if existing else service_owner(db, service_id)
+    if owner != g.user["id"]:
         if is_autosave:
             return jsonify({"ok": False, "error": "Service not found."}), 404
         return render_error("Service not found.", 404)
@@ -1208,14 +1502,14 @@ def persist_service():
         "season": None,
         "service_date": existing_data.get("service_date"),
         "observance_handle": existing_data.get("observance_handle"),
+        "revision": existing_data.get("revision"),
+        "updated_at": existing_data.get("updated_at"),
     }
     payload.update(
         {
             "rite": normalize_value(request.form.get("rite")) or payload["rite"],
             "service_date": normalize_value(request.form.get("service_date"))
             or payload["service_date"],
-            "text_order": order_json,
-            "text_disabled": disabled_json,
             "observance_handle": normalize_value(request.form.get("observance_handle")),
         }
     )
@@ -1263,10 +1557,9 @@ def persist_service():
             (json.dumps(payload), service_id),
         )
     else:
-        db.execute(
-            "insert into services (id, data) values (?, ?)",
-            (service_id, json.dumps(payload)),
-        )
+        insert_service(db, service_id, payload)
+    save_plan(db, service_id, order_tokens, disabled_tokens)
+    touch_service(db, service_id)
     db.commit()
     # flash('Service saved.')
     if is_autosave:
@@ -1364,3 +1657,142 @@ def observance_from_date():
             "default_handle": options_payload[0]["handle"] if options_payload else None,
         }
     )
+
+
+@bp.route("/observance/range")
+def observance_range():
+    try:
+        start = date.fromisoformat(request.args.get("start", ""))
+        end = date.fromisoformat(request.args.get("end", ""))
+    except ValueError:
+        return jsonify({"error": "Valid start and end dates are required."}), 400
+    if end < start:
+        return jsonify({"error": "End date must not be before start date."}), 400
+    if (end - start).days >= OBSERVANCE_RANGE_MAX_DAYS:
+        return (
+            jsonify(
+                {
+                    "error": f"Ranges are limited to {OBSERVANCE_RANGE_MAX_DAYS} days.",
+                }
+            ),
+            400,
+        )
+    days = resolve_observance_range(start, end)
+    titles = {}
+    for day in days:
+        for option in day.observances:
+            titles.setdefault(option.handle, option.name or option.alternative_name)
+    return jsonify(
+        {
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "dates": [day.date.isoformat() for day in days],
+            "handles": [
+                day.observances[0].handle if day.observances else None for day in days
+            ],
+            "seasons": [day.season for day in days],
+            "subcycles": [day.subcycle for day in days],
+            "options": [[option.handle for option in day.observances] for day in days],
+            "titles": titles,
+        }
+    )
+
+
+def _calendar_feed_span():
+    today = date.today()
+    raw_start = request.args.get("start")
+    try:
+        start = (
+            date.fromisoformat(raw_start) if raw_start else date(today.year - 1, 1, 1)
+        )
+    except ValueError:
+        return None
+    years = request.args.get("years", CALENDAR_FEED_DEFAULT_YEARS, type=int)
+    years = max(1, min(years, CALENDAR_FEED_MAX_YEARS))
+    return start, date(min(start.year + years - 1, date.max.year), 12, 31)
+
+
+def _calendar_feed_response(name, events, etag_parts, cache_control):
+    etag = hashlib.sha1(repr(etag_parts).encode("utf-8")).hexdigest()
+    if request.if_none_match.contains(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = current_app.response_class(
+            stream_with_context(calendar_lines(name, events)),
+            mimetype="text/calendar",
+        )
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = cache_control
+    return response
+
+
+@bp.route("/calendar.ics")
+def calendar_feed():
+    span = _calendar_feed_span()
+    if not span:
+        return render_error("Valid start date required.", 400)
+    start, end = span
+    return _calendar_feed_response(
+        "Ordinarium",
+        observance_events(start, end, datetime.now(timezone.utc)),
+        ("observances", calendar_store().refresh().version, start, end),
+        "public, max-age=3600",
+    )
+
+
+@bp.route("/calendar/<feed_token>.ics")
+def user_calendar_feed(feed_token):
+    db = get_db()
+    user = db.execute(
+        "select id from users where json_extract(data, '$.calendar_token')=? limit 1",
+        (feed_token,),
+    ).fetchone()
+    if not user:
+        return render_error("Calendar feed not found.", 404)
+    span = _calendar_feed_span()
+    if not span:
+        return render_error("Valid start date required.", 400)
+    start, end = span
+    fingerprint = hashlib.sha1()
+    for row in db.execute(
+        "select id, data from services where user_id=? and service_date between ? and ? order by service_date, id",
+        (user["id"], start.isoformat(), end.isoformat()),
+    ):
+        fingerprint.update(f"{row['id']}:{row['data']}\n".encode("utf-8"))
+
+    def services_in_span():
+        # Runs as the body streams, after the view has returned;
+        # stream_with_context keeps the request, and so its connection, open
+        # until then.
+        rows = get_db().execute(
+            SERVICE_LISTING_SELECT
+            + "where services.user_id=? and services.service_date between ? and ? order by services.service_date asc",
+            (user["id"], start.isoformat(), end.isoformat()),
+        )
+        for row in rows:
+            yield format_services([row])[0]
+
+    stamp = datetime.now(timezone.utc)
+    events = itertools.chain(
+        observance_events(start, end, stamp),
+        service_events(
+            services_in_span(),
+            lambda service_id: url_for(
+                "main.service", service_id=service_id, _external=True
+            ),
+            stamp,
+        ),
+    )
+    return _calendar_feed_response(
+        "Ordinarium services",
+        events,
+        (
+            "services",
+            user["id"],
+            calendar_store().refresh().version,
+            start,
+            end,
+            fingerprint.hexdigest(),
+        ),
+        "private, max-age=300",
+    )
@@ -3,217 +3,101 @@ CREATE TABLE schema_migrations (
   filename TEXT UNIQUE NOT NULL,
   applied_at TEXT DEFAULT CURRENT_TIMESTAMP
 );
-
-CREATE TABLE holidays (
-  id INTEGER PRIMARY KEY,
-  handle TEXT,
-  date_rule TEXT,
-  style TEXT,
-  priority INTEGER,
-  colour TEXT,
-  propers TEXT,
-  name TEXT,
-  alternative_name TEXT,
-  importable_fragments TEXT
-);
-CREATE INDEX idx_holidays_handle ON holidays(handle);
-CREATE INDEX idx_holidays_priority ON holidays(priority);
-
-CREATE TABLE fragments (
+CREATE TABLE services (
   id INTEGER PRIMARY KEY,
-  date_rule TEXT,
-  behaviour TEXT,
-  propers TEXT
+  data JSON,
+  user_id INTEGER GENERATED ALWAYS AS (json_extract(data, '$.user_id')) STORED,
+  title TEXT GENERATED ALWAYS AS (json_extract(data, '$.title')) STORED,
+  rite TEXT GENERATED ALWAYS AS (json_extract(data, '$.rite')) STORED,
+  text_order TEXT GENERATED ALWAYS AS (json_extract(data, '$.text_order')) VIRTUAL,
+  text_disabled TEXT GENERATED ALWAYS AS (json_extract(data, '$.text_disabled')) VIRTUAL,
+  season TEXT GENERATED ALWAYS AS (json_extract(data, '$.season')) STORED,
+  service_date TEXT GENERATED ALWAYS AS (json_extract(data, '$.service_date')) STORED,
+  revision INTEGER GENERATED ALWAYS AS (json_extract(data, '$.revision')) STORED,
+  updated_at TEXT GENERATED ALWAYS AS (json_extract(data, '$.updated_at')) STORED
 );
-CREATE INDEX idx_fragments_date_rule ON fragments(date_rule);
-
-CREATE TABLE subcycles (
+INSERT INTO "services" VALUES(1, '{"user_id": 1, "title": "Last Sunday of Christmas", "rite": "Renewed Ancient Text", "season": "Christmastide", "service_date": "2026-01-04", "revision": 1, "updated_at": "2026-01-01 12:00:00"}');
+INSERT INTO "services" VALUES(2, '{"user_id": 1, "title": "First Sunday of Epiphanytide", "rite": "Renewed Ancient Text", "season": "Epiphanytide", "service_date": "2026-01-11", "revision": 1, "updated_at": "2026-01-01 12:00:00"}');
+CREATE INDEX idx_services_user_date ON services(user_id, service_date);
+CREATE INDEX idx_services_user_rite_date ON services(user_id, rite, service_date);
+CREATE INDEX idx_services_season ON services(season);
+CREATE TABLE service_items (
   id INTEGER PRIMARY KEY,
-  handle TEXT,
-  epoch INTEGER,
-  order_value INTEGER,
-  full_cycle INTEGER
+  service_id INTEGER NOT NULL,
+  token TEXT NOT NULL,
+  position REAL,
+  disabled INTEGER NOT NULL DEFAULT 0
 );
-CREATE INDEX idx_subcycles_handle ON subcycles(handle);
-CREATE INDEX idx_subcycles_order_value ON subcycles(order_value);
-
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (1, 'AdventI', '11/27→Sun', 'Sunday', 2, 'Purple', 'AdventI', 'The First Sunday in Advent', 'Advent Sunday', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (2, 'AdventII', '12/4→Sun', 'Sunday', 2, 'Purple', 'AdventII', 'The Second Sunday in Advent', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (3, 'AdventIII', '12/11→Sun', 'Sunday', 2, 'Rose', 'AdventIII', 'The Third Sunday in Advent', 'Gaudete Sunday', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (4, 'AdventIV', '12/18→Sun', 'Sunday', 2, 'Purple', 'AdventIV', 'The Fourth Sunday in Advent', 'Annunciation Sunday', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (5, 'ChristmasEve', '12/24', 'SeasonDay', 7, 'White', 'ChristmasEve', 'Christmas Eve', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (6, 'Christmas', '12/25', 'Principal', 0, 'White', 'Christmas', 'The Nativity of Our Lord Jesus Christ', 'Christmas Day', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (7, 'ChristmasI', '12/25→Sun (not on 12/25)', 'Sunday', 5, 'White', 'ChristmasI', 'The First Sunday of Christmas', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (8, 'ChristmasII', '1/1→Sun (before 1/6)', 'Sunday', 5, 'White', 'ChristmasII', 'The Second Sunday of Christmas', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (9, 'Epiphany', '1/6', 'Principal', 0, 'White', 'Epiphany', 'The Epiphany of Our Lord Jesus Christ', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (10, 'EpiphanyI', '1/7→Sun', 'Sunday', 5, 'Green', 'EpiphanyI', 'The First Sunday of Epiphany', 'The Baptism of Our Lord Jesus Christ', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (11, 'EpiphanyII', '1/14→Sun', 'Sunday', 5, 'Green', 'EpiphanyII', 'The Second Sunday of Epiphany', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (12, 'EpiphanyIII', '1/21→Sun', 'Sunday', 5, 'Green', 'EpiphanyIII', 'The Third Sunday of Epiphany', '_', 'EpiphanySunday');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (13, 'EpiphanyIV', '1/28→Sun (before E-49)', 'Sunday', 5, 'Green', 'EpiphanyIV', 'The Fourth Sunday of Epiphany', '_', 'EpiphanySunday');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (14, 'EpiphanyV', '2/4→Sun (before E-49)', 'Sunday', 5, 'Green', 'EpiphanyV', 'The Fifth Sunday of Epiphany', '_', 'EpiphanySunday');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (15, 'EpiphanyVI', '2/11→Sun (before E-49)', 'Sunday', 5, 'Green', 'EpiphanyVI', 'The Sixth Sunday of Epiphany', '_', 'EpiphanySunday');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (16, 'EpiphanyVII', '2/18→Sun (before E-49)', 'Sunday', 5, 'Green', 'EpiphanyVII', 'The Seventh Sunday of Epiphany', '_', 'EpiphanySunday');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (17, 'EpiphanyVIII', '2/25→Sun (before E-49)', 'Sunday', 5, 'Green', 'EpiphanyVIII', 'The Eighth Sunday of Epiphany', '_', 'EpiphanySunday');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (18, 'EpiphanyUltima', 'E-49', 'Sunday', 5, 'Green', 'EpiphanyUltima', 'The Last Sunday of Epiphany', 'Transfiguration Sunday', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (19, 'AshWednesday', 'E-46', 'Major', 3, 'Purple', 'AshWednesday', 'Ash Wednesday', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (20, 'LentI', 'E-42', 'Sunday', 2, 'Purple', 'LentI', 'The First Sunday in Lent', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (21, 'LentII', 'E-35', 'Sunday', 2, 'Purple', 'LentII', 'The Second Sunday in Lent', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (22, 'LentIII', 'E-28', 'Sunday', 2, 'Purple', 'LentIII', 'The Third Sunday in Lent', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (23, 'LentIV', 'E-21', 'Sunday', 2, 'Rose', 'LentIV', 'The Fourth Sunday in Lent', 'Laetare Sunday', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (24, 'LentV', 'E-14', 'Sunday', 2, 'Purple', 'LentV', 'The Fifth Sunday in Lent', 'Passion Sunday', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (25, 'PalmSunday', 'E-7', 'Sunday', 2, 'Red', 'PalmSunday', 'Palm Sunday', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (26, 'HolyMonday', 'E-6', 'SeasonDay', 3, 'Red', 'HolyMonday', 'Monday of Holy Week', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (27, 'HolyTuesday', 'E-5', 'SeasonDay', 3, 'Red', 'HolyTuesday', 'Tuesday of Holy Week', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (28, 'HolyWednesday', 'E-4', 'SeasonDay', 3, 'Red', 'HolyWednesday', 'Wednesday of Holy Week', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (29, 'MaundyThursday', 'E-3', 'Major', 3, 'White', 'MaundyThursday', 'Maundy Thursday', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (30, 'GoodFriday', 'E-2', 'Major', 3, 'Red', 'GoodFriday', 'Good Friday', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (31, 'HolySaturday', 'E-1', 'SeasonDay', 3, 'Red', 'HolySaturday', 'Holy Saturday', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (32, 'EasterEve', 'E-1', 'SeasonDay', 7, 'White', 'EasterEve', 'Easter Eve', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (33, 'Easter', 'E', 'Principal', 0, 'White', 'Easter', 'Easter Day', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (34, 'EasterMonday', 'E+1', 'SeasonDay', 3, 'White', 'EasterMonday', 'Monday of Easter Week', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (35, 'EasterTuesday', 'E+2', 'SeasonDay', 3, 'White', 'EasterTuesday', 'Tuesday of Easter Week', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (36, 'EasterWednesday', 'E+3', 'SeasonDay', 3, 'White', 'EasterWednesday', 'Wednesday of Easter Week', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (37, 'EasterThursday', 'E+4', 'SeasonDay', 3, 'White', 'EasterThursday', 'Thursday of Easter Week', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (38, 'EasterFriday', 'E+5', 'SeasonDay', 3, 'White', 'EasterFriday', 'Friday of Easter Week', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (39, 'EasterSaturday', 'E+6', 'SeasonDay', 3, 'White', 'EasterSaturday', 'Saturday of Easter Week', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (40, 'EasterII', 'E+7', 'Sunday', 2, 'White', 'EasterII', 'The Second Sunday of Easter', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (41, 'EasterIII', 'E+14', 'Sunday', 2, 'White', 'EasterIII', 'The Third Sunday of Easter', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (42, 'EasterIV', 'E+21', 'Sunday', 2, 'White', 'EasterIV', 'The Fourth Sunday of Easter', 'Good Shepherd Sunday', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (43, 'EasterV', 'E+28', 'Sunday', 2, 'White', 'EasterV', 'The Fifth Sunday of Easter', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (44, 'EasterVI', 'E+35', 'Sunday', 2, 'White', 'EasterVI', 'The Sixth Sunday of Easter', 'Rogation Sunday', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (45, 'Ascension', 'E+39', 'Principal', 0, 'White', 'Ascension', 'Ascension Day', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (46, 'EasterVII', 'E+42', 'Sunday', 2, 'White', 'EasterVII', 'The Seventh Sunday of Easter', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (47, 'Pentecost', 'E+49', 'Principal', 0, 'Red', 'Pentecost', 'The Day of Pentecost', 'Whitsunday', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (48, 'TrinitySunday', 'E+56', 'Principal', 0, 'White', 'TrinitySunday', 'Trinity Sunday', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (49, 'AfterPentecostII', 'E+63', 'Sunday', 5, 'Green', '_', 'The Second Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (50, 'AfterPentecostIII', 'E+70', 'Sunday', 5, 'Green', '_', 'The Third Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (51, 'AfterPentecostIV', 'E+77', 'Sunday', 5, 'Green', '_', 'The Fourth Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (52, 'AfterPentecostV', 'E+84', 'Sunday', 5, 'Green', '_', 'The Fifth Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (53, 'AfterPentecostVI', 'E+91', 'Sunday', 5, 'Green', '_', 'The Sixth Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (54, 'AfterPentecostVII', 'E+98', 'Sunday', 5, 'Green', '_', 'The Seventh Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (55, 'AfterPentecostVIII', 'E+105', 'Sunday', 5, 'Green', '_', 'The Eighth Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (56, 'AfterPentecostIX', 'E+112', 'Sunday', 5, 'Green', '_', 'The Ninth Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (57, 'AfterPentecostX', 'E+119', 'Sunday', 5, 'Green', '_', 'The Tenth Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (58, 'AfterPentecostXI', 'E+126', 'Sunday', 5, 'Green', '_', 'The Eleventh Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (59, 'AfterPentecostXII', 'E+133', 'Sunday', 5, 'Green', '_', 'The Twelfth Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (60, 'AfterPentecostXIII', 'E+140', 'Sunday', 5, 'Green', '_', 'The Thirteenth Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (61, 'AfterPentecostXIV', 'E+147', 'Sunday', 5, 'Green', '_', 'The Fourteenth Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (62, 'AfterPentecostXV', 'E+154', 'Sunday', 5, 'Green', '_', 'The Fifteenth Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (63, 'AfterPentecostXVI', 'E+161', 'Sunday', 5, 'Green', '_', 'The Sixteenth Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (64, 'AfterPentecostXVII', 'E+168', 'Sunday', 5, 'Green', '_', 'The Seventeenth Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (65, 'AfterPentecostXVIII', 'E+175', 'Sunday', 5, 'Green', '_', 'The Eighteenth Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (66, 'AfterPentecostXIX', 'E+182', 'Sunday', 5, 'Green', '_', 'The Nineteenth Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (67, 'AfterPentecostXX', 'E+189', 'Sunday', 5, 'Green', '_', 'The Twentieth Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (68, 'AfterPentecostXXI', 'E+196', 'Sunday', 5, 'Green', '_', 'The Twenty-First Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (69, 'AfterPentecostXXII', 'E+203', 'Sunday', 5, 'Green', '_', 'The Twenty-Second Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (70, 'AfterPentecostXXIII', 'E+210 (before 11/20→Sun)', 'Sunday', 5, 'Green', '_', 'The Twenty-Third Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (71, 'AfterPentecostXXIV', 'E+217 (before 11/20→Sun)', 'Sunday', 5, 'Green', '_', 'The Twenty-Fourth Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (72, 'AfterPentecostXXV', 'E+224 (before 11/20→Sun)', 'Sunday', 5, 'Green', '_', 'The Twenty-Fifth Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (73, 'AfterPentecostXXVI', 'E+231 (before 11/20→Sun)', 'Sunday', 5, 'Green', '_', 'The Twenty-Sixth Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (74, 'AfterPentecostXXVII', 'E+238 (before 11/20→Sun)', 'Sunday', 5, 'Green', '_', 'The Twenty-Seventh Sunday After Pentecost', '_', 'Proper');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (75, 'AfterPentecostUltima', '11/20→Sun', 'Sunday', 5, 'Green', 'Proper29', 'The Last Sunday After Pentecost', 'Christ the King', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (76, 'Andrew', '11/30', 'Major', 4, 'Red', 'Andrew', 'Andrew the Apostle', 'Andermas', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (77, 'Thomas', '12/21', 'Major', 4, 'Red', 'Thomas', 'Thomas the Apostle', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (78, 'Stephen', '12/26', 'Major', 4, 'Red', 'Stephen', 'Stephen, Deacon and Martyr', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (79, 'John', '12/27', 'Major', 4, 'White', 'John', 'John, Apostle and Evangelist', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (80, 'HolyInnocents', '12/28', 'Major', 4, 'Red', 'HolyInnocents', 'The Holy Innocents', 'Childermas', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (81, 'HolyName', '1/1', 'Major', 4, 'White', 'HolyName', 'The Circumcision and Holy Name of Our Lord Jesus Christ', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (82, 'ConfessionOfPeter', '1/18', 'Major', 4, 'White', 'Peter', 'Confession of Peter the Apostle', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (83, 'ConversionOfPaul', '1/25', 'Major', 4, 'White', 'Paul', 'Conversion of Paul the Apostle', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (84, 'Presentation', '2/2', 'Major', 4, 'White', 'Presentation', 'The Presentation of Our Lord Jesus Christ in the Temple', 'Candlemas', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (85, 'Matthias', '2/24', 'Major', 4, 'Red', 'Matthias', 'Matthias the Apostle', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (86, 'Joseph', '3/19', 'Major', 4, 'White', 'Joseph', 'Joseph, Husband of the Virgin Mary and Guardian of Jesus', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (87, 'Annunciation', '3/25', 'Major', 4, 'White', 'Annunciation', 'The Annunciation of Our Lord Jesus Christ to the Virgin Mary', 'Lady Day', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (88, 'Mark', '4/25', 'Major', 4, 'Red', 'Mark', 'Mark the Evangelist', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (89, 'PhilipJames', '5/1', 'Major', 4, 'Red', 'PhilipJames', 'Philip and James, Apostles', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (90, 'Visitation', '5/31', 'Major', 4, 'White', 'Visitation', 'The Visitation of the Virgin Mary to Elizabeth and Zechariah', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (91, 'Barnabas', '6/11', 'Major', 4, 'Red', 'Barnabas', 'Barnabas the Apostle', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (92, 'NativityOfJohnTheBaptist', '6/24', 'Major', 4, 'White', 'JohnTheBaptist', 'The Nativity of John the Baptist', 'Midsummer Day', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (93, 'PeterPaul', '6/29', 'Major', 4, 'Red', 'PeterPaul', 'Peter and Paul, Apostles', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (94, 'MaryMagdalene', '7/22', 'Major', 4, 'White', 'MaryMagdalene', 'Mary Magdalene', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (95, 'JamesSonOfZebedee', '7/25', 'Major', 4, 'Red', 'James', 'James the Elder, Apostle', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (96, 'Transfiguration', '8/6', 'Major', 4, 'White', 'Transfiguration', 'The Transfiguration of Our Lord Jesus Christ', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (97, 'Mary', '8/15', 'Major', 4, 'White', 'Mary', 'The Virgin Mary, Mother of Our Lord Jesus Christ', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (98, 'Bartholomew', '8/24', 'Major', 4, 'Red', 'Bartholomew', 'Bartholomew the Apostle', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (99, 'HolyCrossDay', '9/14', 'Major', 4, 'Red', 'HolyCrossDay', 'Holy Cross Day', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (100, 'Matthew', '9/21', 'Major', 4, 'Red', 'Matthew', 'Matthew, Apostle and Evangelist', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (101, 'Michael', '9/29', 'Major', 4, 'White', 'Michael', 'Holy Michael and All Angels', 'Michaelmas', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (102, 'Luke', '10/18', 'Major', 4, 'Red', 'Luke', 'Luke the Evangelist and Companion of Paul', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (103, 'JamesOfJerusalem', '10/23', 'Major', 4, 'Red', 'JamesOfJerusalem', 'James of Jerusalem, Bishop and Martyr, Brother of Our Lord', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (104, 'SimonJude', '10/28', 'Major', 4, 'Red', 'SimonJude', 'Simon and Jude, Apostles', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (105, 'AllSaints', '11/1', 'Principal', 0, 'White', 'AllSaints', 'All Saints’ Day', '_', 'AllSaints');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (106, 'WinterEmber', '12/14→Wed,12/16→Fri,12/17→Sat', 'Ember', 10, 'Purple', 'Ember', 'Ember Day', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (107, 'Ember', 'E-39,E-37,E-36,E+52,E+54,E+55,9/15→Wed,9/17→Fri,9/18→Sat', 'Ember', 10, 'Purple', '_', 'Ember Day', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (108, 'Rogation', 'E+36,E+37,E+38', 'Rogation', 10, 'White', 'Rogation', 'Rogation Day', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (109, 'MemorialDay', '5/25→Mon', 'National', 11, '_', 'Military', 'Memorial Day (United States)', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (110, 'CanadaDay', '7/1', 'National', 11, '_', 'CanadaDay', 'Canada Day (Canada)', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (111, 'IndependenceDay', '7/4', 'National', 11, '_', 'IndependenceDay', 'Independence Day (United States)', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (112, 'ThanksgivingCanada', '10/8→Mon', 'National', 11, '_', 'Thanksgiving', 'Thanksgiving Day (Canada)', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (113, 'RemembranceDay', '11/11', 'National', 11, '_', 'Military', 'Remembrance Day (Canada)', '_', '_');
-INSERT INTO holidays (id, handle, date_rule, style, priority, colour, propers, name, alternative_name, importable_fragments) VALUES (114, 'ThanksgivingUnitedStates', '11/22→Thu', 'National', 11, '_', 'Thanksgiving', 'Thanksgiving Day (United States)', '_', '_');
-
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (1, 'E-56', 'Append', 'EpiphanyPaenultima');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (2, '11/1 (not on 11/1→Sun)', 'Append', 'AllSaintsWeekday');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (3, '5/8→Sun', 'Append', 'Proper1');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (4, '5/15→Sun', 'Append', 'Proper2');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (5, '5/22→Sun', 'Append', 'Proper3');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (6, '5/29→Sun', 'Append', 'Proper4');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (7, '6/5→Sun', 'Append', 'Proper5');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (8, '6/12→Sun', 'Append', 'Proper6');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (9, '6/19→Sun', 'Append', 'Proper7');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (10, '6/26→Sun', 'Append', 'Proper8');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (11, '7/3→Sun', 'Append', 'Proper9');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (12, '7/10→Sun', 'Append', 'Proper10');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (13, '7/17→Sun', 'Append', 'Proper11');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (14, '7/24→Sun', 'Append', 'Proper12');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (15, '7/31→Sun', 'Append', 'Proper13');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (16, '8/7→Sun', 'Append', 'Proper14');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (17, '8/14→Sun', 'Append', 'Proper15');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (18, '8/21→Sun', 'Append', 'Proper16');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (19, '8/28→Sun', 'Append', 'Proper17');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (20, '9/4→Sun', 'Append', 'Proper18');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (21, '9/11→Sun', 'Append', 'Proper19');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (22, '9/18→Sun', 'Append', 'Proper20');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (23, '9/25→Sun', 'Append', 'Proper21');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (24, '10/2→Sun', 'Append', 'Proper22');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (25, '10/9→Sun', 'Append', 'Proper23');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (26, '10/16→Sun', 'Append', 'Proper24');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (27, '10/23→Sun', 'Append', 'Proper25');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (28, '10/30→Sun', 'Append', 'Proper26');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (29, '11/6→Sun', 'Append', 'Proper27');
-INSERT INTO fragments (id, date_rule, behaviour, propers) VALUES (30, '11/13→Sun', 'Append', 'Proper28');
-
-INSERT INTO subcycles (id, handle, epoch, order_value, full_cycle) VALUES (1, 'A', 2020, 0, 3);
-INSERT INTO subcycles (id, handle, epoch, order_value, full_cycle) VALUES (2, 'B', 2020, 1, 3);
-INSERT INTO subcycles (id, handle, epoch, order_value, full_cycle) VALUES (3, 'C', 2020, 2, 3);
-
-CREATE TABLE pages (
+INSERT INTO "service_items" VALUES(1, 1, 'text:68', 1.0, 0);
+INSERT INTO "service_items" VALUES(2, 1, 'text:69', 2.0, 0);
+INSERT INTO "service_items" VALUES(3, 1, 'text:70', 3.0, 0);
+INSERT INTO "service_items" VALUES(4, 1, 'text:71', 4.0, 0);
+INSERT INTO "service_items" VALUES(5, 1, 'text:72', 5.0, 0);
+INSERT INTO "service_items" VALUES(6, 1, 'text:73', 6.0, 0);
+INSERT INTO "service_items" VALUES(7, 1, 'text:74', 7.0, 0);
+INSERT INTO "service_items" VALUES(8, 1, 'text:75', 8.0, 0);
+INSERT INTO "service_items" VALUES(9, 1, 'text:76', 9.0, 0);
+INSERT INTO "service_items" VALUES(10, 1, 'text:77', 10.0, 0);
+INSERT INTO "service_items" VALUES(11, 1, 'text:78', 11.0, 0);
+INSERT INTO "service_items" VALUES(12, 1, 'text:79', 12.0, 0);
+INSERT INTO "service_items" VALUES(13, 1, 'text:80', 13.0, 0);
+INSERT INTO "service_items" VALUES(14, 1, 'text:81', 14.0, 0);
+INSERT INTO "service_items" VALUES(15, 1, 'text:82', 15.0, 0);
+INSERT INTO "service_items" VALUES(16, 1, 'text:83', 16.0, 0);
+INSERT INTO "service_items" VALUES(17, 1, 'text:84', 17.0, 0);
+INSERT INTO "service_items" VALUES(18, 1, 'text:85', 18.0, 0);
+INSERT INTO "service_items" VALUES(19, 1, 'text:86', 19.0, 0);
+INSERT INTO "service_items" VALUES(20, 1, 'text:87', 20.0, 0);
+INSERT INTO "service_items" VALUES(21, 1, 'text:88', 21.0, 0);
+INSERT INTO "service_items" VALUES(22, 1, 'text:89', 22.0, 0);
+INSERT INTO "service_items" VALUES(23, 1, 'text:90', 23.0, 0);
+INSERT INTO "service_items" VALUES(24, 1, 'text:91', 24.0, 0);
+INSERT INTO "service_items" VALUES(25, 1, 'text:92', 25.0, 0);
+INSERT INTO "service_items" VALUES(26, 1, 'text:93', 26.0, 0);
+INSERT INTO "service_items" VALUES(27, 1, 'text:94', 27.0, 0);
+INSERT INTO "service_items" VALUES(28, 1, 'text:95', 28.0, 0);
+INSERT INTO "service_items" VALUES(29, 1, 'text:96', 29.0, 0);
+INSERT INTO "service_items" VALUES(30, 2, 'text:68', 1.0, 0);
+INSERT INTO "service_items" VALUES(31, 2, 'text:69', 2.0, 0);
+INSERT INTO "service_items" VALUES(32, 2, 'text:70', 3.0, 0);
+INSERT INTO "service_items" VALUES(33, 2, 'text:71', 4.0, 0);
+INSERT INTO "service_items" VALUES(34, 2, 'text:72', 5.0, 0);
+INSERT INTO "service_items" VALUES(35, 2, 'text:73', 6.0, 0);
+INSERT INTO "service_items" VALUES(36, 2, 'text:74', 7.0, 0);
+INSERT INTO "service_items" VALUES(37, 2, 'text:75', 8.0, 0);
+INSERT INTO "service_items" VALUES(38, 2, 'text:76', 9.0, 0);
+INSERT INTO "service_items" VALUES(39, 2, 'text:77', 10.0, 0);
+INSERT INTO "service_items" VALUES(40, 2, 'text:78', 11.0, 0);
+INSERT INTO "service_items" VALUES(41, 2, 'text:79', 12.0, 0);
+INSERT INTO "service_items" VALUES(42, 2, 'text:80', 13.0, 0);
+INSERT INTO "service_items" VALUES(43, 2, 'text:81', 14.0, 0);
+INSERT INTO "service_items" VALUES(44, 2, 'text:82', 15.0, 0);
+INSERT INTO "service_items" VALUES(45, 2, 'text:83', 16.0, 0);
+INSERT INTO "service_items" VALUES(46, 2, 'text:84', 17.0, 0);
+INSERT INTO "service_items" VALUES(47, 2, 'text:85', 18.0, 0);
+INSERT INTO "service_items" VALUES(48, 2, 'text:86', 19.0, 0);
+INSERT INTO "service_items" VALUES(49, 2, 'text:87', 20.0, 0);
+INSERT INTO "service_items" VALUES(50, 2, 'text:88', 21.0, 0);
+INSERT INTO "service_items" VALUES(51, 2, 'text:89', 22.0, 0);
+INSERT INTO "service_items" VALUES(52, 2, 'text:90', 23.0, 0);
+INSERT INTO "service_items" VALUES(53, 2, 'text:91', 24.0, 0);
+INSERT INTO "service_items" VALUES(54, 2, 'text:92', 25.0, 0);
+INSERT INTO "service_items" VALUES(55, 2, 'text:93', 26.0, 0);
+INSERT INTO "service_items" VALUES(56, 2, 'text:94', 27.0, 0);
+INSERT INTO "service_items" VALUES(57, 2, 'text:95', 28.0, 0);
+INSERT INTO "service_items" VALUES(58, 2, 'text:96', 29.0, 0);
+CREATE UNIQUE INDEX idx_service_items_service_token ON service_items(service_id, token);
+CREATE INDEX idx_service_items_plan ON service_items(service_id, position, token, disabled);
+CREATE TABLE service_drafts (
   id INTEGER PRIMARY KEY,
-  data JSON,
-  title TEXT GENERATED ALWAYS AS (json_extract(data, '$.title')) VIRTUAL,
-  content TEXT GENERATED ALWAYS AS (json_extract(data, '$.content')) VIRTUAL,
-  slug TEXT GENERATED ALWAYS AS (json_extract(data, '$.slug')) VIRTUAL
+  user_id INTEGER NOT NULL,
+  created_at TEXT DEFAULT CURRENT_TIMESTAMP
 );
-INSERT INTO "pages" VALUES(1, '{"title":"About","content":"Ordinarium is a liturgy planning workspace that incorporates the structure and rubrics of the ACNA 2019 Book of Common Prayer, enabling clergy and liturgists to assemble, order, and manage liturgical orders of service. It supports the selection of propers, readings, prayers, and ceremonial elements; their arrangement into a coherent liturgy; and export or sharing for use in planning, presentation, or printed materials.\n\n*The Rev. Ryan Willers*\n\nP.S. You can also find collects and other prayers from the *Book of Common Prayer*, the Anglican tradition, and the broader Church at <a href=\"https://occasionalprayers.com\" target=\"_blank\">Occasional Prayers</a>.","slug":"about"}');
-INSERT INTO "pages" VALUES(2, '{"title":"Welcome to Ordinarium","content":"Ordinarium is a liturgy planning workspace supporting the assembly, ordering, and management of liturgical orders of service. We currently support the eucharistic services from the <a href=\"https://anglicanchurch.net/\" target=\"_blank\">Anglican Church in North America</a> *Book of Common Prayer* (2019).\n\n<a href=\"/services\" class=\"button\">Manage services</a>","slug":"home"}');
-CREATE INDEX idx_pages_slug ON pages(slug);
-CREATE TABLE services (
+CREATE INDEX idx_service_drafts_user_id ON service_drafts(user_id);
+CREATE TABLE service_id_sequence (
   id INTEGER PRIMARY KEY,
-  data JSON,
-  user_id INTEGER GENERATED ALWAYS AS (json_extract(data, '$.user_id')) VIRTUAL,
-  title TEXT GENERATED ALWAYS AS (json_extract(data, '$.title')) VIRTUAL,
-  rite TEXT GENERATED ALWAYS AS (json_extract(data, '$.rite')) VIRTUAL,
-  text_order TEXT GENERATED ALWAYS AS (json_extract(data, '$.text_order')) VIRTUAL,
-  text_disabled TEXT GENERATED ALWAYS AS (json_extract(data, '$.text_disabled')) VIRTUAL,
-  season TEXT GENERATED ALWAYS AS (json_extract(data, '$.season')) VIRTUAL,
-  service_date TEXT GENERATED ALWAYS AS (json_extract(data, '$.service_date')) VIRTUAL
+  last_id INTEGER NOT NULL
 );
-INSERT INTO "services" VALUES(1, '{"user_id": 1, "title": "Last Sunday of Christmas", "rite": "Renewed Ancient Text", "season": "Christmastide", "service_date": "2026-01-04", "text_order": "[68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96]", "text_disabled": "[]"}');
-INSERT INTO "services" VALUES(2, '{"user_id": 1, "title": "First Sunday of Epiphanytide", "rite": "Renewed Ancient Text", "season": "Epiphanytide", "service_date": "2026-01-11", "text_order": "[68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96]", "text_disabled": "[]"}');
-CREATE INDEX idx_services_user_id ON services(user_id);
-CREATE INDEX idx_services_rite ON services(rite);
-CREATE INDEX idx_services_season ON services(season);
-CREATE INDEX idx_services_service_date ON services(service_date);
 CREATE TABLE service_shares (
   id INTEGER PRIMARY KEY,
   service_id INTEGER NOT NULL,
@@ -230,8 +114,12 @@ CREATE TABLE service_custom_elements (
   text TEXT NOT NULL,
   created_at TEXT DEFAULT CURRENT_TIMESTAMP
 );
-CREATE INDEX idx_service_custom_elements_service_id ON service_custom_elements(service_id);
-CREATE INDEX idx_service_custom_elements_user_id ON service_custom_elements(user_id);
+CREATE INDEX idx_service_custom_elements_service_created ON service_custom_elements(service_id, created_at);
+CREATE TABLE custom_element_id_sequence (
+  id INTEGER PRIMARY KEY,
+  last_id INTEGER NOT NULL
+);
+INSERT INTO "custom_element_id_sequence" VALUES(1, 0);
 CREATE TABLE service_custom_templates (
   id INTEGER PRIMARY KEY,
   user_id INTEGER NOT NULL,
@@ -240,116 +128,45 @@ CREATE TABLE service_custom_templates (
   created_at TEXT DEFAULT CURRENT_TIMESTAMP,
   updated_at TEXT DEFAULT CURRENT_TIMESTAMP
 );
-CREATE INDEX idx_service_custom_templates_user_id ON service_custom_templates(user_id);
-CREATE INDEX idx_service_custom_templates_updated_at ON service_custom_templates(updated_at);
-CREATE TABLE "texts" ("id" INTEGER PRIMARY KEY, "data" JSON, type TEXT
-generated always as (json_extract(data, '$.type')) virtual, filter_type TEXT
-generated always as (json_extract(data, '$.filter.type')) virtual, filter_content TEXT
-generated always as (json_extract(data, '$.filter.content')) virtual, text TEXT
-generated always as (json_extract(data, '$.text')) virtual, title TEXT
-generated always as (json_extract(data, '$.title')) virtual, default_order INTEGER
-generated always as (json_extract(data, '$.default_order')) virtual, detailed_title text
-generated always as (json_extract(data, '$.detailed_title')) virtual);
-INSERT INTO "texts" VALUES(1, '{"type": "proper_preface", "filter": {"type": "season", "content": "Christmastide"}, "text": "Because you gave Jesus Christ, your only Son, to be born for us; who, by the Holy Spirit and the Virgin Mary his mother, was made truly man, yet without the stain of sin, that we might be cleansed from sin and given the right to become your children."}');
-INSERT INTO "texts" VALUES(2, '{"type": "proper_preface", "filter": {"type": "day", "content": "The Lord’s Day"}, "text": "Through Jesus Christ our Lord, who on the first day of the week overcame death and the grave, and by his glorious resurrection opened to us the way of everlasting life."}');
-INSERT INTO "texts" VALUES(3, '{"type": "proper_preface", "filter": {"type": "other", "content": "At Any Time"}, "text": "Through Jesus Christ our Lord; for he is your living Word from before time and for all ages; by him you created all things, and by him you make all things new."}');
-INSERT INTO "texts" VALUES(4, '{"type": "proper_preface", "filter": {"type": "other", "content": "At Any Time"}, "text": "For you are the source of light and life; you made us in your image, and called us to new life in Jesus Christ our Lord."}');
-INSERT INTO "texts" VALUES(5, '{"type": "proper_preface", "filter": {"type": "season", "content": "Advent"}, "text": "Because you sent your beloved Son to redeem us from sin and death, and to make us heirs in him of everlasting life; that when he shall come again in power and great glory to judge the world, we may without shame or fear rejoice to behold his appearing."}');
-INSERT INTO "texts" VALUES(6, '{"type": "proper_preface", "filter": {"type": "season", "content": "Epiphany"}, "text": "Through Jesus Christ our Lord, who took on our mortal flesh to reveal his glory; that he might bring us out of darkness and into his own glorious light."}');
-INSERT INTO "texts" VALUES(1261, '{"type": "proper_preface", "filter": {"type": "season", "content": "Epiphanytide"}, "text": "Through Jesus Christ our Lord, who took on our mortal flesh to reveal his glory; that he might bring us out of darkness and into his own glorious light."}');
-INSERT INTO "texts" VALUES(7, '{"type": "proper_preface", "filter": {"type": "season", "content": "Presentation, Annunciation, and Transfiguration"}, "text": "Because in the mystery of the Word made flesh, you have caused a new light to shine in our hearts, to give the knowledge of your glory in the face of your Son Jesus Christ our Lord."}');
-INSERT INTO "texts" VALUES(8, '{"type": "proper_preface", "filter": {"type": "season", "content": "Lent"}, "text": "You bid your faithful people cleanse their hearts, and prepare with joy for the Paschal feast; that, fervent in prayer and in works of mercy, and renewed by your Word and Sacraments, they may come to the fullness of grace which you have prepared for those who love you."}');
-INSERT INTO "texts" VALUES(9, '{"type": "proper_preface", "filter": {"type": "season", "content": "Holy Week"}, "text": "Through Jesus Christ our Lord. For our sins he was lifted high upon the Cross, that he might draw the whole world to himself; and by his suffering and death he became the author of eternal salvation for all who put their trust in him."}');
-INSERT INTO "texts" VALUES(10, '{"type": "proper_preface", "filter": {"type": "season", "content": "Maundy Thursday"}, "text": "Through Jesus Christ our Lord. Having loved his own who were in the world, he loved them to the end; and on the night before he suffered, he instituted these holy mysteries; that we, receiving the benefits of his passion and resurrection, might be made partakers of his divine nature."}');
-INSERT INTO "texts" VALUES(11, '{"type": "proper_preface", "filter": {"type": "season", "content": "Easter"}, "text": "But chiefly are we bound to praise you for the glorious resurrection of your Son Jesus Christ our Lord; for he is the true Paschal Lamb, who was offered for us, and has taken away the sin of the world; who by his death has destroyed death, and by his rising to life again has won for us everlasting life."}');
-INSERT INTO "texts" VALUES(12, '{"type": "proper_preface", "filter": {"type": "season", "content": "Ascension"}, "text": "Through your dearly beloved Son Jesus Christ our Lord, who after his most glorious resurrection appeared to his Apostles, and in their sight ascended into heaven to prepare a place for us; that where he is, there we might also ascend, and reign with him in glory."}');
-INSERT INTO "texts" VALUES(13, '{"type": "proper_preface", "filter": {"type": "season", "content": "Pentecost"}, "text": "Through Jesus Christ our Lord; according to whose most true promise, the Holy Spirit came down from heaven, lighting upon the disciples, to teach them and to lead them into all truth, giving them boldness and fervent zeal constantly to preach the Gospel to all nations; by which we have been brought out of darkness and error into the clear light and true knowledge of you, and of your Son Jesus Christ."}');
-INSERT INTO "texts" VALUES(14, '{"type": "proper_preface", "filter": {"type": "season", "content": "Trinity Sunday"}, "text": "Who, with your co-eternal Son and Holy Spirit, are one God, one Lord, in Trinity of Persons and in Unity of Substance. For that which we believe of your glory, O Father, we believe the same of your Son, and of the Holy Spirit, without any difference or inequality."}');
-INSERT INTO "texts" VALUES(15, '{"type": "proper_preface", "filter": {"type": "season", "content": "All Saints’"}, "text": "For in the multitude of your saints, you have surrounded us with so great a cloud of witnesses that we, rejoicing in their fellowship, may run with patience the race that is set before us, and, together with them, may receive the unfading crown of glory."}');
-INSERT INTO "texts" VALUES(16, '{"type": "proper_preface", "filter": {"type": "season", "content": "Christ the King"}, "text": "Through your only begotten Son Jesus Christ, the King of kings and Lord of lords; for you have seated him at your right hand in glory, and put all things in subjection under his feet, that he may present them to you, O Father, perfectly restored in beauty, truth, and love."}');
-INSERT INTO "texts" VALUES(17, '{"type": "proper_preface", "filter": {"type": "occasion", "content": "Apostles and Ordinations"}, "text": "Through the great shepherd of your flock, Jesus Christ our Lord, who after his resurrection sent forth his apostles to preach the Gospel and to teach all nations, and promised to be with them always, even to the end of the ages."}');
-INSERT INTO "texts" VALUES(18, '{"type": "proper_preface", "filter": {"type": "occasion", "content": "Dedication of a Church"}, "text": "Through Jesus Christ our great High Priest, in whom we are built up as living stones of a holy temple, that we might offer before you a sacrifice of praise and thanksgiving which is holy and pleasing in your sight."}');
-INSERT INTO "texts" VALUES(19, '{"type": "proper_preface", "filter": {"type": "occasion", "content": "Baptism"}, "text": "Because in Jesus Christ our Lord, you have received us as your sons and daughters, made us citizens of your kingdom, and given us the Holy Spirit to guide us into all truth."}');
-INSERT INTO "texts" VALUES(20, '{"type": "proper_preface", "filter": {"type": "occasion", "content": "Holy Matrimony"}, "text": "Because in the love of wife and husband, you have given us an image of the heavenly Jerusalem, adorned as a bride for her bridegroom, your Son Jesus Christ our Lord; who loves her and gave himself for her, that he might make the whole creation new."}');
-INSERT INTO "texts" VALUES(21, '{"type": "proper_preface", "filter": {"type": "occasion", "content": "Burial or Commemoration of the Faithful Departed"}, "text": "Through Jesus Christ our Lord, who rose victorious from the dead and comforts us with the blessed hope of everlasting life. For to your faithful people, O Lord, life is changed, not ended; and when our mortal body lies in death, there is prepared for us a dwelling place eternal in the heavens."}');
-INSERT INTO "texts" VALUES(22, '{"type": "proper_preface", "filter": {"type": "occasion", "content": "Penitential Occasions"}, "text": "Through Jesus Christ our Lord, who was tempted in every way as we are, yet did not sin. By his grace we are able to triumph over every evil, and to live no longer for ourselves alone, but for him who died for us and rose again."}');
-INSERT INTO "texts" VALUES(23, '{"type": "proper_preface", "filter": {"type": "occasion", "content": "Rogation Days or Thanksgiving Day"}, "text": "Because the wonders of your Creation reflect your goodness and beauty; and your gifts of sun and rain, seed-time and harvest, manifest your constant love and care for all that you have made."}');
-INSERT INTO "texts" VALUES(24, '{"type": "proper_preface", "filter": {"type": "occasion", "content": "Canada Day or Independence Day"}, "text": "Because you have made us in your image, that we might serve you on earth in freedom, justice, and peace; and have given us the hope of our eternal citizenship with you in your heavenly kingdom."}');
-INSERT INTO "texts" VALUES(25, '{"type": "proper_preface", "filter": {"type": "occasion", "content": "Remembrance Day or Memorial Day"}, "text": "For by the sacrifice of your Son on the Cross, all who turn to him in the tribulation of war will find their peace with him in paradise."}');
-INSERT INTO "texts" VALUES(26, '{"type": "proper_preface", "filter": {"type": "common", "content": "Common of a Martyr"}, "text": "For the witness of your martyrs, who took up their cross and followed you even unto death, and revealed your power made perfect in human weakness."}');
-INSERT INTO "texts" VALUES(27, '{"type": "proper_preface", "filter": {"type": "common", "content": "Common of a Missionary or Evangelist"}, "text": "For the gifts of your Holy Spirit poured out upon prophets and evangelists, to proclaim the Gospel to the ends of the earth, and to bring all peoples under the reign of Jesus Christ our Lord."}');
-INSERT INTO "texts" VALUES(28, '{"type": "proper_preface", "filter": {"type": "common", "content": "Common of a Pastor"}, "text": "Through Jesus Christ, the great shepherd of the sheep; in him you call faithful pastors and anoint them with your Holy Spirit, to feed your flock by Word and Sacrament, and to lead them in the way of everlasting life."}');
-INSERT INTO "texts" VALUES(29, '{"type": "proper_preface", "filter": {"type": "common", "content": "Common of a Teacher of the Faith"}, "text": "For you have imparted gifts of wisdom and knowledge to those who teach the Gospel in word and deed, to build up the body of Christ, until we all attain to the unity of the faith and of the knowledge of the Son of God."}');
-INSERT INTO "texts" VALUES(30, '{"type": "proper_preface", "filter": {"type": "common", "content": "Common of a Monastic or Religious"}, "text": "For calling to the consecrated life those who leave everything for the sake of your kingdom, and who show forth in this world an anticipation of the abundant life you promise in the age to come."}');
-INSERT INTO "texts" VALUES(31, '{"type": "proper_preface", "filter": {"type": "common", "content": "Common of an Ecumenist"}, "text": "Through your Son Jesus Christ our Lord; in him you bring us to the knowledge of your truth, and unite us by the bond of one Faith and one Baptism, that we might love one another and manifest your love to the world."}');
-INSERT INTO "texts" VALUES(32, '{"type": "proper_preface", "filter": {"type": "common", "content": "Common of a Renewer of Society"}, "text": "For you never turn away from us, and continually send among us those who seek justice, defend the oppressed, feed the poor, and bind up the brokenhearted."}');
-INSERT INTO "texts" VALUES(33, '{"type": "proper_preface", "filter": {"type": "common", "content": "Common of a Reformer of the Church"}, "text": "For you, the master builder, never abandon your Church, which you have built of living stones; you call your faithful servants to restore its ancient walls and reunite its broken ramparts, that it may be a holy temple of your presence."}');
-INSERT INTO "texts" VALUES(34, '{"type": "proper_preface", "filter": {"type": "common", "content": "Common of any Commemoration"}, "text": "For the grace and virtue manifest in [N. and all] your saints, who have been the chosen vessels of your love, and the lights of the world in their generations."}');
-INSERT INTO "texts" VALUES(35, '{"type": "acclamation", "filter": {"type": "other", "content": "At Any Time"}, "text": "*&nbsp;* Blessed be God: the Father, the Son, and the Holy Spirit.  \n*People* **And blessed be his kingdom, now and for ever. Amen.**"}');
-INSERT INTO "texts" VALUES(36, '{"type": "acclamation", "filter": {"type": "season", "content": "Advent"}, "text": "*&nbsp;* Surely the Lord is coming soon.  \n*People* **Amen. Come Lord Jesus!**\n###### Revelation 22:20"}');
-INSERT INTO "texts" VALUES(37, '{"type": "acclamation", "filter": {"type": "season", "content": "Christmastide"}, "text": "*&nbsp;* For unto us a child is born,  \n*People* **Unto us a son is given.**\n###### Isaiah 9:6T"}');
-INSERT INTO "texts" VALUES(38, '{"type": "acclamation", "filter": {"type": "season", "content": "Feast of the Presentation of Christ"}, "text": "*&nbsp;* For unto us a child is born,  \n*People* **Unto us a son is given.**\n###### Isaiah 9:6T"}');
-INSERT INTO "texts" VALUES(39, '{"type": "acclamation", "filter": {"type": "season", "content": "Epiphanytide"}, "text": "*&nbsp;* I will make you as a light for the nations,  \n*People* **That my salvation may reach to the end of the earth.**\n###### Isaiah 49:6"}');
-INSERT INTO "texts" VALUES(40, '{"type": "acclamation", "filter": {"type": "season", "content": "Lent"}, "text": "*&nbsp;* Bless the Lord who forgives all our sins.  \n*People* **His mercy endures for ever.**"}');
-INSERT INTO "texts" VALUES(41, '{"type": "acclamation", "filter": {"type": "occasion", "content": "Penitential Occasions"}, "text": "*&nbsp;* Bless the Lord who forgives all our sins.  \n*People* **His mercy endures for ever.**"}');
-INSERT INTO "texts" VALUES(42, '{"type": "acclamation", "filter": {"type": "season", "content": "Holy Week"}, "text": "*&nbsp;* Blessed be our God.  \n*People* **Now and for ever. Amen.**"}');
-INSERT INTO "texts" VALUES(43, '{"type": "acclamation", "filter": {"type": "season", "content": "Easter"}, "text": "*&nbsp;* Alleluia! Christ is risen!  \n*People* **The Lord is risen indeed! Alleluia!**"}');
-INSERT INTO "texts" VALUES(44, '{"type": "acclamation", "filter": {"type": "season", "content": "Pentecost"}, "text": "*&nbsp;* The Lord will pour out his Spirit upon all flesh,  \n*People* **And your sons and daughters shall prophesy.**  \n*&nbsp;* Your old men shall dream dreams,  \n*People* **And your young men shall see visions.**  \n*&nbsp;* You shall know that the Lord is in the midst of his people,  \n*People* **That he is the Lord and there is none else.**  \n*&nbsp;* And it shall come to pass  \n*People* **That everyone who calls on the Name of the Lord shall be saved.**\n###### Joel 2:27-28, 32T; Acts 2:17, 21T"}');
-INSERT INTO "texts" VALUES(45, '{"type": "acclamation", "filter": {"type": "occasion", "content": "Occasions of Confirmation and Ordination"}, "text": "*&nbsp;* The Lord will pour out his Spirit upon all flesh,  \n*People* **And your sons and daughters shall prophesy.**  \n*&nbsp;* Your old men shall dream dreams,  \n*People* **And your young men shall see visions.**  \n*&nbsp;* You shall know that the Lord is in the midst of his people,  \n*People* **That he is the Lord and there is none else.**  \n*&nbsp;* And it shall come to pass  \n*People* **That everyone who calls on the Name of the Lord shall be saved.**\n###### Joel 2:27-28, 32T; Acts 2:17, 21T"}');
-INSERT INTO "texts" VALUES(46, '{"type": "acclamation", "filter": {"type": "season", "content": "All Saints’ Day"}, "text": "*&nbsp;* Worthy is the Lord our God,  \n*People* **To receive glory and honor and power.**\n###### Revelation 4:11T"}');
-INSERT INTO "texts" VALUES(47, '{"type": "acclamation", "filter": {"type": "occasion", "content": "Other Appropriate Occasions"}, "text": "*&nbsp;* Worthy is the Lord our God,  \n*People* **To receive glory and honor and power.**\n###### Revelation 4:11T"}');
-INSERT INTO "texts" VALUES(48, '{"type": "offertory_sentence", "text": "Remember the words of the Lord Jesus, how he himself said, “It is more blessed to give than to receive.”\n###### Acts 20:35"}');
-INSERT INTO "texts" VALUES(49, '{"type": "offertory_sentence", "text": "Let your light shine before others, so that they may see your good works and give glory to your Father who is in heaven.\n###### Matthew 5:16"}');
-INSERT INTO "texts" VALUES(50, '{"type": "offertory_sentence", "text": "Do not lay up for yourselves treasures on earth, where moth and rust destroy and where thieves break in and steal, but lay up for yourselves treasures in heaven, where neither moth nor rust destroys and where thieves do not break in and steal. For where your treasure is, there your heart will be also.\n###### Matthew 6:19-21"}');
-INSERT INTO "texts" VALUES(51, '{"type": "offertory_sentence", "text": "Not everyone who says to me, “Lord, Lord,” will enter the kingdom of heaven, but the one who does the will of my Father who is in heaven.\n###### Matthew 7:21"}');
-INSERT INTO "texts" VALUES(52, '{"type": "offertory_sentence", "text": "Whoever sows sparingly will also reap sparingly, and whoever sows bountifully will also reap bountifully. Each one must give as he has decided in his heart, not reluctantly or under compulsion, for God loves a cheerful giver.\n###### 2 Corinthians 9:6-7"}');
-INSERT INTO "texts" VALUES(53, '{"type": "offertory_sentence", "text": "As we have opportunity, let us do good to everyone, and especially to those who are of the household of faith.\n###### Galatians 6:10"}');
-INSERT INTO "texts" VALUES(54, '{"type": "offertory_sentence", "text": "For God is not unjust so as to overlook your work and the love that you have shown for his name in serving the saints, as you still do.\n###### Hebrews 6:10"}');
-INSERT INTO "texts" VALUES(55, '{"type": "offertory_sentence", "text": "Do not neglect to do good and to share what you have, for such sacrifices are pleasing to God.\n###### Hebrews 13:16"}');
-INSERT INTO "texts" VALUES(56, '{"type": "offertory_sentence", "text": "If anyone has the world’s goods and sees his brother in need, yet closes his heart against him, how does God’s love abide in him?\n###### 1 John 3:17"}');
-INSERT INTO "texts" VALUES(57, '{"type": "offertory_sentence", "text": "If you have many possessions, make your gift from them in proportion; if few, do not be afraid to give according to the little you have. So you will be laying up a good treasure for yourself against the day of necessity.\n###### Tobit 4:8-9"}');
-INSERT INTO "texts" VALUES(58, '{"type": "offertory_sentence", "text": "And the King will answer them, “Truly, I say to you, as you did it to one of the least of these my brothers, you did it to me.”\n###### Matthew 25:40"}');
-INSERT INTO "texts" VALUES(59, '{"type": "offertory_sentence", "text": "How then will they call on him in whom they have not believed? And how are they to believe in him of whom they have never heard? And how are they to hear without someone preaching? And how are they to preach unless they are sent?\n###### Romans 10:14-15"}');
-INSERT INTO "texts" VALUES(60, '{"type": "offertory_sentence", "text": "And Jesus said to them, “The harvest is plentiful, but the laborers are few. Therefore pray earnestly to the Lord of the harvest to send out laborers into his harvest.”\n###### Luke 10:2"}');
-INSERT INTO "texts" VALUES(61, '{"type": "offertory_sentence", "text": "They shall not appear before the LORD empty-handed. Every man shall give as he is able, according to the blessing of the LORD your God that he has given you.\n###### Deuteronomy 16:16-17"}');
-INSERT INTO "texts" VALUES(62, '{"type": "offertory_sentence", "text": "Offer unto God a sacrifice of thanksgiving, and pay your vows unto the Most High.\n###### Psalm 50:14"}');
-INSERT INTO "texts" VALUES(63, '{"type": "offertory_sentence", "text": "Ascribe unto the LORD the honor due unto his Name; bring offerings and come into his courts.\n###### Psalm 96:8"}');
-INSERT INTO "texts" VALUES(64, '{"type": "offertory_sentence", "text": "Walk in love, as Christ loved us and gave himself up for us, a fragrant offering and sacrifice to God.\n###### Ephesians 5:2"}');
-INSERT INTO "texts" VALUES(65, '{"type": "offertory_sentence", "text": "I appeal to you therefore, brothers and sisters, by the mercies of God, to present your bodies as a living sacrifice, holy and acceptable to God, which is your spiritual worship.\n###### Romans 12:1"}');
-INSERT INTO "texts" VALUES(66, '{"type": "offertory_sentence", "text": "For you know the grace of our Lord Jesus Christ, that though he was rich, yet for your sake he became poor, so that you by his poverty might become rich.\n###### 2 Corinthians 8:9"}');
-INSERT INTO "texts" VALUES(67, '{"type": "offertory_sentence", "text": "You are a chosen race, a royal priesthood, a holy nation, a people for his own possession, that you may proclaim the excellencies of him who called you out of darkness into his marvelous light.\n###### 1 Peter 2:9"}');
-INSERT INTO "texts" VALUES(68, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*The People standing, the Celebrant says*\n\n{{ acclamation | markdown }}","title":"The Acclamation","default_order":10}');
-INSERT INTO "texts" VALUES(69, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*The Celebrant prays (and the People may be invited to join)*\n\nAlmighty God, to you all hearts are open, all desires known, and from you no secrets are hid: Cleanse the thoughts of our hearts by the inspiration of your Holy Spirit, that we may perfectly love you, and worthily magnify your holy Name; through Christ our Lord. **Amen.**","title":"The Collect for Purity","default_order":20}');
-INSERT INTO "texts" VALUES(70, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*Then follows the Summary of the Law, or The Decalogue (page 100).*\n\nHear what our Lord Jesus Christ says:  \nYou shall love the Lord your God with all your heart and with all your soul and with all your mind. This is the first and great commandment. And the second is like it: You shall love your neighbor as yourself. On these two commandments depend all the Law and the Prophets.\n###### Matthew 22:37-40T","title":"The Summary of the Law","default_order":30}');
-INSERT INTO "texts" VALUES(71, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*The Celebrant and People pray*\n\n-   Lord, have mercy upon us.  \n    **Christ, have mercy upon us.**  \n    Lord, have mercy upon us.\n-   Lord, have mercy.  \n    **Christ, have mercy.**  \n    Lord, have mercy.\n-   Kyrie eleison.  \n    **Christe eleison.**  \n    Kyrie eleison.\n\n*or this*","title":"The Kyrie","default_order":40}');
-INSERT INTO "texts" VALUES(72, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"Holy God,  \nHoly and Mighty,  \nHoly Immortal One,  \n**Have mercy upon us.**","title":"The Trisagion","default_order":50}');
-INSERT INTO "texts" VALUES(73, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*The Gloria or some other song of praise may be sung or said, all standing. It is appropriate to omit the song of praise during penitential seasons and days appointed for fasting.*\n\n    Glory to God in the highest,\n        and peace to his people on earth.\n    Lord God, heavenly King,\n    almighty God and Father, \n        we worship you, we give you thanks,\n        we praise you for your glory.\n    Lord Jesus Christ, only Son of the Father,\n    Lord God, Lamb of God,\n    you take away the sin of the world:\n        have mercy on us;\n    you are seated at the right hand of the Father:\n        receive our prayer.\n    For you alone are the Holy One,\n    you alone are the Lord,\n    you alone are the Most High,\n        Jesus Christ,\n        with the Holy Spirit,\n        in the glory of God the Father. Amen.","title":"The Gloria in Excelsis","default_order":60}');
-INSERT INTO "texts" VALUES(74, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*The Celebrant says to the People*\n\n*&nbsp;* The Lord be with you.  \n*People* **And with your spirit.**  \n*Officiant* Let us pray.\n\n*The Celebrant prays the Collect.*\n\n{{ collect_of_the_day | markdown }}\n\n*People* **Amen.**","title":"The Collect of the Day","default_order":70}');
-INSERT INTO "texts" VALUES(75, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*One or more Lessons, as appointed, are read, the Reader first saying*\n\n**A Reading from {{ lesson_1_reference }}.**\n\n*A citation giving chapter and verse may be added.*\n\n*After each Lesson the Reader may say*\n\n*&nbsp;* The Word of the Lord.  \n*People* **Thanks be to God.**\n\n*Or the Reader may say* **Here ends the Reading.**\n\n*Silence may follow.*","title":"The Lessons","default_order":80,"detailed_title":"The Lessons (1)"}');
-INSERT INTO "texts" VALUES(76, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*A psalm, hymn, or anthem may follow each reading.*\n\n{{ psalm_reference }}","title":"The Lessons","default_order":90,"detailed_title":"The Lessons (Psalter)"}');
-INSERT INTO "texts" VALUES(77, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*One or more Lessons, as appointed, are read, the Reader first saying*\n\n**A Reading from {{ lesson_2_reference }}.**\n\n*A citation giving chapter and verse may be added.*\n\n*After each Lesson the Reader may say*\n\n*&nbsp;* The Word of the Lord.  \n*People* **Thanks be to God.**\n\n*Or the Reader may say* **Here ends the Reading.**\n\n*Silence may follow.*","title":"The Lessons","default_order":100,"detailed_title":"The Lessons (2)"}');
-INSERT INTO "texts" VALUES(78, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*All standing, the Deacon or Priest reads the Gospel, first saying*\n\n*&nbsp;* The Holy Gospel of our Lord Jesus Christ according to {{ gospel_reference }}.  \n*People* **Glory to you, Lord Christ.**\n\n*After the Gospel, the Reader says*\n\n*&nbsp;* The Gospel of the Lord.  \n*People* **Praise to you, Lord Christ.**","title":"The Lessons","default_order":110,"detailed_title":"The Lessons (Gospel)"}');
-INSERT INTO "texts" VALUES(79, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":null,"title":"The Sermon","default_order":120}');
-INSERT INTO "texts" VALUES(80, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*On Sundays, other Major Feast Days, and other times as appointed, all stand to recite the Nicene Creed, the Celebrant first saying*\n\nLet us confess our faith in the words of the Nicene Creed:\n\n*Celebrant and People*\n\n    We believe in one God,\n        the Father, the Almighty,\n        maker of heaven and earth,\n        of all that is, visible and invisible.\n\n    We believe in one Lord, Jesus Christ,\n        the only-begotten Son of God,\n        eternally begotten of the Father,\n        God from God, Light from Light,\n        true God from true God,\n        begotten, not made,\n        of one Being with the Father;\n        through him all things were made.\n        For us and for our salvation he came down from heaven,\n        was incarnate from the Holy Spirit and the Virgin Mary,\n        and was made man.\n        For our sake he was crucified under Pontius Pilate;\n        he suffered death and was buried.\n        On the third day he rose again in accordance with the Scriptures;\n        he ascended into heaven\n        and is seated at the right hand of the Father.\n        He will come again in glory to judge the living and the dead,\n        and his kingdom will have no end.\n\n    We believe in the Holy Spirit, the Lord, the giver of life,\n        who proceeds from the Father [and the Son],  \n        who with the Father and the Son is worshiped and glorified,\n        who has spoken through the prophets.\n        We believe in one holy catholic and apostolic Church.\n        We acknowledge one Baptism for the forgiveness of sins.\n        We look for the resurrection of the dead,\n        and the life of the world to come. Amen.","title":"The Nicene Creed","default_order":130}');
-INSERT INTO "texts" VALUES(81, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*The Deacon or other person appointed says these prayers, or the Prayers of the People in the Anglican Standard Text. The reader pauses after each bidding, and the people may add petitions, either silently or aloud.*\n\nLet us pray for the Church and for the world, saying, “hear our prayer.”\n\nFor the peace of the whole world, and for the well-being and unity of the people of God.\n\n*Reader* Lord, in your mercy:  \n*People* **Hear our prayer.**\n\nFor N., our Archbishop, and N., our Bishop, and for all the clergy and people of our Diocese and Congregation.\n\n*Reader* Lord, in your mercy:  \n*People* **Hear our prayer.**\n\nFor all those who proclaim the Gospel at home and abroad; and for all who teach and disciple others.\n\n*Reader* Lord, in your mercy:  \n*People* **Hear our prayer.**\n\nFor our brothers and sisters in Christ who are persecuted for their faith.\n\n*Reader* Lord, in your mercy:  \n*People* **Hear our prayer.**\n\nFor our nation, for those in authority, and for all in public service [especially _____________].\n\n*Reader* Lord, in your mercy:  \n*People* **Hear our prayer.**\n\nFor all those who are in trouble, sorrow, need, sickness, or any other adversity [especially _____________].\n\n*Reader* Lord, in your mercy:  \n*People* **Hear our prayer.**\n\nFor all those who have departed this life in the certain hope of the resurrection, [especially ______,] in thanksgiving let us pray.\n\n*Reader* Lord, in your mercy:  \n*People* **Hear our prayer.**\n\n*Additional petitions may be added. Thanksgivings may also be invited.*\n\n*The Celebrant concludes with this or some other appropriate Collect.*\n\nHeavenly Father, grant these our prayers for the sake of Jesus Christ, our only Mediator and Advocate, who lives and reigns with you in the unity of the Holy Spirit, one God, now and for ever. **Amen.**\n\n*The Celebrant may then say the Exhortation.*","title":"The Prayers of the People","default_order":140}');
-INSERT INTO "texts" VALUES(82, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*The Deacon or other person appointed says the following*\n\nLet us humbly confess our sins to Almighty God.\n\n*Silence*\n\n*The Deacon and People kneel as able and pray*\n\n    Most merciful God,\n        we confess that we have sinned against you\n        in thought, word, and deed,\n        by what we have done, and by what we have left undone.\n    We have not loved you with our whole heart;\n        we have not loved our neighbors as ourselves.\n    We are truly sorry and we humbly repent.\n    For the sake of your Son Jesus Christ,\n        have mercy on us and forgive us;\n        that we may delight in your will, and walk in your ways,\n        to the glory of your Name. Amen.\n\n*The Bishop or Priest stands and says*\n\nAlmighty God, our heavenly Father, who in his great mercy has promised forgiveness of sins to all those who sincerely repent and with true faith turn to him, have mercy upon you, pardon and deliver you from all your sins, confirm and strengthen you in all goodness, and bring you to everlasting life; through Jesus Christ our Lord. **Amen.**","title":"The Confession and Absolution of Sin","default_order":150}');
-INSERT INTO "texts" VALUES(83, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*The Celebrant may then say one or more of the following sentences, first saying*\n\nHear the Word of God to all who truly turn to him.\n\nCome to me, all who labor and are heavy laden, and I will give you rest.\n###### Matthew 11:28\n\nGod so loved the world, that he gave his only-begotten Son, that whoever believes in him should not perish but have eternal life.\n###### John 3:16T\n\nThe saying is trustworthy and deserving of full acceptance, that Christ Jesus came into the world to save sinners.\t\n###### 1 Timothy 1:15\n\nIf anyone sins, we have an advocate with the Father, Jesus Christ the righteous. He is the propitiation for our sins, and not for ours only, but also for the sins of the whole world.\n###### 1 John 2:1-2T","title":"The Comfortable Words","default_order":160}');
-INSERT INTO "texts" VALUES(84, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*Celebrant* The Peace of the Lord be always with you.  \n*People* **And with your spirit.**\n\n*Then the Ministers and People may greet one another in the Name of the Lord.*","title":"The Peace","default_order":170}');
-INSERT INTO "texts" VALUES(85, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*The Celebrant may begin the Offertory with one of the provided sentences of Scripture.*\n\n{{ offertory_sentence | markdown }}\n\n*During the Offertory a hymn, psalm, or anthem may be sung. The Deacon or Priest prepares the Holy Table for the celebration. Representatives of the Congregation may bring the People’s offerings of bread and wine, and money or other gifts, to the Deacon or Priest.*\n\n*The People stand while the offerings are presented. The following may be said.*\n\n*Celebrant* Yours, O LORD, is the greatness, and the power, and the glory, and the victory, and the majesty: for everything in heaven and on earth is yours; yours is the kingdom, O LORD, and you are exalted as Head above all. All things come from you, O LORD,  \n*People* **And of your own have we given you.**\n###### 1 Chronicles 29:11, 14T","title":"The Offertory","default_order":180}');
-INSERT INTO "texts" VALUES(86, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*The People remain standing. The Celebrant faces them and sings or says*\n\n*&nbsp;* The Lord be with you.  \n*People* **And with your spirit.**  \n*Celebrant* Lift up your hearts.  \n*People* **We lift them up to the Lord.**  \n*Celebrant* Let us give thanks to the Lord our God.  \n*People* **It is right to give him thanks and praise.**\n\n*The Celebrant continues*\n\nIt is right, our duty and our joy, always and everywhere to give thanks to you, Father Almighty, Creator of heaven and earth.\n\n{{ proper_preface | markdown }}\n\nTherefore we praise you, joining our voices with Angels and Archangels and with all the company of heaven, who for ever sing this hymn to proclaim the glory of your Name:","title":"The Sursum Corda","default_order":190}');
-INSERT INTO "texts" VALUES(87, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*Celebrant and People*\n\n    Holy, Holy, Holy, Lord God of power and might, heaven and earth are full of your glory.\n        Hosanna in the highest.\n    Blessed is he who comes in the Name of the Lord.\n        Hosanna in the highest.","title":"The Sanctus","default_order":200}');
-INSERT INTO "texts" VALUES(88, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*The People stand or kneel. The Celebrant continues*\n\nHoly and gracious Father: In your infinite love you made us for yourself; and when we had sinned against you and become subject to evil and death, you, in your mercy, sent your only Son Jesus Christ into the world for our salvation. By the Holy Spirit and the Virgin Mary he became flesh and dwelt among us. In obedience to your will, he stretched out his arms upon the Cross and offered himself once for all, that by his suffering and death we might be saved. By his resurrection he broke the bonds of death, trampling Hell and Satan under his feet. As our great high priest, he ascended to your right hand in glory, that we might come with confidence before the throne of grace.\n\n*At the following words concerning the bread, the Celebrant is to hold it, or lay a hand upon it, and here\\* may break the bread; and at the words concerning the cup, to hold or place a hand upon the cup and any other vessel containing the wine to be consecrated.*\n\nOn the night that he was betrayed, our Lord Jesus Christ took bread; and when he had given thanks, he broke it,\\* and gave it to his disciples, saying, “Take, eat; this is my Body, which is given for you: Do this in remembrance of me.”\n\nLikewise, after supper, Jesus took the cup, and when he had given thanks, he gave it to them, saying, “Drink this, all of you; for this is my Blood of the New Covenant, which is shed for you, and for many, for the forgiveness of sins: Whenever you drink it, do this in remembrance of me.”\n\nTherefore we proclaim the mystery of faith:\n\n*Celebrant and People*\n\n        Christ has died.\n        Christ is risen.\n        Christ will come again.\n\nWe celebrate the memorial of our redemption, O Father, in this sacrifice of praise and thanksgiving, and we offer you these gifts.\n\nSanctify them by your Word and Holy Spirit to be for your people the Body and Blood of your Son Jesus Christ. Sanctify us also, that we may worthily receive this holy Sacrament, and be made one body with him, that he may dwell in us and we in him. In the fullness of time, put all things in subjection under your Christ, and bring us with all your saints into the joy of your heavenly kingdom, where we shall see our Lord face to face.\n\nAll this we ask through your Son Jesus Christ: By him, and with him, and in him, in the unity of the Holy Spirit, all honor and glory is yours, Almighty Father, now and for ever. **Amen.**","title":"The Prayer of Consecration","default_order":210}');
-INSERT INTO "texts" VALUES(89, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*The Celebrant then says*\n\nAnd now as our Savior Christ has taught us, we are bold to pray:\n\n*Celebrant and People together pray*\n\n- ```Our Father, who art in heaven,\n        hallowed be thy Name,\n        thy kingdom come,\n        thy will be done,\n        on earth as it is in heaven.\n    Give us this day our daily bread.\n    And forgive us our trespasses,\n        as we forgive those\n        who trespass against us.\n    And lead us not into temptation,\n        but deliver us from evil.\n    For thine is the kingdom,\n        and the power, and the glory,\n        for ever and ever. Amen.```\n- ```Our Father in heaven,\n        hallowed be your Name,\n        your kingdom come,\n        your will be done,\n        on earth as it is in heaven.\n    Give us today our daily bread.\n    And forgive us our sins\n        as we forgive those\n        who sin against us.\n    Save us from the time of trial,\n        and deliver us from evil.\n    For the kingdom, the power,\n        and the glory are yours,\n        now and for ever. Amen.```","title":"The Lord’s Prayer","default_order":220}');
-INSERT INTO "texts" VALUES(90, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*If the consecrated Bread was not broken earlier, the Celebrant breaks it now.*\n\n*A period of silence is kept.*\n\n*Then may be sung or said*\n\n*Celebrant* [Alleluia.] Christ our Passover is sacrificed for us.  \n*People* **Therefore let us keep the feast. [Alleluia.]**\n\n*or this*\n\n*Celebrant* [Alleluia.] Christ our Passover Lamb has been sacrificed, once for all upon the Cross.  \n*People* **Therefore let us keep the feast. [Alleluia.]**\n\n*In Lent, Alleluia is omitted, and may be omitted at other times except during Easter Season.*","title":"The Fraction","default_order":230}');
-INSERT INTO "texts" VALUES(91, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*Celebrant and People together may say*\n\n    We do not presume to come to this your table, O merciful Lord,\n        trusting in our own righteousness,\n        but in your abundant and great mercies.\n    We are not worthy so much as to gather up\n        the crumbs under your table;\n        but you are the same Lord\n        whose character is always to have mercy.\n    Grant us, therefore, gracious Lord,\n        so to eat the flesh of your dear Son Jesus Christ,\n        and to drink his blood,\n        that our sinful bodies may be made clean by his body,\n        and our souls washed through his most precious blood,\n        and that we may evermore dwell in him, and he in us. Amen.","title":"The Prayer of Humble Access","default_order":240}');
-INSERT INTO "texts" VALUES(92, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*The following or some other suitable anthem may be sung or said here*\n\nLamb of God, you take away the sin of the world;  \n&nbsp;&nbsp;&nbsp;&nbsp;**have mercy on us.**  \nLamb of God, you take away the sin of the world;  \n&nbsp;&nbsp;&nbsp;&nbsp;**have mercy on us.**  \nLamb of God, you take away the sin of the world;  \n&nbsp;&nbsp;&nbsp;&nbsp;**grant us your peace.**","title":"The Agnus Dei","default_order":250}');
-INSERT INTO "texts" VALUES(93, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*Facing the People, the Celebrant may say the following invitation*\n\nThe gifts of God for the people of God. [Take them in remembrance that Christ died for you and feed on him in your hearts by faith, with thanksgiving.]\n\n*or this*\n\nBehold the Lamb of God, behold him who takes away the sins of the world. Blessed are those who are invited to the marriage supper of the Lamb.\n###### John 1:29T, Revelation 19:9\n\n*The Ministers receive the Sacrament in both kinds, and then immediately deliver it to the People.*\n\n*The Bread and Cup are given to the communicants with these words*\n\nThe Body of our Lord Jesus Christ, [which was given for you, preserve your body and soul to everlasting life. Take and eat this in remembrance that Christ died for you, and feed on him in your heart by faith, with thanksgiving.]\n\nThe Blood of our Lord Jesus Christ, [which was shed for you, preserve your body and soul to everlasting life. Drink this in remembrance that Christ’s Blood was shed for you, and be thankful.]\n\n*During the ministration of Communion, hymns, psalms, or anthems may be sung.*\n\n*The Celebrant may offer a sentence of Scripture at the conclusion of the Communion.*","title":"The Ministration of Communion","default_order":260}');
-INSERT INTO "texts" VALUES(94, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*After Communion, the Celebrant says*\n\nLet us pray.\n\n*Celebrant and People together say the following, or the Post Communion Prayer in the Anglican Standard Text*\n\n    Heavenly Father,\n    We thank you for feeding us with the spiritual food\n        of the most precious Body and Blood\n        of your Son our Savior Jesus Christ;\n        and for assuring us in these holy mysteries\n        that we are living members of the body of your Son,\n        and heirs of your eternal kingdom.\n    And now, Father, send us out to do the work you have given us to do,\n        to love and serve you as faithful witnesses of Christ our Lord.\n    To him, to you, and to the Holy Spirit,\n        be honor and glory, now and for ever. Amen.","title":"The Post Communion Prayer","default_order":270}');
-INSERT INTO "texts" VALUES(95, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*The Bishop when present, or the Priest, gives this or an alternate blessing*\n\nThe peace of God, which passes all understanding, keep your hearts and minds in the knowledge and love of God, and of his Son Jesus Christ our Lord; and the blessing of God Almighty, the Father, the Son, and the Holy Spirit, be among you, and remain with you always. **Amen.**\n\n*A hymn, psalm, or anthem may be sung after the Blessing (or following the Dismissal).*","title":"The Blessing","default_order":280}');
-INSERT INTO "texts" VALUES(96, '{"type":"ordinarium","filter":{"type":"rite","content":"Renewed Ancient Text"},"text":"*The Deacon, or the Priest, may dismiss the People with these words*\n\n*&nbsp;* Let us go forth in the Name of Christ.  \n*People* **Thanks be to God.**\n\n*or this*\n\n*Deacon* Go in peace to love and serve the Lord.  \n*People* **Thanks be to God.**\n\n*or this*\n\n*Deacon* Let us go forth into the world, rejoicing in the power of the Holy Spirit.  \n*People* **Thanks be to God.**\n\n*or this*\n\n*Deacon* Let us bless the Lord.  \n*People* **Thanks be to God.**\n\n*From the Easter Vigil through the Day of Pentecost, “Alleluia, alleluia” is added to any of the dismissals. It may be added at other times, except during Lent and on other penitential occasions.*\n\n*The People respond*\n\n**Thanks be to God. Alleluia, alleluia.**","title":"The Dismissal","default_order":290}');
-CREATE INDEX idx_texts_type on texts(type);
-CREATE INDEX idx_texts_filter_type on texts(filter_type);
-CREATE INDEX idx_texts_filter_content on texts(filter_content);
+CREATE INDEX idx_service_custom_templates_user_updated ON service_custom_templates(user_id, updated_at);
+CREATE TABLE calendar_days (
+  id INTEGER PRIMARY KEY,
+  date TEXT NOT NULL,
+  rank INTEGER NOT NULL,
+  handle TEXT,
+  title TEXT,
+  priority INTEGER,
+  season TEXT,
+  subcycle TEXT,
+  propers JSON
+);
+CREATE UNIQUE INDEX idx_calendar_days_date_rank ON calendar_days(date, rank);
+CREATE INDEX idx_calendar_days_date_handle ON calendar_days(date, handle);
+CREATE TABLE export_jobs (
+  id INTEGER PRIMARY KEY,
+  job_uuid TEXT NOT NULL,
+  user_id INTEGER NOT NULL,
+  format TEXT NOT NULL,
+  status TEXT NOT NULL DEFAULT 'queued',
+  total INTEGER NOT NULL DEFAULT 0,
+  completed INTEGER NOT NULL DEFAULT 0,
+  skipped INTEGER NOT NULL DEFAULT 0,
+  path TEXT,
+  error TEXT,
+  created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+  updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+  service_ids JSON
+);
+CREATE UNIQUE INDEX idx_export_jobs_uuid ON export_jobs(job_uuid);
+CREATE INDEX idx_export_jobs_user_id ON export_jobs(user_id);
+CREATE INDEX idx_export_jobs_status ON export_jobs(status, id);
+CREATE TABLE text_renders (
+  source_hash TEXT NOT NULL,
+  kind TEXT NOT NULL,
+  html TEXT,
+  fragments JSON,
+  PRIMARY KEY (source_hash, kind)
+);
 CREATE TABLE users (
   id INTEGER PRIMARY KEY,
   data JSON,
@@ -358,1167 +175,4 @@ CREATE TABLE users (
   email TEXT GENERATED ALWAYS AS (json_extract(data, '$.email')) VIRTUAL
 );
 CREATE INDEX idx_users_email ON users(email);
-INSERT INTO "texts" VALUES(97, '{"type": "collect", "filter": {"type": "proper", "content": "AdventI"}, "text": "Almighty God, give us grace to cast away the works of darkness, and put on the armor of light, now in the time of this mortal life in which your Son Jesus Christ came to visit us in great humility; that in the last day, when he shall come again in his glorious majesty to judge both the living and the dead, we may rise to the life immortal; through him who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(98, '{"type": "collect", "filter": {"type": "proper", "content": "AdventII"}, "text": "Blessed Lord, who caused all holy Scriptures to be written for our learning: Grant us so to hear them, read, mark, learn, and inwardly digest them, that by patience and the comfort of your holy Word we may embrace and ever hold fast the blessed hope of everlasting life, which you have given us in our Savior Jesus Christ; who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(99, '{"type": "collect", "filter": {"type": "proper", "content": "AdventIII"}, "text": "O Lord Jesus Christ, you sent your messengers the prophets to preach repentance and prepare the way for our salvation: Grant that the ministers and stewards of your mysteries may likewise make ready your way, by turning the hearts of the disobedient toward the wisdom of the just, that at your second coming to judge the world, we may be found a people acceptable in your sight; for with the Father and the Holy Spirit you live and reign, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(100, '{"type": "collect", "filter": {"type": "proper", "content": "AdventIV"}, "text": "Stir up your power, O Lord, and with great might come among us; and as we are sorely hindered by our sins from running the race that is set before us, let your bountiful grace and mercy speedily help and deliver us; through Jesus Christ our Lord, to whom, with you and the Holy Spirit, be honor and glory, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(101, '{"type": "collect", "filter": {"type": "proper", "content": "ChristmasEve"}, "text": "O God, you have caused this holy night to shine with the brightness of the true Light: Grant that we, who have known the mystery of that Light on earth, may also enjoy him perfectly in heaven; where with you and the Holy Spirit he lives and reigns, one God, in glory everlasting. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(102, '{"type": "collect", "filter": {"type": "proper", "content": "Christmas"}, "text": "Almighty God, you have given your only-begotten Son to take our nature upon him, and to be born \\\\[this day\\\\] of a pure virgin: Grant that we, who have been born again and made your children by adoption and grace, may daily be renewed by your Holy Spirit; through Jesus Christ our Lord, to whom with you and the same Spirit be honor and glory, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(103, '{"type": "collect", "filter": {"type": "proper", "content": "ChristmasI"}, "text": "Almighty God, you have poured upon us the new light of your incarnate Word: Grant that this light, kindled in our hearts, may shine forth in our lives; through Jesus Christ our Lord, who lives and reigns with you in the unity of the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(104, '{"type": "collect", "filter": {"type": "proper", "content": "ChristmasII"}, "text": "O God, who wonderfully created, and yet more wonderfully restored, the dignity of human nature: Grant that we may share the divine life of him who humbled himself to share our humanity, your Son Jesus Christ our Lord; who lives and reigns with you, in the unity of the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(105, '{"type": "collect", "filter": {"type": "proper", "content": "Epiphany"}, "text": "O God, by the leading of a star you manifested your only Son to the peoples of the earth: Lead us, who know you now by faith, to your presence, where we may see your glory face to face; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(106, '{"type": "collect", "filter": {"type": "proper", "content": "EpiphanyI"}, "text": "Eternal Father, at the baptism of Jesus you revealed him to be your Son, and your Holy Spirit descended upon him like a dove: Grant that we, who are born again by water and the Spirit, may be faithful as your adopted children; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(107, '{"type": "collect", "filter": {"type": "proper", "content": "EpiphanyII"}, "text": "Almighty God, whose Son our Savior Jesus Christ is the light of the world: Grant that your people, illumined by your Word and Sacraments, may shine with the radiance of Christ’s glory, that he may be known, worshiped, and obeyed to the ends of the earth; through Jesus Christ our Lord, who with you and the Holy Spirit lives and reigns, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(108, '{"type": "collect", "filter": {"type": "proper", "content": "EpiphanyIII"}, "text": "Give us grace, O Lord, to answer readily the call of our Savior Jesus Christ and proclaim to all people the Good News of his salvation, that we and the whole world may perceive the glory of his marvelous works; who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(109, '{"type": "collect", "filter": {"type": "proper", "content": "EpiphanyIV"}, "text": "O God, you know that we are set in the midst of many grave dangers, and because of the frailty of our nature we cannot always stand upright: Grant that your strength and protection may support us in all dangers and carry us through every temptation; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(110, '{"type": "collect", "filter": {"type": "proper", "content": "EpiphanyV"}, "text": "O Lord, our heavenly Father, keep your household the Church continually in your true religion, that we who trust in the hope of your heavenly grace may always be defended by your mighty power; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(111, '{"type": "collect", "filter": {"type": "proper", "content": "EpiphanyVI"}, "text": "Almighty God, look mercifully upon your people, that by your great goodness they may be governed and preserved evermore; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(112, '{"type": "collect", "filter": {"type": "proper", "content": "EpiphanyVII"}, "text": "O God, the strength of all who put their trust in you: mercifully accept our prayers, and because, through the weakness of our mortal nature, we can do no good thing without you, grant us the help of your grace, that in keeping your commandments we may please you both in will and deed; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(113, '{"type": "collect", "filter": {"type": "proper", "content": "EpiphanyVIII"}, "text": "Almighty and merciful God, in your goodness keep us, we pray, from all things that may hurt us; that we, being ready both in mind and body, may accomplish with joyful hearts those things which belong to your purpose; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(114, '{"type": "collect", "filter": {"type": "proper", "content": "EpiphanyPaenultima"}, "text": "Almighty God, through the outpouring of the Holy Spirit, you revealed the way of eternal life to every race and nation: Pour out this gift anew, that by the preaching of the Gospel your salvation may reach to the ends of the earth; through Jesus Christ our Lord, who lives and reigns with you, in the unity of the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(115, '{"type": "collect", "filter": {"type": "proper", "content": "EpiphanyUltima"}, "text": "O God, who before the passion of your only-begotten Son revealed his glory upon the holy mountain: Grant that we, beholding by faith the light of his countenance, may be strengthened to bear our cross, and be changed into his likeness from glory to glory; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(116, '{"type": "collect", "filter": {"type": "proper", "content": "AshWednesday"}, "text": "Almighty and everlasting God, you hate nothing you have made, and you forgive the sins of all who are penitent: Create and make in us new and contrite hearts, that we, worthily lamenting our sins and acknowledging our wretchedness, may obtain of you, the God of all mercy, perfect remission and forgiveness; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(117, '{"type": "collect", "filter": {"type": "proper", "content": "LentI"}, "text": "Almighty God, whose blessed Son was led by the Spirit to be tempted by Satan: Come quickly to help us who are assaulted by many temptations, and, as you know the weaknesses of each of us, let each one find you mighty to save; through Jesus Christ your Son our Lord, who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(118, '{"type": "collect", "filter": {"type": "proper", "content": "LentII"}, "text": "Almighty God, you know that we have no power in ourselves to help ourselves: Keep us both outwardly in our bodies and inwardly in our souls, that we may be defended from all adversities that may happen to the body, and from all evil thoughts that may assault and hurt the soul; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(119, '{"type": "collect", "filter": {"type": "proper", "content": "LentIII"}, "text": "Heavenly Father, you have made us for yourself, and our hearts are restless until they rest in you: Look with compassion upon the heartfelt desires of your servants, and purify our disordered affections, that we may behold your eternal glory in the face of Christ Jesus; who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(120, '{"type": "collect", "filter": {"type": "proper", "content": "LentIV"}, "text": "Gracious Father, whose blessed Son Jesus Christ came down from heaven to be the true bread which gives life to the world: Evermore give us this bread, that he may live in us, and we in him; who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(121, '{"type": "collect", "filter": {"type": "proper", "content": "LentV"}, "text": "Almighty God, you alone can bring into order the unruly wills and affections of sinners: Grant your people grace to love what you command and desire what you promise; that, among the swift and varied changes of this world, our hearts may surely there be fixed where true joys are to be found; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(122, '{"type": "collect", "filter": {"type": "proper", "content": "PalmSunday"}, "text": "Almighty and everlasting God, in your tender love for us you sent your Son our Savior Jesus Christ to take upon himself our nature, and to suffer death upon the cross, giving us the example of his great humility: Mercifully grant that we may walk in the way of his suffering, and come to share in his resurrection; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(123, '{"type": "collect", "filter": {"type": "proper", "content": "HolyMonday"}, "text": "Almighty God, whose most dear Son went not up to joy but first he suffered pain, and entered not into glory before he was crucified: Mercifully grant that we, walking in the way of the cross, may find it none other than the way of life and peace; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(124, '{"type": "collect", "filter": {"type": "proper", "content": "HolyTuesday"}, "text": "O Lord our God, whose blessed Son gave his back to be whipped and did not hide his face from shame and spitting: Give us grace to accept joyfully the sufferings of the present time, confident of the glory that shall be revealed; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(125, '{"type": "collect", "filter": {"type": "proper", "content": "HolyWednesday"}, "text": "Assist us mercifully with your grace, Lord God of our salvation, that we may enter with joy upon the meditation of those mighty acts by which you have promised us life and immortality; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(126, '{"type": "collect", "filter": {"type": "proper", "content": "MaundyThursday"}, "text": "Almighty Father, whose most dear Son, on the night before he suffered, instituted the Sacrament of his Body and Blood: Mercifully grant that we may receive it in thankful remembrance of Jesus Christ our Savior, who in these holy mysteries gives us a pledge of eternal life; and who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(127, '{"type": "collect", "filter": {"type": "proper", "content": "GoodFriday"}, "text": "Almighty God, we beseech you graciously to behold this your family, for whom our Lord Jesus Christ was willing to be betrayed and given into the hands of sinners, and to suffer death upon the cross; who now lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(128, '{"type": "collect", "filter": {"type": "proper", "content": "HolySaturday"}, "text": "O God, Creator of heaven and earth: Grant that, as the crucified body of your dear Son was laid in the tomb and rested on this holy Sabbath, so we may await with him the coming of the third day, and rise with him to newness of life; through Jesus Christ our Lord. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(129, '{"type": "collect", "filter": {"type": "proper", "content": "HolySaturday"}, "text": "O God of the living, on this day your Son our Savior descended to the place of the dead: Look with kindness on all of us who wait in hope for liberation from the corruption of sin and death, and give us a share in the glory of the children of God; through Jesus Christ your Son our Lord. **Amen.**", "default_order": 1}');
-INSERT INTO "texts" VALUES(130, '{"type": "collect", "filter": {"type": "proper", "content": "EasterEve"}, "text": "O God, you made this most holy night to shine with the glory of the Lord’s resurrection: Stir up in your Church that Spirit of adoption which is given to us in Baptism, that we, being renewed both in body and mind, may worship you in sincerity and truth; through Jesus Christ our Lord, who lives and reigns with you, in the unity of the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(131, '{"type": "collect", "filter": {"type": "proper", "content": "Easter"}, "text": "Almighty God, who through your only-begotten Son Jesus Christ overcame death and opened to us the gate of everlasting life: Grant that we, who celebrate with joy the day of the Lord’s resurrection, may, by your life-giving Spirit, be delivered from sin and raised from death; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(132, '{"type": "collect", "filter": {"type": "proper", "content": "Easter"}, "text": "O God, who for our redemption gave your only begotten Son to die upon the cross, and by his glorious resurrection delivered us from the devil and the power of death: Grant us grace to die daily to sin, that we may live with him in the joy of his resurrection; who lives and reigns with you and the Holy Spirit, now and for ever. **Amen.**", "default_order": 1}');
-INSERT INTO "texts" VALUES(133, '{"type": "collect", "filter": {"type": "proper", "content": "EasterMonday"}, "text": "Grant, we pray, Almighty God, that we who celebrate with reverence the Paschal feast may be made worthy to attain to everlasting joys; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(134, '{"type": "collect", "filter": {"type": "proper", "content": "EasterTuesday"}, "text": "O God, who by the glorious resurrection of your Son Jesus Christ destroyed death and brought life and immortality to light: Grant that we, who have been raised with him, may abide in his presence and rejoice in the hope of eternal glory; through Jesus Christ our Lord, to whom, with you and the Holy Spirit, be honor and glory, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(135, '{"type": "collect", "filter": {"type": "proper", "content": "EasterWednesday"}, "text": "O God, whose blessed Son made himself known to his disciples in the breaking of bread: Open the eyes of our faith, that we may behold him in the fullness of his redeeming work; who lives and reigns with you, in the unity of the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(136, '{"type": "collect", "filter": {"type": "proper", "content": "EasterThursday"}, "text": "Almighty God, you show those in error the light of your truth so that they may turn to the path of righteousness: Grant that all who have been reborn into the fellowship of Christ’s Body may show forth in their lives what they profess by their faith; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(137, '{"type": "collect", "filter": {"type": "proper", "content": "EasterFriday"}, "text": "Almighty Father, who gave your only Son to die for our sins and to rise for our justification: Give us grace so to put away the leaven of malice and wickedness, that we may always serve you in purity of life; through Jesus Christ your Son our Lord, who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(138, '{"type": "collect", "filter": {"type": "proper", "content": "EasterSaturday"}, "text": "Heavenly Father, you have delivered us from the dominion of sin and death, and brought us into the kingdom of your beloved Son: Grant that, as by his death he has called us to life, so by his love he may raise us to eternal joys; who lives and reigns with you, in the unity of the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(139, '{"type": "collect", "filter": {"type": "proper", "content": "EasterII"}, "text": "Almighty and everlasting God, who in the Paschal mystery established the new covenant of reconciliation: Grant that all who have been reborn into the fellowship of Christ’s Body may show forth in their lives what they profess by their faith; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(140, '{"type": "collect", "filter": {"type": "proper", "content": "EasterIII"}, "text": "Almighty God, you gave your only Son to be for us both a sacrifice for sin and an example of godly living: Give us grace thankfully to receive his inestimable benefits, and daily to follow the blessed steps of his most holy life; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(141, '{"type": "collect", "filter": {"type": "proper", "content": "EasterIV"}, "text": "O God, whose Son Jesus Christ is the Good Shepherd of your people: Grant that, when we hear his voice, we may know him who calls us each by name, and follow where he leads; who, with you and the Holy Spirit, lives and reigns, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(142, '{"type": "collect", "filter": {"type": "proper", "content": "EasterV"}, "text": "Almighty God, whom truly to know is everlasting life: Grant us so perfectly to know your Son Jesus Christ to be the way, the truth, and the life, that we may steadfastly follow his steps in the way that leads to eternal glory; through Jesus Christ your Son our Lord, who lives and reigns with you, in the unity of the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(143, '{"type": "collect", "filter": {"type": "proper", "content": "EasterVI"}, "text": "O God, you have prepared for those who love you such good things as surpass our understanding: Pour into our hearts such love towards you, that we, loving you in all things and above all things, may obtain your promises, which exceed all that we can desire; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(144, '{"type": "collect", "filter": {"type": "proper", "content": "Ascension"}, "text": "Almighty God, whose only-begotten Son our Lord Jesus Christ ascended into heaven: May our hearts and minds also there ascend, and with him continually dwell; who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(145, '{"type": "collect", "filter": {"type": "proper", "content": "EasterVII"}, "text": "O God, the King of glory, you have exalted your only Son Jesus Christ with great triumph to your kingdom in heaven: Do not leave us comfortless, but send us your Holy Spirit to strengthen us, and exalt us to that place where our Savior Christ has gone before; who lives and reigns with you and the Holy Spirit, one God, in glory everlasting. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(146, '{"type": "collect", "filter": {"type": "proper", "content": "Pentecost"}, "text": "Almighty God, on this day, through the outpouring of the Holy Spirit, you revealed the way of eternal life to every race and nation: Pour out this gift anew, that by the preaching of the Gospel your salvation may reach to the ends of the earth; through Jesus Christ our Lord, who lives and reigns with you, in the unity of the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(147, '{"type": "collect", "filter": {"type": "proper", "content": "Pentecost"}, "text": "O God, who on this day taught the hearts of your faithful people by sending to them the light of your Holy Spirit: Grant us by the same Spirit to have a right judgment in all things, and evermore to rejoice in his holy comfort; through Jesus Christ your Son our Lord, who lives and reigns with you, in the unity of the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 1}');
-INSERT INTO "texts" VALUES(148, '{"type": "collect", "filter": {"type": "proper", "content": "TrinitySunday"}, "text": "Almighty and everlasting God, you have given to us your servants grace, by the confession of a true faith, to acknowledge the glory of the eternal Trinity, and in the power of your divine Majesty to worship the Unity: Keep us steadfast in this faith and worship, and bring us at last to see you in your one and eternal glory, O Father; who with the Son and the Holy Spirit live and reign, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(149, '{"type": "collect", "filter": {"type": "proper", "content": "Proper1"}, "text": "O God, the strength of all who put their trust in you: Mercifully accept our prayers, and because, through the weakness of our mortal nature, we can do no good thing without you, grant us the help of your grace to keep your commandments, that we may please you in will and deed; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(150, '{"type": "collect", "filter": {"type": "proper", "content": "Proper2"}, "text": "O Lord, you never fail to support and govern those whom you bring up in your steadfast love and fear: Keep us, we pray, under your continual protection and providence, and give us a perpetual fear and love of your holy Name; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(151, '{"type": "collect", "filter": {"type": "proper", "content": "Proper3"}, "text": "O Lord, we entreat you mercifully to hear us, and grant that we, to whom you have given the desire to pray, may by your mighty aid be defended and comforted in all our adversities; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(152, '{"type": "collect", "filter": {"type": "proper", "content": "Proper4"}, "text": "O God, the protector of all those who trust in you, without whom nothing is strong, nothing is holy: Increase and multiply upon us your mercy, that, with you as our ruler and guide, we may so pass through things temporal that we lose not the things eternal; grant this, heavenly Father, for the sake of your Son Jesus Christ, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(153, '{"type": "collect", "filter": {"type": "proper", "content": "Proper5"}, "text": "Grant, O Lord, that the course of this world may be so peaceably ordered by your providence, that your Church may joyfully serve you in quiet confidence and godly peace; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(154, '{"type": "collect", "filter": {"type": "proper", "content": "Proper6"}, "text": "O Lord, from whom all good proceeds: Grant us the inspiration of your Holy Spirit, that we may always think those things that are good, and by your merciful guidance may accomplish the same; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(155, '{"type": "collect", "filter": {"type": "proper", "content": "Proper7"}, "text": "Lord of all power and might, the author and giver of all good things: Graft in our hearts the love of your Name, increase in us true religion, nourish us with all goodness, and bring forth in us the fruit of good works; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(156, '{"type": "collect", "filter": {"type": "proper", "content": "Proper8"}, "text": "O God, your never-failing providence sets in order all things both in heaven and on earth: Put away from us all hurtful things, and give us those things that are profitable for us; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(157, '{"type": "collect", "filter": {"type": "proper", "content": "Proper9"}, "text": "Grant us, O Lord, we pray, the spirit to think and do always those things that are right, that we, who can do no good thing apart from you, may by you be enabled to live according to your will; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(158, '{"type": "collect", "filter": {"type": "proper", "content": "Proper10"}, "text": "Let your merciful ears, O Lord, be open to the prayers of your humble servants; and, that we may receive what we ask, teach us by your Holy Spirit to ask only those things that are pleasing to you; through Jesus Christ our Lord, who with you and the same Spirit lives and reigns for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(159, '{"type": "collect", "filter": {"type": "proper", "content": "Proper11"}, "text": "O God, you declare your almighty power chiefly in showing mercy and pity: Grant us the fullness of your grace, that we, running to obtain your promises, may become partakers of your heavenly treasure; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(160, '{"type": "collect", "filter": {"type": "proper", "content": "Proper12"}, "text": "Almighty and everlasting God, you are always more ready to hear than we to pray, and to give more than we either desire or deserve: Pour down upon us the abundance of your mercy, forgiving us those things of which our conscience is afraid, and giving us those good things for which we are not worthy to ask, except through the merits and mediation of Jesus Christ our Savior; who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(161, '{"type": "collect", "filter": {"type": "proper", "content": "Proper13"}, "text": "Almighty and merciful God, it is only by your grace that your faithful people offer you true and laudable service: Grant that we may run without stumbling to obtain your heavenly promises; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(162, '{"type": "collect", "filter": {"type": "proper", "content": "Proper14"}, "text": "Almighty God, give us the increase of faith, hope, and love; and, that we may obtain what you have promised, make us love what you command; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(163, '{"type": "collect", "filter": {"type": "proper", "content": "Proper15"}, "text": "Keep your Church, O Lord, by your perpetual mercy; and because without you the frailty of our nature causes us to fall, keep us from all things hurtful, and lead us to all things profitable for our salvation; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(164, '{"type": "collect", "filter": {"type": "proper", "content": "Proper16"}, "text": "Let your continual mercy, O Lord, cleanse and defend your Church; and, because it cannot continue in safety without your help, protect and govern it always by your goodness; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(165, '{"type": "collect", "filter": {"type": "proper", "content": "Proper17"}, "text": "O Lord, we pray that your grace may always precede and follow after us, that we may continually be given to good works; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(166, '{"type": "collect", "filter": {"type": "proper", "content": "Proper18"}, "text": "O Lord God, grant your people grace to withstand the temptations of the world, the flesh, and the devil, and with pure hearts and minds to follow you, the only God; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(167, '{"type": "collect", "filter": {"type": "proper", "content": "Proper19"}, "text": "O God, because without you we are not able to please you, mercifully grant that your Holy Spirit may in all things direct and rule our hearts; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(168, '{"type": "collect", "filter": {"type": "proper", "content": "Proper20"}, "text": "O Lord, you have taught us that without love, all our deeds are worth nothing: Send your Holy Spirit and pour into our hearts that most excellent gift of charity, the true bond of peace and of all virtues, without which whoever lives is counted dead before you; grant this for the sake of your Son Jesus Christ, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(169, '{"type": "collect", "filter": {"type": "proper", "content": "Proper21"}, "text": "O merciful Lord, grant to your faithful people pardon and peace, that we may be cleansed from all our sins and serve you with a quiet mind; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(170, '{"type": "collect", "filter": {"type": "proper", "content": "Proper22"}, "text": "Keep, O Lord, your household the Church in continual godliness, that through your protection it may be free from all adversities, and devoutly serve you in good works, to the glory of your Name; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(171, '{"type": "collect", "filter": {"type": "proper", "content": "Proper23"}, "text": "O God, our refuge and strength, true source of all godliness: Graciously hear the devout prayers of your Church, and grant that those things which we ask faithfully, we may obtain effectually; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(172, '{"type": "collect", "filter": {"type": "proper", "content": "Proper24"}, "text": "Set us free, loving Father, from the bondage of our sins, and in your goodness and mercy give us the liberty of that abundant life which you have made known to us in our Savior Jesus Christ; who lives and reigns with you, in the unity of the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(173, '{"type": "collect", "filter": {"type": "proper", "content": "Proper25"}, "text": "Almighty and everlasting God, you govern all things both in heaven and on earth: Mercifully hear the supplications of your people, and in our time grant us your peace; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(174, '{"type": "collect", "filter": {"type": "proper", "content": "Proper26"}, "text": "Grant us, Lord, not to be anxious about earthly things, but to love things heavenly; and even now, as we live among things that are passing away, to hold fast to those that shall endure; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(175, '{"type": "collect", "filter": {"type": "proper", "content": "Proper27"}, "text": "O God, whose blessed Son came into the world that he might destroy the works of the devil and make us children of God and heirs of eternal life: Grant that, having this hope, we may purify ourselves as he is pure; that, when he comes again with power and great glory, we may be made like him in his eternal and glorious kingdom; where he lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(176, '{"type": "collect", "filter": {"type": "proper", "content": "Proper28"}, "text": "Stir up, O Lord, the wills of your faithful people, that bringing forth in abundance the fruit of good works, they may be abundantly rewarded when our Savior Jesus Christ comes to restore all things; who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(177, '{"type": "collect", "filter": {"type": "proper", "content": "Proper29"}, "text": "Almighty and everlasting God, whose will it is to restore all things in your well-beloved Son, the King of kings and Lord of lords: Mercifully grant that the peoples of the earth, divided and enslaved by sin, may be freed and brought together under his most gracious rule; who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(178, '{"type": "collect", "filter": {"type": "proper", "content": "Andrew"}, "text": "Almighty God, you gave such grace to your apostle Andrew that he readily obeyed the call of your Son Jesus Christ, and brought his brother with him: Give us, who are called by your holy Word, grace to follow him without delay, and to bring those near to us into his gracious presence; who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(179, '{"type": "collect", "filter": {"type": "proper", "content": "Thomas"}, "text": "Everliving God, you strengthened your apostle Thomas with firm and certain faith in your Son’s resurrection: Grant us so perfectly and without doubt to believe in Jesus Christ, our Lord and our God, that our faith may never be found wanting in your sight; through him who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(180, '{"type": "collect", "filter": {"type": "proper", "content": "Stephen"}, "text": "O Glorious Lord, your servant Stephen looked up to heaven and prayed for his persecutors: grant that in all our sufferings here upon earth we may love and forgive our enemies, looking steadfastly to Jesus Christ our Lord, who sits at your right hand and intercedes for us; and who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(181, '{"type": "collect", "filter": {"type": "proper", "content": "John"}, "text": "Shed upon your Church, O Lord, the brightness of your light; that we, being illumined by the teaching of your apostle and evangelist John, may so walk in the light of your truth, that at length we may attain to the fullness of eternal life; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(182, '{"type": "collect", "filter": {"type": "proper", "content": "HolyInnocents"}, "text": "Almighty God, out of the mouths of children you manifest your truth, and by the death of the Holy Innocents at the hands of evil tyrants you show your strength in our weakness: We ask you to mortify all that is evil within us, and so strengthen us by your grace, that we may glorify your holy Name by the innocence of our lives and the constancy of our faith even unto death; through Jesus Christ our Lord, who died for us and now lives with you and the Holy Spirit, world without end. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(183, '{"type": "collect", "filter": {"type": "proper", "content": "HolyName"}, "text": "Almighty God, your blessed Son fulfilled the covenant of circumcision for our sake, and was given the Name that is above every name: Give us grace faithfully to bear his Name, and to worship him with pure hearts according to the New Covenant; who lives and reigns with you, in the unity of the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(184, '{"type": "collect", "filter": {"type": "proper", "content": "Peter"}, "text": "Almighty Father, who inspired Simon Peter, first among the apostles, to confess Jesus as Messiah and Son of the living God: Keep your Church steadfast upon the rock of this faith, that in unity and peace we may proclaim the one truth and follow the one Lord, our Savior Jesus Christ; who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(185, '{"type": "collect", "filter": {"type": "proper", "content": "Paul"}, "text": "O God, by the preaching of your apostle Paul you have caused the light of the Gospel to shine throughout the world: Grant, we pray, that having his wonderful conversion in remembrance, we may show ourselves thankful to you by following his holy teaching; through Jesus Christ our Lord, who lives and reigns with you, in the unity of the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(186, '{"type": "collect", "filter": {"type": "proper", "content": "Presentation"}, "text": "Almighty and everliving God, we humbly pray that, as your only-begotten Son was this day presented in the temple in the substance of our flesh, so we may be presented to you with pure and clean hearts by Jesus Christ our Lord; who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(187, '{"type": "collect", "filter": {"type": "proper", "content": "Matthias"}, "text": "Almighty God, who in the place of Judas chose your faithful servant Matthias to be numbered among the Twelve: Grant that your Church, being delivered from false apostles, may always be guided and governed by faithful and true pastors; through Jesus Christ our Lord, who lives and reigns with you, in the unity of the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(188, '{"type": "collect", "filter": {"type": "proper", "content": "Joseph"}, "text": "O God, who from the family of your servant David raised up Joseph to be the guardian of your incarnate Son and the husband of his virgin mother: Give us grace to imitate his uprightness of life and his obedience to your commands; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(189, '{"type": "collect", "filter": {"type": "proper", "content": "Annunciation"}, "text": "Pour your grace into our hearts, O Lord, that we who have known the incarnation of your Son Jesus Christ, announced by an angel to the Virgin Mary, may by his cross and passion be brought to the glory of his resurrection; who lives and reigns with you, in the unity of the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(190, '{"type": "collect", "filter": {"type": "proper", "content": "Mark"}, "text": "Almighty God, by the hand of Mark the evangelist you have given to your Church the Gospel of Jesus Christ: We thank you for his witness, and pray that you will give us grace to know the truth, and not to be carried about by every wind of false doctrine, that we may know Jesus Christ as our Lord and Savior; who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(191, '{"type": "collect", "filter": {"type": "proper", "content": "PhilipJames"}, "text": "Almighty God, you gave to your apostles Philip and James the grace and strength to bear witness to Jesus as the way, the truth, and the life: Grant that we, being mindful of their victory of faith, may glorify in life and death the Name of our Lord Jesus Christ; who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(192, '{"type": "collect", "filter": {"type": "proper", "content": "Visitation"}, "text": "Almighty God, by whose grace Elizabeth rejoiced with the blessed virgin Mary and greeted her as the mother of the Lord: look with favor on your lowly servants, that, with Mary, we may magnify your holy Name and rejoice to acclaim her Son as our Savior; who lives and reigns with you, in the unity of the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(193, '{"type": "collect", "filter": {"type": "proper", "content": "Barnabas"}, "text": "Grant, O God, that we may follow the example of your faithful servant Barnabas, who, seeking not his own renown but the well-being of your Church, gave generously of his life and substance for the relief of the poor, and went forth courageously in mission for the spread of the Gospel; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(194, '{"type": "collect", "filter": {"type": "proper", "content": "JohnTheBaptist"}, "text": "Almighty God, by whose providence your servant John the Baptist was wonderfully born, and sent to prepare the way of your Son our Savior by preaching repentance: Make us so to follow his teaching and holy life, that we may truly repent, boldly rebuke vice, patiently suffer for the sake of truth, and proclaim the coming of Jesus Christ our Lord; who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(195, '{"type": "collect", "filter": {"type": "proper", "content": "PeterPaul"}, "text": "Almighty God, whose blessed apostles Peter and Paul glorified you by their martyrdom: Grant that your Church, instructed by their teaching and example, and knit together in unity by your Spirit, may ever stand firm upon the one foundation, which is Jesus Christ our Lord; who lives and reigns with you, in the unity of the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(196, '{"type": "collect", "filter": {"type": "proper", "content": "MaryMagdalene"}, "text": "Almighty God, whose blessed Son restored Mary Magdalene to health of body and of mind, and called her to be a witness of his resurrection: Mercifully grant that, by your grace, we may be healed from all our infirmities and know you in the power of his unending life; who with you and the Holy Spirit lives and reigns, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(197, '{"type": "collect", "filter": {"type": "proper", "content": "James"}, "text": "O gracious God, your servant and apostle James was first among the Twelve to suffer martyrdom for the Name of Jesus Christ: Pour out upon the leaders of your Church that spirit of self-denying service, by which they may have true authority among your people; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(198, '{"type": "collect", "filter": {"type": "proper", "content": "Transfiguration"}, "text": "O God, who on the holy mount revealed to chosen witnesses your well-beloved Son, wonderfully transfigured, in raiment white and glistening: Mercifully grant that we, being delivered from the disquietude of this world, may by faith behold the King in his beauty; who with you and the Holy Spirit lives and reigns, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(199, '{"type": "collect", "filter": {"type": "proper", "content": "Mary"}, "text": "O God, you have taken to yourself the blessed Virgin Mary, mother of your incarnate Son: Grant that we, who have been redeemed by his blood, may share with her the glory of your eternal kingdom; through Jesus Christ our Lord, who lives and reigns with you, in the unity of the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(200, '{"type": "collect", "filter": {"type": "proper", "content": "Bartholomew"}, "text": "Almighty and everlasting God, you gave your apostle Bartholomew grace truly to believe and to preach your Word: Grant that your Church may love what he believed and preach what he taught; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(201, '{"type": "collect", "filter": {"type": "proper", "content": "HolyCrossDay"}, "text": "Almighty God, whose Son our Savior Jesus Christ was lifted high upon the cross that he might draw the whole world to himself: Mercifully grant that we, who glory in the mystery of our redemption, may have grace to take up our cross and follow him; who lives and reigns with you and the Holy Spirit, one God, in glory everlasting. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(202, '{"type": "collect", "filter": {"type": "proper", "content": "Matthew"}, "text": "Lord Jesus, you called Matthew from collecting taxes to become your apostle and evangelist: Grant us the grace to forsake all covetous desires and inordinate love of riches, that we may follow you as he did and proclaim to the world around us the good news of your salvation; for with the Father and the Holy Spirit you live and reign, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(203, '{"type": "collect", "filter": {"type": "proper", "content": "Michael"}, "text": "Everlasting God, you have ordained and constituted in a wonderful order the ministries of angels and mortals: Mercifully grant that, as your holy angels always serve and worship you in heaven, so by your appointment they may help and defend us here on earth; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(204, '{"type": "collect", "filter": {"type": "proper", "content": "Luke"}, "text": "Almighty God, you called your servant Luke to be an evangelist and physician of the soul: Grant that, by the wholesome medicine of the doctrine he taught, all the diseases of our souls may be healed; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(205, '{"type": "collect", "filter": {"type": "proper", "content": "JamesOfJerusalem"}, "text": "Grant, O God, that, following the example of your apostle James the Just, kinsman of our Lord, your Church may give itself continually to prayer and to the reconciliation of all who are at variance and enmity; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(206, '{"type": "collect", "filter": {"type": "proper", "content": "SimonJude"}, "text": "Grant, O God, that as your apostles Simon and Jude were faithful and zealous in their mission, so we may with ardent devotion make known the love and mercy of our Lord and Savior Jesus Christ; who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(207, '{"type": "collect", "filter": {"type": "proper", "content": "AllSaints"}, "text": "Almighty God, you have knit together your elect in one communion and fellowship in the mystical Body of your Son: Give us grace so to follow your blessed saints in all virtuous and godly living, that we may come to those ineffable joys that you have prepared for those who truly love you; through Jesus Christ our Lord, who with you and the Holy Spirit lives and reigns, one God, in glory everlasting. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(208, '{"type": "collect", "filter": {"type": "proper", "content": "Ember"}, "text": "Almighty God, the giver of all good gifts, in your divine providence you have appointed various orders in your Church: Give your grace, we humbly pray, to all who are \\\\[now\\\\] called to any office and ministry for your people; and so fill them with the truth of your doctrine and clothe them with holiness of life, that they may faithfully serve before you, to the glory of your great Name and for the benefit of your holy Church; through Jesus Christ our Lord, who lives and reigns with you, in the unity of the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(209, '{"type": "collect", "filter": {"type": "proper", "content": "Ember"}, "text": "O God, you led your holy apostles to ordain ministers in every place: Grant that your Church, under the guidance of the Holy Spirit, may choose suitable persons for the ministry of Word and Sacrament, and may uphold them in their work for the extension of your kingdom; through the great Shepherd and Bishop of our souls, Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 1}');
-INSERT INTO "texts" VALUES(210, '{"type": "collect", "filter": {"type": "proper", "content": "Rogation"}, "text": "Almighty God, Lord of heaven and earth: We humbly pray that your gracious providence may give and preserve to our use the harvests of the land and of the seas, and may prosper all who labor to gather them, that we, who are constantly receiving good things from your hand, may always give you thanks; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(211, '{"type": "collect", "filter": {"type": "proper", "content": "Rogation"}, "text": "Almighty God, whose Son Jesus Christ in his earthly life shared our toil and hallowed our labor: Be present with your people where they work; make those who carry on the industries and commerce of this land responsive to your will; and give us all a right satisfaction in what we do, and a just return for our labor; through Jesus Christ our Lord, who lives and reigns with you, in the unity of the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 1}');
-INSERT INTO "texts" VALUES(212, '{"type": "collect", "filter": {"type": "proper", "content": "Military"}, "text": "O King and Judge of the nations: We remember before you with grateful hearts the men and women of our armed forces, who in the day of decision ventured much for the liberties we now enjoy; grant that we may not rest until all the people of this land share the benefits of true freedom and gladly accept its disciplines; through Jesus Christ our Lord, who with you and the Holy Spirit lives and reigns, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(213, '{"type": "collect", "filter": {"type": "proper", "content": "CanadaDay"}, "text": "Almighty God, whose wisdom and love are over all: Accept the prayers we offer for Canada, and give integrity to its citizens and wisdom to those in authority, that harmony and justice may be secured in obedience to your will; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(214, '{"type": "collect", "filter": {"type": "proper", "content": "IndependenceDay"}, "text": "Lord God, by your providence our founders won their liberties of old: Grant that we and all the people of this land may have grace to exercise these liberties in righteousness and peace; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(215, '{"type": "collect", "filter": {"type": "proper", "content": "Thanksgiving"}, "text": "Most merciful Father, we humbly thank you for all your gifts so freely bestowed upon us: for life and health and safety, for strength to work and leisure to rest, for all that is beautiful in creation and in human life; but above all we thank you for our spiritual mercies in Christ Jesus our Lord; who with you and the Holy Spirit lives and reigns, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(216, '{"type": "collect", "filter": {"type": "proper", "content": "Martyr"}, "text": "Almighty God, you gave your servant *N.* boldness to confess the Name of our Savior Jesus Christ before the rulers of this world, and courage to die for this faith: Grant that we may always be ready to give a reason for the hope that is in us, and to suffer gladly for the sake of our Lord Jesus Christ; who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(217, '{"type": "collect", "filter": {"type": "proper", "content": "MissionaryEvangelist"}, "text": "Almighty and everlasting God, you called your servant *N.* to preach the Gospel to the people of \\\\_\\\\_\\\\_\\\\_\\\\_\\\\_\\\\_\\\\_\\\\_ \\\\[*or* to the \\\\_\\\\_\\\\_\\\\_\\\\_\\\\_\\\\_\\\\_\\\\_ people\\\\]: Raise up in this and every land evangelists and heralds of your kingdom, that your Church may proclaim the unsearchable riches of our Savior Jesus Christ; who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(218, '{"type": "collect", "filter": {"type": "proper", "content": "Pastor"}, "text": "O God, our heavenly Father, you raised up your faithful servant *N.* to be a \\\\[Bishop and\\\\] pastor in your Church and to feed your flock: Give abundantly to all pastors the gifts of your Holy Spirit, that they may minister in your household as true servants of Christ and stewards of your divine mysteries; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(219, '{"type": "collect", "filter": {"type": "proper", "content": "TeacherOfTheFaith"}, "text": "Almighty God, you gave your servant *N.* special gifts of grace to understand and teach the truth revealed in Christ Jesus: Grant that by this teaching we may know you, the one true God, and Jesus Christ whom you have sent; who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(220, '{"type": "collect", "filter": {"type": "proper", "content": "Monastic"}, "text": "O God, your blessed Son became poor for our sake, and chose the Cross over the kingdoms of this world: Deliver us from an inordinate love of worldly things, that we, inspired by the devotion of your servant *N.*, may seek you with singleness of heart, behold your glory by faith, and attain to the riches of your everlasting kingdom, where we shall be united with our Savior Jesus Christ; who lives and reigns with you and the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(221, '{"type": "collect", "filter": {"type": "proper", "content": "Ecumenist"}, "text": "Almighty God, we give you thanks for the ministry of *N.*, who labored that the Church of Jesus Christ might be one: Grant that we, instructed by *his* teaching and example, and knit together in unity by your Spirit, may ever stand firm upon the one foundation, which is Jesus Christ our Lord; who lives and reigns with you, in the unity of the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(222, '{"type": "collect", "filter": {"type": "proper", "content": "ReformerOfTheChurch"}, "text": "O God, by your grace your servant *N.*, kindled by the flame of your love, became a burning and shining light in your Church, turning pride into humility and error into truth: Grant that we may be set aflame with the same spirit of love and discipline, and walk before you as children of light; through Jesus Christ our Lord, who lives and reigns with you, in the unity of the Holy Spirit, one God, now and for ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(223, '{"type": "collect", "filter": {"type": "proper", "content": "RenewerOfSociety"}, "text": "Almighty and everlasting God, you kindled the flame of your love in the heart of your servant *N.* to manifest your compassion and mercy to the poor and the persecuted: Grant to us, your humble servants, a like faith and power of love, that we who give thanks for *his* righteous zeal may profit by *his* example; through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(224, '{"type": "collect", "filter": {"type": "proper", "content": "Commemoration"}, "text": "Almighty God, you have surrounded us with a great cloud of witnesses: Grant that we, encouraged by the good example of your servant *N.*, may persevere in running the race that is set before us, until at last, with *him*, we attain to your eternal joy; through Jesus Christ, the pioneer and perfecter of our faith, who lives and reigns with you and the Holy Spirit, one God, for ever and ever. **Amen.**", "default_order": 0}');
-INSERT INTO "texts" VALUES(225, '{"type": "collect", "filter": {"type": "proper", "content": "Commemoration"}, "text": "Almighty God, by your Holy Spirit you have made us one with your saints in heaven and on earth: Grant that in our earthly pilgrimage we may always be supported by this fellowship of love and prayer, and know ourselves to be surrounded by their witness to your power and mercy; for the sake of Jesus Christ, in whom all our intercessions are acceptable through the Spirit, and who lives and reigns with you and the same Spirit, one God, for ever and ever. **Amen.**", "default_order": 1}');
-INSERT INTO "texts" VALUES(226, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventI"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "2:1-5", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(227, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventI"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "64:1-9a", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(228, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventI"}, "reading": 1, "option_group": null, "optional": false, "book": "Zech", "book_name": "Zechariah", "reference_long": "14:1-9", "reference_short": "14:3-9", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(229, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventI"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "122", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(230, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventI"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "80", "reference_short": "80:1-7", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(231, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventI"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "50", "reference_short": "50:1-6", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(232, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventI"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "13:8-14", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(233, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventI"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "1:1-9", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(234, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventI"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Thess", "book_name": "I Thessalonians", "reference_long": "3:6-13", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(235, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventI"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "24:29-44", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(236, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventI"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "13:24-37", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(237, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventI"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "21:25-33", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(238, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventII"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "11:1-10", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(239, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventII"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "40:1-11", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(240, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventII"}, "reading": 1, "option_group": null, "optional": false, "book": "Mal", "book_name": "Malachi", "reference_long": "3:1-5", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(241, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventII"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "72", "reference_short": "72:1-15", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(242, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventII"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "85", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(243, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventII"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "126", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(244, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventII"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "15:1-13", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(245, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventII"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Pet", "book_name": "II Peter", "reference_long": "3:8-18", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(246, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventII"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "4", "reference_short": "4:8-21", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(247, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventII"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "3:1-12", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(248, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventII"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "1:1-8", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(249, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventII"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "3:1-6", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(250, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventIII"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "35", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(251, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventIII"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "65:17-25", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(252, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventIII"}, "reading": 1, "option_group": null, "optional": false, "book": "Zeph", "book_name": "Zephaniah", "reference_long": "3:14-20", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(253, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventIII"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "146", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(254, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventIII"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "126", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(255, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventIII"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "85", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(256, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventIII"}, "reading": 3, "option_group": null, "optional": false, "book": "Jas", "book_name": "James", "reference_long": "5:7-20", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(257, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventIII"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Thess", "book_name": "I Thessalonians", "reference_long": "5:12-28", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(258, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventIII"}, "reading": 3, "option_group": null, "optional": false, "book": "Phil", "book_name": "Philippians", "reference_long": "4:4-9", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(259, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventIII"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "11:2-19", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(260, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventIII"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "3:22-30", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(261, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventIII"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "1:19-28", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 2}');
-INSERT INTO "texts" VALUES(262, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventIII"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "3:7-20", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(263, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventIV"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "7:10-17", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(264, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventIV"}, "reading": 1, "option_group": null, "optional": false, "book": "2 Sam", "book_name": "II Samuel", "reference_long": "7:1-17", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(265, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventIV"}, "reading": 1, "option_group": null, "optional": false, "book": "Mic", "book_name": "Micah", "reference_long": "5:2-5a", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(266, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventIV"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "24", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(267, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventIV"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "132", "reference_short": "132:8-19", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(268, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventIV"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "80:1-7", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(269, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventIV"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "1:1-7", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(270, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventIV"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "16:25-27", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(271, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventIV"}, "reading": 3, "option_group": null, "optional": false, "book": "Heb", "book_name": "Hebrews", "reference_long": "10:1-10", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(272, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventIV"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "1:18-25", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(273, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventIV"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "1:26-38", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(274, '{"type": "lesson", "filter": {"type": "proper", "content": "AdventIV"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "1:39-56", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(275, '{"type": "lesson", "filter": {"type": "proper", "content": "Christmas"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "9:1-7", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(276, '{"type": "lesson", "filter": {"type": "proper", "content": "Christmas"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "96", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(277, '{"type": "lesson", "filter": {"type": "proper", "content": "Christmas"}, "reading": 3, "option_group": null, "optional": false, "book": "Titus", "book_name": "Titus", "reference_long": "2:11-14", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(278, '{"type": "lesson", "filter": {"type": "proper", "content": "Christmas"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "2:1-20", "reference_short": "2:1-14", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(279, '{"type": "lesson", "filter": {"type": "proper", "content": "Christmas"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "62:6-12", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(280, '{"type": "lesson", "filter": {"type": "proper", "content": "Christmas"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "97", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(281, '{"type": "lesson", "filter": {"type": "proper", "content": "Christmas"}, "reading": 3, "option_group": null, "optional": false, "book": "Titus", "book_name": "Titus", "reference_long": "3:4-7", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(282, '{"type": "lesson", "filter": {"type": "proper", "content": "Christmas"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "2:1-20", "reference_short": "2:15-20", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(283, '{"type": "lesson", "filter": {"type": "proper", "content": "Christmas"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "52:7-12", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(284, '{"type": "lesson", "filter": {"type": "proper", "content": "Christmas"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "98", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(285, '{"type": "lesson", "filter": {"type": "proper", "content": "Christmas"}, "reading": 3, "option_group": null, "optional": false, "book": "Heb", "book_name": "Hebrews", "reference_long": "1:1-12", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(286, '{"type": "lesson", "filter": {"type": "proper", "content": "Christmas"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "1:1-18", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(287, '{"type": "lesson", "filter": {"type": "proper", "content": "ChristmasI"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "61:10-62:5", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(288, '{"type": "lesson", "filter": {"type": "proper", "content": "ChristmasI"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "147:12-20", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(289, '{"type": "lesson", "filter": {"type": "proper", "content": "ChristmasI"}, "reading": 3, "option_group": null, "optional": false, "book": "Gal", "book_name": "Galatians", "reference_long": "3:23-4:7", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(290, '{"type": "lesson", "filter": {"type": "proper", "content": "ChristmasI"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "1:1-18", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(291, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyName"}, "reading": 1, "option_group": null, "optional": false, "book": "Exod", "book_name": "Exodus", "reference_long": "34:1-9", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(292, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyName"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "8", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(293, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyName"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "1:1-7", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(294, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyName"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "2:15-21", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(295, '{"type": "lesson", "filter": {"type": "proper", "content": "ChristmasII"}, "reading": 1, "option_group": null, "optional": false, "book": "Jer", "book_name": "Jeremiah", "reference_long": "31:7-14", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(296, '{"type": "lesson", "filter": {"type": "proper", "content": "ChristmasII"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "84", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(297, '{"type": "lesson", "filter": {"type": "proper", "content": "ChristmasII"}, "reading": 3, "option_group": null, "optional": false, "book": "Eph", "book_name": "Ephesians", "reference_long": "1:3-14", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(298, '{"type": "lesson", "filter": {"type": "proper", "content": "ChristmasII"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "2:41-52", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(299, '{"type": "lesson", "filter": {"type": "proper", "content": "ChristmasII"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "2:1-12", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(300, '{"type": "lesson", "filter": {"type": "proper", "content": "ChristmasII"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "2:13-23", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(301, '{"type": "lesson", "filter": {"type": "proper", "content": "ChristmasII"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "2:22-40", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(302, '{"type": "lesson", "filter": {"type": "proper", "content": "Epiphany"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "60:1-9", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(303, '{"type": "lesson", "filter": {"type": "proper", "content": "Epiphany"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "72", "reference_short": "72:1-11", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(304, '{"type": "lesson", "filter": {"type": "proper", "content": "Epiphany"}, "reading": 3, "option_group": null, "optional": false, "book": "Eph", "book_name": "Ephesians", "reference_long": "3:1-13", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(305, '{"type": "lesson", "filter": {"type": "proper", "content": "Epiphany"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "2:1-12", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(306, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyI"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "42:1-9", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(307, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyI"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "89:1-29", "reference_short": "89:20-29", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(308, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyI"}, "reading": 3, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "10:34-38", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(309, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyI"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "3:13-17", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(310, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyI"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "1:7-11", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(311, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyI"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "3:15-22", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(312, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyII"}, "reading": 1, "option_group": null, "optional": false, "book": "Exod", "book_name": "Exodus", "reference_long": "12:21-28", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(313, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyII"}, "reading": 1, "option_group": null, "optional": false, "book": "1 Sam", "book_name": "I Samuel", "reference_long": "3:1-20", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(314, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyII"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "62:1-5", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(315, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyII"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "40:1-11", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(316, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyII"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "63", "reference_short": "63:1-9", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(317, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyII"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "96", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(318, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyII"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "1:1-9", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(319, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyII"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "6:9-20", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(320, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyII"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "12:1-11", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(321, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyII"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "1:29-42", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(322, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyII"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "1:43-51", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(323, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyII"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "2:1-11", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(324, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyIII"}, "reading": 1, "option_group": 1, "optional": false, "book": "Amos", "book_name": "Amos", "reference_long": "3:1-11", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(325, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyIII"}, "reading": 1, "option_group": 1, "optional": false, "book": "Jer", "book_name": "Jeremiah", "reference_long": "3:19-4:4", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(326, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyIII"}, "reading": 1, "option_group": 1, "optional": false, "book": "Neh", "book_name": "Nehemiah", "reference_long": "8:1-12", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(327, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyIII"}, "reading": 2, "option_group": 1, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "139:1-18", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(328, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyIII"}, "reading": 2, "option_group": 1, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "130", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(329, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyIII"}, "reading": 2, "option_group": 1, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "113", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(330, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyIII"}, "reading": 3, "option_group": 1, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "1:10-17", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(331, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyIII"}, "reading": 3, "option_group": 1, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "7:17-24", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(332, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyIII"}, "reading": 3, "option_group": 1, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "12:12-27", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(333, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyIII"}, "reading": 5, "option_group": 1, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "4:12-22", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(334, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyIII"}, "reading": 5, "option_group": 1, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "1:14-20", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(335, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyIII"}, "reading": 5, "option_group": 1, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "4:14-21", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(336, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyIV"}, "reading": 1, "option_group": 1, "optional": false, "book": "Mic", "book_name": "Micah", "reference_long": "6:1-8", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(337, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyIV"}, "reading": 1, "option_group": 1, "optional": false, "book": "Deut", "book_name": "Deuteronomy", "reference_long": "18:15-22", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(338, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyIV"}, "reading": 1, "option_group": 1, "optional": false, "book": "Jer", "book_name": "Jeremiah", "reference_long": "1:4-10", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(339, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyIV"}, "reading": 2, "option_group": 1, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "37:1-11", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(340, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyIV"}, "reading": 2, "option_group": 1, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "111", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(341, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyIV"}, "reading": 2, "option_group": 1, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "71:11-20", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(342, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyIV"}, "reading": 3, "option_group": 1, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "1:18-31", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(343, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyIV"}, "reading": 3, "option_group": 1, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "8", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(344, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyIV"}, "reading": 3, "option_group": 1, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "14:12-25", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(345, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyIV"}, "reading": 5, "option_group": 1, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "5:1-12", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(346, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyIV"}, "reading": 5, "option_group": 1, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "1:21-28", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(347, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyIV"}, "reading": 5, "option_group": 1, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "4:21-32", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(348, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyV"}, "reading": 1, "option_group": 1, "optional": false, "book": "2 Kgs", "book_name": "II Kings", "reference_long": "22:8-20", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(349, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyV"}, "reading": 1, "option_group": 1, "optional": false, "book": "2 Kgs", "book_name": "II Kings", "reference_long": "4:8-37", "reference_short": "4:8-21,32-37", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(350, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyV"}, "reading": 1, "option_group": 1, "optional": false, "book": "Judg", "book_name": "Judges", "reference_long": "6:11-24", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(351, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyV"}, "reading": 2, "option_group": 1, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "27", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(352, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyV"}, "reading": 2, "option_group": 1, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "142", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(353, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyV"}, "reading": 2, "option_group": 1, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "85", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(354, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyV"}, "reading": 3, "option_group": 1, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "2", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(355, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyV"}, "reading": 3, "option_group": 1, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "9:16-23", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(356, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyV"}, "reading": 3, "option_group": 1, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "15:1-11", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(357, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyV"}, "reading": 5, "option_group": 1, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "5:13-20", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(358, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyV"}, "reading": 5, "option_group": 1, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "1:29-39", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(359, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyV"}, "reading": 5, "option_group": 1, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "5:1-11", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(360, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVI"}, "reading": 1, "option_group": 1, "optional": false, "book": "Sir", "book_name": "Sirach", "reference_long": "15:11-20", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(361, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVI"}, "reading": 1, "option_group": 1, "optional": false, "book": "2 Kgs", "book_name": "II Kings", "reference_long": "5:1-15a", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(362, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVI"}, "reading": 1, "option_group": 1, "optional": false, "book": "Jer", "book_name": "Jeremiah", "reference_long": "17:5-10", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(363, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVI"}, "reading": 2, "option_group": 1, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "119:1-16", "reference_short": "119:9-16", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(364, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVI"}, "reading": 2, "option_group": 1, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "42", "reference_short": "42:1-7", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(365, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVI"}, "reading": 2, "option_group": 1, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "1", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(366, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVI"}, "reading": 3, "option_group": 1, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "3:1-9", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(367, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVI"}, "reading": 3, "option_group": 1, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "9:24-27", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(368, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVI"}, "reading": 3, "option_group": 1, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "15:12-20", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(369, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVI"}, "reading": 5, "option_group": 1, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "5:21-37", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(370, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVI"}, "reading": 5, "option_group": 1, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "1:40-45", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(371, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVI"}, "reading": 5, "option_group": 1, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "6:17-26", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(372, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVII"}, "reading": 1, "option_group": 1, "optional": false, "book": "Lev", "book_name": "Leviticus", "reference_long": "19:1-2,9-18", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(373, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVII"}, "reading": 1, "option_group": 1, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "43:18-25", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(374, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVII"}, "reading": 1, "option_group": 1, "optional": false, "book": "Gen", "book_name": "Genesis", "reference_long": "45:3-11,21-28", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(375, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVII"}, "reading": 2, "option_group": 1, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "71", "reference_short": "71:11-23", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(376, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVII"}, "reading": 2, "option_group": 1, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "32", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(377, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVII"}, "reading": 2, "option_group": 1, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "37:1-17", "reference_short": "37:8-17", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(378, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVII"}, "reading": 3, "option_group": 1, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "3:10-23", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(379, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVII"}, "reading": 3, "option_group": 1, "optional": false, "book": "2 Cor", "book_name": "II Corinthians", "reference_long": "1:18-22", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(380, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVII"}, "reading": 3, "option_group": 1, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "15:35-49", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(381, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVII"}, "reading": 5, "option_group": 1, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "5:38-48", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(382, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVII"}, "reading": 5, "option_group": 1, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "2:1-12", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(383, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVII"}, "reading": 5, "option_group": 1, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "6:27-38", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(384, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVIII"}, "reading": 1, "option_group": 1, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "49:8-23", "reference_short": "49:8-18", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(385, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVIII"}, "reading": 1, "option_group": 1, "optional": false, "book": "Hos", "book_name": "Hosea", "reference_long": "2:14-23", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(386, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVIII"}, "reading": 1, "option_group": 1, "optional": false, "book": "Jer", "book_name": "Jeremiah", "reference_long": "7:1-15", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(387, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVIII"}, "reading": 2, "option_group": 1, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "62", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(388, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVIII"}, "reading": 2, "option_group": 1, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "103", "reference_short": "103:1-14", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(389, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVIII"}, "reading": 2, "option_group": 1, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "92", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(390, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVIII"}, "reading": 3, "option_group": 1, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "4:1-13", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(391, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVIII"}, "reading": 3, "option_group": 1, "optional": false, "book": "2 Cor", "book_name": "II Corinthians", "reference_long": "3:4-18", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(392, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVIII"}, "reading": 3, "option_group": 1, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "15:50-58", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(393, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVIII"}, "reading": 5, "option_group": 1, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "6:24-34", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(394, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVIII"}, "reading": 5, "option_group": 1, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "2:18-22", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(395, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyVIII"}, "reading": 5, "option_group": 1, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "6:39-49", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(396, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyPaenultima"}, "reading": 1, "option_group": 2, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "49:1-7", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(397, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyPaenultima"}, "reading": 1, "option_group": 2, "optional": false, "book": "Gen", "book_name": "Genesis", "reference_long": "12:1-3", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(398, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyPaenultima"}, "reading": 1, "option_group": 2, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "61:1-4", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(399, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyPaenultima"}, "reading": 2, "option_group": 2, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "67", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(400, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyPaenultima"}, "reading": 2, "option_group": 2, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "86:8-13", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(401, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyPaenultima"}, "reading": 2, "option_group": 2, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "96", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(402, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyPaenultima"}, "reading": 3, "option_group": 2, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "1:1-8", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(403, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyPaenultima"}, "reading": 3, "option_group": 2, "optional": false, "book": "Rev", "book_name": "Revelation", "reference_long": "7:9-17", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(404, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyPaenultima"}, "reading": 3, "option_group": 2, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "10:9-17", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(405, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyPaenultima"}, "reading": 5, "option_group": 2, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "9:35-38", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(406, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyPaenultima"}, "reading": 5, "option_group": 2, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "28:16-20", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(407, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyPaenultima"}, "reading": 5, "option_group": 2, "optional": false, "book": "John", "book_name": "John", "reference_long": "20:19-31", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(408, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyUltima"}, "reading": 1, "option_group": null, "optional": false, "book": "Exod", "book_name": "Exodus", "reference_long": "24:12-18", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(409, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyUltima"}, "reading": 1, "option_group": null, "optional": false, "book": "1 Kgs", "book_name": "I Kings", "reference_long": "19:9-18", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(410, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyUltima"}, "reading": 1, "option_group": null, "optional": false, "book": "Exod", "book_name": "Exodus", "reference_long": "34:29-35", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(411, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyUltima"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "99", "reference_short": "_", "note": "_", "subcycles": ["A", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(412, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyUltima"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "27", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(413, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyUltima"}, "reading": 3, "option_group": null, "optional": false, "book": "Phil", "book_name": "Philippians", "reference_long": "3:7-14", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(414, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyUltima"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Pet", "book_name": "II Peter", "reference_long": "1:13-21", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(415, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyUltima"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "12:27-13:13", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(416, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyUltima"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "17:1-9", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(417, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyUltima"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "9:2-9", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(418, '{"type": "lesson", "filter": {"type": "proper", "content": "EpiphanyUltima"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "9:28-36", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(419, '{"type": "lesson", "filter": {"type": "proper", "content": "AshWednesday"}, "reading": 1, "option_group": null, "optional": false, "book": "Joel", "book_name": "Joel", "reference_long": "2:1-2,12-17", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(420, '{"type": "lesson", "filter": {"type": "proper", "content": "AshWednesday"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "58:1-12", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(421, '{"type": "lesson", "filter": {"type": "proper", "content": "AshWednesday"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "103", "reference_short": "103:8-14", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(422, '{"type": "lesson", "filter": {"type": "proper", "content": "AshWednesday"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Cor", "book_name": "II Corinthians", "reference_long": "5:20-6:10", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(423, '{"type": "lesson", "filter": {"type": "proper", "content": "AshWednesday"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "6:1-6,16-21", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(424, '{"type": "lesson", "filter": {"type": "proper", "content": "LentI"}, "reading": 1, "option_group": null, "optional": false, "book": "Gen", "book_name": "Genesis", "reference_long": "2:4-9,15-17,25;3:1-7", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(425, '{"type": "lesson", "filter": {"type": "proper", "content": "LentI"}, "reading": 1, "option_group": null, "optional": false, "book": "Gen", "book_name": "Genesis", "reference_long": "9:8-17", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(426, '{"type": "lesson", "filter": {"type": "proper", "content": "LentI"}, "reading": 1, "option_group": null, "optional": false, "book": "Deut", "book_name": "Deuteronomy", "reference_long": "26:1-11", "reference_short": "26:5-11", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(427, '{"type": "lesson", "filter": {"type": "proper", "content": "LentI"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "51", "reference_short": "51:1-12", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(428, '{"type": "lesson", "filter": {"type": "proper", "content": "LentI"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "25", "reference_short": "25:3-9", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(429, '{"type": "lesson", "filter": {"type": "proper", "content": "LentI"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "91", "reference_short": "91:9-16", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(430, '{"type": "lesson", "filter": {"type": "proper", "content": "LentI"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "5:12-21", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(431, '{"type": "lesson", "filter": {"type": "proper", "content": "LentI"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Pet", "book_name": "I Peter", "reference_long": "3:18-22", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(432, '{"type": "lesson", "filter": {"type": "proper", "content": "LentI"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "10:4-13", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(433, '{"type": "lesson", "filter": {"type": "proper", "content": "LentI"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "4:1-11", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(434, '{"type": "lesson", "filter": {"type": "proper", "content": "LentI"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "1:9-13", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(435, '{"type": "lesson", "filter": {"type": "proper", "content": "LentI"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "4:1-13", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(436, '{"type": "lesson", "filter": {"type": "proper", "content": "LentII"}, "reading": 1, "option_group": null, "optional": false, "book": "Gen", "book_name": "Genesis", "reference_long": "12:1-9", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(437, '{"type": "lesson", "filter": {"type": "proper", "content": "LentII"}, "reading": 1, "option_group": null, "optional": false, "book": "Gen", "book_name": "Genesis", "reference_long": "22:1-14", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(438, '{"type": "lesson", "filter": {"type": "proper", "content": "LentII"}, "reading": 1, "option_group": null, "optional": false, "book": "Gen", "book_name": "Genesis", "reference_long": "15:1-18", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(439, '{"type": "lesson", "filter": {"type": "proper", "content": "LentII"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "33:12-21", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(440, '{"type": "lesson", "filter": {"type": "proper", "content": "LentII"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "16", "reference_short": "16:6-12", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(441, '{"type": "lesson", "filter": {"type": "proper", "content": "LentII"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "27", "reference_short": "27:9-17", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(442, '{"type": "lesson", "filter": {"type": "proper", "content": "LentII"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "4:1-17", "reference_short": "4:1-5,13-17", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(443, '{"type": "lesson", "filter": {"type": "proper", "content": "LentII"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "8:31-39", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(444, '{"type": "lesson", "filter": {"type": "proper", "content": "LentII"}, "reading": 3, "option_group": null, "optional": false, "book": "Phil", "book_name": "Philippians", "reference_long": "3:17-4:1", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(445, '{"type": "lesson", "filter": {"type": "proper", "content": "LentII"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "3:1-16", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(446, '{"type": "lesson", "filter": {"type": "proper", "content": "LentII"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "8:31-38", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(447, '{"type": "lesson", "filter": {"type": "proper", "content": "LentII"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "13:22-35", "reference_short": "13:31-35", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(448, '{"type": "lesson", "filter": {"type": "proper", "content": "LentIII"}, "reading": 1, "option_group": null, "optional": false, "book": "Exod", "book_name": "Exodus", "reference_long": "17:1-7", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(449, '{"type": "lesson", "filter": {"type": "proper", "content": "LentIII"}, "reading": 1, "option_group": null, "optional": false, "book": "Exod", "book_name": "Exodus", "reference_long": "20:1-21", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(450, '{"type": "lesson", "filter": {"type": "proper", "content": "LentIII"}, "reading": 1, "option_group": null, "optional": false, "book": "Exod", "book_name": "Exodus", "reference_long": "3:1-15", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(451, '{"type": "lesson", "filter": {"type": "proper", "content": "LentIII"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "95", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(452, '{"type": "lesson", "filter": {"type": "proper", "content": "LentIII"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "19:7-14", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(453, '{"type": "lesson", "filter": {"type": "proper", "content": "LentIII"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "103", "reference_short": "103:1-12", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(454, '{"type": "lesson", "filter": {"type": "proper", "content": "LentIII"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "1:16-32", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(455, '{"type": "lesson", "filter": {"type": "proper", "content": "LentIII"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "7:12-25", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(456, '{"type": "lesson", "filter": {"type": "proper", "content": "LentIII"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "10:1-13", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(457, '{"type": "lesson", "filter": {"type": "proper", "content": "LentIII"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "4:5-42", "reference_short": "4:5-26,39-42", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(458, '{"type": "lesson", "filter": {"type": "proper", "content": "LentIII"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "2:13-22", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(459, '{"type": "lesson", "filter": {"type": "proper", "content": "LentIII"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "13:1-17", "reference_short": "13:1-9", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(460, '{"type": "lesson", "filter": {"type": "proper", "content": "LentIV"}, "reading": 1, "option_group": null, "optional": false, "book": "1 Sam", "book_name": "I Samuel", "reference_long": "16:1-13", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(461, '{"type": "lesson", "filter": {"type": "proper", "content": "LentIV"}, "reading": 1, "option_group": null, "optional": false, "book": "2 Chr", "book_name": "II Chronicles", "reference_long": "36:14-23", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(462, '{"type": "lesson", "filter": {"type": "proper", "content": "LentIV"}, "reading": 1, "option_group": null, "optional": false, "book": "Josh", "book_name": "Joshua", "reference_long": "4:19-5:12", "reference_short": "5:1,9-12", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(463, '{"type": "lesson", "filter": {"type": "proper", "content": "LentIV"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "23", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(464, '{"type": "lesson", "filter": {"type": "proper", "content": "LentIV"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "122", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(465, '{"type": "lesson", "filter": {"type": "proper", "content": "LentIV"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "34", "reference_short": "34:1-8", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(466, '{"type": "lesson", "filter": {"type": "proper", "content": "LentIV"}, "reading": 3, "option_group": null, "optional": false, "book": "Eph", "book_name": "Ephesians", "reference_long": "5:1-14", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(467, '{"type": "lesson", "filter": {"type": "proper", "content": "LentIV"}, "reading": 3, "option_group": null, "optional": false, "book": "Eph", "book_name": "Ephesians", "reference_long": "2:1-10", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(468, '{"type": "lesson", "filter": {"type": "proper", "content": "LentIV"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Cor", "book_name": "II Corinthians", "reference_long": "5:17-21", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(469, '{"type": "lesson", "filter": {"type": "proper", "content": "LentIV"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "9:1-13,28-41", "reference_short": "9:1-13,28-38", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(470, '{"type": "lesson", "filter": {"type": "proper", "content": "LentIV"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "6:1-15", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(471, '{"type": "lesson", "filter": {"type": "proper", "content": "LentIV"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "15:11-32", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(472, '{"type": "lesson", "filter": {"type": "proper", "content": "LentV"}, "reading": 1, "option_group": null, "optional": false, "book": "Ezek", "book_name": "Ezekiel", "reference_long": "37:1-14", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(473, '{"type": "lesson", "filter": {"type": "proper", "content": "LentV"}, "reading": 1, "option_group": null, "optional": false, "book": "Jer", "book_name": "Jeremiah", "reference_long": "31:31-34", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(474, '{"type": "lesson", "filter": {"type": "proper", "content": "LentV"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "43:16-21", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(475, '{"type": "lesson", "filter": {"type": "proper", "content": "LentV"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "130", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(476, '{"type": "lesson", "filter": {"type": "proper", "content": "LentV"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "51", "reference_short": "51:10-15", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(477, '{"type": "lesson", "filter": {"type": "proper", "content": "LentV"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "126", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(478, '{"type": "lesson", "filter": {"type": "proper", "content": "LentV"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "6:15-23", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(479, '{"type": "lesson", "filter": {"type": "proper", "content": "LentV"}, "reading": 3, "option_group": null, "optional": false, "book": "Heb", "book_name": "Hebrews", "reference_long": "4:14-5:10", "reference_short": "5:1-10", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(480, '{"type": "lesson", "filter": {"type": "proper", "content": "LentV"}, "reading": 3, "option_group": null, "optional": false, "book": "Phil", "book_name": "Philippians", "reference_long": "3:7-16", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(481, '{"type": "lesson", "filter": {"type": "proper", "content": "LentV"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "11:1-44", "reference_short": "11:18-44", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(482, '{"type": "lesson", "filter": {"type": "proper", "content": "LentV"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "12:20-36", "reference_short": "12:20-33", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(483, '{"type": "lesson", "filter": {"type": "proper", "content": "LentV"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "20:9-19", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(484, '{"type": "lesson", "filter": {"type": "proper", "content": "PalmSunday"}, "reading": 0, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "21:1-11", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(485, '{"type": "lesson", "filter": {"type": "proper", "content": "PalmSunday"}, "reading": 0, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "11:1-11a", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(486, '{"type": "lesson", "filter": {"type": "proper", "content": "PalmSunday"}, "reading": 0, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "19:29-40", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(487, '{"type": "lesson", "filter": {"type": "proper", "content": "PalmSunday"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "118:19-29", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(488, '{"type": "lesson", "filter": {"type": "proper", "content": "PalmSunday"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "52:13-53:12", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(489, '{"type": "lesson", "filter": {"type": "proper", "content": "PalmSunday"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "22:1-21", "reference_short": "22:1-11", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(490, '{"type": "lesson", "filter": {"type": "proper", "content": "PalmSunday"}, "reading": 3, "option_group": null, "optional": false, "book": "Phil", "book_name": "Philippians", "reference_long": "2:5-11", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(491, '{"type": "lesson", "filter": {"type": "proper", "content": "PalmSunday"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "26:36-27:66", "reference_short": "27:1-54", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(492, '{"type": "lesson", "filter": {"type": "proper", "content": "PalmSunday"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "14:32-15:47", "reference_short": "15:1-39", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(493, '{"type": "lesson", "filter": {"type": "proper", "content": "PalmSunday"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "22:39-23:56", "reference_short": "23:1-49", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(494, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyMonday"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "42:1-9", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(495, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyMonday"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "36:5-10", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(496, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyMonday"}, "reading": 3, "option_group": null, "optional": false, "book": "Heb", "book_name": "Hebrews", "reference_long": "11:39-12:3", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(497, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyMonday"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "12:1-11", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(498, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyMonday"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "14:3-9", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(499, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyTuesday"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "49:1-6", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(500, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyTuesday"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "71:1-11", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(501, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyTuesday"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "1:18-31", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(502, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyTuesday"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "12:37-38,42-50", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(503, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyTuesday"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "11:15-19", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(504, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyWednesday"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "50:4-9", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(505, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyWednesday"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "69:6-14,21-22", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(506, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyWednesday"}, "reading": 3, "option_group": null, "optional": false, "book": "Heb", "book_name": "Hebrews", "reference_long": "9:11-28", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(507, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyWednesday"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "26:1-5,14-25", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(508, '{"type": "lesson", "filter": {"type": "proper", "content": "MaundyThursday"}, "reading": 1, "option_group": null, "optional": false, "book": "Exod", "book_name": "Exodus", "reference_long": "12:1-14", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(509, '{"type": "lesson", "filter": {"type": "proper", "content": "MaundyThursday"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "78:15-26", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(510, '{"type": "lesson", "filter": {"type": "proper", "content": "MaundyThursday"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "11:23-34", "reference_short": "11:23-26", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(511, '{"type": "lesson", "filter": {"type": "proper", "content": "MaundyThursday"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "13:1-15", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(512, '{"type": "lesson", "filter": {"type": "proper", "content": "MaundyThursday"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "22:14-30", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(513, '{"type": "lesson", "filter": {"type": "proper", "content": "GoodFriday"}, "reading": 1, "option_group": null, "optional": false, "book": "Gen", "book_name": "Genesis", "reference_long": "22:1-18", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(514, '{"type": "lesson", "filter": {"type": "proper", "content": "GoodFriday"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "52:13-53:12", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(515, '{"type": "lesson", "filter": {"type": "proper", "content": "GoodFriday"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "22:1-21", "reference_short": "22:1-11", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(516, '{"type": "lesson", "filter": {"type": "proper", "content": "GoodFriday"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "40:1-16", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(517, '{"type": "lesson", "filter": {"type": "proper", "content": "GoodFriday"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "69:1-22", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 3}');
-INSERT INTO "texts" VALUES(518, '{"type": "lesson", "filter": {"type": "proper", "content": "GoodFriday"}, "reading": 3, "option_group": null, "optional": false, "book": "Heb", "book_name": "Hebrews", "reference_long": "10:1-25", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(519, '{"type": "lesson", "filter": {"type": "proper", "content": "GoodFriday"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "18:1-19:37", "reference_short": "19:1-37", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(520, '{"type": "lesson", "filter": {"type": "proper", "content": "HolySaturday"}, "reading": 1, "option_group": null, "optional": false, "book": "Job", "book_name": "Job", "reference_long": "14:1-17", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(521, '{"type": "lesson", "filter": {"type": "proper", "content": "HolySaturday"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "130", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(522, '{"type": "lesson", "filter": {"type": "proper", "content": "HolySaturday"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "88", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(523, '{"type": "lesson", "filter": {"type": "proper", "content": "HolySaturday"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "31:1-6", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 3}');
-INSERT INTO "texts" VALUES(524, '{"type": "lesson", "filter": {"type": "proper", "content": "HolySaturday"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Pet", "book_name": "I Peter", "reference_long": "4:1-8", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(525, '{"type": "lesson", "filter": {"type": "proper", "content": "HolySaturday"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "27:57-66", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(526, '{"type": "lesson", "filter": {"type": "proper", "content": "HolySaturday"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "19:38-42", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(527, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 1, "option_group": 1, "optional": true, "book": "Gen", "book_name": "Genesis", "reference_long": "1:1-2:3", "reference_short": "_", "note": "The Creation", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(528, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 2, "option_group": 1, "optional": true, "book": "Ps", "book_name": "Psalm", "reference_long": "104:1-24", "reference_short": "104:1-13", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(529, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 2, "option_group": 1, "optional": true, "book": "Canticle", "book_name": "Canticle", "reference_long": "10", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(530, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 1, "option_group": 2, "optional": true, "book": "Gen", "book_name": "Genesis", "reference_long": "3", "reference_short": "_", "note": "The Fall", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(531, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 2, "option_group": 2, "optional": true, "book": "Ps", "book_name": "Psalm", "reference_long": "32", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(532, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 1, "option_group": 3, "optional": true, "book": "Gen", "book_name": "Genesis", "reference_long": "7:1-5,11-18;8:6-20;9:8-13", "reference_short": "_", "note": "The Flood", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(533, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 2, "option_group": 3, "optional": true, "book": "Ps", "book_name": "Psalm", "reference_long": "36", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(534, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 2, "option_group": 3, "optional": true, "book": "Ps", "book_name": "Psalm", "reference_long": "46", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(535, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 1, "option_group": 4, "optional": true, "book": "Gen", "book_name": "Genesis", "reference_long": "22:1-18", "reference_short": "_", "note": "Abraham’s sacrifice of Isaac", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(536, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 2, "option_group": 4, "optional": true, "book": "Ps", "book_name": "Psalm", "reference_long": "16", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(537, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 1, "option_group": 5, "optional": false, "book": "Exod", "book_name": "Exodus", "reference_long": "14:10-15:1", "reference_short": "_", "note": "Israel’s deliverance at the Red Sea", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(538, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 2, "option_group": 5, "optional": false, "book": "Canticle", "book_name": "Canticle", "reference_long": "5", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(539, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 1, "option_group": 6, "optional": true, "book": "Isa", "book_name": "Isaiah", "reference_long": "4:2-6", "reference_short": "_", "note": "God’s presence in a renewed Israel", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(540, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 2, "option_group": 6, "optional": true, "book": "Ps", "book_name": "Psalm", "reference_long": "122", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(541, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 1, "option_group": 7, "optional": true, "book": "Isa", "book_name": "Isaiah", "reference_long": "55:1-11", "reference_short": "_", "note": "Salvation offered freely to all", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(542, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 2, "option_group": 7, "optional": true, "book": "Canticle", "book_name": "Canticle", "reference_long": "8", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(543, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 2, "option_group": 7, "optional": true, "book": "Ps", "book_name": "Psalm", "reference_long": "42:1-7", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(544, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 1, "option_group": 8, "optional": true, "book": "Ezek", "book_name": "Ezekiel", "reference_long": "36:24-28", "reference_short": "_", "note": "A new heart and a new spirit", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(545, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 2, "option_group": 8, "optional": true, "book": "Ps", "book_name": "Psalm", "reference_long": "42:1-7", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(546, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 2, "option_group": 8, "optional": true, "book": "Canticle", "book_name": "Canticle", "reference_long": "8", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(547, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 1, "option_group": 9, "optional": true, "book": "Ezek", "book_name": "Ezekiel", "reference_long": "37:1-14", "reference_short": "_", "note": "The valley of dry bones", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(548, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 2, "option_group": 9, "optional": true, "book": "Ps", "book_name": "Psalm", "reference_long": "30", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(549, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 2, "option_group": 9, "optional": true, "book": "Ps", "book_name": "Psalm", "reference_long": "126", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(550, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 1, "option_group": 10, "optional": true, "book": "Dan", "book_name": "Daniel", "reference_long": "3:1-28", "reference_short": "_", "note": "The three young men in the furnace", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(551, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 2, "option_group": 10, "optional": true, "book": "Canticle", "book_name": "Canticle", "reference_long": "10", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(552, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 2, "option_group": 10, "optional": true, "book": "Canticle", "book_name": "Canticle", "reference_long": "Benedictus es, Domine", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(553, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 1, "option_group": 11, "optional": true, "book": "Jonah", "book_name": "Jonah", "reference_long": "1:1-2:10", "reference_short": "_", "note": "Jonah and the fish", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(554, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 2, "option_group": 11, "optional": true, "book": "Ps", "book_name": "Psalm", "reference_long": "130", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(555, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 1, "option_group": 12, "optional": true, "book": "Zeph", "book_name": "Zephaniah", "reference_long": "3:12-20", "reference_short": "_", "note": "The gathering of God’s people", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(556, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 2, "option_group": 12, "optional": true, "book": "Ps", "book_name": "Psalm", "reference_long": "98", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(557, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "6:3-11", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(558, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 4, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "114", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(559, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterEve"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "28:1-10", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(560, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 1, "option_group": null, "optional": false, "book": "Gen", "book_name": "Genesis", "reference_long": "1:1-2:3", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(561, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 1, "option_group": null, "optional": false, "book": "Gen", "book_name": "Genesis", "reference_long": "3", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(562, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 1, "option_group": null, "optional": false, "book": "Gen", "book_name": "Genesis", "reference_long": "7:1-5,11-18;8:6-20;9:8-13", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 3}');
-INSERT INTO "texts" VALUES(563, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 1, "option_group": null, "optional": false, "book": "Gen", "book_name": "Genesis", "reference_long": "22:1-18", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 4}');
-INSERT INTO "texts" VALUES(564, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 1, "option_group": null, "optional": false, "book": "Exod", "book_name": "Exodus", "reference_long": "14:10-15:1", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 5}');
-INSERT INTO "texts" VALUES(565, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "4:2-6", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 6}');
-INSERT INTO "texts" VALUES(566, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "55:1-11", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 7}');
-INSERT INTO "texts" VALUES(567, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 1, "option_group": null, "optional": false, "book": "Ezek", "book_name": "Ezekiel", "reference_long": "36:24-28", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 8}');
-INSERT INTO "texts" VALUES(568, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 1, "option_group": null, "optional": false, "book": "Ezek", "book_name": "Ezekiel", "reference_long": "37:1-14", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 9}');
-INSERT INTO "texts" VALUES(569, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 1, "option_group": null, "optional": false, "book": "Dan", "book_name": "Daniel", "reference_long": "3:1-28", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 10}');
-INSERT INTO "texts" VALUES(570, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 1, "option_group": null, "optional": false, "book": "Jonah", "book_name": "Jonah", "reference_long": "1:1-2:10", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 11}');
-INSERT INTO "texts" VALUES(571, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 1, "option_group": null, "optional": false, "book": "Zeph", "book_name": "Zephaniah", "reference_long": "3:12-20", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 12}');
-INSERT INTO "texts" VALUES(572, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "114", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(573, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "6:3-11", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(574, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "28:1-10", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(575, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 1, "option_group": null, "optional": false, "book": "Exod", "book_name": "Exodus", "reference_long": "14:10-14,21-31", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 2}');
-INSERT INTO "texts" VALUES(576, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "10:34-43", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(577, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "25:6-9", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 2}');
-INSERT INTO "texts" VALUES(578, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "51:9-11", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(579, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "118:14-17,22-24", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(580, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 3, "option_group": null, "optional": false, "book": "Col", "book_name": "Colossians", "reference_long": "3:1-4", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(581, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 3, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "10:34-43", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(582, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "20:1-18", "reference_short": "20:1-10", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(583, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "28:1-10", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 2}');
-INSERT INTO "texts" VALUES(584, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "16:1-8", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(585, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "24:1-12", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(586, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 1, "option_group": null, "optional": false, "book": "Dan", "book_name": "Daniel", "reference_long": "12:1-3", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(587, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "136", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(588, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "5:6-8", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(589, '{"type": "lesson", "filter": {"type": "proper", "content": "Easter"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "24:13-35", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(590, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterMonday"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "2:14,22-32", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(591, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterMonday"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "16", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(592, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterMonday"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "28:9-15", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(593, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterTuesday"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "2:14,36-41", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(594, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterTuesday"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "33:17-21", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(595, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterTuesday"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "20:11-18", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(596, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterWednesday"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "3:1-10", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(597, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterWednesday"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "105:1-8", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(598, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterWednesday"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "24:13-35", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(599, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterThursday"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "3:11-26", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(600, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterThursday"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "8", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(601, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterThursday"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "24:36-49", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(602, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterFriday"}, "reading": 1, "option_group": null, "optional": false, "book": "1 Pet", "book_name": "I Peter", "reference_long": "1:3-9", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(603, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterFriday"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "116:1-9", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(604, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterFriday"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "21:1-14", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(605, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterSaturday"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "4:1-22", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(606, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterSaturday"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "118:14-18", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(607, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterSaturday"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "16:9-20", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(608, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterII"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "2:14a,22-32", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(609, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterII"}, "reading": 1, "option_group": null, "optional": false, "book": "Gen", "book_name": "Genesis", "reference_long": "8:6-16;9:8-16", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 2}');
-INSERT INTO "texts" VALUES(610, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterII"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "3:12a,13-15,17-26", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(611, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterII"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "26:1-9,19", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 2}');
-INSERT INTO "texts" VALUES(612, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterII"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "5:12a,17-22,25-29", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(613, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterII"}, "reading": 1, "option_group": null, "optional": false, "book": "Job", "book_name": "Job", "reference_long": "42:1-6", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(614, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterII"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "111", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(615, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterII"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Pet", "book_name": "I Peter", "reference_long": "1:3-9", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(616, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterII"}, "reading": 3, "option_group": null, "optional": false, "book": "1 John", "book_name": "I John", "reference_long": "5:1-5", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(617, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterII"}, "reading": 3, "option_group": null, "optional": false, "book": "Rev", "book_name": "Revelation", "reference_long": "1:1-19", "reference_short": "1:9-19", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(618, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterII"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "20:19-31", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(619, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIII"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "2:14a,36-47", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(620, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIII"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "43:1-12", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 2}');
-INSERT INTO "texts" VALUES(621, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIII"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "4:5-14", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(622, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIII"}, "reading": 1, "option_group": null, "optional": false, "book": "Mic", "book_name": "Micah", "reference_long": "4:1-5", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 2}');
-INSERT INTO "texts" VALUES(623, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIII"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "9:1-19a", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(624, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIII"}, "reading": 1, "option_group": null, "optional": false, "book": "Jer", "book_name": "Jeremiah", "reference_long": "32:36-41", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(625, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIII"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "116:11-16", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(626, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIII"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "98", "reference_short": "98:1-5", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(627, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIII"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "33", "reference_short": "33:1-11", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(628, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIII"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Pet", "book_name": "I Peter", "reference_long": "1:13-25", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(629, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIII"}, "reading": 3, "option_group": null, "optional": false, "book": "1 John", "book_name": "I John", "reference_long": "1:1-2:2", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(630, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIII"}, "reading": 3, "option_group": null, "optional": false, "book": "Rev", "book_name": "Revelation", "reference_long": "5", "reference_short": "5:6-14", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(631, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIII"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "24:13-35", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(632, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIII"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "24:36-49", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(633, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIII"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "21:1-14", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(634, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIV"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "6:1-9;7:2a,51-60", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(635, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIV"}, "reading": 1, "option_group": null, "optional": false, "book": "Neh", "book_name": "Nehemiah", "reference_long": "9:1-3,6-15", "reference_short": "9:6-15", "note": "_", "subcycles": ["A"], "default_order": 2}');
-INSERT INTO "texts" VALUES(636, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIV"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "4:23-37", "reference_short": "4:32-37", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(637, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIV"}, "reading": 1, "option_group": null, "optional": false, "book": "Ezek", "book_name": "Ezekiel", "reference_long": "34:1-10", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 2}');
-INSERT INTO "texts" VALUES(638, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIV"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "13:14b-16,26-39", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(639, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIV"}, "reading": 1, "option_group": null, "optional": false, "book": "Num", "book_name": "Numbers", "reference_long": "27:12-23", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(640, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIV"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "23", "reference_short": "_", "note": "_", "subcycles": ["A", "B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(641, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIV"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "100", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(642, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIV"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Pet", "book_name": "I Peter", "reference_long": "2:13-25", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(643, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIV"}, "reading": 3, "option_group": null, "optional": false, "book": "1 John", "book_name": "I John", "reference_long": "3:1-10", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(644, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIV"}, "reading": 3, "option_group": null, "optional": false, "book": "Rev", "book_name": "Revelation", "reference_long": "7:9-17", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(645, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIV"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "10:1-10", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(646, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIV"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "10:11-16", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(647, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterIV"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "10:22-30", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(648, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterV"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "17:1-15", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(649, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterV"}, "reading": 1, "option_group": null, "optional": false, "book": "Deut", "book_name": "Deuteronomy", "reference_long": "6:20-25", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 2}');
-INSERT INTO "texts" VALUES(650, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterV"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "8:26-40", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(651, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterV"}, "reading": 1, "option_group": null, "optional": false, "book": "Deut", "book_name": "Deuteronomy", "reference_long": "4:32-40", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 2}');
-INSERT INTO "texts" VALUES(652, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterV"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "13:44-52", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(653, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterV"}, "reading": 1, "option_group": null, "optional": false, "book": "Lev", "book_name": "Leviticus", "reference_long": "19:1-2,9-18", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(654, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterV"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "66:1-11", "reference_short": "66:1-8", "note": "_", "subcycles": ["A", "B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(655, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterV"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "145", "reference_short": "145:1-9", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(656, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterV"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Pet", "book_name": "I Peter", "reference_long": "2:1-12", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(657, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterV"}, "reading": 3, "option_group": null, "optional": false, "book": "1 John", "book_name": "I John", "reference_long": "3:11-24", "reference_short": "3:18-24", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(658, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterV"}, "reading": 3, "option_group": null, "optional": false, "book": "Rev", "book_name": "Revelation", "reference_long": "19:1-9", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(659, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterV"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "14:1-14", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(660, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterV"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "14:15-21", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(661, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterV"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "13:31-35", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(662, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVI"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "17:16-34", "reference_short": "17:22-34", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(663, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVI"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "41:17-20", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 2}');
-INSERT INTO "texts" VALUES(664, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVI"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "11:19-30", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(665, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVI"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "45:11-13,18-25", "reference_short": "45:11-13,18-19", "note": "_", "subcycles": ["B"], "default_order": 2}');
-INSERT INTO "texts" VALUES(666, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVI"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "14:8-18", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(667, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVI"}, "reading": 1, "option_group": null, "optional": false, "book": "Joel", "book_name": "Joel", "reference_long": "2:21-27", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(668, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVI"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "148", "reference_short": "148:7-14", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(669, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVI"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "33", "reference_short": "33:1-8,18-22", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(670, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVI"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "67", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(671, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVI"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Pet", "book_name": "I Peter", "reference_long": "3:8-18", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(672, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVI"}, "reading": 3, "option_group": null, "optional": false, "book": "1 John", "book_name": "I John", "reference_long": "4:7-21", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(673, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVI"}, "reading": 3, "option_group": null, "optional": false, "book": "Rev", "book_name": "Revelation", "reference_long": "21:1-4,22-27;22:1-5", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(674, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVI"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "15:1-11", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(675, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVI"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "15:9-17", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(676, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVI"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "14:21-29", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(677, '{"type": "lesson", "filter": {"type": "proper", "content": "Ascension"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "1:1-11", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(678, '{"type": "lesson", "filter": {"type": "proper", "content": "Ascension"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "47", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(679, '{"type": "lesson", "filter": {"type": "proper", "content": "Ascension"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "110:1-5", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(680, '{"type": "lesson", "filter": {"type": "proper", "content": "Ascension"}, "reading": 3, "option_group": null, "optional": false, "book": "Eph", "book_name": "Ephesians", "reference_long": "1:15-23", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(681, '{"type": "lesson", "filter": {"type": "proper", "content": "Ascension"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "24:44-53", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(682, '{"type": "lesson", "filter": {"type": "proper", "content": "Ascension"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "16:9-20", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(683, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVII"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "1:1-14", "reference_short": "1:6-14", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(684, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVII"}, "reading": 1, "option_group": null, "optional": false, "book": "Ezek", "book_name": "Ezekiel", "reference_long": "39:21-29", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 2}');
-INSERT INTO "texts" VALUES(685, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVII"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "1:15-26", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(686, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVII"}, "reading": 1, "option_group": null, "optional": false, "book": "Exod", "book_name": "Exodus", "reference_long": "28:1-4,9-10,29-30", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 2}');
-INSERT INTO "texts" VALUES(687, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVII"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "16:16-34", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(688, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVII"}, "reading": 1, "option_group": null, "optional": false, "book": "1 Sam", "book_name": "I Samuel", "reference_long": "12:19-24", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(689, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVII"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "68:1-20", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(690, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVII"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "47", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(691, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVII"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Pet", "book_name": "I Peter", "reference_long": "4:12-19", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(692, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVII"}, "reading": 3, "option_group": null, "optional": false, "book": "1 John", "book_name": "I John", "reference_long": "5:6-15", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(693, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVII"}, "reading": 3, "option_group": null, "optional": false, "book": "Rev", "book_name": "Revelation", "reference_long": "22:10-21", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(694, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVII"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "17:1-11", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(695, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVII"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "17:11b-19", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(696, '{"type": "lesson", "filter": {"type": "proper", "content": "EasterVII"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "17:20-26", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(697, '{"type": "lesson", "filter": {"type": "proper", "content": "Pentecost"}, "reading": 1, "option_group": null, "optional": false, "book": "Gen", "book_name": "Genesis", "reference_long": "11:1-9", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(698, '{"type": "lesson", "filter": {"type": "proper", "content": "Pentecost"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "2:1-21", "reference_short": "2:1-11", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(699, '{"type": "lesson", "filter": {"type": "proper", "content": "Pentecost"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "104:24-35", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(700, '{"type": "lesson", "filter": {"type": "proper", "content": "Pentecost"}, "reading": 3, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "2:1-21", "reference_short": "2:1-11", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(701, '{"type": "lesson", "filter": {"type": "proper", "content": "Pentecost"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "12:4-13", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(702, '{"type": "lesson", "filter": {"type": "proper", "content": "Pentecost"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "14:8-17", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(703, '{"type": "lesson", "filter": {"type": "proper", "content": "TrinitySunday"}, "reading": 1, "option_group": null, "optional": false, "book": "Gen", "book_name": "Genesis", "reference_long": "1:1-2:3", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(704, '{"type": "lesson", "filter": {"type": "proper", "content": "TrinitySunday"}, "reading": 1, "option_group": null, "optional": false, "book": "Exod", "book_name": "Exodus", "reference_long": "3:1-6", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(705, '{"type": "lesson", "filter": {"type": "proper", "content": "TrinitySunday"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "6:1-7", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(706, '{"type": "lesson", "filter": {"type": "proper", "content": "TrinitySunday"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "150", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(707, '{"type": "lesson", "filter": {"type": "proper", "content": "TrinitySunday"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "93", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(708, '{"type": "lesson", "filter": {"type": "proper", "content": "TrinitySunday"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "29", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(709, '{"type": "lesson", "filter": {"type": "proper", "content": "TrinitySunday"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Cor", "book_name": "II Corinthians", "reference_long": "13:5-14", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(710, '{"type": "lesson", "filter": {"type": "proper", "content": "TrinitySunday"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "8:12-17", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(711, '{"type": "lesson", "filter": {"type": "proper", "content": "TrinitySunday"}, "reading": 3, "option_group": null, "optional": false, "book": "Rev", "book_name": "Revelation", "reference_long": "4", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(712, '{"type": "lesson", "filter": {"type": "proper", "content": "TrinitySunday"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "28:16-20", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(713, '{"type": "lesson", "filter": {"type": "proper", "content": "TrinitySunday"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "3:1-16", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(714, '{"type": "lesson", "filter": {"type": "proper", "content": "TrinitySunday"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "16:5-15", "reference_short": "16:12-15", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(715, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper1"}, "reading": 1, "option_group": null, "optional": false, "book": "Sir", "book_name": "Sirach", "reference_long": "15:11-20", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(716, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper1"}, "reading": 1, "option_group": null, "optional": false, "book": "2 Kgs", "book_name": "II Kings", "reference_long": "5:1-15a", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(717, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper1"}, "reading": 1, "option_group": null, "optional": false, "book": "Jer", "book_name": "Jeremiah", "reference_long": "17:5-10", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(718, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper1"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "119:1-16", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(719, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper1"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "42", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(720, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper1"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "1", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(721, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper1"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "3:1-9", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(722, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper1"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "9:24-27", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(723, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper1"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "15:12-20", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(724, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper1"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "5:21-37", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(725, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper1"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "1:40-45", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(726, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper1"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "6:17-26", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(727, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper2"}, "reading": 1, "option_group": null, "optional": false, "book": "Lev", "book_name": "Leviticus", "reference_long": "19:1-2,9-18", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(728, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper2"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "43:18-25", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(729, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper2"}, "reading": 1, "option_group": null, "optional": false, "book": "Gen", "book_name": "Genesis", "reference_long": "45:3-11,21-28", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(730, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper2"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "71", "reference_short": "71:11-23", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(731, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper2"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "32", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(732, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper2"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "37:1-17", "reference_short": "37:7-17", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(733, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper2"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "3:10-23", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(734, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper2"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Cor", "book_name": "II Corinthians", "reference_long": "1:18-22", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(735, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper2"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "15:35-49", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(736, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper2"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "5:38-48", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(737, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper2"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "2:1-12", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(738, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper2"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "6:27-38", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(739, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper3"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "49:8-23", "reference_short": "49:8-18", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(740, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper3"}, "reading": 1, "option_group": null, "optional": false, "book": "Hos", "book_name": "Hosea", "reference_long": "2:14-23", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(741, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper3"}, "reading": 1, "option_group": null, "optional": false, "book": "Jer", "book_name": "Jeremiah", "reference_long": "7:1-15", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(742, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper3"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "62", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(743, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper3"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "103", "reference_short": "103:1-14", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(744, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper3"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "92", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(745, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper3"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "4:1-13", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(746, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper3"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Cor", "book_name": "II Corinthians", "reference_long": "3:4-18", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(747, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper3"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "15:50-58", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(748, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper3"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "6:24-34", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(749, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper3"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "2:18-22", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(750, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper3"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "6:39-49", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(751, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper4"}, "reading": 1, "option_group": null, "optional": false, "book": "Deut", "book_name": "Deuteronomy", "reference_long": "11:18-32", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(752, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper4"}, "reading": 1, "option_group": null, "optional": false, "book": "Deut", "book_name": "Deuteronomy", "reference_long": "5:6-21", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(753, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper4"}, "reading": 1, "option_group": null, "optional": false, "book": "1 Kgs", "book_name": "I Kings", "reference_long": "8:22-30,41-43", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(754, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper4"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "31", "reference_short": "31:18-27", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(755, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper4"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "81", "reference_short": "81:1-10", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(756, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper4"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "96", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(757, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper4"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "3:21-31", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(758, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper4"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Cor", "book_name": "II Corinthians", "reference_long": "4:1-12", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(759, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper4"}, "reading": 3, "option_group": null, "optional": false, "book": "Gal", "book_name": "Galatians", "reference_long": "1:1-10", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(760, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper4"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "7:21-27", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(761, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper4"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "2:23-28", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(762, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper4"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "7:1-10", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(763, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper5"}, "reading": 1, "option_group": null, "optional": false, "book": "Hos", "book_name": "Hosea", "reference_long": "5:15-6:6", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(764, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper5"}, "reading": 1, "option_group": null, "optional": false, "book": "Gen", "book_name": "Genesis", "reference_long": "3:1-21", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(765, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper5"}, "reading": 1, "option_group": null, "optional": false, "book": "1 Kgs", "book_name": "I Kings", "reference_long": "17:17-24", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(766, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper5"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "50", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(767, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper5"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "130", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(768, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper5"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "30", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(769, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper5"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "4:13-18", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(770, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper5"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Cor", "book_name": "II Corinthians", "reference_long": "4:13-18", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(771, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper5"}, "reading": 3, "option_group": null, "optional": false, "book": "Gal", "book_name": "Galatians", "reference_long": "1:11-24", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(772, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper5"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "9:9-13", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(773, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper5"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "3:20-35", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(774, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper5"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "7:11-17", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(775, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper6"}, "reading": 1, "option_group": null, "optional": false, "book": "Exod", "book_name": "Exodus", "reference_long": "19:1-8", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(776, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper6"}, "reading": 1, "option_group": null, "optional": false, "book": "Ezek", "book_name": "Ezekiel", "reference_long": "31:1-14", "reference_short": "31:1-6,10-14", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(777, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper6"}, "reading": 1, "option_group": null, "optional": false, "book": "2 Sam", "book_name": "II Samuel", "reference_long": "11:26-12:15", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(778, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper6"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "100", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(779, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper6"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "92", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(780, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper6"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "32", "reference_short": "32:1-6", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(781, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper6"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "5:1-11", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(782, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper6"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Cor", "book_name": "II Corinthians", "reference_long": "5:1-10", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(783, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper6"}, "reading": 3, "option_group": null, "optional": false, "book": "Gal", "book_name": "Galatians", "reference_long": "2:11-21", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(784, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper6"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "9:35-10:15", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(785, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper6"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "4:26-34", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(786, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper6"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "7:36-8:3", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(787, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper7"}, "reading": 1, "option_group": null, "optional": false, "book": "Jer", "book_name": "Jeremiah", "reference_long": "20:7-13", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(788, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper7"}, "reading": 1, "option_group": null, "optional": false, "book": "Job", "book_name": "Job", "reference_long": "38:1-18", "reference_short": "38:1-11,16-18", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(789, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper7"}, "reading": 1, "option_group": null, "optional": false, "book": "Zech", "book_name": "Zechariah", "reference_long": "12:8-10;13:1", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(790, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper7"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "69:1-18", "reference_short": "69:1-15", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(791, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper7"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "107:1-32", "reference_short": "107:1-3,23-32", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(792, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper7"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "63", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(793, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper7"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "5:15b-19", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(794, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper7"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Cor", "book_name": "II Corinthians", "reference_long": "5:14-21", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(795, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper7"}, "reading": 3, "option_group": null, "optional": false, "book": "Gal", "book_name": "Galatians", "reference_long": "3:23-29", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(796, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper7"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "10:16-33", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(797, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper7"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "4:35-5:20", "reference_short": "4:35-41", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(798, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper7"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "9:18-24", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(799, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper8"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "2:10-17", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(800, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper8"}, "reading": 1, "option_group": null, "optional": false, "book": "Deut", "book_name": "Deuteronomy", "reference_long": "15:7-11", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(801, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper8"}, "reading": 1, "option_group": null, "optional": false, "book": "1 Kgs", "book_name": "I Kings", "reference_long": "19:15-21", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(802, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper8"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "89:1-18", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(803, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper8"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "112", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(804, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper8"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "16", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(805, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper8"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "6:1-11", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(806, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper8"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Cor", "book_name": "II Corinthians", "reference_long": "8:1-15", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(807, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper8"}, "reading": 3, "option_group": null, "optional": false, "book": "Gal", "book_name": "Galatians", "reference_long": "5:1,13-25", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(808, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper8"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "10:34-42", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(809, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper8"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "5:22-43", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(810, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper8"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "9:51-62", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(811, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper9"}, "reading": 1, "option_group": null, "optional": false, "book": "Zech", "book_name": "Zechariah", "reference_long": "9:9-12", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(812, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper9"}, "reading": 1, "option_group": null, "optional": false, "book": "Ezek", "book_name": "Ezekiel", "reference_long": "2:1-7", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(813, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper9"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "66:10-16", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(814, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper9"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "145", "reference_short": "145:1-13", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(815, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper9"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "123", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(816, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper9"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "66", "reference_short": "66:1-8", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(817, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper9"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "7:21-8:6", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(818, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper9"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Cor", "book_name": "II Corinthians", "reference_long": "12:2-10", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(819, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper9"}, "reading": 3, "option_group": null, "optional": false, "book": "Gal", "book_name": "Galatians", "reference_long": "6", "reference_short": "6:6-18", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(820, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper9"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "11:25-30", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(821, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper9"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "6:1-6", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(822, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper9"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "10:1-20", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(823, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper10"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "55", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(824, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper10"}, "reading": 1, "option_group": null, "optional": false, "book": "Amos", "book_name": "Amos", "reference_long": "7:7-15", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(825, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper10"}, "reading": 1, "option_group": null, "optional": false, "book": "Deut", "book_name": "Deuteronomy", "reference_long": "30:9-14", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(826, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper10"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "65", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(827, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper10"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "85", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(828, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper10"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "25", "reference_short": "25:1-14", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(829, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper10"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "8:7-17", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(830, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper10"}, "reading": 3, "option_group": null, "optional": false, "book": "Eph", "book_name": "Ephesians", "reference_long": "1", "reference_short": "1:1-14", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(831, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper10"}, "reading": 3, "option_group": null, "optional": false, "book": "Col", "book_name": "Colossians", "reference_long": "1:1-14", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(832, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper10"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "13:1-9,18-23", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(833, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper10"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "6:7-13", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(834, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper10"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "10:25-37", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(835, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper11"}, "reading": 1, "option_group": null, "optional": false, "book": "Wis", "book_name": "Wisdom", "reference_long": "12:13,16-19", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(836, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper11"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "57:14-21", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(837, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper11"}, "reading": 1, "option_group": null, "optional": false, "book": "Gen", "book_name": "Genesis", "reference_long": "18:1-14", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(838, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper11"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "86", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(839, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper11"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "22:23-31", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(840, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper11"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "15", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(841, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper11"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "8:18-25", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(842, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper11"}, "reading": 3, "option_group": null, "optional": false, "book": "Eph", "book_name": "Ephesians", "reference_long": "2:11-22", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(843, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper11"}, "reading": 3, "option_group": null, "optional": false, "book": "Col", "book_name": "Colossians", "reference_long": "1:21-29", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(844, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper11"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "13:24-30,34-43", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(845, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper11"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "6:30-44", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(846, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper11"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "10:38-42", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(847, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper12"}, "reading": 1, "option_group": null, "optional": false, "book": "1 Kgs", "book_name": "I Kings", "reference_long": "3:3-14", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(848, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper12"}, "reading": 1, "option_group": null, "optional": false, "book": "2 Kgs", "book_name": "II Kings", "reference_long": "2:1-15", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(849, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper12"}, "reading": 1, "option_group": null, "optional": false, "book": "Gen", "book_name": "Genesis", "reference_long": "18:20-33", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(850, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper12"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "119:121-136", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(851, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper12"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "114", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(852, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper12"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "138", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(853, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper12"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "8:26-34", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(854, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper12"}, "reading": 3, "option_group": null, "optional": false, "book": "Eph", "book_name": "Ephesians", "reference_long": "3", "reference_short": "3:8-21", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(855, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper12"}, "reading": 3, "option_group": null, "optional": false, "book": "Col", "book_name": "Colossians", "reference_long": "2:6-15", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(856, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper12"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "13:31-33,44-50", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(857, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper12"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "6:45-52", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(858, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper12"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "11:1-13", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(859, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper13"}, "reading": 1, "option_group": null, "optional": false, "book": "Neh", "book_name": "Nehemiah", "reference_long": "9:16-21", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(860, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper13"}, "reading": 1, "option_group": null, "optional": false, "book": "Exod", "book_name": "Exodus", "reference_long": "16:2-15", "reference_short": "16:2-4,9-15", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(861, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper13"}, "reading": 1, "option_group": null, "optional": false, "book": "Eccl", "book_name": "Ecclesiastes", "reference_long": "1:12-2:11", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(862, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper13"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "78:1-26", "reference_short": "78:14-26", "note": "_", "subcycles": ["A", "B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(863, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper13"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "49", "reference_short": "49:1-12", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(864, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper13"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "8:35-39", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(865, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper13"}, "reading": 3, "option_group": null, "optional": false, "book": "Eph", "book_name": "Ephesians", "reference_long": "4:1-16", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(866, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper13"}, "reading": 3, "option_group": null, "optional": false, "book": "Col", "book_name": "Colossians", "reference_long": "3:5-17", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(867, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper13"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "14:13-21", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(868, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper13"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "6:24-35", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(869, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper13"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "12:13-21", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(870, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper14"}, "reading": 1, "option_group": null, "optional": false, "book": "Jonah", "book_name": "Jonah", "reference_long": "2", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(871, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper14"}, "reading": 1, "option_group": null, "optional": false, "book": "Deut", "book_name": "Deuteronomy", "reference_long": "8:1-10", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(872, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper14"}, "reading": 1, "option_group": null, "optional": false, "book": "Gen", "book_name": "Genesis", "reference_long": "15:1-6", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(873, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper14"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "29", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(874, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper14"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "34", "reference_short": "34:8-15", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(875, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper14"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "33", "reference_short": "33:10-21", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(876, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper14"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "9:1-5", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(877, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper14"}, "reading": 3, "option_group": null, "optional": false, "book": "Eph", "book_name": "Ephesians", "reference_long": "4:17-5:2", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(878, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper14"}, "reading": 3, "option_group": null, "optional": false, "book": "Heb", "book_name": "Hebrews", "reference_long": "11:1-16", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(879, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper14"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "14:22-33", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(880, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper14"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "6:37-51", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(881, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper14"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "12:32-40", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(882, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper15"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "56:1-8", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(883, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper15"}, "reading": 1, "option_group": null, "optional": false, "book": "Prov", "book_name": "Proverbs", "reference_long": "9:1-6", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(884, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper15"}, "reading": 1, "option_group": null, "optional": false, "book": "Jer", "book_name": "Jeremiah", "reference_long": "23:23-29", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(885, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper15"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "67", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(886, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper15"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "147", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(887, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper15"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "82", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(888, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper15"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "11:13-24", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(889, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper15"}, "reading": 3, "option_group": null, "optional": false, "book": "Eph", "book_name": "Ephesians", "reference_long": "5:3-14", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(890, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper15"}, "reading": 3, "option_group": null, "optional": false, "book": "Heb", "book_name": "Hebrews", "reference_long": "12:1-14", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(891, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper15"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "15:21-28", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(892, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper15"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "6:53-59", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(893, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper15"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "12:49-56", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(894, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper16"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "51:1-6", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(895, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper16"}, "reading": 1, "option_group": null, "optional": false, "book": "Josh", "book_name": "Joshua", "reference_long": "24:1-2a,14-25", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(896, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper16"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "28:14-22", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(897, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper16"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "138", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(898, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper16"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "16", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(899, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper16"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "46", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(900, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper16"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "11:25-36", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(901, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper16"}, "reading": 3, "option_group": null, "optional": false, "book": "Eph", "book_name": "Ephesians", "reference_long": "5:15-6:9", "reference_short": "5:15-33", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(902, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper16"}, "reading": 3, "option_group": null, "optional": false, "book": "Heb", "book_name": "Hebrews", "reference_long": "12:15-29", "reference_short": "12:18-29", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(903, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper16"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "16:13-20", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(904, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper16"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "6:60-69", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(905, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper16"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "13:22-30", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(906, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper17"}, "reading": 1, "option_group": null, "optional": false, "book": "Jer", "book_name": "Jeremiah", "reference_long": "15:15-21", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(907, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper17"}, "reading": 1, "option_group": null, "optional": false, "book": "Deut", "book_name": "Deuteronomy", "reference_long": "4:1-9", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(908, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper17"}, "reading": 1, "option_group": null, "optional": false, "book": "Sir", "book_name": "Sirach", "reference_long": "10:7-18", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(909, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper17"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "26", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(910, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper17"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "15", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(911, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper17"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "112", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(912, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper17"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "12:1-8", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(913, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper17"}, "reading": 3, "option_group": null, "optional": false, "book": "Eph", "book_name": "Ephesians", "reference_long": "6:10-20", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(914, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper17"}, "reading": 3, "option_group": null, "optional": false, "book": "Heb", "book_name": "Hebrews", "reference_long": "13:1-8", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(915, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper17"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "16:21-27", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(916, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper17"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "7:1-23", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(917, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper17"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "14:1,7-14", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(918, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper18"}, "reading": 1, "option_group": null, "optional": false, "book": "Ezek", "book_name": "Ezekiel", "reference_long": "33:1-11", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(919, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper18"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "35:4-7a", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(920, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper18"}, "reading": 1, "option_group": null, "optional": false, "book": "Deut", "book_name": "Deuteronomy", "reference_long": "30:15-20", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(921, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper18"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "119:33-48", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(922, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper18"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "146", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(923, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper18"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "1", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(924, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper18"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "12:9-21", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(925, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper18"}, "reading": 3, "option_group": null, "optional": false, "book": "Jas", "book_name": "James", "reference_long": "1:17-27", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(926, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper18"}, "reading": 3, "option_group": null, "optional": false, "book": "Phlm", "book_name": "Philemon", "reference_long": "1:1-25", "reference_short": "1:4-21", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(927, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper18"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "18:15-20", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(928, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper18"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "7:31-37", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(929, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper18"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "14:25-33", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(930, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper19"}, "reading": 1, "option_group": null, "optional": false, "book": "Sir", "book_name": "Sirach", "reference_long": "27:30-28:7", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(931, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper19"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "50:4-9", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(932, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper19"}, "reading": 1, "option_group": null, "optional": false, "book": "Exod", "book_name": "Exodus", "reference_long": "32:1,7-14", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(933, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper19"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "103", "reference_short": "103:1-14", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(934, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper19"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "116", "reference_short": "116:1-9", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(935, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper19"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "51:1-17", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(936, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper19"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "14:5-12", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(937, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper19"}, "reading": 3, "option_group": null, "optional": false, "book": "Jas", "book_name": "James", "reference_long": "2:1-18", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(938, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper19"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Tim", "book_name": "I Timothy", "reference_long": "1:12-17", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(939, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper19"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "18:21-35", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(940, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper19"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "9:14-29", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(941, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper19"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "15:1-10", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(942, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper20"}, "reading": 1, "option_group": null, "optional": false, "book": "Jonah", "book_name": "Jonah", "reference_long": "3:10-4:11", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(943, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper20"}, "reading": 1, "option_group": null, "optional": false, "book": "Wis", "book_name": "Wisdom", "reference_long": "1:16-2:1;2:12-22", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(944, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper20"}, "reading": 1, "option_group": null, "optional": false, "book": "Amos", "book_name": "Amos", "reference_long": "8:4-12", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(945, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper20"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "145", "reference_short": "145:14-21", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(946, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper20"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "54", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(947, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper20"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "138", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(948, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper20"}, "reading": 3, "option_group": null, "optional": false, "book": "Phil", "book_name": "Philippians", "reference_long": "1:21-27", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(949, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper20"}, "reading": 3, "option_group": null, "optional": false, "book": "Jas", "book_name": "James", "reference_long": "3:16-4:6", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(950, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper20"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Tim", "book_name": "I Timothy", "reference_long": "2", "reference_short": "2:1-7", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(951, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper20"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "20:1-16", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(952, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper20"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "9:30-37", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(953, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper20"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "16:1-13", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(954, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper21"}, "reading": 1, "option_group": null, "optional": false, "book": "Ezek", "book_name": "Ezekiel", "reference_long": "18:1-4,25-32", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(955, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper21"}, "reading": 1, "option_group": null, "optional": false, "book": "Num", "book_name": "Numbers", "reference_long": "11:4-6,10-17,24-29", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(956, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper21"}, "reading": 1, "option_group": null, "optional": false, "book": "Amos", "book_name": "Amos", "reference_long": "6:1-7", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(957, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper21"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "25", "reference_short": "25:1-14", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(958, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper21"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "19", "reference_short": "19:7-14", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(959, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper21"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "146", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(960, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper21"}, "reading": 3, "option_group": null, "optional": false, "book": "Phil", "book_name": "Philippians", "reference_long": "2:1-13", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(961, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper21"}, "reading": 3, "option_group": null, "optional": false, "book": "Jas", "book_name": "James", "reference_long": "4:7-5:6", "reference_short": "4:7-12", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(962, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper21"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Tim", "book_name": "I Timothy", "reference_long": "6:11-19", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(963, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper21"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "21:28-32", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(964, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper21"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "9:38-48", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(965, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper21"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "16:19-31", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(966, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper22"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "5:1-7", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(967, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper22"}, "reading": 1, "option_group": null, "optional": false, "book": "Gen", "book_name": "Genesis", "reference_long": "2:18-24", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(968, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper22"}, "reading": 1, "option_group": null, "optional": false, "book": "Hab", "book_name": "Habakkuk", "reference_long": "1:1-13;2:1-4", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(969, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper22"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "80", "reference_short": "80:7-19", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(970, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper22"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "8", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(971, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper22"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "37:1-17", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(972, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper22"}, "reading": 3, "option_group": null, "optional": false, "book": "Phil", "book_name": "Philippians", "reference_long": "3:14-21", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(973, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper22"}, "reading": 3, "option_group": null, "optional": false, "book": "Heb", "book_name": "Hebrews", "reference_long": "2", "reference_short": "2:9-18", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(974, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper22"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Tim", "book_name": "II Timothy", "reference_long": "1:1-14", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(975, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper22"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "21:33-44", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(976, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper22"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "10:2-16", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(977, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper22"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "17:5-10", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(978, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper23"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "25:1-9", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(979, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper23"}, "reading": 1, "option_group": null, "optional": false, "book": "Amos", "book_name": "Amos", "reference_long": "5:6-15", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(980, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper23"}, "reading": 1, "option_group": null, "optional": false, "book": "Ruth", "book_name": "Ruth", "reference_long": "1:1-19a", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(981, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper23"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "23", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(982, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper23"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "90", "reference_short": "90:1-12", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(983, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper23"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "113", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(984, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper23"}, "reading": 3, "option_group": null, "optional": false, "book": "Phil", "book_name": "Philippians", "reference_long": "4:4-13", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(985, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper23"}, "reading": 3, "option_group": null, "optional": false, "book": "Heb", "book_name": "Hebrews", "reference_long": "3:1-6", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(986, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper23"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Tim", "book_name": "II Timothy", "reference_long": "2:1-15", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(987, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper23"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "22:1-14", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(988, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper23"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "10:17-31", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(989, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper23"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "17:11-19", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(990, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper24"}, "reading": 1, "option_group": null, "optional": false, "book": "Mal", "book_name": "Malachi", "reference_long": "3:6-12", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(991, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper24"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "53:4-12", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(992, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper24"}, "reading": 1, "option_group": null, "optional": false, "book": "Gen", "book_name": "Genesis", "reference_long": "32:3-8,22-30", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(993, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper24"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "96", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(994, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper24"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "91", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(995, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper24"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "121", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(996, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper24"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Thess", "book_name": "I Thessalonians", "reference_long": "1", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(997, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper24"}, "reading": 3, "option_group": null, "optional": false, "book": "Heb", "book_name": "Hebrews", "reference_long": "4:12-16", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(998, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper24"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Tim", "book_name": "II Timothy", "reference_long": "3:14-4:5", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(999, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper24"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "22:15-22", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1000, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper24"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "10:35-45", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1001, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper24"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "18:1-8", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1002, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper25"}, "reading": 1, "option_group": null, "optional": false, "book": "Exod", "book_name": "Exodus", "reference_long": "22:21-27", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1003, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper25"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "59:9-20", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1004, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper25"}, "reading": 1, "option_group": null, "optional": false, "book": "Jer", "book_name": "Jeremiah", "reference_long": "14:1-10,19-22", "reference_short": "14:7-10,19-22", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1005, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper25"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "1", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1006, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper25"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "13", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1007, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper25"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "84", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1008, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper25"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Thess", "book_name": "I Thessalonians", "reference_long": "2:1-8", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1009, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper25"}, "reading": 3, "option_group": null, "optional": false, "book": "Heb", "book_name": "Hebrews", "reference_long": "5:11-6:12", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1010, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper25"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Tim", "book_name": "II Timothy", "reference_long": "4:6-18", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1011, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper25"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "22:34-46", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1012, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper25"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "10:46-52", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1013, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper25"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "18:9-14", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1014, '{"type": "lesson", "filter": {"type": "proper", "content": "AllSaints"}, "reading": 1, "option_group": null, "optional": false, "book": "Sir", "book_name": "Sirach", "reference_long": "44:1-14", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1015, '{"type": "lesson", "filter": {"type": "proper", "content": "AllSaints"}, "reading": 1, "option_group": null, "optional": false, "book": "Rev", "book_name": "Revelation", "reference_long": "7:9-17", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(1016, '{"type": "lesson", "filter": {"type": "proper", "content": "AllSaints"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "149", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1017, '{"type": "lesson", "filter": {"type": "proper", "content": "AllSaints"}, "reading": 3, "option_group": null, "optional": false, "book": "Rev", "book_name": "Revelation", "reference_long": "7:9-17", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1018, '{"type": "lesson", "filter": {"type": "proper", "content": "AllSaints"}, "reading": 3, "option_group": null, "optional": false, "book": "Eph", "book_name": "Ephesians", "reference_long": "1:11-23", "reference_short": "1:15-23", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(1019, '{"type": "lesson", "filter": {"type": "proper", "content": "AllSaints"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "5:1-12", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1020, '{"type": "lesson", "filter": {"type": "proper", "content": "AllSaints"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "6:20-36", "reference_short": "6:20-26", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(1021, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper26"}, "reading": 1, "option_group": null, "optional": false, "book": "Mic", "book_name": "Micah", "reference_long": "3:5-12", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1022, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper26"}, "reading": 1, "option_group": null, "optional": false, "book": "Deut", "book_name": "Deuteronomy", "reference_long": "6:1-9", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1023, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper26"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "1:10-20", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1024, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper26"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "43", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1025, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper26"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "119:1-16", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1026, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper26"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "32", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1027, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper26"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Thess", "book_name": "I Thessalonians", "reference_long": "2:9-20", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1028, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper26"}, "reading": 3, "option_group": null, "optional": false, "book": "Heb", "book_name": "Hebrews", "reference_long": "7:23-28", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1029, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper26"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Thess", "book_name": "II Thessalonians", "reference_long": "1", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1030, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper26"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "23:1-12", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1031, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper26"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "12:28-34", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1032, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper26"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "19:1-10", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1033, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper27"}, "reading": 1, "option_group": null, "optional": false, "book": "Amos", "book_name": "Amos", "reference_long": "5:18-24", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1034, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper27"}, "reading": 1, "option_group": null, "optional": false, "book": "1 Kgs", "book_name": "I Kings", "reference_long": "17:8-16", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1035, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper27"}, "reading": 1, "option_group": null, "optional": false, "book": "Job", "book_name": "Job", "reference_long": "19:23-27a", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1036, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper27"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "70", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1037, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper27"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "146", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1038, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper27"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "17", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1039, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper27"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Thess", "book_name": "I Thessalonians", "reference_long": "4:13-18", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1040, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper27"}, "reading": 3, "option_group": null, "optional": false, "book": "Heb", "book_name": "Hebrews", "reference_long": "9:24-28", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1041, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper27"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Thess", "book_name": "II Thessalonians", "reference_long": "2:13-3:5", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1042, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper27"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "25:1-13", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1043, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper27"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "12:38-44", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1044, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper27"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "20:27-38", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1045, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper28"}, "reading": 1, "option_group": null, "optional": false, "book": "Zeph", "book_name": "Zephaniah", "reference_long": "1:7,12-18", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1046, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper28"}, "reading": 1, "option_group": null, "optional": false, "book": "Dan", "book_name": "Daniel", "reference_long": "12", "reference_short": "12:1-4a", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1047, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper28"}, "reading": 1, "option_group": null, "optional": false, "book": "Mal", "book_name": "Malachi", "reference_long": "3:13-4:6", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1048, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper28"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "90", "reference_short": "90:1-12", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1049, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper28"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "16", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1050, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper28"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "98", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1051, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper28"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Thess", "book_name": "I Thessalonians", "reference_long": "5:1-10", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1052, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper28"}, "reading": 3, "option_group": null, "optional": false, "book": "Heb", "book_name": "Hebrews", "reference_long": "10:31-39", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1053, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper28"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Thess", "book_name": "II Thessalonians", "reference_long": "3:6-16", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1054, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper28"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "25:14-30", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1055, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper28"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "13:14-23", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1056, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper28"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "21:5-19", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1057, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper29"}, "reading": 1, "option_group": null, "optional": false, "book": "Ezek", "book_name": "Ezekiel", "reference_long": "34:11-20", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1058, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper29"}, "reading": 1, "option_group": null, "optional": false, "book": "Dan", "book_name": "Daniel", "reference_long": "7:9-14", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1059, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper29"}, "reading": 1, "option_group": null, "optional": false, "book": "Jer", "book_name": "Jeremiah", "reference_long": "23:1-6", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1060, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper29"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "95", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1061, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper29"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "93", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1062, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper29"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "46", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1063, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper29"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "15:20-28", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1064, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper29"}, "reading": 3, "option_group": null, "optional": false, "book": "Rev", "book_name": "Revelation", "reference_long": "1:1-8", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1065, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper29"}, "reading": 3, "option_group": null, "optional": false, "book": "Col", "book_name": "Colossians", "reference_long": "1:11-20", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1066, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper29"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "25:31-46", "reference_short": "_", "note": "_", "subcycles": ["A"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1067, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper29"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "18:33-37", "reference_short": "_", "note": "_", "subcycles": ["B"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1068, '{"type": "lesson", "filter": {"type": "proper", "content": "Proper29"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "23:35-43", "reference_short": "_", "note": "_", "subcycles": ["C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1069, '{"type": "lesson", "filter": {"type": "proper", "content": "Andrew"}, "reading": 1, "option_group": null, "optional": false, "book": "Deut", "book_name": "Deuteronomy", "reference_long": "30:11-14", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1070, '{"type": "lesson", "filter": {"type": "proper", "content": "Andrew"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "19", "reference_short": "19:1-6", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1071, '{"type": "lesson", "filter": {"type": "proper", "content": "Andrew"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "10:8b-18", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1072, '{"type": "lesson", "filter": {"type": "proper", "content": "Andrew"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "4:18-22", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1073, '{"type": "lesson", "filter": {"type": "proper", "content": "Thomas"}, "reading": 1, "option_group": null, "optional": false, "book": "Hab", "book_name": "Habakkuk", "reference_long": "2:1-4", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1074, '{"type": "lesson", "filter": {"type": "proper", "content": "Thomas"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "126", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1075, '{"type": "lesson", "filter": {"type": "proper", "content": "Thomas"}, "reading": 3, "option_group": null, "optional": false, "book": "Heb", "book_name": "Hebrews", "reference_long": "10:35-11:1", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1076, '{"type": "lesson", "filter": {"type": "proper", "content": "Thomas"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "20:19-29", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1077, '{"type": "lesson", "filter": {"type": "proper", "content": "Stephen"}, "reading": 1, "option_group": null, "optional": false, "book": "Jer", "book_name": "Jeremiah", "reference_long": "26:1-15", "reference_short": "26:1-9,12-15", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1078, '{"type": "lesson", "filter": {"type": "proper", "content": "Stephen"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "31", "reference_short": "31:1-6", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1079, '{"type": "lesson", "filter": {"type": "proper", "content": "Stephen"}, "reading": 3, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "6:8-7:2a;7:51-60", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1080, '{"type": "lesson", "filter": {"type": "proper", "content": "Stephen"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "23:29-39", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1081, '{"type": "lesson", "filter": {"type": "proper", "content": "John"}, "reading": 1, "option_group": null, "optional": false, "book": "Exod", "book_name": "Exodus", "reference_long": "33:18-23", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1082, '{"type": "lesson", "filter": {"type": "proper", "content": "John"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "92", "reference_short": "92:1-4,11-14", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1083, '{"type": "lesson", "filter": {"type": "proper", "content": "John"}, "reading": 3, "option_group": null, "optional": false, "book": "1 John", "book_name": "I John", "reference_long": "1", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1084, '{"type": "lesson", "filter": {"type": "proper", "content": "John"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "21:9-25", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1085, '{"type": "lesson", "filter": {"type": "proper", "content": "John"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "1:1-18", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(1086, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyInnocents"}, "reading": 1, "option_group": null, "optional": false, "book": "Jer", "book_name": "Jeremiah", "reference_long": "31:15-17", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1087, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyInnocents"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "124", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1088, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyInnocents"}, "reading": 3, "option_group": null, "optional": false, "book": "Rev", "book_name": "Revelation", "reference_long": "21:1-7", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1089, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyInnocents"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "2:13-18", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1090, '{"type": "lesson", "filter": {"type": "proper", "content": "Peter"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "4:8-13", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1091, '{"type": "lesson", "filter": {"type": "proper", "content": "Peter"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "23", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1092, '{"type": "lesson", "filter": {"type": "proper", "content": "Peter"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Pet", "book_name": "I Peter", "reference_long": "5:1-11", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1093, '{"type": "lesson", "filter": {"type": "proper", "content": "Peter"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "16:13-19", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1094, '{"type": "lesson", "filter": {"type": "proper", "content": "Paul"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "26:9-21", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1095, '{"type": "lesson", "filter": {"type": "proper", "content": "Paul"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "67", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1096, '{"type": "lesson", "filter": {"type": "proper", "content": "Paul"}, "reading": 3, "option_group": null, "optional": false, "book": "Gal", "book_name": "Galatians", "reference_long": "1:11-24", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1097, '{"type": "lesson", "filter": {"type": "proper", "content": "Paul"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "10:16-25", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1098, '{"type": "lesson", "filter": {"type": "proper", "content": "Presentation"}, "reading": 1, "option_group": null, "optional": false, "book": "Mal", "book_name": "Malachi", "reference_long": "3:1-4", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1099, '{"type": "lesson", "filter": {"type": "proper", "content": "Presentation"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "84", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1100, '{"type": "lesson", "filter": {"type": "proper", "content": "Presentation"}, "reading": 3, "option_group": null, "optional": false, "book": "Heb", "book_name": "Hebrews", "reference_long": "2:14-18", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1101, '{"type": "lesson", "filter": {"type": "proper", "content": "Presentation"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "2:22-40", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1102, '{"type": "lesson", "filter": {"type": "proper", "content": "Matthias"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "1:15-26", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1103, '{"type": "lesson", "filter": {"type": "proper", "content": "Matthias"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "15", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1104, '{"type": "lesson", "filter": {"type": "proper", "content": "Matthias"}, "reading": 3, "option_group": null, "optional": false, "book": "Phil", "book_name": "Philippians", "reference_long": "3:12-21", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1105, '{"type": "lesson", "filter": {"type": "proper", "content": "Matthias"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "15:1-16", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1106, '{"type": "lesson", "filter": {"type": "proper", "content": "Joseph"}, "reading": 1, "option_group": null, "optional": false, "book": "2 Sam", "book_name": "II Samuel", "reference_long": "7:4,8-16", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1107, '{"type": "lesson", "filter": {"type": "proper", "content": "Joseph"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "89:1-29", "reference_short": "89:1-4,19-29", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1108, '{"type": "lesson", "filter": {"type": "proper", "content": "Joseph"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "4:13-18", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1109, '{"type": "lesson", "filter": {"type": "proper", "content": "Joseph"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "2:41-52", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1110, '{"type": "lesson", "filter": {"type": "proper", "content": "Annunciation"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "7:10-14", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1111, '{"type": "lesson", "filter": {"type": "proper", "content": "Annunciation"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "40:1-13", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1112, '{"type": "lesson", "filter": {"type": "proper", "content": "Annunciation"}, "reading": 2, "option_group": null, "optional": false, "book": "Canticle", "book_name": "Canticle", "reference_long": "Magnificat", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(1113, '{"type": "lesson", "filter": {"type": "proper", "content": "Annunciation"}, "reading": 3, "option_group": null, "optional": false, "book": "Heb", "book_name": "Hebrews", "reference_long": "10:5-10", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1114, '{"type": "lesson", "filter": {"type": "proper", "content": "Annunciation"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "1:26-38", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1115, '{"type": "lesson", "filter": {"type": "proper", "content": "Mark"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "52:7-10", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1116, '{"type": "lesson", "filter": {"type": "proper", "content": "Mark"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "2", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1117, '{"type": "lesson", "filter": {"type": "proper", "content": "Mark"}, "reading": 3, "option_group": null, "optional": false, "book": "Eph", "book_name": "Ephesians", "reference_long": "4:7-8,11-16", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1118, '{"type": "lesson", "filter": {"type": "proper", "content": "Mark"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "16:15-20", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1119, '{"type": "lesson", "filter": {"type": "proper", "content": "PhilipJames"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "30:18-21", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1120, '{"type": "lesson", "filter": {"type": "proper", "content": "PhilipJames"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "119:33-40", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1121, '{"type": "lesson", "filter": {"type": "proper", "content": "PhilipJames"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Cor", "book_name": "II Corinthians", "reference_long": "4:1-7", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1122, '{"type": "lesson", "filter": {"type": "proper", "content": "PhilipJames"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "14:6-14", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1123, '{"type": "lesson", "filter": {"type": "proper", "content": "Visitation"}, "reading": 1, "option_group": null, "optional": false, "book": "Zeph", "book_name": "Zephaniah", "reference_long": "3:14-18", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1124, '{"type": "lesson", "filter": {"type": "proper", "content": "Visitation"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "113", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1125, '{"type": "lesson", "filter": {"type": "proper", "content": "Visitation"}, "reading": 2, "option_group": null, "optional": false, "book": "Canticle", "book_name": "Canticle", "reference_long": "8", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(1126, '{"type": "lesson", "filter": {"type": "proper", "content": "Visitation"}, "reading": 3, "option_group": null, "optional": false, "book": "Col", "book_name": "Colossians", "reference_long": "3:12-17", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1127, '{"type": "lesson", "filter": {"type": "proper", "content": "Visitation"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "1:39-56", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1128, '{"type": "lesson", "filter": {"type": "proper", "content": "Barnabas"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "42:5-12", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1129, '{"type": "lesson", "filter": {"type": "proper", "content": "Barnabas"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "112", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1130, '{"type": "lesson", "filter": {"type": "proper", "content": "Barnabas"}, "reading": 3, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "11:19-30;13:1-3", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1131, '{"type": "lesson", "filter": {"type": "proper", "content": "Barnabas"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "10:7-16", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1132, '{"type": "lesson", "filter": {"type": "proper", "content": "JohnTheBaptist"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "40:1-11", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1133, '{"type": "lesson", "filter": {"type": "proper", "content": "JohnTheBaptist"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "85:7-13", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1134, '{"type": "lesson", "filter": {"type": "proper", "content": "JohnTheBaptist"}, "reading": 3, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "13:14b-26", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1135, '{"type": "lesson", "filter": {"type": "proper", "content": "JohnTheBaptist"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "1:57-80", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1136, '{"type": "lesson", "filter": {"type": "proper", "content": "PeterPaul"}, "reading": 1, "option_group": null, "optional": false, "book": "Ezek", "book_name": "Ezekiel", "reference_long": "34:11-16", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1137, '{"type": "lesson", "filter": {"type": "proper", "content": "PeterPaul"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "87", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1138, '{"type": "lesson", "filter": {"type": "proper", "content": "PeterPaul"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Tim", "book_name": "II Timothy", "reference_long": "4:1-8", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1139, '{"type": "lesson", "filter": {"type": "proper", "content": "PeterPaul"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "21:15-19", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1140, '{"type": "lesson", "filter": {"type": "proper", "content": "MaryMagdalene"}, "reading": 1, "option_group": null, "optional": false, "book": "Judg", "book_name": "Judges", "reference_long": "4:4-10", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1141, '{"type": "lesson", "filter": {"type": "proper", "content": "MaryMagdalene"}, "reading": 1, "option_group": null, "optional": false, "book": "Jdt", "book_name": "Judith", "reference_long": "9:1,11-14", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(1142, '{"type": "lesson", "filter": {"type": "proper", "content": "MaryMagdalene"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "42", "reference_short": "42:1-7", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1143, '{"type": "lesson", "filter": {"type": "proper", "content": "MaryMagdalene"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Cor", "book_name": "II Corinthians", "reference_long": "5:14-20a", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1144, '{"type": "lesson", "filter": {"type": "proper", "content": "MaryMagdalene"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "20:11-18", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1145, '{"type": "lesson", "filter": {"type": "proper", "content": "James"}, "reading": 1, "option_group": null, "optional": false, "book": "Jer", "book_name": "Jeremiah", "reference_long": "45", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1146, '{"type": "lesson", "filter": {"type": "proper", "content": "James"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "7", "reference_short": "7:1-11", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1147, '{"type": "lesson", "filter": {"type": "proper", "content": "James"}, "reading": 3, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "11:27-12:3", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1148, '{"type": "lesson", "filter": {"type": "proper", "content": "James"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "20:20-28", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1149, '{"type": "lesson", "filter": {"type": "proper", "content": "Transfiguration"}, "reading": 1, "option_group": null, "optional": false, "book": "Exod", "book_name": "Exodus", "reference_long": "34:29-35", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1150, '{"type": "lesson", "filter": {"type": "proper", "content": "Transfiguration"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "99", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1151, '{"type": "lesson", "filter": {"type": "proper", "content": "Transfiguration"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Pet", "book_name": "II Peter", "reference_long": "1:13-21", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1152, '{"type": "lesson", "filter": {"type": "proper", "content": "Transfiguration"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "9:28-36", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1153, '{"type": "lesson", "filter": {"type": "proper", "content": "Mary"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "61:10-11", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1154, '{"type": "lesson", "filter": {"type": "proper", "content": "Mary"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "34", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1155, '{"type": "lesson", "filter": {"type": "proper", "content": "Mary"}, "reading": 3, "option_group": null, "optional": false, "book": "Gal", "book_name": "Galatians", "reference_long": "4:4-7", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1156, '{"type": "lesson", "filter": {"type": "proper", "content": "Mary"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "1:46-55", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1157, '{"type": "lesson", "filter": {"type": "proper", "content": "Bartholomew"}, "reading": 1, "option_group": null, "optional": false, "book": "Deut", "book_name": "Deuteronomy", "reference_long": "18:15-18", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1158, '{"type": "lesson", "filter": {"type": "proper", "content": "Bartholomew"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "91", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1159, '{"type": "lesson", "filter": {"type": "proper", "content": "Bartholomew"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "4:9-16", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1160, '{"type": "lesson", "filter": {"type": "proper", "content": "Bartholomew"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "22:24-30", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1161, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyCrossDay"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "45:21-25", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1162, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyCrossDay"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "98", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1163, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyCrossDay"}, "reading": 3, "option_group": null, "optional": false, "book": "Phil", "book_name": "Philippians", "reference_long": "2:5-11", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1164, '{"type": "lesson", "filter": {"type": "proper", "content": "HolyCrossDay"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "12:31-36a", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1165, '{"type": "lesson", "filter": {"type": "proper", "content": "Matthew"}, "reading": 1, "option_group": null, "optional": false, "book": "Prov", "book_name": "Proverbs", "reference_long": "3:1-12", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1166, '{"type": "lesson", "filter": {"type": "proper", "content": "Matthew"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "119:33-40", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1167, '{"type": "lesson", "filter": {"type": "proper", "content": "Matthew"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Tim", "book_name": "II Timothy", "reference_long": "3", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1168, '{"type": "lesson", "filter": {"type": "proper", "content": "Matthew"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "9:9-13", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1169, '{"type": "lesson", "filter": {"type": "proper", "content": "Michael"}, "reading": 1, "option_group": null, "optional": false, "book": "Gen", "book_name": "Genesis", "reference_long": "28:10-17", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1170, '{"type": "lesson", "filter": {"type": "proper", "content": "Michael"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "103", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1171, '{"type": "lesson", "filter": {"type": "proper", "content": "Michael"}, "reading": 3, "option_group": null, "optional": false, "book": "Rev", "book_name": "Revelation", "reference_long": "12:7-12", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1172, '{"type": "lesson", "filter": {"type": "proper", "content": "Michael"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "1:47-51", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1173, '{"type": "lesson", "filter": {"type": "proper", "content": "Luke"}, "reading": 1, "option_group": null, "optional": false, "book": "Sir", "book_name": "Sirach", "reference_long": "38:1-14", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1174, '{"type": "lesson", "filter": {"type": "proper", "content": "Luke"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "147:1-11", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1175, '{"type": "lesson", "filter": {"type": "proper", "content": "Luke"}, "reading": 3, "option_group": null, "optional": false, "book": "2 Tim", "book_name": "II Timothy", "reference_long": "4:1-13", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1176, '{"type": "lesson", "filter": {"type": "proper", "content": "Luke"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "4:14-21", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1177, '{"type": "lesson", "filter": {"type": "proper", "content": "JamesOfJerusalem"}, "reading": 1, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "15:12-22a", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1178, '{"type": "lesson", "filter": {"type": "proper", "content": "JamesOfJerusalem"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "1", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1179, '{"type": "lesson", "filter": {"type": "proper", "content": "JamesOfJerusalem"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "15:1-11", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1180, '{"type": "lesson", "filter": {"type": "proper", "content": "JamesOfJerusalem"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "13:54-58", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1181, '{"type": "lesson", "filter": {"type": "proper", "content": "SimonJude"}, "reading": 1, "option_group": null, "optional": false, "book": "Deut", "book_name": "Deuteronomy", "reference_long": "32:1-4", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1182, '{"type": "lesson", "filter": {"type": "proper", "content": "SimonJude"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "119:89-96", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1183, '{"type": "lesson", "filter": {"type": "proper", "content": "SimonJude"}, "reading": 3, "option_group": null, "optional": false, "book": "Eph", "book_name": "Ephesians", "reference_long": "2:13-22", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1184, '{"type": "lesson", "filter": {"type": "proper", "content": "SimonJude"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "15:17-27", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1185, '{"type": "lesson", "filter": {"type": "proper", "content": "Ember"}, "reading": 1, "option_group": null, "optional": false, "book": "Num", "book_name": "Numbers", "reference_long": "11:16-17,24-29", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1186, '{"type": "lesson", "filter": {"type": "proper", "content": "Ember"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "99", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1187, '{"type": "lesson", "filter": {"type": "proper", "content": "Ember"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "3:5-11", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1188, '{"type": "lesson", "filter": {"type": "proper", "content": "Ember"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "4:31-38", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1189, '{"type": "lesson", "filter": {"type": "proper", "content": "Ember"}, "reading": 1, "option_group": null, "optional": false, "book": "1 Sam", "book_name": "I Samuel", "reference_long": "3:1-10", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1190, '{"type": "lesson", "filter": {"type": "proper", "content": "Ember"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "63:1-8", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1191, '{"type": "lesson", "filter": {"type": "proper", "content": "Ember"}, "reading": 3, "option_group": null, "optional": false, "book": "Eph", "book_name": "Ephesians", "reference_long": "4:11-16", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1192, '{"type": "lesson", "filter": {"type": "proper", "content": "Ember"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "9:35-38", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1193, '{"type": "lesson", "filter": {"type": "proper", "content": "Rogation"}, "reading": 1, "option_group": null, "optional": false, "book": "Deut", "book_name": "Deuteronomy", "reference_long": "11:10-15", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1194, '{"type": "lesson", "filter": {"type": "proper", "content": "Rogation"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "147", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1195, '{"type": "lesson", "filter": {"type": "proper", "content": "Rogation"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "8:18-25", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1196, '{"type": "lesson", "filter": {"type": "proper", "content": "Rogation"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "4:26-32", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1197, '{"type": "lesson", "filter": {"type": "proper", "content": "Rogation"}, "reading": 1, "option_group": null, "optional": false, "book": "Sir", "book_name": "Sirach", "reference_long": "38:27-32", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1198, '{"type": "lesson", "filter": {"type": "proper", "content": "Rogation"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "107:1-9", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1199, '{"type": "lesson", "filter": {"type": "proper", "content": "Rogation"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "3:10-14", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1200, '{"type": "lesson", "filter": {"type": "proper", "content": "Rogation"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "6:19-24", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1201, '{"type": "lesson", "filter": {"type": "proper", "content": "Military"}, "reading": 1, "option_group": null, "optional": false, "book": "Wis", "book_name": "Wisdom", "reference_long": "3:1-9", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1202, '{"type": "lesson", "filter": {"type": "proper", "content": "Military"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "121", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1203, '{"type": "lesson", "filter": {"type": "proper", "content": "Military"}, "reading": 3, "option_group": null, "optional": false, "book": "Rev", "book_name": "Revelation", "reference_long": "7:9-17", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1204, '{"type": "lesson", "filter": {"type": "proper", "content": "Military"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "11:21-27", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1205, '{"type": "lesson", "filter": {"type": "proper", "content": "Military"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "15:12-17", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(1206, '{"type": "lesson", "filter": {"type": "proper", "content": "CanadaDay"}, "reading": 1, "option_group": null, "optional": false, "book": "Deut", "book_name": "Deuteronomy", "reference_long": "6:1-15", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1207, '{"type": "lesson", "filter": {"type": "proper", "content": "CanadaDay"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "145", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1208, '{"type": "lesson", "filter": {"type": "proper", "content": "CanadaDay"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Pet", "book_name": "I Peter", "reference_long": "2:1-6", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1209, '{"type": "lesson", "filter": {"type": "proper", "content": "CanadaDay"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "22:16-21", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1210, '{"type": "lesson", "filter": {"type": "proper", "content": "CanadaDay"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "25:14-30", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(1211, '{"type": "lesson", "filter": {"type": "proper", "content": "IndependenceDay"}, "reading": 1, "option_group": null, "optional": false, "book": "Deut", "book_name": "Deuteronomy", "reference_long": "10:17-21", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1212, '{"type": "lesson", "filter": {"type": "proper", "content": "IndependenceDay"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "145", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1213, '{"type": "lesson", "filter": {"type": "proper", "content": "IndependenceDay"}, "reading": 3, "option_group": null, "optional": false, "book": "Heb", "book_name": "Hebrews", "reference_long": "11:8-16", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1214, '{"type": "lesson", "filter": {"type": "proper", "content": "IndependenceDay"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "5:43-48", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1215, '{"type": "lesson", "filter": {"type": "proper", "content": "Thanksgiving"}, "reading": 1, "option_group": null, "optional": false, "book": "Deut", "book_name": "Deuteronomy", "reference_long": "8", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1216, '{"type": "lesson", "filter": {"type": "proper", "content": "Thanksgiving"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "65", "reference_short": "65:1-8", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1217, '{"type": "lesson", "filter": {"type": "proper", "content": "Thanksgiving"}, "reading": 3, "option_group": null, "optional": false, "book": "Jas", "book_name": "James", "reference_long": "1:17-27", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1218, '{"type": "lesson", "filter": {"type": "proper", "content": "Thanksgiving"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "6:25-33", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1219, '{"type": "lesson", "filter": {"type": "proper", "content": "Martyr"}, "reading": 1, "option_group": null, "optional": false, "book": "Jer", "book_name": "Jeremiah", "reference_long": "15:15-21", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1220, '{"type": "lesson", "filter": {"type": "proper", "content": "Martyr"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "34", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1221, '{"type": "lesson", "filter": {"type": "proper", "content": "Martyr"}, "reading": 3, "option_group": null, "optional": false, "book": "Rev", "book_name": "Revelation", "reference_long": "7:9-17", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1222, '{"type": "lesson", "filter": {"type": "proper", "content": "Martyr"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "12:4-12", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1223, '{"type": "lesson", "filter": {"type": "proper", "content": "MissionaryEvangelist"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "49:1-7", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1224, '{"type": "lesson", "filter": {"type": "proper", "content": "MissionaryEvangelist"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "98", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1225, '{"type": "lesson", "filter": {"type": "proper", "content": "MissionaryEvangelist"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "10:11-18", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1226, '{"type": "lesson", "filter": {"type": "proper", "content": "MissionaryEvangelist"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "5:1-11", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1227, '{"type": "lesson", "filter": {"type": "proper", "content": "Pastor"}, "reading": 1, "option_group": null, "optional": false, "book": "Isa", "book_name": "Isaiah", "reference_long": "6:1-8", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1228, '{"type": "lesson", "filter": {"type": "proper", "content": "Pastor"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "71:17-24", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1229, '{"type": "lesson", "filter": {"type": "proper", "content": "Pastor"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Pet", "book_name": "I Peter", "reference_long": "5:1-11", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1230, '{"type": "lesson", "filter": {"type": "proper", "content": "Pastor"}, "reading": 3, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "20:24-35", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(1231, '{"type": "lesson", "filter": {"type": "proper", "content": "Pastor"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "24:42-50", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1232, '{"type": "lesson", "filter": {"type": "proper", "content": "TeacherOfTheFaith"}, "reading": 1, "option_group": null, "optional": false, "book": "Prov", "book_name": "Proverbs", "reference_long": "3:13-26", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1233, '{"type": "lesson", "filter": {"type": "proper", "content": "TeacherOfTheFaith"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "119:89-106", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1234, '{"type": "lesson", "filter": {"type": "proper", "content": "TeacherOfTheFaith"}, "reading": 3, "option_group": null, "optional": false, "book": "1 John", "book_name": "I John", "reference_long": "1", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1235, '{"type": "lesson", "filter": {"type": "proper", "content": "TeacherOfTheFaith"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "13:47-52", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1236, '{"type": "lesson", "filter": {"type": "proper", "content": "Monastic"}, "reading": 1, "option_group": null, "optional": false, "book": "Lam", "book_name": "Lamentations", "reference_long": "3:22-33", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1237, '{"type": "lesson", "filter": {"type": "proper", "content": "Monastic"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "1", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1238, '{"type": "lesson", "filter": {"type": "proper", "content": "Monastic"}, "reading": 3, "option_group": null, "optional": false, "book": "Heb", "book_name": "Hebrews", "reference_long": "4:1-13", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1239, '{"type": "lesson", "filter": {"type": "proper", "content": "Monastic"}, "reading": 3, "option_group": null, "optional": false, "book": "Acts", "book_name": "Acts", "reference_long": "2:42-47", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 2}');
-INSERT INTO "texts" VALUES(1240, '{"type": "lesson", "filter": {"type": "proper", "content": "Monastic"}, "reading": 5, "option_group": null, "optional": false, "book": "Mark", "book_name": "Mark", "reference_long": "10:23-31", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1241, '{"type": "lesson", "filter": {"type": "proper", "content": "Ecumenist"}, "reading": 1, "option_group": null, "optional": false, "book": "Ezek", "book_name": "Ezekiel", "reference_long": "34:11-16", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1242, '{"type": "lesson", "filter": {"type": "proper", "content": "Ecumenist"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "133", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1243, '{"type": "lesson", "filter": {"type": "proper", "content": "Ecumenist"}, "reading": 3, "option_group": null, "optional": false, "book": "Eph", "book_name": "Ephesians", "reference_long": "3:14-21", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1244, '{"type": "lesson", "filter": {"type": "proper", "content": "Ecumenist"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "17:10-26", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1245, '{"type": "lesson", "filter": {"type": "proper", "content": "ReformerOfTheChurch"}, "reading": 1, "option_group": null, "optional": false, "book": "Jer", "book_name": "Jeremiah", "reference_long": "1:4-10", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1246, '{"type": "lesson", "filter": {"type": "proper", "content": "ReformerOfTheChurch"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "46", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1247, '{"type": "lesson", "filter": {"type": "proper", "content": "ReformerOfTheChurch"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "3:10-23", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1248, '{"type": "lesson", "filter": {"type": "proper", "content": "ReformerOfTheChurch"}, "reading": 5, "option_group": null, "optional": false, "book": "Matt", "book_name": "Matthew", "reference_long": "5:13-20", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1249, '{"type": "lesson", "filter": {"type": "proper", "content": "RenewerOfSociety"}, "reading": 1, "option_group": null, "optional": false, "book": "Exod", "book_name": "Exodus", "reference_long": "3:7-12", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1250, '{"type": "lesson", "filter": {"type": "proper", "content": "RenewerOfSociety"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "145:1-13", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1251, '{"type": "lesson", "filter": {"type": "proper", "content": "RenewerOfSociety"}, "reading": 3, "option_group": null, "optional": false, "book": "Rom", "book_name": "Romans", "reference_long": "12:9-21", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1252, '{"type": "lesson", "filter": {"type": "proper", "content": "RenewerOfSociety"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "6:20-38", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1253, '{"type": "lesson", "filter": {"type": "proper", "content": "Commemoration"}, "reading": 1, "option_group": null, "optional": false, "book": "Mic", "book_name": "Micah", "reference_long": "6:6-8", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1254, '{"type": "lesson", "filter": {"type": "proper", "content": "Commemoration"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "1", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1255, '{"type": "lesson", "filter": {"type": "proper", "content": "Commemoration"}, "reading": 3, "option_group": null, "optional": false, "book": "1 Cor", "book_name": "I Corinthians", "reference_long": "1:18-31", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1256, '{"type": "lesson", "filter": {"type": "proper", "content": "Commemoration"}, "reading": 5, "option_group": null, "optional": false, "book": "John", "book_name": "John", "reference_long": "3:16-21", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1257, '{"type": "lesson", "filter": {"type": "proper", "content": "Commemoration"}, "reading": 1, "option_group": null, "optional": false, "book": "Wis", "book_name": "Wisdom", "reference_long": "3:1-9", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1258, '{"type": "lesson", "filter": {"type": "proper", "content": "Commemoration"}, "reading": 2, "option_group": null, "optional": false, "book": "Ps", "book_name": "Psalm", "reference_long": "15", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1259, '{"type": "lesson", "filter": {"type": "proper", "content": "Commemoration"}, "reading": 3, "option_group": null, "optional": false, "book": "Phil", "book_name": "Philippians", "reference_long": "4:4-9", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
-INSERT INTO "texts" VALUES(1260, '{"type": "lesson", "filter": {"type": "proper", "content": "Commemoration"}, "reading": 5, "option_group": null, "optional": false, "book": "Luke", "book_name": "Luke", "reference_long": "6:17-23", "reference_short": "_", "note": "_", "subcycles": ["A", "B", "C"], "default_order": 1}');
+CREATE INDEX idx_users_calendar_token ON users(json_extract(data, '$.calendar_token'));
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""Time calendar lookups over a full 400-year Gregorian cycle.
+
+The engine is warmed before timing so the figures reflect steady-state
+lookups rather than the one-off cost of loading holidays from SQLite.
+"""
+import argparse
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+GREGORIAN_CYCLE_DAYS = 146097
+
+
+def benchmark(name, func, days, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for day in days:
+            func(day)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    rate = len(days) / best
+    print(f"{name:<28} {best:8.3f}s {rate:14,.0f} lookups/s")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--start-year", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--database",
+        help="Benchmark against an existing database instead of a fresh one.",
+    )
+    args = parser.parse_args()
+
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+
+    from ordinarium import create_app
+    from ordinarium.db import init_db
+    from ordinarium.liturgical_calendar import (
+        resolve_observance_options,
+        resolve_season,
+        resolve_subcycle,
+    )
+
+    start = date(args.start_year, 1, 1)
+    days = [start + timedelta(days=offset) for offset in range(GREGORIAN_CYCLE_DAYS)]
+    print(f"{len(days)} days from {days[0]} to {days[-1]}, best of {args.repeat}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app()
+        app.config.update(
+            DATABASE=args.database or str(Path(tmp) / "benchmark.db"),
+            CALENDAR_RELOAD_FILE=str(Path(tmp) / "calendar.reload"),
+            CALENDAR_SNAPSHOT_FILE=str(Path(tmp) / "calendar.snapshot"),
+        )
+        with app.app_context():
+            if not args.database:
+                init_db()
+            resolve_observance_options(start)
+            benchmark(
+                "resolve_observance_options",
+                resolve_observance_options,
+                days,
+                args.repeat,
+            )
+            benchmark("resolve_season", resolve_season, days, args.repeat)
+            benchmark("resolve_subcycle", resolve_subcycle, days, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+"""Time the trailing_indent filter over the longest liturgical texts.
+
+Texts are rendered from markdown once up front, so the figures cover only
+the filter, as it runs on every ordinary of every generated service.
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def benchmark(name, func, texts, repeat):
+    total_chars = sum(len(text) for text in texts)
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in texts:
+            func(text)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{name:<28} {best:8.3f}s {total_chars / best / 1e6:10.1f} MB/s")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--limit", type=int, default=20, help="Number of longest texts to use."
+    )
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--database",
+        help="Benchmark against an existing database instead of a fresh one.",
+    )
+    args = parser.parse_args()
+
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+
+    import markdown2
+
+    from ordinarium import create_app
+    from ordinarium.db import get_db, init_db
+    from ordinarium.rendering import MARKDOWN_EXTRAS
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app()
+        app.config.update(
+            DATABASE=args.database or str(Path(tmp) / "benchmark.db"),
+            CALENDAR_RELOAD_FILE=str(Path(tmp) / "calendar.reload"),
+            CALENDAR_SNAPSHOT_FILE=str(Path(tmp) / "calendar.snapshot"),
+        )
+        with app.app_context():
+            if not args.database:
+                init_db()
+            # The Eucharistic prayers and creeds are the longest texts.
+            rows = (
+                get_db()
+                .execute(
+                    "select type, title, text from texts order by length(text) desc limit ?",
+                    (args.limit,),
+                )
+                .fetchall()
+            )
+        for row in rows:
+            print(f"{len(row['text']):7,} chars  {row['title'] or row['type']}")
+        texts = [
+            markdown2.markdown(row["text"], extras=MARKDOWN_EXTRAS) for row in rows
+        ] * args.rounds
+        print(f"{len(texts)} renders, best of {args.repeat}")
+        trailing_indent = app.jinja_env.filters["trailing_indent"]
+        benchmark("trailing_indent", trailing_indent, texts, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ if [ -f "venv/bin/activate" ]; then
   source venv/bin/activate
   pip install -r requirements.txt
   python scripts/migrate_db.py
+  flask --app ordinarium precompute-calendar
 fi
 
-sudo systemctl restart ordinarium
+sudo systemctl restart ordinarium ordinarium-exports
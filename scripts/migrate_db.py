@@ -4,15 +4,62 @@ import sys
 from pathlib import Path
 
 
-def get_db_path():
+def get_app():
     repo_root = Path(__file__).resolve().parents[1]
     if str(repo_root) not in sys.path:
         sys.path.insert(0, str(repo_root))
 
     from ordinarium import create_app
 
-    app = create_app()
-    return app.config["DATABASE"]
+    return create_app()
+
+
+def write_content(app, conn):
+    from ordinarium.db import (
+        CONTENT_TABLES,
+        build_content,
+        content_version,
+        script_content_version,
+    )
+
+    path = app.config["CONTENT_DATABASE"]
+    if not path:
+        return
+    with app.app_context():
+        version = script_content_version()
+        if content_version(path) == version:
+            print(f"Content database {path} is up to date ({version[:12]})")
+        else:
+            build_content(path)
+            print(f"Built content database {path} ({version[:12]})")
+    # The user database's copies would shadow the attached content tables.
+    for table in CONTENT_TABLES:
+        conn.execute(f"drop table if exists main.{table}")
+    conn.commit()
+
+
+def write_snapshot(app):
+    from ordinarium.liturgical_calendar import write_calendar_snapshot
+
+    path = write_calendar_snapshot(app)
+    print(f"Wrote calendar snapshot {path}")
+
+
+def write_calendar_days(app):
+    from ordinarium.liturgical_calendar import refresh_precomputed_calendar
+
+    with app.app_context():
+        span = refresh_precomputed_calendar()
+    if span:
+        print(f"Precomputed calendar days for {span[0]}-{span[1]}")
+
+
+def write_text_renders(app):
+    from ordinarium.rendering import prerender_texts
+
+    with app.app_context():
+        static, slotted = prerender_texts()
+    print(f"Pre-rendered {static} static and {slotted} slotted texts")
 
 
 def ensure_schema_migrations(conn):
@@ -42,13 +89,17 @@ def apply_migration(conn, path):
 
 
 def main():
-    db_path = get_db_path()
+    app = get_app()
+    db_path = app.config["DATABASE"]
     migrations_dir = Path(__file__).resolve().parent / "migrations"
     if not migrations_dir.exists():
         raise SystemExit(f"Migrations directory not found: {migrations_dir}")
     migration_files = sorted(migrations_dir.glob("*.sql"))
     if not migration_files:
         print("No migrations found.")
+        write_snapshot(app)
+        write_calendar_days(app)
+        write_text_renders(app)
         return
 
     conn = sqlite3.connect(db_path)
@@ -61,8 +112,12 @@ def main():
             apply_migration(conn, path)
             conn.commit()
             print(f"Applied {path.name}")
+        write_content(app, conn)
     finally:
         conn.close()
+    write_snapshot(app)
+    write_calendar_days(app)
+    write_text_renders(app)
 
 
 if __name__ == "__main__":
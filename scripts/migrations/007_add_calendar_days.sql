@@ -0,0 +1,13 @@
+CREATE TABLE IF NOT EXISTS calendar_days (
+  id INTEGER PRIMARY KEY,
+  date TEXT NOT NULL,
+  rank INTEGER NOT NULL,
+  handle TEXT,
+  title TEXT,
+  priority INTEGER,
+  season TEXT,
+  subcycle TEXT,
+  propers JSON
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_calendar_days_date_rank ON calendar_days(date, rank);
+CREATE INDEX IF NOT EXISTS idx_calendar_days_date_handle ON calendar_days(date, handle);
@@ -0,0 +1 @@
+CREATE INDEX IF NOT EXISTS idx_users_calendar_token ON users(json_extract(data, '$.calendar_token'));
@@ -0,0 +1,7 @@
+CREATE TABLE IF NOT EXISTS text_renders (
+  source_hash TEXT NOT NULL,
+  kind TEXT NOT NULL,
+  html TEXT,
+  fragments JSON,
+  PRIMARY KEY (source_hash, kind)
+);
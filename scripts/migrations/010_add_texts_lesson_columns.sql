@@ -0,0 +1,7 @@
+ALTER TABLE texts ADD COLUMN reading INTEGER
+generated always as (json_extract(data, '$.reading')) virtual;
+ALTER TABLE texts ADD COLUMN optional INTEGER
+generated always as (json_extract(data, '$.optional')) virtual;
+ALTER TABLE texts ADD COLUMN subcycles TEXT
+generated always as (json_extract(data, '$.subcycles')) virtual;
+CREATE INDEX IF NOT EXISTS idx_texts_propers ON texts(type, filter_type, filter_content, default_order);
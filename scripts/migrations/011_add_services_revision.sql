@@ -0,0 +1,4 @@
+ALTER TABLE services ADD COLUMN revision INTEGER
+GENERATED ALWAYS AS (json_extract(data, '$.revision')) VIRTUAL;
+ALTER TABLE services ADD COLUMN updated_at TEXT
+GENERATED ALWAYS AS (json_extract(data, '$.updated_at')) VIRTUAL;
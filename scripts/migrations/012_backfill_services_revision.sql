@@ -0,0 +1,3 @@
+UPDATE services
+SET data = json_set(data, '$.revision', 1, '$.updated_at', datetime('now'))
+WHERE revision IS NULL;
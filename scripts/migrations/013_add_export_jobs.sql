@@ -0,0 +1,16 @@
+CREATE TABLE IF NOT EXISTS export_jobs (
+  id INTEGER PRIMARY KEY,
+  job_uuid TEXT NOT NULL,
+  user_id INTEGER NOT NULL,
+  format TEXT NOT NULL,
+  status TEXT NOT NULL DEFAULT 'queued',
+  total INTEGER NOT NULL DEFAULT 0,
+  completed INTEGER NOT NULL DEFAULT 0,
+  skipped INTEGER NOT NULL DEFAULT 0,
+  path TEXT,
+  error TEXT,
+  created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+  updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_export_jobs_uuid ON export_jobs(job_uuid);
+CREATE INDEX IF NOT EXISTS idx_export_jobs_user_id ON export_jobs(user_id);
@@ -0,0 +1,27 @@
+CREATE TABLE services_rebuilt (
+  id INTEGER PRIMARY KEY,
+  data JSON,
+  user_id INTEGER GENERATED ALWAYS AS (json_extract(data, '$.user_id')) STORED,
+  title TEXT GENERATED ALWAYS AS (json_extract(data, '$.title')) STORED,
+  rite TEXT GENERATED ALWAYS AS (json_extract(data, '$.rite')) STORED,
+  text_order TEXT GENERATED ALWAYS AS (json_extract(data, '$.text_order')) VIRTUAL,
+  text_disabled TEXT GENERATED ALWAYS AS (json_extract(data, '$.text_disabled')) VIRTUAL,
+  season TEXT GENERATED ALWAYS AS (json_extract(data, '$.season')) STORED,
+  service_date TEXT GENERATED ALWAYS AS (json_extract(data, '$.service_date')) STORED,
+  revision INTEGER GENERATED ALWAYS AS (json_extract(data, '$.revision')) STORED,
+  updated_at TEXT GENERATED ALWAYS AS (json_extract(data, '$.updated_at')) STORED
+);
+INSERT INTO services_rebuilt (id, data) SELECT id, data FROM services;
+DROP TABLE services;
+ALTER TABLE services_rebuilt RENAME TO services;
+CREATE INDEX idx_services_user_date ON services(user_id, service_date);
+CREATE INDEX idx_services_user_rite_date ON services(user_id, rite, service_date);
+CREATE INDEX idx_services_season ON services(season);
+
+DROP INDEX IF EXISTS idx_service_custom_elements_service_id;
+DROP INDEX IF EXISTS idx_service_custom_elements_user_id;
+CREATE INDEX IF NOT EXISTS idx_service_custom_elements_service_created ON service_custom_elements(service_id, created_at);
+
+DROP INDEX IF EXISTS idx_service_custom_templates_user_id;
+DROP INDEX IF EXISTS idx_service_custom_templates_updated_at;
+CREATE INDEX IF NOT EXISTS idx_service_custom_templates_user_updated ON service_custom_templates(user_id, updated_at);
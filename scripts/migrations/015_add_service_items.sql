@@ -0,0 +1,44 @@
+CREATE TABLE IF NOT EXISTS service_items (
+  id INTEGER PRIMARY KEY,
+  service_id INTEGER NOT NULL,
+  token TEXT NOT NULL,
+  position REAL,
+  disabled INTEGER NOT NULL DEFAULT 0
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_service_items_service_token ON service_items(service_id, token);
+CREATE INDEX IF NOT EXISTS idx_service_items_plan ON service_items(service_id, position, token, disabled);
+
+-- Plan tokens are normalized as parse_plan_tokens does: numbers and digit
+-- strings are text ids, anything else must already be a "kind:id" token.
+CREATE TEMP TABLE legacy_plan_tokens AS
+SELECT services.id AS service_id, plan.list, items.key,
+  CASE
+    WHEN items.type IN ('integer', 'real') THEN 'text:' || CAST(items.value AS INTEGER)
+    WHEN items.type != 'text' OR trim(items.value) = '' THEN NULL
+    WHEN instr(trim(items.value), ':') > 0 THEN trim(items.value)
+    WHEN trim(items.value) NOT GLOB '*[^0-9]*' THEN 'text:' || trim(items.value)
+  END AS token
+FROM services
+JOIN (SELECT 'order' AS list UNION ALL SELECT 'disabled') AS plan
+JOIN json_each(
+  CASE
+    WHEN plan.list = 'order' AND json_valid(services.text_order) AND json_type(services.text_order) = 'array' THEN services.text_order
+    WHEN plan.list = 'disabled' AND json_valid(services.text_disabled) AND json_type(services.text_disabled) = 'array' THEN services.text_disabled
+    ELSE '[]'
+  END
+) AS items;
+
+-- Positions only need to keep the order, so the first index of each token
+-- in the legacy list will do.
+INSERT OR IGNORE INTO service_items (service_id, token, position, disabled)
+SELECT service_id, token,
+  min(CASE WHEN list = 'order' THEN key + 1 END),
+  max(list = 'disabled')
+FROM legacy_plan_tokens
+WHERE token IS NOT NULL
+GROUP BY service_id, token;
+
+DROP TABLE legacy_plan_tokens;
+UPDATE services
+SET data = json_remove(data, '$.text_order', '$.text_disabled')
+WHERE text_order IS NOT NULL OR text_disabled IS NOT NULL;
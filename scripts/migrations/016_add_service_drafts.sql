@@ -0,0 +1,6 @@
+CREATE TABLE IF NOT EXISTS service_drafts (
+  id INTEGER PRIMARY KEY,
+  user_id INTEGER NOT NULL,
+  created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_service_drafts_user_id ON service_drafts(user_id);
@@ -0,0 +1,6 @@
+CREATE TABLE IF NOT EXISTS service_id_sequence (
+  id INTEGER PRIMARY KEY,
+  last_id INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO service_id_sequence (id, last_id)
+SELECT 1, max((SELECT coalesce(max(id), 0) FROM services), (SELECT coalesce(max(id), 0) FROM service_drafts));
@@ -0,0 +1,6 @@
+CREATE TABLE IF NOT EXISTS custom_element_id_sequence (
+  id INTEGER PRIMARY KEY,
+  last_id INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO custom_element_id_sequence (id, last_id)
+SELECT 1, coalesce(max(id), 0) FROM service_custom_elements;
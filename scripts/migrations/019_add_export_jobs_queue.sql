@@ -0,0 +1,2 @@
+ALTER TABLE export_jobs ADD COLUMN service_ids JSON;
+CREATE INDEX IF NOT EXISTS idx_export_jobs_status ON export_jobs(status, id);
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""Record the ICS fixtures used by tests/test_ics_alignment.py.
+
+``google`` downloads the public ACNA calendar used as an external oracle.
+``engine`` records this tree's own observances as a regression fixture.
+Both are written gzip-compressed with a fixed mtime so re-recording
+unchanged data produces an identical file.
+"""
+import argparse
+import gzip
+import sys
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+from urllib.request import urlopen
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+FIXTURES_DIR = REPO_ROOT / "tests" / "fixtures"
+GOOGLE_ICS_URL = (
+    "https://calendar.google.com/calendar/ical/"
+    "ma7m909q4huvqedci3fbl1u6rg%40group.calendar.google.com/"
+    "public/basic.ics"
+)
+
+
+def write_gzip(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as raw:
+        with gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as f:
+            f.write(text.encode("utf-8"))
+
+
+def record_google(args):
+    with urlopen(args.url, timeout=30) as response:
+        text = response.read().decode("utf-8")
+    write_gzip(args.output, text)
+    print(f"Recorded {args.url} to {args.output}")
+
+
+def engine_lines(start, end):
+    from ordinarium.liturgical_calendar import (
+        resolve_observance_options,
+        resolve_season,
+        resolve_subcycle,
+    )
+
+    yield "BEGIN:VCALENDAR"
+    yield "VERSION:2.0"
+    yield "PRODID:-//Ordinarium//Calendar Regression Fixture//EN"
+    current = start
+    while current <= end:
+        season = resolve_season(current)
+        subcycle = resolve_subcycle(current)
+        for rank, option in enumerate(resolve_observance_options(current)):
+            yield "BEGIN:VEVENT"
+            yield f"UID:{current:%Y%m%d}-{rank}-{option.handle}@ordinarium"
+            yield f"DTSTART;VALUE=DATE:{current:%Y%m%d}"
+            yield f"SUMMARY:{option.name or option.alternative_name}"
+            yield f"X-ORDINARIUM-HANDLE:{option.handle}"
+            yield f"X-ORDINARIUM-RANK:{rank}"
+            yield f"X-ORDINARIUM-SEASON:{season}"
+            yield f"X-ORDINARIUM-SUBCYCLE:{subcycle or ''}"
+            yield f"X-ORDINARIUM-PROPERS:{' '.join(option.propers)}"
+            yield "END:VEVENT"
+        current += timedelta(days=1)
+    yield "END:VCALENDAR"
+
+
+def record_engine(args):
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+
+    from ordinarium import create_app
+    from ordinarium.db import init_db
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app()
+        app.config.update(
+            DATABASE=str(Path(tmp) / "fixture.db"),
+            CALENDAR_RELOAD_FILE=str(Path(tmp) / "calendar.reload"),
+            CALENDAR_SNAPSHOT_FILE=str(Path(tmp) / "calendar.snapshot"),
+        )
+        with app.app_context():
+            init_db()
+            lines = engine_lines(
+                date(args.start_year, 1, 1), date(args.end_year, 12, 31)
+            )
+            text = "\r\n".join(lines) + "\r\n"
+    write_gzip(args.output, text)
+    print(f"Recorded {args.start_year}-{args.end_year} to {args.output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    google = commands.add_parser("google", help="Record the public ACNA calendar.")
+    google.add_argument("--url", default=GOOGLE_ICS_URL)
+    google.add_argument(
+        "--output", type=Path, default=FIXTURES_DIR / "google_calendar.ics.gz"
+    )
+    google.set_defaults(func=record_google)
+
+    engine = commands.add_parser("engine", help="Record this tree's observances.")
+    engine.add_argument("--start-year", type=int, default=2000)
+    engine.add_argument("--end-year", type=int, default=2099)
+    engine.add_argument(
+        "--output", type=Path, default=FIXTURES_DIR / "observances.ics.gz"
+    )
+    engine.set_defaults(func=record_engine)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
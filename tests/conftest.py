@@ -20,6 +20,8 @@ def app(tmp_path):
         TESTING=True,
         DATABASE=str(tmp_path / "test.db"),
         SECRET_KEY="test",
+        CALENDAR_RELOAD_FILE=str(tmp_path / "calendar.reload"),
+        CALENDAR_SNAPSHOT_FILE=str(tmp_path / "calendar.snapshot"),
     )
     with app.app_context():
         init_db()
@@ -92,6 +94,22 @@ def service_factory(app):
     return _factory
 
 
+@pytest.fixture()
+def draft_factory(app):
+    # Reserves an id for a service the user has not saved yet.
+    def _factory(user_id, service_id):
+        with app.app_context():
+            db = get_db()
+            db.execute(
+                "insert into service_drafts (id, user_id) values (?, ?)",
+                (service_id, user_id),
+            )
+            db.commit()
+        return service_id
+
+    return _factory
+
+
 @pytest.fixture()
 def auth_client(client, user_factory):
     user_id = user_factory()
@@ -39,3 +39,28 @@ def test_observance_endpoint_returns_options_for_date(client):
     assert payload["title"] == "The First Sunday in Advent"
     assert payload["season"] == "Advent"
     assert payload["options"]
+
+
+def test_observance_range_returns_columns_for_each_date(client):
+    response = client.get("/observance/range?start=2024-11-30&end=2024-12-02")
+    payload = response.get_json()
+    assert response.status_code == 200
+    assert payload["dates"] == ["2024-11-30", "2024-12-01", "2024-12-02"]
+    assert payload["handles"][1] == "AdventI"
+    assert payload["seasons"][1] == "Advent"
+    assert payload["options"][1][0] == "AdventI"
+    assert payload["titles"]["AdventI"] == "The First Sunday in Advent"
+    single = client.get("/observance?date=2024-12-01").get_json()
+    assert payload["subcycles"][1] == single["subcycle"]
+
+
+def test_observance_range_rejects_invalid_ranges(client):
+    assert client.get("/observance/range?start=bad&end=2024-12-01").status_code == 400
+    assert (
+        client.get("/observance/range?start=2024-12-02&end=2024-12-01").status_code
+        == 400
+    )
+    assert (
+        client.get("/observance/range?start=2020-01-01&end=2024-12-01").status_code
+        == 400
+    )
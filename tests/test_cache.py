@@ -0,0 +1,43 @@
+from ordinarium.cache import LRUCache
+from ordinarium.rendering import template_cache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert "a" in cache
+    assert "b" not in cache
+    assert len(cache) == 2
+
+
+def test_lru_cache_counts_hits_and_misses():
+    cache = LRUCache(maxsize=4)
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return "value"
+
+    assert cache.get_or_set("key", factory) == "value"
+    assert cache.get_or_set("key", factory) == "value"
+    assert calls == [1]
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 4}
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_markdown_template_reuses_compiled_templates(app):
+    with app.test_request_context():
+        cache = template_cache()
+        render = app.jinja_env.from_string("{{ source | markdown_template }}").render
+        assert "Hello Lord" in render(source="Hello {{ name }}", name="Lord")
+        assert "Hello Peter" in render(source="Hello {{ name }}", name="Peter")
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hits"] == 1
+
+        assert "Goodbye" in render(source="Goodbye {{ name }}", name="Lord")
+        assert cache.stats()["misses"] == 2
+        assert len(cache) == 2
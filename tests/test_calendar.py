@@ -1,14 +1,29 @@
 from datetime import date
 
+from ordinarium import create_app
+from ordinarium.db import get_db, init_db
 from ordinarium.liturgical_calendar import (
+    CALENDAR_SNAPSHOT_HEADER,
+    CALENDAR_SNAPSHOT_MAGIC,
+    CalendarEngine,
+    DateExpression,
+    _compile_date_rules,
     _expand_date_rules,
     _parse_date_expression,
+    _season_label,
     _split_rule_condition,
     advent_start,
+    calendar_store,
     easter_date,
+    movable_anchors,
     resolve_observance,
     resolve_observance_options,
+    resolve_observance_range,
     resolve_season,
+    resolve_seasons,
+    resolve_subcycle,
+    signal_calendar_reload,
+    write_calendar_snapshot,
 )
 
 
@@ -37,13 +52,28 @@ def test_expand_date_rules_applies_conditions():
     assert dates == [date(2024, 12, 25)]
 
 
+def test_compile_date_rules_parses_once_into_rule_objects():
+    rules = _compile_date_rules("1/28→Sun (before E-49), E+36")
+    assert rules[0].base == DateExpression(month=1, day=28, weekday=6)
+    assert rules[0].before == DateExpression(easter_offset=-49)
+    assert rules[1].base == DateExpression(easter_offset=36)
+    assert _compile_date_rules("1/28→Sun (before E-49), E+36") is rules
+
+
+def test_compile_date_rules_drops_unparseable_entries():
+    assert _compile_date_rules("_") == ()
+    assert _compile_date_rules("E+1→Sun, 13/1, 12/25 (before nonsense)") == ()
+    assert _expand_date_rules("2/29", 2023) == []
+    assert _expand_date_rules("2/29", 2024) == [date(2024, 2, 29)]
+
+
 def test_split_rule_condition_parses_parts():
     base, condition = _split_rule_condition("12/25 (before 12/26)")
     assert base == "12/25"
     assert condition == "before 12/26"
 
 
-def test_resolve_observance_options_sorts_by_priority_and_index(monkeypatch):
+def test_resolve_observance_options_sorts_by_priority_and_index(app, monkeypatch):
     def fake_holidays():
         return [
             {
@@ -79,12 +109,13 @@ def test_resolve_observance_options_sorts_by_priority_and_index(monkeypatch):
         ]
 
     monkeypatch.setattr("ordinarium.liturgical_calendar._load_holidays", fake_holidays)
-    options = resolve_observance_options(date(2024, 12, 1))
+    with app.app_context():
+        options = resolve_observance_options(date(2024, 12, 1))
     handles = [option.handle for option in options]
     assert handles == ["A", "B", "C"]
 
 
-def test_resolve_observance_prefers_handle_match(monkeypatch):
+def test_resolve_observance_prefers_handle_match(app, monkeypatch):
     def fake_holidays():
         return [
             {
@@ -110,5 +141,214 @@ def test_resolve_observance_prefers_handle_match(monkeypatch):
         ]
 
     monkeypatch.setattr("ordinarium.liturgical_calendar._load_holidays", fake_holidays)
-    observance = resolve_observance(date(2024, 12, 1), handle="B")
+    with app.app_context():
+        observance = resolve_observance(date(2024, 12, 1), handle="B")
     assert observance.handle == "B"
+
+
+def test_calendar_engine_builds_liturgical_year_table():
+    holidays = [
+        {
+            "index": 0,
+            "handle": "AdventI",
+            "date": "11/27→Sun",
+            "style": "Sunday",
+            "priority": 2,
+            "propers": ["AdventI"],
+            "name": "Advent Sunday",
+            "alternative_name": "",
+        },
+        {
+            "index": 1,
+            "handle": "Easter",
+            "date": "E",
+            "style": "Principal",
+            "priority": 0,
+            "propers": ["Easter"],
+            "name": "Easter Day",
+            "alternative_name": "",
+        },
+    ]
+    fragments = [{"date": "11/27→Sun", "behaviour": "Append", "propers": ["Extra"]}]
+    subcycles = [{"handle": "A", "epoch": 2020, "order": 0, "full_cycle": 1}]
+    engine = CalendarEngine(holidays, fragments, subcycles, max_years=2)
+
+    table = engine.year_table(2025)
+    assert set(table) == {date(2024, 12, 1), date(2025, 4, 20)}
+    assert table[date(2024, 12, 1)][0].propers == ("AdventI", "Extra")
+    assert table[date(2025, 4, 20)][0].subcycle == "A"
+    assert engine.observances(date(2025, 4, 20))[0].handle == "Easter"
+    assert engine.observances(date(2025, 11, 30))[0].handle == "AdventI"
+    assert engine.observances(date(2025, 4, 21)) == ()
+    assert engine.year_table(2025) is table
+
+
+def test_resolve_observance_range_matches_single_lookups(app):
+    with app.app_context():
+        days = resolve_observance_range(date(2024, 11, 24), date(2025, 1, 7))
+        assert len(days) == 45
+        for day in days:
+            assert list(day.observances) == resolve_observance_options(day.date)
+            assert day.season == resolve_season(day.date)
+            assert day.subcycle == resolve_subcycle(day.date)
+
+
+def test_movable_anchors_matches_scalar_functions():
+    years = list(range(1900, 2300))
+    table = movable_anchors(years)
+    assert sorted(table) == years
+    for year in years:
+        anchors = table[year]
+        easter = easter_date(year).toordinal()
+        assert anchors.easter == easter
+        assert anchors.ash_wednesday == easter - 46
+        assert anchors.pentecost == easter + 49
+        assert anchors.advent == advent_start(year).toordinal()
+        assert anchors.christ_the_king == anchors.advent - 7
+
+
+def test_calendar_store_is_scoped_to_each_app(app, tmp_path):
+    other = create_app()
+    other.config.update(TESTING=True, DATABASE=str(tmp_path / "other.db"))
+    with other.app_context():
+        init_db()
+        get_db().execute("delete from holidays where handle=?", ("AdventI",))
+        get_db().commit()
+        assert resolve_observance(date(2024, 12, 1)) is None
+    with app.app_context():
+        assert resolve_observance(date(2024, 12, 1)).handle == "AdventI"
+    assert calendar_store(app) is not calendar_store(other)
+
+
+def test_calendar_store_reloads_after_migration_or_signal(app):
+    app.config["CALENDAR_CHECK_INTERVAL"] = 0
+    with app.app_context():
+        db = get_db()
+        assert resolve_observance(date(2024, 12, 1)).handle == "AdventI"
+        db.execute(
+            "update holidays set name=? where handle=?", ("Advent Sunday I", "AdventI")
+        )
+        db.commit()
+        assert resolve_observance(date(2024, 12, 1)).name != "Advent Sunday I"
+        db.execute(
+            "insert into schema_migrations (filename) values (?)", ("999_test.sql",)
+        )
+        db.commit()
+        assert resolve_observance(date(2024, 12, 1)).name == "Advent Sunday I"
+
+        db.execute("update holidays set name=? where handle=?", ("Renamed", "AdventI"))
+        db.commit()
+        signal_calendar_reload(app)
+        assert resolve_observance(date(2024, 12, 1)).name == "Renamed"
+
+
+def test_resolve_season_single_day_feasts():
+    assert resolve_season(date(2024, 11, 24)) == "Christ the King"
+    assert resolve_season(date(2024, 3, 28)) == "Maundy Thursday"
+    assert resolve_season(date(2024, 3, 29)) == "Holy Week"
+    assert resolve_season(date(2024, 5, 9)) == "Ascension"
+    assert resolve_season(date(2024, 5, 10)) == "Easter"
+    assert resolve_season(date(2024, 5, 19)) == "Pentecost"
+    assert resolve_season(date(2024, 5, 26)) == "Trinity Sunday"
+    assert resolve_season(date(2024, 5, 27)) == "Ordinary Time"
+
+
+def test_resolve_seasons_matches_comparison_chain_over_gregorian_cycle():
+    start = date(2000, 1, 1).toordinal()
+    dates = [date.fromordinal(start + offset) for offset in range(146097)]
+    seasons = resolve_seasons(dates)
+    for service_date, season in zip(dates, seasons):
+        anchors = movable_anchors([service_date.year])[service_date.year]
+        assert season == _season_label(service_date.toordinal(), anchors)
+    assert resolve_seasons([None, date(2024, 12, 25)]) == [None, "Christmastide"]
+
+
+def test_precompute_calendar_command_materializes_days(app):
+    runner = app.test_cli_runner()
+    result = runner.invoke(
+        args=["precompute-calendar", "--start-year", "2024", "--end-year", "2024"]
+    )
+    assert "Precomputed 366 calendar days" in result.output
+    with app.app_context():
+        db = get_db()
+        advent = db.execute(
+            "select handle, title, season, subcycle, propers from calendar_days where date=? and rank=0",
+            ("2024-12-01",),
+        ).fetchone()
+        assert advent["handle"] == "AdventI"
+        assert advent["title"] == "The First Sunday in Advent"
+        assert advent["season"] == "Advent"
+        assert advent["subcycle"] == resolve_subcycle(date(2024, 12, 1))
+        assert "AdventI" in advent["propers"]
+        dates = db.execute(
+            "select count(distinct date) as count from calendar_days"
+        ).fetchone()
+        assert dates["count"] == 366
+
+
+def test_reload_calendar_rematerializes_precomputed_days(app):
+    runner = app.test_cli_runner()
+    runner.invoke(
+        args=["precompute-calendar", "--start-year", "2024", "--end-year", "2025"]
+    )
+    with app.app_context():
+        db = get_db()
+        db.execute(
+            "update calendar_days set title=? where date=? and rank=0",
+            ("Stale Title", "2025-11-30"),
+        )
+        db.commit()
+    result = runner.invoke(args=["reload-calendar"])
+    assert "Precomputed calendar days for 2024-2025." in result.output
+    with app.app_context():
+        advent = (
+            get_db()
+            .execute(
+                "select title from calendar_days where date=? and rank=0",
+                ("2025-11-30",),
+            )
+            .fetchone()
+        )
+    assert advent["title"] == "The First Sunday in Advent"
+
+
+def test_calendar_snapshot_is_loaded_instead_of_database(app, monkeypatch):
+    write_calendar_snapshot(app)
+
+    def fail(_db):
+        raise AssertionError("calendar data should come from the snapshot")
+
+    monkeypatch.setattr("ordinarium.liturgical_calendar._read_holidays", fail)
+    with app.app_context():
+        store = calendar_store().refresh(force=True)
+        assert store.engine is not None
+        assert resolve_observance(date(2024, 12, 1)).handle == "AdventI"
+
+
+def test_unreadable_calendar_snapshot_falls_back_to_database(app):
+    path = app.config["CALENDAR_SNAPSHOT_FILE"]
+    # A snapshot from an older build: a class this code no longer has, and
+    # one written before the header carried the code version.
+    for contents in (
+        CALENDAR_SNAPSHOT_HEADER + b"cordinarium.liturgical_calendar\nGone\n.",
+        CALENDAR_SNAPSHOT_MAGIC + b"not a pickle",
+    ):
+        with open(path, "wb") as f:
+            f.write(contents)
+        with app.app_context():
+            store = calendar_store().refresh(force=True)
+            assert store.engine is None
+            assert resolve_observance(date(2024, 12, 1)).handle == "AdventI"
+
+
+def test_calendar_snapshot_ignored_when_data_version_changes(app):
+    write_calendar_snapshot(app)
+    with app.app_context():
+        db = get_db()
+        db.execute("update holidays set name=? where handle=?", ("Renamed", "AdventI"))
+        db.execute(
+            "insert into schema_migrations (filename) values (?)", ("999_test.sql",)
+        )
+        db.commit()
+        calendar_store().refresh(force=True)
+        assert resolve_observance(date(2024, 12, 1)).name == "Renamed"
@@ -0,0 +1,111 @@
+import json
+from datetime import date, datetime, timezone
+
+from ordinarium.db import get_db
+from ordinarium.ics import _all_day_event, _fold
+
+
+def test_calendar_feed_streams_observances(client):
+    response = client.get("/calendar.ics?start=2024-11-01&years=1")
+    assert response.status_code == 200
+    assert response.mimetype == "text/calendar"
+    assert response.is_streamed
+    body = response.get_data(as_text=True)
+    assert body.startswith("BEGIN:VCALENDAR\r\n")
+    assert body.endswith("END:VCALENDAR\r\n")
+    assert "UID:20241201-AdventI@ordinarium" in body
+    assert "DTSTART;VALUE=DATE:20241201" in body
+    assert "SUMMARY:The First Sunday in Advent" in body
+    assert "DTSTART;VALUE=DATE:2025" not in body
+
+
+def test_calendar_feed_answers_conditional_get(client):
+    first = client.get("/calendar.ics?start=2024-01-01&years=1")
+    first.get_data()
+    etag = first.headers["ETag"]
+    assert etag
+    repeat = client.get(
+        "/calendar.ics?start=2024-01-01&years=1",
+        headers={"If-None-Match": etag},
+    )
+    assert repeat.status_code == 304
+    assert repeat.data == b""
+    other = client.get(
+        "/calendar.ics?start=2025-01-01&years=1",
+        headers={"If-None-Match": etag},
+    )
+    assert other.status_code == 200
+    assert "BEGIN:VEVENT" in other.get_data(as_text=True)
+
+
+def test_user_calendar_feed_includes_services(app, auth_client, service_factory):
+    client, user_id = auth_client
+    service_factory(user_id=user_id, service_id=12, service_date="2024-12-01")
+    response = client.post(
+        "/account/calendar-feed", headers={"Accept": "application/json"}
+    )
+    payload = response.get_json()
+    assert payload["created"] is True
+    feed_path = payload["feed_url"].split("localhost", 1)[1]
+
+    anonymous = app.test_client()
+    feed = anonymous.get(f"{feed_path}?start=2024-01-01&years=1")
+    assert feed.status_code == 200
+    body = feed.get_data(as_text=True)
+    assert "UID:service-12@ordinarium" in body
+    assert "URL:http://localhost/service/12" in body
+
+    etag = feed.headers["ETag"]
+    unchanged = anonymous.get(
+        f"{feed_path}?start=2024-01-01&years=1", headers={"If-None-Match": etag}
+    )
+    assert unchanged.status_code == 304
+    with app.app_context():
+        db = get_db()
+        row = db.execute("select data from services where id=?", (12,)).fetchone()
+        data = json.loads(row["data"])
+        data["service_date"] = "2024-12-08"
+        db.execute("update services set data=? where id=?", (json.dumps(data), 12))
+        db.commit()
+    changed = anonymous.get(
+        f"{feed_path}?start=2024-01-01&years=1", headers={"If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert "DTSTART;VALUE=DATE:20241208" in changed.get_data(as_text=True)
+
+
+def test_user_calendar_feed_unknown_token_returns_404(client):
+    response = client.get("/calendar/not-a-token.ics")
+    assert response.status_code == 404
+
+
+def test_fold_splits_long_lines_at_75_octets():
+    folded = _fold("SUMMARY:" + "é" * 60)
+    lines = folded.split("\r\n")[:-1]
+    assert len(lines) == 2
+    assert all(len(line.encode("utf-8")) <= 75 for line in lines)
+    assert lines[1].startswith(" ")
+
+
+def test_calendar_feed_ends_at_the_last_representable_date(client):
+    for query in ("start=9999-01-01&years=3", "start=9999-06-01&years=1"):
+        response = client.get(f"/calendar.ics?{query}")
+        assert response.status_code == 200
+        body = response.get_data(as_text=True)
+        assert body.endswith("END:VCALENDAR\r\n")
+        assert "DTSTART;VALUE=DATE:9999" in body
+
+
+def test_calendar_feed_events_share_a_generation_stamp(client):
+    body = client.get("/calendar.ics?start=2030-01-01&years=1").get_data(as_text=True)
+    stamps = {line for line in body.split("\r\n") if line.startswith("DTSTAMP:")}
+    assert len(stamps) == 1
+    assert stamps.pop() < "DTSTAMP:2030"
+
+
+def test_event_on_the_last_representable_date_has_no_end():
+    stamp = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    lines = _all_day_event("max@ordinarium", date.max, stamp, "Last")
+    assert "DTSTART;VALUE=DATE:99991231\r\n" in lines
+    assert not any(line.startswith("DTEND") for line in lines)
+    assert "DTSTAMP:20260101T000000Z\r\n" in lines
@@ -0,0 +1,96 @@
+import json
+import os
+import shutil
+import sqlite3
+
+import pytest
+
+from ordinarium import create_app
+from ordinarium.db import (
+    content_version,
+    data_version,
+    get_db,
+    init_db,
+    script_content_version,
+)
+
+
+@pytest.fixture()
+def app(tmp_path):
+    # The conftest app, with the reference data in a content database.
+    app = create_app()
+    app.config.update(
+        TESTING=True,
+        DATABASE=str(tmp_path / "test.db"),
+        CONTENT_DATABASE=str(tmp_path / "content.db"),
+        SECRET_KEY="test",
+        CALENDAR_RELOAD_FILE=str(tmp_path / "calendar.reload"),
+        CALENDAR_SNAPSHOT_FILE=str(tmp_path / "calendar.snapshot"),
+    )
+    with app.app_context():
+        init_db()
+    return app
+
+
+def test_reference_data_lives_in_read_only_content_database(app):
+    with app.app_context():
+        db = get_db()
+        main_tables = {
+            row["name"]
+            for row in db.execute(
+                "select name from main.sqlite_master where type='table'"
+            )
+        }
+        assert "texts" not in main_tables
+        assert "services" in main_tables
+        assert db.execute("select count(*) from texts").fetchone()[0] > 0
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            db.execute("update pages set data=json_set(data, '$.title', 'x')")
+
+
+def test_text_renders_from_content_database(auth_client, service_factory):
+    client, user_id = auth_client
+    service_factory(
+        user_id=user_id,
+        service_id=14,
+        service_date="2026-01-04",
+        rite="Renewed Ancient Text",
+    )
+    response = client.get("/text/14")
+    assert response.status_code == 200
+    assert b"Holy Eucharist" in response.data
+
+
+def test_replaced_content_database_is_attached_on_next_use(app, tmp_path):
+    path = app.config["CONTENT_DATABASE"]
+    with app.app_context():
+        version = data_version(get_db(), app.config["CALENDAR_RELOAD_FILE"])
+
+    staged = tmp_path / "content.staged.db"
+    shutil.copyfile(path, staged)
+    connection = sqlite3.connect(staged)
+    connection.execute(
+        "update pages set data=json_set(data, '$.title', 'About Us') where slug='about'"
+    )
+    connection.commit()
+    connection.close()
+    os.replace(staged, path)
+
+    with app.app_context():
+        db = get_db()
+        title = db.execute("select title from pages where slug='about'").fetchone()
+        assert title[0] == "About Us"
+        assert data_version(db, app.config["CALENDAR_RELOAD_FILE"]) != version
+
+
+def test_build_content_command_records_version(app):
+    result = app.test_cli_runner().invoke(args=["build-content"])
+    assert result.exit_code == 0, result.output
+    with app.app_context():
+        assert content_version(app.config["CONTENT_DATABASE"]) == (
+            script_content_version()
+        )
+        db = get_db()
+        rows = db.execute("pragma database_list").fetchall()
+        assert [row["name"] for row in rows] == ["main", "content"]
+        assert json.loads(db.execute("select data from texts limit 1").fetchone()[0])
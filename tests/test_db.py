@@ -0,0 +1,62 @@
+import json
+import threading
+
+from ordinarium.db import ConnectionPool, connection_pool, get_db
+
+
+def test_connection_is_kept_across_app_contexts(app):
+    with app.app_context():
+        first = get_db()
+    with app.app_context():
+        db = get_db()
+        assert db is first
+        assert db.execute("pragma journal_mode").fetchone()[0] == "wal"
+        assert db.execute("pragma busy_timeout").fetchone()[0] == 5000
+    stats = connection_pool(app).stats()
+    assert stats["connections"] == 1
+    assert stats["opened"] == 1
+    assert stats["reused"] >= 1
+
+
+def test_uncommitted_writes_are_rolled_back_at_teardown(app):
+    with app.app_context():
+        get_db().execute(
+            "insert into users (data) values (?)",
+            (json.dumps({"email": "rolled-back@example.com"}),),
+        )
+    with app.app_context():
+        row = (
+            get_db()
+            .execute("select id from users where email=?", ("rolled-back@example.com",))
+            .fetchone()
+        )
+    assert row is None
+    assert connection_pool(app).stats()["rolled_back"] == 1
+
+
+def test_connections_of_exited_threads_are_closed(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "pool.db"))
+    opened = []
+
+    def use_pool():
+        opened.append(pool.acquire())
+
+    for _ in range(2):
+        thread = threading.Thread(target=use_pool)
+        thread.start()
+        thread.join()
+    assert pool.stats()["opened"] == 2
+    assert pool.stats()["connections"] == 1
+    pool.close_all()
+    assert pool.stats()["connections"] == 0
+
+
+def test_database_health_reports_pool_stats(client):
+    response = client.get("/health/database")
+    assert response.status_code == 200
+    assert set(response.get_json()) == {
+        "connections",
+        "opened",
+        "reused",
+        "rolled_back",
+    }
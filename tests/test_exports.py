@@ -0,0 +1,177 @@
+import io
+import zipfile
+
+import pytest
+
+from ordinarium.db import get_db
+from ordinarium.exports import process_export_jobs
+
+
+@pytest.fixture()
+def export_app(app, tmp_path):
+    app.config.update(EXPORT_DIR=str(tmp_path / "exports"), EXPORT_WORKERS=2)
+    yield app
+    executor = app.extensions.get("ordinarium_export_executor")
+    if executor is not None:
+        executor.shutdown()
+
+
+def run_export(app, client, status_url):
+    # What `flask export-worker` does, until the queue is empty.
+    process_export_jobs(app)
+    return client.get(status_url).get_json()
+
+
+def test_export_renders_date_range_into_one_document(
+    export_app, auth_client, service_factory
+):
+    client, user_id = auth_client
+    for service_id, service_date in (
+        (21, "2026-02-22"),
+        (22, "2026-03-01"),
+        (23, "2026-04-05"),
+    ):
+        service_factory(
+            user_id=user_id,
+            service_id=service_id,
+            service_date=service_date,
+            rite="Renewed Ancient Text",
+        )
+    response = client.post(
+        "/exports", json={"start": "2026-02-18", "end": "2026-03-31"}
+    )
+    assert response.status_code == 202
+    payload = response.get_json()
+    assert payload["total"] == 2
+
+    status = run_export(export_app, client, payload["status_url"])
+    assert status["status"] == "done", status
+    assert status["completed"] == 2
+    assert status["skipped"] == 0
+
+    download = client.get(status["download_url"])
+    assert download.status_code == 200
+    assert download.mimetype == "text/html"
+    body = download.get_data(as_text=True)
+    assert body.count('class="export-section"') == 2
+    assert body.index("February 22, 2026") < body.index("March 1, 2026")
+    assert "April 5, 2026" not in body
+    assert "2026-02-22 to 2026-03-01" in body
+
+
+def test_export_zip_of_selected_services(export_app, auth_client, service_factory):
+    client, user_id = auth_client
+    service_factory(
+        user_id=user_id,
+        service_id=24,
+        service_date="2026-12-25",
+        rite="Renewed Ancient Text",
+    )
+    service_factory(
+        user_id=user_id, service_id=25, service_date="2026-12-27", rite="Unknown"
+    )
+    response = client.post("/exports", data={"service_ids": "24,25", "format": "zip"})
+    assert response.status_code == 202
+    status = run_export(export_app, client, response.get_json()["status_url"])
+    assert status["status"] == "done", status
+    assert status["skipped"] == 1
+
+    download = client.get(status["download_url"])
+    assert download.mimetype == "application/zip"
+    with zipfile.ZipFile(io.BytesIO(download.get_data())) as bundle:
+        assert bundle.namelist() == ["2026-12-25-24.html"]
+        assert "Holy Eucharist" in bundle.read("2026-12-25-24.html").decode("utf-8")
+
+
+def test_export_rejects_unavailable_formats(export_app, auth_client, service_factory):
+    client, user_id = auth_client
+    service_factory(user_id=user_id, service_id=26, service_date="2026-01-04")
+    response = client.post("/exports", json={"service_ids": [26], "format": "pdf"})
+    assert response.status_code == 400
+    assert "not available" in response.get_json()["error"]
+    assert "ordinarium_export_executor" not in export_app.extensions
+
+
+def test_export_rejects_format_that_is_not_a_string(
+    export_app, auth_client, service_factory
+):
+    client, user_id = auth_client
+    service_factory(user_id=user_id, service_id=29, service_date="2026-01-04")
+    response = client.post("/exports", json={"service_ids": [29], "format": ["zip"]})
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "Unknown export format."
+
+
+def insert_export_job(app, user_id, job_uuid, status, updated_at):
+    with app.app_context():
+        db = get_db()
+        db.execute(
+            "insert into export_jobs (job_uuid, user_id, format, status, updated_at) values (?, ?, 'html', ?, ?)",
+            (job_uuid, user_id, status, updated_at),
+        )
+        db.commit()
+
+
+def test_stale_export_is_failed_when_polled(export_app, auth_client):
+    client, user_id = auth_client
+    insert_export_job(
+        export_app, user_id, "stale-job", "running", "2000-01-01 00:00:00"
+    )
+    status = client.get("/exports/stale-job").get_json()
+    assert status["status"] == "failed"
+    assert status["error"] == "Export was interrupted."
+
+
+def test_active_exports_are_capped_per_user(export_app, auth_client, service_factory):
+    export_app.config["EXPORT_MAX_ACTIVE_JOBS"] = 1
+    client, user_id = auth_client
+    service_factory(user_id=user_id, service_id=30, service_date="2026-01-04")
+    with export_app.app_context():
+        now = get_db().execute("select CURRENT_TIMESTAMP as now").fetchone()["now"]
+    insert_export_job(export_app, user_id, "running-job", "running", now)
+    response = client.post("/exports", json={"service_ids": [30]})
+    assert response.status_code == 429
+
+    # A job lost with its worker no longer counts against the cap.
+    with export_app.app_context():
+        db = get_db()
+        db.execute(
+            "update export_jobs set updated_at='2000-01-01 00:00:00' where job_uuid='running-job'"
+        )
+        db.commit()
+    response = client.post("/exports", json={"service_ids": [30]})
+    assert response.status_code == 202
+    run_export(export_app, client, response.get_json()["status_url"])
+
+
+def test_export_worker_command_runs_queued_jobs(
+    export_app, auth_client, service_factory
+):
+    client, user_id = auth_client
+    service_factory(user_id=user_id, service_id=31, service_date="2026-01-04")
+    status_url = client.post("/exports", json={"service_ids": [31]}).get_json()[
+        "status_url"
+    ]
+    assert client.get(status_url).get_json()["status"] == "queued"
+    result = export_app.test_cli_runner().invoke(args=["export-worker", "--once"])
+    assert "Ran 1 exports." in result.output
+    assert client.get(status_url).get_json()["status"] == "done"
+
+
+def test_export_jobs_are_private(
+    export_app, auth_client, service_factory, user_factory
+):
+    client, user_id = auth_client
+    other_user_id = user_factory(email="other-export@example.com")
+    service_factory(user_id=other_user_id, service_id=27, service_date="2026-01-04")
+    response = client.post("/exports", json={"service_ids": [27]})
+    assert response.status_code == 404
+
+    service_factory(user_id=user_id, service_id=28, service_date="2026-01-04")
+    status_url = client.post("/exports", json={"service_ids": [28]}).get_json()[
+        "status_url"
+    ]
+    run_export(export_app, client, status_url)
+    with client.session_transaction() as session:
+        session["user_id"] = other_user_id
+    assert client.get(status_url).status_code == 404
@@ -1,21 +1,21 @@
-import os
-import random
+import gzip
 import re
-from datetime import date, timedelta
-from urllib.request import urlopen
+from datetime import date
+from pathlib import Path
 
 import pytest
 
 from ordinarium.liturgical_calendar import (
     resolve_observance_options,
     resolve_season,
+    resolve_subcycle,
 )
 
-ICS_URL = (
-    "https://calendar.google.com/calendar/ical/"
-    "ma7m909q4huvqedci3fbl1u6rg%40group.calendar.google.com/"
-    "public/basic.ics"
-)
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+# Recorded with `python scripts/record_ics_fixture.py google`.
+GOOGLE_ICS_FIXTURE = FIXTURES_DIR / "google_calendar.ics.gz"
+# Recorded with `python scripts/record_ics_fixture.py engine`.
+OBSERVANCES_ICS_FIXTURE = FIXTURES_DIR / "observances.ics.gz"
 
 ORDINAL_WORDS = {
     1: "first",
@@ -48,9 +48,19 @@ ORDINAL_WORDS = {
 }
 
 
-def _fetch_ics(url):
-    with urlopen(url, timeout=10) as response:
-        return response.read().decode("utf-8")
+def _read_ics_fixture(path):
+    with gzip.open(path, "rt", encoding="utf-8", newline="") as f:
+        return f.read()
+
+
+def _events_by_date(text):
+    events_by_date = {}
+    for event in _parse_events(text):
+        event_date = _event_date(event)
+        if not event_date:
+            continue
+        events_by_date.setdefault(event_date, []).append(event)
+    return events_by_date
 
 
 def _unfold_lines(text):
@@ -177,78 +187,83 @@ def _infer_season_from_summary(summary):
     return None
 
 
-def _add_years(start, years):
-    try:
-        return start.replace(year=start.year + years)
-    except ValueError:
-        return start.replace(month=2, day=28, year=start.year + years)
-
-
-def _sunday_dates(start, end):
-    offset = (6 - start.weekday()) % 7
-    current = start + timedelta(days=offset)
-    while current <= end:
-        yield current
-        current += timedelta(days=7)
+def test_sunday_observances_and_seasons_match_google_fixture(app):
+    if not GOOGLE_ICS_FIXTURE.exists():
+        pytest.skip(
+            "No recorded ACNA calendar; run scripts/record_ics_fixture.py google."
+        )
+    events_by_date = _events_by_date(_read_ics_fixture(GOOGLE_ICS_FIXTURE))
 
+    checked = 0
+    with app.app_context():
+        for candidate in sorted(events_by_date):
+            if candidate.weekday() != 6:
+                continue
+            summary = None
+            for event in events_by_date[candidate]:
+                value = event.get("SUMMARY", "")
+                lower = value.lower()
+                if "sunday" in lower or lower.startswith("pentecost"):
+                    summary = value
+                    break
+            if not summary:
+                continue
+            inferred_season = _infer_season_from_summary(summary)
+            if not inferred_season:
+                continue
+            options = resolve_observance_options(candidate)
+            if not options:
+                continue
+            normalized_options = {
+                _normalize_title(option.name or option.alternative_name or "")
+                for option in options
+            }
+            expected = _summary_to_observance(summary)
+            assert _normalize_title(expected) in normalized_options, (
+                f"Observance mismatch for {candidate}: "
+                f"ics='{summary}' local={[option.name or option.alternative_name for option in options]}"
+            )
+            assert resolve_season(candidate) == inferred_season, (
+                f"Season mismatch for {candidate}: "
+                f"ics='{summary}' local='{resolve_season(candidate)}'"
+            )
+            checked += 1
 
-def test_sunday_sample_matches_ics_observance_and_season():
-    if os.getenv("SKIP_ICS_TESTS"):
-        pytest.skip("Skipping ICS alignment test via SKIP_ICS_TESTS.")
-    ics_text = _fetch_ics(ICS_URL)
-    events = _parse_events(ics_text)
-    events_by_date = {}
-    for event in events:
-        event_date = _event_date(event)
-        if not event_date:
-            continue
-        events_by_date.setdefault(event_date, []).append(event)
+    assert checked, "No Sundays in the recorded ICS could be validated."
 
-    today = date.today()
-    end_date = _add_years(today, 3)
-    candidates = list(_sunday_dates(today, end_date))
-    rng = random.Random(42)
-    rng.shuffle(candidates)
 
-    checked = 0
-    for candidate in candidates:
-        if checked >= 10:
-            break
-        events_for_date = events_by_date.get(candidate, [])
-        if not events_for_date:
-            continue
-        summary = None
-        for event in events_for_date:
-            value = event.get("SUMMARY", "")
-            lower = value.lower()
-            if (
-                "sunday" in lower
-                or lower.startswith("pentecost")
-                or lower == "pentecost"
-            ):
-                summary = value
-                break
-        if not summary:
-            continue
-        inferred_season = _infer_season_from_summary(summary)
-        if not inferred_season:
-            continue
-        options = resolve_observance_options(candidate)
-        if not options:
-            continue
-        normalized_options = {
-            _normalize_title(option.name or option.alternative_name or "")
-            for option in options
-        }
-        expected = _summary_to_observance(summary)
-        assert _normalize_title(expected) in normalized_options, (
-            f"Observance mismatch for {candidate}: "
-            f"ics='{summary}' local={[option.name or option.alternative_name for option in options]}"
-        )
-        assert resolve_season(candidate) == inferred_season, (
-            f"Season mismatch for {candidate}: "
-            f"ics='{summary}' local='{resolve_season(candidate)}'"
-        )
-        checked += 1
+def test_observances_match_recorded_fixture(app):
+    events_by_date = _events_by_date(_read_ics_fixture(OBSERVANCES_ICS_FIXTURE))
+    first = min(events_by_date)
+    last = max(events_by_date)
+    assert (first.year, last.year) == (2000, 2099)
 
-    assert checked == 10, f"Only validated {checked} Sundays from ICS data."
+    with app.app_context():
+        for ordinal in range(first.toordinal(), last.toordinal() + 1):
+            day = date.fromordinal(ordinal)
+            events = sorted(
+                events_by_date.get(day, []),
+                key=lambda event: int(event["X-ORDINARIUM-RANK"]),
+            )
+            expected = [
+                (
+                    event["X-ORDINARIUM-HANDLE"],
+                    event["SUMMARY"],
+                    event["X-ORDINARIUM-PROPERS"].split(),
+                )
+                for event in events
+            ]
+            actual = [
+                (
+                    option.handle,
+                    option.name or option.alternative_name,
+                    list(option.propers),
+                )
+                for option in resolve_observance_options(day)
+            ]
+            assert actual == expected, f"Observance mismatch for {day}"
+            for event in events:
+                assert resolve_season(day) == event["X-ORDINARIUM-SEASON"], day
+                assert (resolve_subcycle(day) or "") == event[
+                    "X-ORDINARIUM-SUBCYCLE"
+                ], day
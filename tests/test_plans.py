@@ -0,0 +1,146 @@
+import json
+from pathlib import Path
+
+from ordinarium.db import get_db
+from ordinarium.plans import load_plan, plan_positions
+
+MIGRATION_PATH = (
+    Path(__file__).resolve().parents[1]
+    / "scripts"
+    / "migrations"
+    / "015_add_service_items.sql"
+)
+
+
+def plan_rows(app, service_id):
+    with app.app_context():
+        return {
+            row["token"]: (row["position"], row["disabled"])
+            for row in get_db().execute(
+                "select token, position, disabled from service_items where service_id=?",
+                (service_id,),
+            )
+        }
+
+
+def autosave(client, service_id, ids, disabled=""):
+    response = client.post(
+        "/persist/service",
+        data={
+            "service_id": str(service_id),
+            "rite": "Renewed Ancient Text",
+            "service_date": "2026-01-04",
+            "ids": ",".join(str(value) for value in ids),
+            "disabled": disabled,
+            "autosave": "1",
+        },
+        headers={"Accept": "application/json"},
+    )
+    assert response.get_json() == {"ok": True}
+
+
+def changed_tokens(before, after):
+    return {
+        token
+        for token in before.keys() | after.keys()
+        if before.get(token) != after.get(token)
+    }
+
+
+def test_plan_positions_keep_items_that_did_not_move():
+    current = {"a": 1.0, "b": 2.0, "c": 3.0, "d": 4.0}
+    positions = plan_positions(["a", "c", "d", "b"], current)
+    assert {token for token in current if positions[token] != current[token]} == {"b"}
+    assert sorted(positions, key=positions.get) == ["a", "c", "d", "b"]
+    positions = plan_positions(["x", "a", "b", "y", "c", "d", "z"], current)
+    assert sorted(positions, key=positions.get) == ["x", "a", "b", "y", "c", "d", "z"]
+    assert all(positions[token] == current[token] for token in current)
+
+
+def test_plan_positions_renumber_once_gaps_are_exhausted():
+    order = ["a", "b", "c"]
+    positions = {"a": 1.0, "b": 2.0, "c": 3.0}
+    # Moving the last item between the first two, over and over, halves the
+    # gap each time until it can no longer be split.
+    for _ in range(80):
+        order = [order[0], order[2], order[1]]
+        positions = plan_positions(order, positions)
+        assert sorted(positions, key=positions.get) == order
+
+
+def test_drag_and_toggle_write_one_row(app, auth_client, draft_factory):
+    client, user_id = auth_client
+    draft_factory(user_id=user_id, service_id=40)
+    autosave(client, 40, [68, 69, 70, 71, 72])
+    before = plan_rows(app, 40)
+    assert sorted(before, key=lambda token: before[token][0]) == [
+        "text:68",
+        "text:69",
+        "text:70",
+        "text:71",
+        "text:72",
+    ]
+
+    autosave(client, 40, [68, 71, 69, 70, 72])
+    moved = plan_rows(app, 40)
+    assert changed_tokens(before, moved) == {"text:71"}
+
+    autosave(client, 40, [68, 71, 69, 70, 72], disabled="text:69")
+    toggled = plan_rows(app, 40)
+    assert changed_tokens(moved, toggled) == {"text:69"}
+    assert toggled["text:69"][1] == 1
+
+    with app.app_context():
+        order_tokens, disabled_tokens = load_plan(get_db(), 40)
+    assert order_tokens[:3] == ["text:68", "text:71", "text:69"]
+    assert disabled_tokens == ["text:69"]
+
+
+def test_legacy_json_plan_is_read_and_moved_on_save(app, auth_client, service_factory):
+    client, user_id = auth_client
+    service_factory(
+        user_id=user_id,
+        service_id=41,
+        service_date="2026-01-04",
+        text_order=json.dumps([69, 68]),
+        text_disabled=json.dumps(["text:68"]),
+    )
+    with app.app_context():
+        db = get_db()
+        saved = db.execute(
+            "select text_order, text_disabled from services where id=41"
+        ).fetchone()
+        assert load_plan(db, 41, saved) == (["text:69", "text:68"], ["text:68"])
+    response = client.get("/service/41")
+    assert response.status_code == 200
+
+    autosave(client, 41, [69, 68, 70])
+    assert set(plan_rows(app, 41)) == {"text:68", "text:69", "text:70"}
+    with app.app_context():
+        data = json.loads(
+            get_db().execute("select data from services where id=41").fetchone()[0]
+        )
+    assert "text_order" not in data
+    assert "text_disabled" not in data
+
+
+def test_migration_converts_json_plans(app, user_factory, service_factory):
+    user_id = user_factory(email="legacy-plan@example.com")
+    service_factory(
+        user_id=user_id,
+        service_id=42,
+        text_order=json.dumps([69, "68", "custom:7", 69, "bogus"]),
+        text_disabled=json.dumps(["custom:7", "text:90"]),
+    )
+    service_factory(user_id=user_id, service_id=43, text_order="not json")
+    with app.app_context():
+        db = get_db()
+        db.executescript(MIGRATION_PATH.read_text(encoding="utf-8"))
+        order_tokens, disabled_tokens = load_plan(db, 42)
+        assert order_tokens == ["text:69", "text:68", "custom:7"]
+        assert set(disabled_tokens) == {"custom:7", "text:90"}
+        assert load_plan(db, 43) == ([], [])
+        remaining = db.execute(
+            "select count(*) from services where text_order is not null"
+        ).fetchone()[0]
+    assert remaining == 0
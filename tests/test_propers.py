@@ -0,0 +1,98 @@
+import time
+
+from ordinarium.db import get_db
+from ordinarium.liturgical_calendar import signal_calendar_reload
+from ordinarium.propers import (
+    ANY_TIME_FILTERS,
+    choose_text,
+    resolve_propers,
+    text_pools,
+)
+
+
+def test_text_pools_group_candidates_by_filter(app):
+    with app.app_context():
+        db = get_db()
+        expected = db.execute(
+            "select text from texts where type=? and filter_type=? and filter_content=? order by id",
+            ("acclamation", "season", "Advent"),
+        ).fetchall()
+        candidates = (
+            text_pools().refresh().candidates("acclamation", [("season", "Advent")])
+        )
+        assert [text for _, text in candidates] == [row["text"] for row in expected]
+        any_time = text_pools().candidates("proper_preface", ANY_TIME_FILTERS)
+        assert any_time == sorted(any_time)
+        assert len(any_time) > 1
+
+
+def test_choose_text_is_stable_for_a_seed(app):
+    with app.app_context():
+        picks = {choose_text("offertory_sentence", seed="7:abc") for _ in range(20)}
+        assert len(picks) == 1
+        seeded = {
+            choose_text("offertory_sentence", seed=f"7:{revision}")
+            for revision in range(50)
+        }
+        assert len(seeded) > 1
+        assert choose_text("acclamation", [("season", "No Such Season")]) is None
+
+
+def test_text_pools_reload_when_signalled(app):
+    app.config["CALENDAR_CHECK_INTERVAL"] = 0
+    with app.app_context():
+        pools = text_pools().refresh()
+        before = pools.candidates("offertory_sentence")
+        db = get_db()
+        db.execute(
+            "insert into texts (data) values (?)",
+            ('{"type": "offertory_sentence", "text": "A new sentence."}',),
+        )
+        db.commit()
+        time.sleep(0.01)
+        signal_calendar_reload(app)
+        after = text_pools().refresh().candidates("offertory_sentence")
+        assert len(after) == len(before) + 1
+        assert after[-1][1] == "A new sentence."
+
+
+def test_resolve_propers_filters_lessons_by_subcycle(app):
+    with app.app_context():
+        year_a = resolve_propers(["AdventI"], subcycle="A", season="Advent")
+        year_b = resolve_propers(["AdventI"], subcycle="B", season="Advent")
+        assert year_a["lesson_1_reference"] == "Isaiah (2:1-5)"
+        assert year_b["lesson_1_reference"] == "Isaiah (64:1-9a)"
+        assert year_a["collect_of_the_day"].startswith("Almighty God, give us grace")
+        assert year_a["acclamation"] and not year_a["acclamation"].startswith("*Error")
+
+
+def test_resolve_propers_skips_optional_lessons_and_caches(app):
+    with app.app_context():
+        db = get_db()
+        db.executemany(
+            "insert into texts (data) values (?)",
+            [
+                (
+                    '{"type": "lesson", "filter": {"type": "proper", "content": "TestProper"}, '
+                    '"reading": 1, "optional": true, "book_name": "Tobit", '
+                    '"reference_long": "1:1", "subcycles": [], "default_order": 1}',
+                ),
+                (
+                    '{"type": "lesson", "filter": {"type": "proper", "content": "TestProper"}, '
+                    '"reading": 1, "optional": false, "book_name": "Ruth", '
+                    '"reference_long": "1:1-5", "subcycles": [], "default_order": 2}',
+                ),
+            ],
+        )
+        db.commit()
+        propers = resolve_propers(["TestProper"], subcycle="C")
+        assert propers["lesson_1_reference"] == "Ruth (1:1-5)"
+        assert propers["gospel_reference"] == "*Error: No gospel found.*"
+        assert (
+            propers["collect_of_the_day"] == "*Error: No collect found for this date.*"
+        )
+
+        appointed = text_pools().appointed
+        hits = appointed.stats()["hits"]
+        resolve_propers(["TestProper"], subcycle="C")
+        assert appointed.stats()["hits"] == hits + 1
@@ -0,0 +1,118 @@
+import ast
+import json
+from pathlib import Path
+
+import pytest
+
+from ordinarium import plans, routes
+from ordinarium.db import get_db
+
+# Modules whose queries serve page views.
+QUERY_MODULES = (routes, plans)
+MIGRATION_PATH = (
+    Path(__file__).resolve().parents[1]
+    / "scripts"
+    / "migrations"
+    / "014_add_services_listing_indexes.sql"
+)
+
+
+def _sql(node, module):
+    # String literals, module-level constants and their concatenations.
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.Name):
+        value = getattr(module, node.id, None)
+        return value if isinstance(value, str) else None
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        left, right = _sql(node.left, module), _sql(node.right, module)
+        if left is not None and right is not None:
+            return left + right
+    return None
+
+
+def module_queries():
+    """Every SQL statement in QUERY_MODULES that is spelled out in the source."""
+    queries = []
+    for module in QUERY_MODULES:
+        path = Path(module.__file__)
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            if (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Attribute)
+                and node.func.attr == "execute"
+                and node.args
+            ):
+                sql = _sql(node.args[0], module)
+                if sql is not None:
+                    queries.append((f"{path.name}:{node.lineno}", sql))
+    return queries
+
+
+def heavy_user_services(count):
+    for offset in range(count):
+        yield {
+            "rite": "Renewed Ancient Text",
+            "service_date": f"{2020 + offset // 12}-{offset % 12 + 1:02d}-01",
+        }
+
+
+@pytest.fixture(params=["schema", "migrated"])
+def plan_db(request, app, user_factory):
+    user_id = user_factory(email="plans@example.com")
+    with app.app_context():
+        db = get_db()
+        # A heavy user's worth of services.
+        db.executemany(
+            "insert into services (id, data) values (?, ?)",
+            [
+                (100 + offset, json.dumps({"user_id": user_id, **fields}))
+                for offset, fields in enumerate(heavy_user_services(300))
+            ],
+        )
+        db.commit()
+        if request.param == "migrated":
+            db.executescript(MIGRATION_PATH.read_text(encoding="utf-8"))
+        yield db
+
+
+def test_page_queries_use_indexes_without_sorting(plan_db):
+    queries = module_queries()
+    assert len(queries) > 40
+    slow = {}
+    for location, sql in queries:
+        plan = [
+            row["detail"]
+            for row in plan_db.execute(
+                f"explain query plan {sql}", (None,) * sql.count("?")
+            )
+        ]
+        # json_each over a bound list is the only table that may be walked;
+        # a constant row is a select without a from clause.
+        if any(
+            "TEMP B-TREE" in detail
+            or (
+                detail.startswith("SCAN")
+                and "VIRTUAL TABLE" not in detail
+                and detail != "SCAN CONSTANT ROW"
+            )
+            for detail in plan
+        ):
+            slow[location] = plan
+    assert slow == {}
+
+
+def test_services_listing_columns_are_stored(plan_db):
+    columns = {
+        row["name"]: row["hidden"]
+        for row in plan_db.execute("pragma table_xinfo(services)")
+    }
+    # 3 marks a STORED generated column, 2 a VIRTUAL one.
+    for name in ("user_id", "rite", "service_date", "title", "revision"):
+        assert columns[name] == 3
+    assert columns["text_order"] == 2
+    row = plan_db.execute(
+        "select service_date, json_extract(data, '$.service_date') from services where id=100"
+    ).fetchone()
+    assert tuple(row) == ("2020-01-01", "2020-01-01")
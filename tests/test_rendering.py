@@ -0,0 +1,182 @@
+import json
+import random
+import re
+
+import markdown2
+
+from ordinarium.db import get_db
+from ordinarium.rendering import (
+    MARKDOWN_EXTRAS,
+    _prerendered_text,
+    prerender_texts,
+    text_render_cache,
+    wrap_trailing_indent,
+)
+
+SLOT_TEXT_TYPES = {
+    "acclamation": "acclamation",
+    "collect_of_the_day": "collect",
+    "offertory_sentence": "offertory_sentence",
+    "proper_preface": "proper_preface",
+}
+REFERENCE_SLOTS = {
+    "lesson_1_reference",
+    "psalm_reference",
+    "lesson_2_reference",
+    "gospel_reference",
+}
+
+
+def slot_values(db, slot):
+    errors = ["*Error: No value found.*", ""]
+    if slot in SLOT_TEXT_TYPES:
+        rows = db.execute(
+            "select text from texts where type=? order by id", (SLOT_TEXT_TYPES[slot],)
+        ).fetchall()
+        return [row["text"] for row in rows] + errors
+    assert slot in REFERENCE_SLOTS
+    values = []
+    for row in db.execute("select data from texts where type='lesson' order by id"):
+        lesson = json.loads(row["data"])
+        reference = lesson.get("reference_short")
+        if not reference or reference == "_":
+            reference = lesson.get("reference_long")
+        values.append(f"{lesson.get('book_name') or lesson.get('book')} ({reference})")
+    return sorted(set(values)) + errors
+
+
+def render_all(app, sources, contexts):
+    template = app.jinja_env.from_string("{{ source | markdown_template }}")
+    return [
+        template.render(source=source, **context)
+        for source in sources
+        for context in contexts[source]
+    ]
+
+
+def test_prerendered_texts_match_live_rendering(app):
+    with app.test_request_context():
+        db = get_db()
+        rows = db.execute(
+            "select title, text from texts where type in ('ordinarium', 'collect', 'acclamation')"
+        ).fetchall()
+        sources = sorted(
+            {row["title"] for row in rows if row["title"]}
+            | {row["text"] for row in rows if row["text"]}
+        )
+        contexts = {}
+        for source in sources:
+            slots = [
+                slot
+                for slot in SLOT_TEXT_TYPES.keys() | REFERENCE_SLOTS
+                if "{{ " + slot in source
+            ]
+            contexts[source] = [{}]
+            for slot in slots:
+                contexts[source] = [{slot: value} for value in slot_values(db, slot)]
+        live = render_all(app, sources, contexts)
+
+        static, slotted = prerender_texts()
+        assert static > 0
+        assert slotted == 8
+        assert render_all(app, sources, contexts) == live
+
+
+def test_prerender_texts_cli_stores_static_and_slotted_texts(app):
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["prerender-texts"])
+    assert result.exit_code == 0
+    assert "slotted" in result.output
+    with app.app_context():
+        db = get_db()
+        row = db.execute(
+            "select html, fragments from text_renders where kind='template' and fragments is not null limit 1"
+        ).fetchone()
+        assert row["html"] is None
+        fragments = json.loads(row["fragments"])
+        assert len(fragments["parts"]) == len(fragments["slots"]) + 1
+
+
+def test_sources_without_prerendered_text_are_looked_up_once(app):
+    with app.app_context():
+        prerender_texts()
+        db = get_db()
+        lookups = []
+        db.set_trace_callback(
+            lambda statement: (
+                lookups.append(statement) if "from text_renders" in statement else None
+            )
+        )
+        try:
+            for _ in range(3):
+                assert _prerendered_text("markdown", "Not *pre-rendered*.") is None
+            assert len(lookups) == 1
+            prerender_texts()
+            assert len(text_render_cache()) == 0
+        finally:
+            db.set_trace_callback(None)
+
+
+def regex_trailing_indent(value):
+    # The regex implementation the single-pass transformer replaced.
+    trailing_span_re = re.compile(
+        r'class=["\'][^"\']*\btrailing-indent\b[^"\']*["\']',
+        re.IGNORECASE,
+    )
+    br_split_re = re.compile(r"(<br\s*/?>)", re.IGNORECASE)
+    paragraph_re = re.compile(r"(<p\b[^>]*>)(.*?)(</p>)", re.DOTALL)
+
+    def wrap_segment(segment):
+        match = re.match(r"(\s*)(<em>.*?</em>)(.*)", segment, re.DOTALL)
+        if not match:
+            return segment
+        leading, em_html, remainder = match.groups()
+        if not remainder.strip():
+            return segment
+        if trailing_span_re.search(remainder):
+            return segment
+        return f'{leading}{em_html}<span class="trailing-indent">{remainder}</span>'
+
+    def wrap_paragraph(match):
+        open_tag, inner, close_tag = match.groups()
+        parts = br_split_re.split(inner)
+        for index in range(0, len(parts), 2):
+            parts[index] = wrap_segment(parts[index])
+        return f"{open_tag}{''.join(parts)}{close_tag}"
+
+    return paragraph_re.sub(wrap_paragraph, value)
+
+
+def test_trailing_indent_matches_regex_implementation_on_texts(app):
+    with app.app_context():
+        rows = get_db().execute("select text from texts where text != ''").fetchall()
+    wrapped = 0
+    for row in rows:
+        html_text = markdown2.markdown(row["text"], extras=MARKDOWN_EXTRAS)
+        expected = regex_trailing_indent(html_text)
+        assert wrap_trailing_indent(html_text) == expected
+        wrapped += expected != html_text
+    assert wrapped > 0
+
+
+def test_trailing_indent_matches_regex_implementation_on_edge_cases():
+    cases = [
+        "",
+        "<p><em>People</em> And also with you.</p>",
+        "<p class='x'>\n <em>a</em> b<BR/>  <em>c</em>d<br>e</p>",
+        '<p><em>a</em> <span class="trailing-indent">b</span></p>',
+        "<p><em>a</em>   </p><p><em>b</em>c",
+        "<p>a<p><em>b</em>c</p></p>",
+        "<pre><em>a</em>b</pre><param><p ></p><p\n><em></em>x</p>",
+        "<p><em>a<br><em>b</em>c</p>",
+        "<p><em>a</em>b<br /></p>\n<p>\u00a0<em>c</em>\u2003d</P></p>",
+    ]
+    tokens = ["<p>", "<p class='r'>", "</p>", "<br>", "<BR />", "<em>", "</em>"]
+    tokens += ["text", " ", "\n", "trailing-indent", "class='trailing-indent'"]
+    chooser = random.Random(18)
+    cases += [
+        "".join(chooser.choice(tokens) for _ in range(chooser.randrange(1, 24)))
+        for _ in range(2000)
+    ]
+    for html_text in cases:
+        assert wrap_trailing_indent(html_text) == regex_trailing_indent(html_text)
@@ -1,16 +1,146 @@
 import json
+import threading
 
-from ordinarium.db import get_db
+from ordinarium.db import get_db, write_transaction
+from ordinarium.plans import load_plan
+from ordinarium.routes import reserve_service_id
 
 
 def test_services_new_redirects_to_next_id(auth_client, service_factory):
     client, user_id = auth_client
     service_factory(user_id=user_id, service_id=10)
-    response = client.get("/services/new")
+    response = client.post("/services/new")
     assert response.status_code == 302
     assert response.headers["Location"].endswith("/service/11")
 
 
+def test_services_new_get_reserves_nothing(app, auth_client):
+    client, _ = auth_client
+    response = client.get("/services/new")
+    assert response.status_code == 302
+    assert response.headers["Location"].endswith("/services")
+    with app.app_context():
+        drafts = get_db().execute("select id from service_drafts").fetchall()
+    assert drafts == []
+
+
+def test_persist_service_rejects_unreserved_ids(app, auth_client):
+    client, _ = auth_client
+    response = client.post(
+        "/persist/service",
+        data={"service_id": "50", "service_date": "2026-01-04", "ids": "68"},
+    )
+    assert response.status_code == 404
+    response = client.post(
+        "/service/50/custom-element", data={"title": "Custom Dismissal"}
+    )
+    assert response.status_code == 404
+    with app.app_context():
+        saved = get_db().execute("select id from services where id=50").fetchone()
+    assert saved is None
+
+
+def test_services_new_reserves_distinct_ids(
+    app, auth_client, service_factory, user_factory
+):
+    client, user_id = auth_client
+    service_factory(user_id=user_id, service_id=10)
+    assert client.post("/services/new").headers["Location"].endswith("/service/11")
+    assert client.post("/services/new").headers["Location"].endswith("/service/12")
+
+    other_user_id = user_factory(email="drafts@example.com")
+    other = app.test_client()
+    with other.session_transaction() as session:
+        session["user_id"] = other_user_id
+    assert other.post("/services/new").headers["Location"].endswith("/service/13")
+    assert client.get("/service/13").status_code == 404
+    response = client.post(
+        "/persist/service",
+        data={"service_id": "13", "service_date": "2026-01-04", "ids": "68"},
+    )
+    assert response.status_code == 404
+
+    response = other.post(
+        "/persist/service",
+        data={"service_id": "13", "service_date": "2026-01-04", "ids": "68"},
+    )
+    assert response.status_code == 302
+    with app.app_context():
+        drafts = get_db().execute("select id, user_id from service_drafts").fetchall()
+    assert [tuple(row) for row in drafts] == [(12, user_id)]
+
+
+def test_deleted_service_id_is_not_reused(app, auth_client):
+    client, _ = auth_client
+    service_url = client.post("/services/new").headers["Location"]
+    service_id = int(service_url.rsplit("/", 1)[1])
+    client.post(
+        f"/service/{service_id}/custom-element",
+        data={"title": "Custom Dismissal", "text": "Dismissal"},
+    )
+    with app.app_context():
+        db = get_db()
+        saved = db.execute("select id from services where id=?", (service_id,))
+        assert saved.fetchone()
+        assert db.execute(
+            "select id from service_custom_elements where service_id=?", (service_id,)
+        ).fetchall()
+    client.post(f"/service/{service_id}/delete")
+
+    response = client.post("/services/new")
+    assert response.headers["Location"].endswith(f"/service/{service_id + 1}")
+    with app.app_context():
+        db = get_db()
+        remaining = db.execute(
+            "select id from service_custom_elements where service_id=?", (service_id,)
+        ).fetchall()
+    assert remaining == []
+
+
+def test_deleted_custom_element_id_is_not_reused(app, auth_client, draft_factory):
+    client, user_id = auth_client
+    draft_factory(user_id=user_id, service_id=51)
+
+    def add_element(title):
+        client.post("/service/51/custom-element", data={"title": title})
+        with app.app_context():
+            row = (
+                get_db()
+                .execute(
+                    "select id from service_custom_elements where service_id=51 and title=?",
+                    (title,),
+                )
+                .fetchone()
+            )
+        return row["id"]
+
+    first_id = add_element("First")
+    client.post(f"/service/51/custom-element/{first_id}/delete")
+    assert add_element("Second") > first_id
+
+
+def test_concurrent_reservations_get_distinct_ids(app, user_factory):
+    user_ids = [user_factory(email=f"draft{index}@example.com") for index in range(8)]
+    reserved = []
+    barrier = threading.Barrier(len(user_ids))
+
+    def reserve(user_id):
+        with app.app_context():
+            db = get_db()
+            barrier.wait()
+            with write_transaction(db):
+                reserved.append(reserve_service_id(db, user_id))
+
+    threads = [
+        threading.Thread(target=reserve, args=(user_id,)) for user_id in user_ids
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(reserved) == list(range(3, 3 + len(user_ids)))
+
+
 def test_services_new_copies_service_template(app, auth_client, service_factory):
     client, user_id = auth_client
     source_id = service_factory(
@@ -67,8 +197,7 @@ def test_services_new_copies_service_template(app, auth_client, service_factory)
         assert payload["observance_handle"] is None
         assert payload["title"] is None
         assert payload["rite"] == "Renewed Ancient Text"
-        order_tokens = json.loads(payload["text_order"])
-        disabled_tokens = json.loads(payload["text_disabled"])
+        order_tokens, disabled_tokens = load_plan(db, 21)
         custom_elements = db.execute(
             "select id, title, text from service_custom_elements where service_id=?",
             (21,),
@@ -117,8 +246,9 @@ def test_service_denies_other_user(auth_client, service_factory, user_factory):
     assert b"Service not found" in response.data
 
 
-def test_persist_service_requires_date(auth_client):
-    client, _ = auth_client
+def test_persist_service_requires_date(auth_client, draft_factory):
+    client, user_id = auth_client
+    draft_factory(user_id=user_id, service_id=5)
     response = client.post(
         "/persist/service",
         data={"service_id": "5", "rite": "Renewed Ancient Text", "ids": "68,69"},
@@ -127,8 +257,9 @@ def test_persist_service_requires_date(auth_client):
     assert b"Service date is required." in response.data
 
 
-def test_persist_service_autosave_requires_date(auth_client):
-    client, _ = auth_client
+def test_persist_service_autosave_requires_date(auth_client, draft_factory):
+    client, user_id = auth_client
+    draft_factory(user_id=user_id, service_id=5)
     response = client.post(
         "/persist/service",
         data={
@@ -145,8 +276,9 @@ def test_persist_service_autosave_requires_date(auth_client):
     assert "Service date is required" in payload["error"]
 
 
-def test_persist_service_saves_and_generates_text(app, auth_client):
+def test_persist_service_saves_and_generates_text(app, auth_client, draft_factory):
     client, user_id = auth_client
+    draft_factory(user_id=user_id, service_id=7)
     response = client.post(
         "/persist/service",
         data={
@@ -170,8 +302,9 @@ def test_persist_service_saves_and_generates_text(app, auth_client):
         assert payload["service_date"] == "2026-01-04"
 
 
-def test_persist_service_autosave_saves_data(app, auth_client):
+def test_persist_service_autosave_saves_data(app, auth_client, draft_factory):
     client, user_id = auth_client
+    draft_factory(user_id=user_id, service_id=8)
     response = client.post(
         "/persist/service",
         data={
@@ -196,12 +329,13 @@ def test_persist_service_autosave_saves_data(app, auth_client):
         assert saved["service_date"] == "2026-01-04"
 
 
-def test_persist_service_defaults_invalid_id_to_one(app, auth_client):
+def test_persist_service_defaults_invalid_id_to_one(app, auth_client, draft_factory):
     client, user_id = auth_client
     with app.app_context():
         db = get_db()
         db.execute("delete from services")
         db.commit()
+    draft_factory(user_id=user_id, service_id=1)
     response = client.post(
         "/persist/service",
         data={
@@ -222,8 +356,9 @@ def test_persist_service_defaults_invalid_id_to_one(app, auth_client):
         assert payload["user_id"] == user_id
 
 
-def test_persist_service_normalizes_observance_handle(app, auth_client):
+def test_persist_service_normalizes_observance_handle(app, auth_client, draft_factory):
     client, user_id = auth_client
+    draft_factory(user_id=user_id, service_id=12)
     response = client.post(
         "/persist/service",
         data={
@@ -289,6 +424,41 @@ def test_text_renders_for_saved_service(auth_client, service_factory):
     assert b"Holy Eucharist" in response.data
 
 
+def test_text_reuses_rendered_fragments_across_services(
+    app, auth_client, service_factory
+):
+    client, user_id = auth_client
+    service_factory(
+        user_id=user_id,
+        service_id=15,
+        service_date="2026-01-04",
+        rite="Renewed Ancient Text",
+    )
+    service_factory(
+        user_id=user_id,
+        service_id=16,
+        service_date="2026-01-11",
+        rite="Renewed Ancient Text",
+    )
+    with app.app_context():
+        db = get_db()
+        db.execute(
+            "insert into service_custom_elements (service_id, user_id, title, text) values (?, ?, ?, ?)",
+            (16, user_id, "Welcome", "Welcome, {{ user.first_name }}."),
+        )
+        db.commit()
+    client.get("/text/15").get_data()
+    fragments = app.extensions["ordinarium_fragments"]
+    hits = fragments.stats()["hits"]
+    cached = client.get("/text/16").get_data(as_text=True)
+    assert fragments.stats()["hits"] > hits
+    assert "Welcome, Test." in cached
+
+    fragments.clear()
+    live = client.get("/text/16").get_data(as_text=True)
+    assert cached.split("Generated as of")[0] == live.split("Generated as of")[0]
+
+
 def test_custom_element_added_to_service_plan_and_text(
     app, auth_client, service_factory
 ):
@@ -319,11 +489,7 @@ def test_custom_element_added_to_service_plan_and_text(
         assert element is not None
         assert element["title"] == "Custom Blessing"
         assert element["text"] == "Custom text"
-        service = db.execute(
-            "select data from services where id=? limit 1", (service_id,)
-        ).fetchone()
-        payload = json.loads(service["data"])
-        order_tokens = json.loads(payload["text_order"])
+        order_tokens, _ = load_plan(db, service_id)
         assert order_tokens[:2] == ["text:68", "text:69"]
         assert order_tokens[-1] == f"custom:{element['id']}"
 
@@ -377,9 +543,7 @@ def test_custom_element_edit_updates_content(app, auth_client, service_factory):
         assert updated["text"] == "Updated"
 
 
-def test_custom_element_autosave_edit_returns_json(
-    app, auth_client, service_factory
-):
+def test_custom_element_autosave_edit_returns_json(app, auth_client, service_factory):
     client, user_id = auth_client
     service_id = service_factory(
         user_id=user_id,
@@ -491,9 +655,123 @@ def test_custom_element_delete_removes_from_plan(app, auth_client, service_facto
             (element["id"],),
         ).fetchone()
         assert deleted is None
-        service = db.execute(
-            "select data from services where id=? limit 1", (service_id,)
-        ).fetchone()
-        payload = json.loads(service["data"])
-        order_tokens = json.loads(payload["text_order"])
+        order_tokens, _ = load_plan(db, service_id)
+        assert order_tokens[:2] == ["text:68", "text:69"]
         assert f"custom:{element['id']}" not in order_tokens
+
+
+def test_services_listing_uses_precomputed_calendar_titles(
+    app, auth_client, service_factory
+):
+    client, user_id = auth_client
+    service_factory(user_id=user_id, service_id=90, service_date="2099-12-06")
+    service_factory(user_id=user_id, service_id=91, service_date="2099-12-13")
+    app.test_cli_runner().invoke(
+        args=["precompute-calendar", "--start-year", "2099", "--end-year", "2099"]
+    )
+    with app.app_context():
+        db = get_db()
+        db.execute(
+            "update calendar_days set title=? where date=? and rank=0",
+            ("Precomputed Title", "2099-12-06"),
+        )
+        db.commit()
+    response = client.get("/services")
+    assert response.status_code == 200
+    assert b"Precomputed Title" in response.data
+    assert b"The Third Sunday in Advent" in response.data
+
+
+def test_text_answers_conditional_requests(
+    app, auth_client, draft_factory, monkeypatch
+):
+    client, user_id = auth_client
+    draft_factory(user_id=user_id, service_id=91)
+    client.post(
+        "/persist/service",
+        data={
+            "service_id": "91",
+            "rite": "Renewed Ancient Text",
+            "service_date": "2026-01-04",
+        },
+    )
+    with app.app_context():
+        db = get_db()
+        db.execute(
+            "update services set data=json_set(data, '$.updated_at', ?) where id=?",
+            ("2026-01-02 15:30:00", 91),
+        )
+        db.commit()
+    response = client.get("/text/91")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert response.headers["Last-Modified"] == "Fri, 02 Jan 2026 15:30:00 GMT"
+    assert "no-cache" in response.headers["Cache-Control"]
+    assert "private" in response.headers["Cache-Control"]
+    assert b"Generated as of January 2, 2026" in response.data
+
+    def fail(*args, **kwargs):
+        raise AssertionError("304 responses must not resolve propers")
+
+    monkeypatch.setattr("ordinarium.routes.resolve_propers", fail)
+    response = client.get("/text/91", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    monkeypatch.undo()
+    # The date alone cannot tell whether the calendar or the name in the
+    # header changed since, so it never answers a 304.
+    response = client.get(
+        "/text/91", headers={"If-Modified-Since": "Fri, 02 Jan 2026 15:30:00 GMT"}
+    )
+    assert response.status_code == 200
+    assert b"Generated as of January 2, 2026" in response.data
+
+    client.post(
+        "/persist/service",
+        data={
+            "service_id": "91",
+            "rite": "Renewed Ancient Text",
+            "service_date": "2026-01-11",
+        },
+    )
+    response = client.get("/text/91", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_text_etag_covers_requested_season(app, auth_client, service_factory):
+    client, user_id = auth_client
+    service_factory(user_id=user_id, service_id=92, text_order=json.dumps([68]))
+    service_factory(
+        user_id=user_id, service_id=93, season="Lent", text_order=json.dumps([68])
+    )
+    with app.app_context():
+        db = get_db()
+        db.execute(
+            "update services set data=json_set(data, '$.updated_at', ?) where id in (92, 93)",
+            ("2026-01-02 15:30:00",),
+        )
+        db.commit()
+    plain = client.get("/text/92").headers["ETag"]
+    assert client.get("/text/92?season=Lent").headers["ETag"] != plain
+    # A saved season wins over the query, which then leaves the page as is.
+    saved = client.get("/text/93").headers["ETag"]
+    assert client.get("/text/93?season=Advent").headers["ETag"] == saved
+
+
+def test_flash_on_text_page_is_shown_once(auth_client, service_factory):
+    client, user_id = auth_client
+    service_factory(user_id=user_id, service_id=94, text_order=json.dumps([68]))
+    with client.session_transaction() as session:
+        session["_flashes"] = [("error", "Flashed once.")]
+    assert b"Flashed once." in client.get("/text/94").data
+    assert b"Flashed once." not in client.get("/templates").data
+
+
+def test_seed_services_answer_conditional_requests(auth_client):
+    client, user_id = auth_client
+    assert user_id == 1
+    response = client.get("/text/1")
+    assert response.status_code == 200
+    assert b"Generated as of January 1, 2026" in response.data
+    etag = response.headers["ETag"]
+    assert client.get("/text/1", headers={"If-None-Match": etag}).status_code == 304
@@ -1,6 +1,7 @@
 import uuid
 
 from ordinarium.db import get_db
+from ordinarium.output_cache import share_cache
 
 
 def test_share_creates_link(auth_client, app, service_factory):
@@ -86,3 +87,192 @@ def test_share_reuses_existing_link(auth_client, app, service_factory):
             (63,),
         ).fetchone()
         assert shares["count"] == 1
+
+
+def test_share_link_shows_same_propers_on_reload(
+    client, app, service_factory, user_factory
+):
+    user_id = user_factory()
+    service_id = service_factory(
+        user_id=user_id,
+        service_id=52,
+        service_date="2026-01-04",
+        rite="Renewed Ancient Text",
+    )
+    share_uuid = str(uuid.uuid4())
+    with app.app_context():
+        db = get_db()
+        db.execute(
+            "insert into service_shares (service_id, share_uuid) values (?, ?)",
+            (service_id, share_uuid),
+        )
+        db.commit()
+
+    def page_body():
+        html = client.get(f"/share/{share_uuid}").get_data(as_text=True)
+        return html.split("Generated as of", 1)[0]
+
+    first = page_body()
+    for _ in range(3):
+        assert page_body() == first
+
+
+def create_share(app, service_id):
+    share_uuid = str(uuid.uuid4())
+    with app.app_context():
+        db = get_db()
+        db.execute(
+            "insert into service_shares (service_id, share_uuid) values (?, ?)",
+            (service_id, share_uuid),
+        )
+        db.commit()
+    return share_uuid
+
+
+def test_share_page_is_cached_with_etag(client, app, service_factory, user_factory):
+    user_id = user_factory()
+    service_factory(
+        user_id=user_id,
+        service_id=81,
+        service_date="2026-01-04",
+        rite="Renewed Ancient Text",
+    )
+    share_uuid = create_share(app, 81)
+    first = client.get(f"/share/{share_uuid}")
+    assert first.status_code == 200
+    assert b"Holy Eucharist" in first.data
+    etag = first.headers["ETag"]
+    assert "public" in first.headers["Cache-Control"]
+    assert "max-age=60" in first.headers["Cache-Control"]
+    assert "Cookie" in first.headers["Vary"]
+
+    second = client.get(f"/share/{share_uuid}")
+    assert second.headers["ETag"] == etag
+    assert second.data == first.data
+    assert share_cache(app).memory.stats()["hits"] == 1
+
+    not_modified = client.get(f"/share/{share_uuid}", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.data == b""
+
+
+def test_share_page_streams_and_caches_complete_renders(
+    client, app, service_factory, user_factory
+):
+    user_id = user_factory()
+    service_factory(
+        user_id=user_id,
+        service_id=84,
+        service_date="2026-01-04",
+        rite="Renewed Ancient Text",
+    )
+    share_uuid = create_share(app, 84)
+    dropped = client.get(f"/share/{share_uuid}")
+    chunks = iter(dropped.response)
+    assert b"<html" in b"".join(next(chunks) for _ in range(3)).lower()
+    dropped.close()
+    assert share_cache(app).memory.stats()["size"] == 0
+
+    first = client.get(f"/share/{share_uuid}")
+    body = first.get_data()
+    assert b"text-footer" in body
+    assert share_cache(app).memory.get(first.headers["ETag"].strip('"')) == body
+
+    second = client.get(f"/share/{share_uuid}")
+    assert second.get_data() == body
+    assert share_cache(app).memory.stats()["misses"] == 2
+
+
+def test_share_cache_follows_service_edits(app, auth_client, service_factory):
+    client, user_id = auth_client
+    service_factory(
+        user_id=user_id,
+        service_id=82,
+        service_date="2026-01-04",
+        rite="Renewed Ancient Text",
+    )
+    share_uuid = create_share(app, 82)
+    anonymous = app.test_client()
+    etag = anonymous.get(f"/share/{share_uuid}").headers["ETag"]
+
+    response = client.post(
+        "/service/82/custom-element",
+        data={"title": "Announcements", "text": "Coffee hour follows."},
+    )
+    assert response.status_code == 302
+    updated = anonymous.get(f"/share/{share_uuid}")
+    assert updated.headers["ETag"] != etag
+    assert b"Coffee hour follows." in updated.data
+
+    etag = updated.headers["ETag"]
+    response = client.post(
+        "/persist/service",
+        data={
+            "service_id": "82",
+            "service_date": "2026-01-11",
+            "rite": "Renewed Ancient Text",
+        },
+    )
+    assert response.status_code == 302
+    assert anonymous.get(f"/share/{share_uuid}").headers["ETag"] != etag
+    with app.app_context():
+        revision = (
+            get_db()
+            .execute("select revision from services where id=?", (82,))
+            .fetchone()["revision"]
+        )
+    assert revision == 2
+
+
+def test_share_page_skips_cache_when_logged_in(app, auth_client, service_factory):
+    client, user_id = auth_client
+    service_factory(
+        user_id=user_id,
+        service_id=83,
+        service_date="2026-01-04",
+        rite="Renewed Ancient Text",
+    )
+    share_uuid = create_share(app, 83)
+    response = client.get(f"/share/{share_uuid}")
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+    assert share_cache(app).memory.stats()["misses"] == 0
+
+
+def test_share_cache_disk_tier_is_shared(tmp_path, app, service_factory, user_factory):
+    app.config["SHARE_CACHE_DIR"] = str(tmp_path / "share-cache")
+    user_id = user_factory()
+    service_factory(
+        user_id=user_id,
+        service_id=84,
+        service_date="2026-01-04",
+        rite="Renewed Ancient Text",
+    )
+    share_uuid = create_share(app, 84)
+    first = app.test_client().get(f"/share/{share_uuid}")
+    assert b"Holy Eucharist" in first.data
+    files = list((tmp_path / "share-cache").glob("*.html"))
+    assert len(files) == 1
+
+    # A fresh worker starts with an empty memory tier.
+    app.extensions.pop("ordinarium_share_cache")
+    second = app.test_client().get(f"/share/{share_uuid}")
+    assert second.data == first.data
+    assert share_cache(app).memory.stats()["misses"] == 1
+    assert len(share_cache(app).memory) == 1
+
+
+def test_deleting_service_removes_share_links(app, auth_client, service_factory):
+    client, user_id = auth_client
+    service_factory(
+        user_id=user_id,
+        service_id=85,
+        service_date="2026-01-04",
+        rite="Renewed Ancient Text",
+    )
+    share_uuid = create_share(app, 85)
+    response = client.post("/service/85/delete")
+    assert response.status_code == 302
+    response = app.test_client().get(f"/share/{share_uuid}")
+    assert response.status_code == 404
+    assert b"Share link not found" in response.data